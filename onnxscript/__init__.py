@@ -5,7 +5,7 @@
 import importlib.metadata
 
 from .backend.onnx_export import export2python as proto2python
-from .main import export_onnx_lib, graph, script
+from .main import compile_module, export_onnx_lib, graph, script
 
 # isort: off
 from .onnx_opset import (
@@ -69,6 +69,7 @@ except importlib.metadata.PackageNotFoundError:
 
 __all__ = [
     "script",
+    "compile_module",
     "export_onnx_lib",
     "OnnxFunction",
     "TracedOnnxFunction",
@@ -0,0 +1,151 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+"""Helpers shared by the passes over ONNX graphs and functions.
+
+Used by the optimizer, the inliner, the specializer and the deduplicator.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+import onnx
+import onnx.helper
+import onnx.numpy_helper
+import onnx.reference
+
+# Ops that are evaluated by constant folding when all of their inputs are constants.
+# These are the ops used to compute shapes. Ops whose output size is not bounded by
+# the size of their inputs, like ConstantOfShape, are excluded.
+FOLDABLE_OPS = frozenset(
+    [
+        "Abs",
+        "Add",
+        "And",
+        "Cast",
+        "CastLike",
+        "Concat",
+        "Div",
+        "Equal",
+        "Gather",
+        "Greater",
+        "Identity",
+        "Less",
+        "Max",
+        "Min",
+        "Mul",
+        "Neg",
+        "Not",
+        "Or",
+        "ReduceProd",
+        "Reshape",
+        "Shape",
+        "Size",
+        "Slice",
+        "Squeeze",
+        "Sub",
+        "Unsqueeze",
+        "Where",
+    ]
+)
+
+# Folded values with more elements are not stored in the function
+MAX_FOLDED_SIZE = 1024
+
+
+def is_standard_domain(domain: str) -> bool:
+    return domain in ("", "ai.onnx")
+
+
+def subgraphs(node: onnx.NodeProto) -> Iterable[onnx.GraphProto]:
+    """Returns the graphs of the attributes of a node, e.g. the branches of an If."""
+    for attr in node.attribute:
+        if attr.HasField("g"):
+            yield attr.g
+        yield from attr.graphs
+
+
+def graph_references(graph: onnx.GraphProto) -> set[str]:
+    """Returns the names used as node inputs or outputs in a graph and its subgraphs."""
+    names = {value_info.name for value_info in graph.output}
+    for node in graph.node:
+        names.update(node.input)
+        for subgraph in subgraphs(node):
+            names.update(graph_references(subgraph))
+    return names
+
+
+def _rename_graph(graph: onnx.GraphProto, rename: Callable[[str], str]) -> None:
+    for value_info in (*graph.input, *graph.output, *graph.value_info):
+        value_info.name = rename(value_info.name)
+    for initializer in graph.initializer:
+        initializer.name = rename(initializer.name)
+    for node in graph.node:
+        rename_node(node, rename)
+
+
+def rename_node(node: onnx.NodeProto, rename: Callable[[str], str]) -> None:
+    """Renames the inputs and outputs of a node, and the values of its subgraphs."""
+    node.input[:] = [rename(name) for name in node.input]
+    node.output[:] = [rename(name) for name in node.output]
+    for subgraph in subgraphs(node):
+        _rename_graph(subgraph, rename)
+
+
+def bind_attributes(node: onnx.NodeProto, attributes: Dict[str, onnx.AttributeProto]) -> None:
+    """Replaces references to function attributes with their values.
+
+    References to attributes without a value are removed, which leaves the
+    attribute of the node unset.
+    """
+    bound = []
+    for attr in node.attribute:
+        if attr.ref_attr_name:
+            value = attributes.get(attr.ref_attr_name)
+            if value is None:
+                continue
+            new_attr = onnx.AttributeProto()
+            new_attr.CopyFrom(value)
+            new_attr.name = attr.name
+            attr = new_attr
+        bound.append(attr)
+    del node.attribute[:]
+    node.attribute.extend(bound)
+    for subgraph in subgraphs(node):
+        for subgraph_node in subgraph.node:
+            bind_attributes(subgraph_node, attributes)
+
+
+def constant_attribute_value(attr_proto: onnx.AttributeProto) -> Optional[np.ndarray]:
+    """Returns the value set by the attribute of a Constant node, if it is known."""
+    if attr_proto.ref_attr_name:
+        return None
+    if attr_proto.name == "value":
+        return onnx.numpy_helper.to_array(attr_proto.t)
+    if attr_proto.name == "value_int":
+        return np.array(attr_proto.i, dtype=np.int64)
+    if attr_proto.name == "value_ints":
+        return np.array(attr_proto.ints, dtype=np.int64)
+    if attr_proto.name == "value_float":
+        return np.array(attr_proto.f, dtype=np.float32)
+    if attr_proto.name == "value_floats":
+        return np.array(attr_proto.floats, dtype=np.float32)
+    return None
+
+
+def evaluate_node(
+    node: onnx.NodeProto,
+    opset_imports: Sequence[onnx.OperatorSetIdProto],
+    inputs: Sequence[np.ndarray],
+) -> Sequence[np.ndarray]:
+    """Evaluates a node with the reference implementation of ONNX."""
+    graph = onnx.helper.make_graph(
+        [node],
+        "fold",
+        [onnx.helper.make_value_info(name, onnx.TypeProto()) for name in node.input],
+        [onnx.helper.make_value_info(name, onnx.TypeProto()) for name in node.output],
+    )
+    model = onnx.helper.make_model(graph, opset_imports=opset_imports)
+    return onnx.reference.ReferenceEvaluator(model).run(None, dict(zip(node.input, inputs)))
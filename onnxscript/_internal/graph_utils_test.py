@@ -0,0 +1,30 @@
+import unittest
+
+from onnx import parser
+
+from onnxscript._internal import graph_utils
+
+
+class GraphReferencesTest(unittest.TestCase):
+    def test_graph_references_include_outputs_of_subgraphs(self):
+        graph = parser.parse_graph(
+            """
+            graph (bool cond, float[2] x, float[2] y) => (float[2] z)
+            {
+                z = If(cond) <
+                    then_branch = then_graph () => (float[2] x) {
+                    },
+                    else_branch = else_graph () => (float[2] else_z) {
+                        else_z = Neg(y)
+                    }
+                >
+            }
+            """
+        )
+        self.assertEqual(
+            graph_utils.graph_references(graph), {"cond", "x", "y", "z", "else_z"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
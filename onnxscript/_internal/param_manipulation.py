@@ -2,11 +2,146 @@
 from __future__ import annotations
 
 import collections
-from typing import Any, OrderedDict, Sequence
+from typing import Any, Mapping, OrderedDict, Sequence
 
 from onnxscript import values
 
 
+class ParamBinder:
+    """Binds the arguments of calls to an Op or an OnnxFunction to its parameters.
+
+    A binder is compiled once from the parameter schemas (see
+    :meth:`onnxscript.values.Op.param_binder`) and binds the ``(args, kwargs)`` of a
+    call in a single pass over precomputed slots, instead of walking the
+    parameter schemas and rebuilding the set of parameter names on every call.
+    """
+
+    __slots__ = ("param_schemas", "_names", "_slots")
+
+    def __init__(self, param_schemas: Sequence[values.ParamSchema]):
+        self.param_schemas = tuple(param_schemas)
+        self._names = frozenset(param.name for param in self.param_schemas)
+        # One slot per parameter, in order:
+        # (schema, name, is_input, is_variadic_input, default, is_float_attribute)
+        self._slots = tuple(
+            (
+                param,
+                param.name,
+                param.is_input,
+                param.is_variadic_input,
+                param.default,
+                param.is_attribute and param.type in {float, "float"},
+            )
+            for param in self.param_schemas
+        )
+
+    def _check_kwargs(self, kwargs: Mapping[str, Any], allow_extra_kwargs: bool) -> None:
+        if kwargs and not allow_extra_kwargs and not self._names.issuperset(kwargs):
+            extra_kwargs = set(kwargs).difference(self._names)
+            raise TypeError(f"Unexpected keyword arguments '{extra_kwargs}'")
+
+    def separate_input_attributes(
+        self,
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any],
+        fill_defaults: bool = True,
+        allow_extra_kwargs: bool = False,
+        cast_float_attributes: bool = False,
+    ) -> tuple[list[Any], OrderedDict[str, Any]]:
+        """Separate Python args and kwargs into ONNX inputs and attributes.
+
+        See :func:`separate_input_attributes_from_arguments`.
+
+        Args:
+            args: The Python positional arguments supplied by the caller.
+            kwargs: The Python keyword arguments supplied by the caller.
+            fill_defaults: Whether to fill the default values for attributes.
+            allow_extra_kwargs: Whether to allow extra keyword arguments.
+            cast_float_attributes: Whether to cast the values of the float attributes
+                to float, e.g. when they are given as ints.
+        """
+        self._check_kwargs(kwargs, allow_extra_kwargs)
+
+        onnx_inputs: list[Any] = []
+        onnx_attributes: OrderedDict[str, Any] = collections.OrderedDict()
+        num_args = len(args)
+        for i, (param, name, is_input, is_variadic, default, is_float) in enumerate(
+            self._slots
+        ):
+            if is_variadic:
+                # Exhaust all remaining args
+                onnx_inputs.extend(args[i:])
+                num_args = 0
+                continue
+            if i < num_args:
+                value = args[i]
+            elif name in kwargs:
+                value = kwargs[name]
+            elif (
+                not is_input
+                and default is not values._EmptyDefault  # pylint: disable=protected-access
+            ):
+                # User did not provide the attribute
+                if not fill_defaults:
+                    continue
+                value = default
+            elif param.required:
+                raise TypeError(f"Required input '{param}' was not provided")
+            else:
+                continue
+            if is_input:
+                onnx_inputs.append(value)
+            else:
+                onnx_attributes[name] = (
+                    float(value) if cast_float_attributes and is_float else value
+                )
+
+        return onnx_inputs, onnx_attributes
+
+    def tag_arguments(
+        self,
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any],
+        fill_defaults: bool = True,
+        allow_extra_kwargs: bool = False,
+    ) -> tuple[
+        list[tuple[Any, values.ParamSchema]], dict[str, tuple[Any, values.ParamSchema]]
+    ]:
+        """Tag Python args and kwargs with matching ONNX ParamSchema.
+
+        See :func:`tag_arguments_with_param_schemas`.
+
+        Args:
+            args: The Python positional arguments supplied by the caller.
+            kwargs: The Python keyword arguments supplied by the caller.
+            fill_defaults: Whether to fill the default values for attributes.
+            allow_extra_kwargs: Whether to allow extra keyword arguments.
+        """
+        self._check_kwargs(kwargs, allow_extra_kwargs)
+
+        tagged_args: list[tuple[Any, values.ParamSchema]] = []
+        tagged_kwargs: dict[str, tuple[Any, values.ParamSchema]] = {}
+        num_args = len(args)
+        for i, (param, name, _, is_variadic, default, _) in enumerate(self._slots):
+            if is_variadic:
+                # Exhaust all remaining args
+                tagged_args.extend((arg, param) for arg in args[i:])
+                num_args = 0
+                continue
+            if i < num_args:
+                tagged_args.append((args[i], param))
+            elif name in kwargs:
+                tagged_kwargs[name] = (kwargs[name], param)
+            elif default is not values._EmptyDefault:  # pylint: disable=protected-access
+                # User did not provide the input/attribute
+                if fill_defaults:
+                    tagged_kwargs[name] = (default, param)
+            elif param.required:
+                raise TypeError(f"Required input/attribute '{param}' was not provided")
+
+        return tagged_args, tagged_kwargs
+
+
 def separate_input_attributes_from_arguments(
     param_schemas: Sequence[values.ParamSchema],
     args,
@@ -33,44 +168,9 @@ def separate_input_attributes_from_arguments(
         TypeError: When allow_extra_kwargs is False and there are unknown kwargs.
         TypeError: When a required input is not provided.
     """
-    # args, kwargs and param_schemas should be all in order
-    # user may not specify all inputs or attributes
-
-    all_param_names = {param.name for param in param_schemas}
-    extra_kwargs = set(kwargs).difference(all_param_names)
-    if extra_kwargs and not allow_extra_kwargs:
-        raise TypeError(f"Unexpected keyword arguments '{extra_kwargs}'")
-
-    onnx_inputs = []
-    onnx_attributes = collections.OrderedDict()
-
-    for i, param in enumerate(param_schemas):
-        if param.is_variadic_input:
-            # Exhaust all remaining args
-            onnx_inputs.extend(args[i:])
-            args = []
-            continue
-        if i < len(args):
-            if param.is_input:
-                onnx_inputs.append(args[i])
-            else:
-                onnx_attributes[param.name] = args[i]
-        elif param.name in kwargs:
-            if param.is_input:
-                onnx_inputs.append(kwargs[param.name])
-            else:
-                onnx_attributes[param.name] = kwargs[param.name]
-        elif (
-            param.is_attribute
-            and param.default is not values._EmptyDefault  # pylint: disable=protected-access
-        ):
-            # User did not provide the attribute
-            if fill_defaults:
-                onnx_attributes[param.name] = param.default
-        elif param.required:
-            raise TypeError(f"Required input '{param}' was not provided")
-
-    return onnx_inputs, onnx_attributes
+    return ParamBinder(param_schemas).separate_input_attributes(
+        args, kwargs, fill_defaults=fill_defaults, allow_extra_kwargs=allow_extra_kwargs
+    )
 
 
 def tag_arguments_with_param_schemas(
@@ -100,32 +200,6 @@ def tag_arguments_with_param_schemas(
         TypeError: When allow_extra_kwargs is False and there are unknown kwargs.
         TypeError: When a required input is not provided.
     """
-    # args, kwargs and param_schemas should be all in order
-    # user may not specify all inputs or attributes
-
-    all_param_names = {param.name for param in param_schemas}
-    extra_kwargs = set(kwargs).difference(all_param_names)
-    if extra_kwargs and not allow_extra_kwargs:
-        raise TypeError(f"Unexpected keyword arguments '{extra_kwargs}'")
-
-    tagged_args: list[tuple[Any, values.ParamSchema]] = []
-    tagged_kwargs: dict[str, tuple[Any, values.ParamSchema]] = {}
-
-    for i, param in enumerate(param_schemas):
-        if param.is_variadic_input:
-            # Exhaust all remaining args
-            tagged_args.extend((arg, param) for arg in args[i:])
-            args = []
-            continue
-        if i < len(args):
-            tagged_args.append((args[i], param))
-        elif param.name in kwargs:
-            tagged_kwargs[param.name] = (kwargs[param.name], param)
-        elif param.default is not values._EmptyDefault:  # pylint: disable=protected-access
-            # User did not provide the input/attribute
-            if fill_defaults:
-                tagged_kwargs[param.name] = (param.default, param)
-        elif param.required:
-            raise TypeError(f"Required input/attribute '{param}' was not provided")
-
-    return tagged_args, tagged_kwargs
+    return ParamBinder(param_schemas).tag_arguments(
+        args, kwargs, fill_defaults=fill_defaults, allow_extra_kwargs=allow_extra_kwargs
+    )
@@ -183,5 +183,74 @@ class TestSeparateInputAttributesFromArguments(unittest.TestCase):
             )
 
 
+class TestParamBinder(unittest.TestCase):
+    def setUp(self):
+        self.binder = param_manipulation.ParamBinder(
+            (
+                values.ParamSchema(name="a", type=INT64, is_input=True),
+                values.ParamSchema(
+                    name="b", type=INT64, is_input=True, is_variadic_input=True
+                ),
+                values.ParamSchema(name="c", type=float, default=100.0, is_input=False),
+                values.ParamSchema(name="d", type=int, default=1, is_input=False),
+            )
+        )
+
+    def test_separate_input_attributes_exhausts_args_for_variadic_input(self):
+        inputs, attributes = self.binder.separate_input_attributes(
+            (TEST_INPUT, "b1", "b2"), {"c": 0.0}
+        )
+
+        self.assertEqual(inputs, [TEST_INPUT, "b1", "b2"])
+        self.assertEqual(attributes, collections.OrderedDict([("c", 0.0), ("d", 1)]))
+
+    def test_separate_input_attributes_casts_float_attributes(self):
+        _, attributes = self.binder.separate_input_attributes(
+            (TEST_INPUT,), {"c": 2, "d": 3}, cast_float_attributes=True
+        )
+
+        self.assertEqual(attributes, collections.OrderedDict([("c", 2.0), ("d", 3)]))
+        self.assertIsInstance(attributes["c"], float)
+        self.assertIsInstance(attributes["d"], int)
+
+    def test_separate_input_attributes_is_the_same_as_the_function(self):
+        param_schemas = self.binder.param_schemas
+        for args, kwargs in [
+            ((TEST_INPUT,), {}),
+            ((TEST_INPUT, "b1"), {"d": 2}),
+            ((), {"a": TEST_INPUT, "c": 1.0}),
+        ]:
+            for fill_defaults in (True, False):
+                self.assertEqual(
+                    self.binder.separate_input_attributes(
+                        args, kwargs, fill_defaults=fill_defaults
+                    ),
+                    param_manipulation.separate_input_attributes_from_arguments(
+                        param_schemas, args, kwargs, fill_defaults=fill_defaults
+                    ),
+                )
+
+    def test_tag_arguments_fills_defaults_as_kwargs(self):
+        tagged_args, tagged_kwargs = self.binder.tag_arguments((TEST_INPUT,), {"d": 2})
+
+        param_schemas = self.binder.param_schemas
+        self.assertEqual(tagged_args, [(TEST_INPUT, param_schemas[0])])
+        self.assertEqual(
+            tagged_kwargs, {"c": (100.0, param_schemas[2]), "d": (2, param_schemas[3])}
+        )
+
+    def test_binding_raises_on_extra_kwargs(self):
+        with self.assertRaises(TypeError):
+            self.binder.separate_input_attributes((TEST_INPUT,), {"extra": 42})
+        with self.assertRaises(TypeError):
+            self.binder.tag_arguments((TEST_INPUT,), {"extra": 42})
+
+    def test_binding_raises_on_missing_required_input(self):
+        with self.assertRaises(TypeError):
+            self.binder.separate_input_attributes((), {"c": 0.0})
+        with self.assertRaises(TypeError):
+            self.binder.tag_arguments((), {"c": 0.0})
+
+
 if __name__ == "__main__":
     unittest.main()
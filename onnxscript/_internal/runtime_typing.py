@@ -2,34 +2,48 @@
 
 Decorate a function with `@runtime_typing.checked` to enable runtime
 type checking. The decorator is a no-op when the `beartype` library is not
-installed.
+installed, or when the ONNXSCRIPT_RUNTIME_TYPE_CHECKS environment variable is
+set to 0 when onnxscript is imported. Disabling the checks removes their overhead
+from every call of the decorated functions, e.g. when tracing large graphs.
 """
+import os
 import warnings
+from typing import Any, Callable, TypeVar
 
 __all__ = [
     "checked",
+    "RUNTIME_TYPE_CHECKS_ENV",
 ]
 
-try:
-    from beartype import beartype as checked
-    from beartype import roar as _roar
-
-    # Beartype warns when we import from typing because the types are deprecated
-    # in Python 3.9. But there will be a long time until we can move to using
-    # the native container types for type annotations (when 3.9 is the lowest
-    # supported version). So we silence the warning.
-    warnings.filterwarnings(
-        "ignore",
-        category=_roar.BeartypeDecorHintPep585DeprecationWarning,
-    )
-except ImportError:
-
-    def checked(func):  # type: ignore[no-redef]
-        return func
-
-except Exception as e:  # pylint: disable=broad-exception-caught
-    # Warn errors that are not import errors (unexpected).
-    warnings.warn(f"{e}", stacklevel=2)
-
-    def checked(func):  # type: ignore[no-redef]
-        return func
+RUNTIME_TYPE_CHECKS_ENV = "ONNXSCRIPT_RUNTIME_TYPE_CHECKS"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _unchecked(func: _F) -> _F:
+    return func
+
+
+if os.environ.get(RUNTIME_TYPE_CHECKS_ENV, "1") == "0":
+    checked = _unchecked
+else:
+    try:
+        from beartype import beartype as checked  # type: ignore[assignment]
+        from beartype import roar as _roar
+
+        # Beartype warns when we import from typing because the types are deprecated
+        # in Python 3.9. But there will be a long time until we can move to using
+        # the native container types for type annotations (when 3.9 is the lowest
+        # supported version). So we silence the warning.
+        warnings.filterwarnings(
+            "ignore",
+            category=_roar.BeartypeDecorHintPep585DeprecationWarning,
+        )
+    except ImportError:
+        checked = _unchecked
+
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Warn errors that are not import errors (unexpected).
+        warnings.warn(f"{e}", stacklevel=2)
+
+        checked = _unchecked
@@ -0,0 +1,249 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+"""Structural hashing of graphs and functions.
+
+The hash of a graph or function is computed bottom-up (as a Merkle tree) from the
+operators, the attributes and the inputs of the nodes. A value is identified by the
+digest of the node computing it, so two identical nodes of a graph, e.g. two
+``RandomUniformLike(x)``, compute values with the same key: the hash cannot tell
+apart a graph using both of them from one using either twice. Such graphs can
+have the same hash without being isomorphic, and :func:`unique_structural_hash`
+returns None for them.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple, Union
+
+import onnx
+
+# A generator computing a digest. It yields the generators of the digests it needs,
+# which are sent back to it by _run_digest, and returns its digest.
+_DigestGenerator = Generator[Any, bytes, bytes]
+# The key of a variable: ("input", index), ("initializer", digest), (node digest,
+# output index) or ("undefined", name)
+_ValueKey = Tuple[Any, Any]
+
+
+def _digest(*parts) -> bytes:
+    """Returns the digest of a tuple of strings, numbers, bytes, None and tuples."""
+    return hashlib.sha256(repr(parts).encode()).digest()
+
+
+def _message_digest(message) -> bytes:
+    return hashlib.sha256(message.SerializeToString(deterministic=True)).digest()
+
+
+def _tensor_digest(tensor: onnx.TensorProto) -> bytes:
+    # The name of a tensor is not part of its value
+    if tensor.name:
+        unnamed = onnx.TensorProto()
+        unnamed.CopyFrom(tensor)
+        unnamed.ClearField("name")
+        tensor = unnamed
+    return _message_digest(tensor)
+
+
+def _sparse_tensor_digest(sparse_tensor: onnx.SparseTensorProto) -> bytes:
+    return _digest(
+        "sparse_tensor",
+        _tensor_digest(sparse_tensor.values),
+        _tensor_digest(sparse_tensor.indices),
+        tuple(sparse_tensor.dims),
+    )
+
+
+def _value_key(name: str, scopes: Sequence[Dict[str, _ValueKey]]) -> _ValueKey:
+    """Returns the key of a variable, looked up from the innermost scope."""
+    for scope in scopes:
+        if name in scope:
+            return scope[name]
+    return ("undefined", name)
+
+
+class _Hasher:
+    """Computes the digest of a graph or function.
+
+    Attributes:
+        node_digests: The digests of all the nodes hashed, sub-graphs included.
+    """
+
+    def __init__(self) -> None:
+        self.node_digests: List[bytes] = []
+
+    def attribute_digest(
+        self, attr: onnx.AttributeProto, scopes: Sequence[Dict[str, _ValueKey]]
+    ) -> _DigestGenerator:
+        graphs = []
+        if attr.HasField("g"):
+            graphs.append((yield self.graph_digest(attr.g, scopes)))
+        for graph in attr.graphs:
+            graphs.append((yield self.graph_digest(graph, scopes)))
+        return _digest(
+            "attribute",
+            attr.name,
+            *(
+                getattr(attr, field) if attr.HasField(field) else None
+                for field in ("type", "ref_attr_name", "f", "i", "s")
+            ),
+            _tensor_digest(attr.t) if attr.HasField("t") else None,
+            tuple(_tensor_digest(tensor) for tensor in attr.tensors),
+            tuple(attr.floats),
+            tuple(attr.ints),
+            tuple(attr.strings),
+            tuple(graphs),
+            _sparse_tensor_digest(attr.sparse_tensor)
+            if attr.HasField("sparse_tensor")
+            else None,
+            tuple(_sparse_tensor_digest(tensor) for tensor in attr.sparse_tensors),
+            _message_digest(attr.tp) if attr.HasField("tp") else None,
+            tuple(_message_digest(tp) for tp in attr.type_protos),
+        )
+
+    def node_digests_of(
+        self, nodes: Sequence[onnx.NodeProto], scopes: Sequence[Dict[str, _ValueKey]]
+    ) -> Generator[Any, bytes, List[bytes]]:
+        """Returns the digests of the nodes, and adds the keys of their outputs to scopes[0].
+
+        The digest of a node is computed from its operator, its attributes, the keys
+        of its inputs and its number of outputs, with the positions of the omitted
+        ones. The names of the nodes and of their outputs are ignored.
+        """
+        values = scopes[0]
+        digests = []
+        for node in nodes:
+            attributes = []
+            for attr in node.attribute:
+                attributes.append((yield self.attribute_digest(attr, scopes)))
+            digest = _digest(
+                "node",
+                node.op_type,
+                node.domain,
+                tuple(sorted(attributes)),
+                tuple(_value_key(name, scopes) for name in node.input),
+                len(node.output),
+                tuple(i for i, output in enumerate(node.output) if not output),
+            )
+            for i, output in enumerate(node.output):
+                if output:
+                    values[output] = (digest, i)
+            digests.append(digest)
+        self.node_digests.extend(digests)
+        return digests
+
+    def graph_digest(
+        self, graph: onnx.GraphProto, outer_scopes: Sequence[Dict[str, _ValueKey]] = ()
+    ) -> _DigestGenerator:
+        values: Dict[str, _ValueKey] = {}
+        scopes = [values, *outer_scopes]
+        for i, value_info in enumerate(graph.input):
+            values[value_info.name] = ("input", i)
+        # Initializers that are inputs are the default values of the inputs
+        default_values = []
+        for tensor in graph.initializer:
+            key = ("initializer", _tensor_digest(tensor))
+            if tensor.name in values:
+                default_values.append((values[tensor.name], key))
+            else:
+                values[tensor.name] = key
+        for sparse_tensor in graph.sparse_initializer:
+            key = ("initializer", _sparse_tensor_digest(sparse_tensor))
+            if sparse_tensor.values.name in values:
+                default_values.append((values[sparse_tensor.values.name], key))
+            else:
+                values[sparse_tensor.values.name] = key
+        nodes = yield self.node_digests_of(graph.node, scopes)
+        return _digest(
+            "graph",
+            tuple(_message_digest(value_info) for value_info in graph.input),
+            tuple(sorted(default_values)),
+            tuple(_value_key(value_info.name, scopes) for value_info in graph.output),
+            tuple(sorted(nodes)),
+        )
+
+    def function_digest(self, function: onnx.FunctionProto) -> _DigestGenerator:
+        values: Dict[str, _ValueKey] = {
+            name: ("input", i) for i, name in enumerate(function.input)
+        }
+        nodes = yield self.node_digests_of(function.node, [values])
+        default_attributes = []
+        for attr in function.attribute_proto:
+            default_attributes.append((yield self.attribute_digest(attr, [values])))
+        return _digest(
+            "function",
+            len(function.input),
+            tuple(sorted(set(function.attribute))),
+            tuple(sorted(default_attributes)),
+            tuple(
+                sorted(
+                    {entry.domain: entry.version for entry in function.opset_import}.items()
+                )
+            ),
+            tuple(_value_key(name, [values]) for name in function.output),
+            tuple(sorted(nodes)),
+        )
+
+
+def _run_digest(generator: _DigestGenerator) -> bytes:
+    """Runs a digest generator and the generators it yields without recursion."""
+    generators = [generator]
+    result: Any = None
+    while generators:
+        try:
+            sub_generator = generators[-1].send(result)
+        except StopIteration as stop:
+            generators.pop()
+            result = stop.value
+        else:
+            generators.append(sub_generator)
+            result = None
+    return result
+
+
+def _hash(graph_or_function: Union[onnx.FunctionProto, onnx.GraphProto]) -> Tuple[str, bool]:
+    """Returns the hash of a graph or function, and whether its nodes are all distinct."""
+    hasher = _Hasher()
+    if isinstance(graph_or_function, onnx.FunctionProto):
+        digest = _run_digest(hasher.function_digest(graph_or_function))
+    else:
+        digest = _run_digest(hasher.graph_digest(graph_or_function))
+    return digest.hex(), len(set(hasher.node_digests)) == len(hasher.node_digests)
+
+
+def structural_hash(graph_or_function: Union[onnx.FunctionProto, onnx.GraphProto]) -> str:
+    """Returns a hash of the computation of a graph or function.
+
+    The hash is computed in time linear in the size of the graph or function and
+    without recursion. It does not depend on the order of the nodes, on the names
+    of the nodes and of the intermediate values, on the names of the initializers,
+    on the names and the types of the outputs, nor on the name, domain and input
+    names of a function. Isomorphic graphs or functions have the same hash. Graphs
+    with initializers are supported, and the unused nodes are part of the hash.
+
+    Args:
+        graph_or_function: The graph or function.
+
+    Returns:
+        The hexadecimal SHA-256 hash.
+    """
+    return _hash(graph_or_function)[0]
+
+
+def unique_structural_hash(
+    graph_or_function: Union[onnx.FunctionProto, onnx.GraphProto]
+) -> Optional[str]:
+    """Returns the structural hash of a graph or function without identical nodes.
+
+    Two graphs or functions with the same unique hash are isomorphic.
+
+    Args:
+        graph_or_function: The graph or function.
+
+    Returns:
+        The :func:`structural_hash` of the graph or function, or None if two of its
+        nodes, sub-graphs included, have the same operator, attributes and inputs.
+    """
+    digest, nodes_are_distinct = _hash(graph_or_function)
+    return digest if nodes_are_distinct else None
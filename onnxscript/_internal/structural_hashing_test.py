@@ -0,0 +1,71 @@
+import unittest
+
+from onnx import parser
+
+from onnxscript._internal import structural_hashing
+
+_GRAPH = """
+    graph (bool cond, float[2] x) => (float[2] y)
+    {{
+        a = Relu(x)
+        y = If(cond) <
+            then_branch = then_graph () => (float[2] then_y) {{
+                then_y = {}(x)
+            }},
+            else_branch = else_graph () => (float[2] else_y) {{
+                else_y = Neg(a)
+            }}
+        >
+    }}
+"""
+
+
+class UniqueStructuralHashTest(unittest.TestCase):
+    def test_unique_hash_is_the_hash_of_graph_with_distinct_nodes(self):
+        graph = parser.parse_graph(_GRAPH.format("Abs"))
+        self.assertEqual(
+            structural_hashing.unique_structural_hash(graph),
+            structural_hashing.structural_hash(graph),
+        )
+
+    def test_unique_hash_of_graph_with_identical_nodes_in_sub_graphs_is_none(self):
+        graph = parser.parse_graph(_GRAPH.format("Relu"))
+        self.assertIsNone(structural_hashing.unique_structural_hash(graph))
+
+    def test_unique_hash_of_function_with_identical_nodes_is_none(self):
+        function = parser.parse_function(
+            """
+            <domain: "test", opset_import: ["" : 18]>
+            f (x) => (y, z)
+            {
+                y = Dropout(x)
+                z = Dropout(x)
+            }
+            """
+        )
+        self.assertIsNone(structural_hashing.unique_structural_hash(function))
+
+    def test_hash_depends_on_the_outputs_of_the_nodes(self):
+        function = """
+            <domain: "test", opset_import: ["" : 18]>
+            f (x) => (b)
+            {{
+                {} = Split<axis = 0>(x)
+            }}
+        """
+        expected = structural_hashing.unique_structural_hash(
+            parser.parse_function(function.format("a, b"))
+        )
+        self.assertIsNotNone(expected)
+        for outputs in ("a, b, c", "a, b, "):
+            with self.subTest(outputs=outputs):
+                self.assertNotEqual(
+                    structural_hashing.unique_structural_hash(
+                        parser.parse_function(function.format(outputs))
+                    ),
+                    expected,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
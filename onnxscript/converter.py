@@ -24,7 +24,7 @@ import onnxscript
 from onnxscript import irbuilder, onnx_types, sourceinfo
 from onnxscript import type_annotation as ta
 from onnxscript import values
-from onnxscript._internal import analysis, ast_utils, autocast, param_manipulation
+from onnxscript._internal import analysis, ast_utils, autocast
 
 PY_VERSION_GE_39 = ast_utils.PY_VERSION_GE_39
 
@@ -822,13 +822,13 @@ class Converter:
     def _translate_call_expr(self, node: ast.Call):
         """Translates a call-expression."""
         callee = self._translate_callee_expr(node.func)
-        param_schemas = callee.param_schemas()
+        param_binder = callee.param_binder()
         # If the callee's schema is available, we use it to determine the inputs and attributes.
         # Otherwise, we map named arguments to attributes and positional arguments to inputs.
-        if param_schemas:
+        if param_binder is not None and param_binder.param_schemas:
             kwargs = {x.arg: x.value for x in node.keywords}
-            args, attrs = param_manipulation.separate_input_attributes_from_arguments(
-                param_schemas, node.args, kwargs, fill_defaults=False
+            args, attrs = param_binder.separate_input_attributes(
+                node.args, kwargs, fill_defaults=False
             )
             args = [self._translate_opt_expr(x) for x in args]
             attrs = [
@@ -1100,11 +1100,11 @@ class Converter:
 
     def _translate_if_stmt(self, stmt: ast.If) -> None:
         if hasattr(stmt, "live_out"):
-            live_defs = list(
+            live_defs = sorted(
                 stmt.live_out.intersection(analysis.assigned_vars(stmt, self._message))
             )
         else:
-            live_defs = list(analysis.assigned_vars(stmt, self._message))
+            live_defs = sorted(analysis.assigned_vars(stmt, self._message))
         test = self._translate_expr(stmt.test, "cond").name
         lineno = self._source_of(stmt).lineno
         thenGraph, sub_fct_then = self._translate_block(
@@ -1184,9 +1184,12 @@ class Converter:
         # analyze loop body
         exposed_uses = analysis.exposed_uses(loop_stmt.body, self._message)
         vars_def_in_loop = analysis.assigned_vars(loop_stmt.body, self._message)
-        loop_state_vars = vars_def_in_loop.intersection(exposed_uses | loop_stmt.live_out)
-        scan_outputs = set()  # TODO
-        outputs = list(loop_state_vars | scan_outputs)
+        # Sorted so that the converted function does not depend on the hash seed
+        loop_state_vars = sorted(
+            vars_def_in_loop.intersection(exposed_uses | loop_stmt.live_out)
+        )
+        scan_outputs: list[str] = []  # TODO
+        outputs = loop_state_vars + scan_outputs
 
         # loop-condition:
         o_true = self._emit_const(True, "true", self._source_of(loop_stmt))
@@ -4,6 +4,7 @@
 # --------------------------------------------------------------------------
 
 import ast
+import gc
 import inspect
 import os
 import pathlib
@@ -671,6 +672,51 @@ class TestConverter(testutils.TestBase):
         self.check_run(sum, [np.array(5, dtype=np.int64)], np.array(10, dtype=np.int64))
         self.check_run(sum, [np.array(-5, dtype=np.int64)], np.array(0, dtype=np.int64))
 
+    def test_loop_and_if_outputs_are_in_sorted_order(self):
+        @script(default_opset=op)
+        def running_stats(n: INT64) -> INT64:
+            total = op.Constant(value=0)
+            count = op.Constant(value=0)
+            maximum = op.Constant(value=0)
+            for i in range(n):
+                total = total + i
+                count = count + 1
+                maximum = op.Max(maximum, i)
+            if n > 2:
+                z = total
+                a = count
+            else:
+                z = count
+                a = total
+            return z + a + maximum
+
+        nodes = running_stats.to_function_proto().node
+        (loop,) = [node for node in nodes if node.op_type == "Loop"]
+        (if_node,) = [node for node in nodes if node.op_type == "If"]
+        self.assertEqual(
+            [name.split("_")[0] for name in loop.output], ["count", "maximum", "total"]
+        )
+        self.assertEqual([name.split("_")[0] for name in if_node.output], ["a", "z"])
+        self.check_run(
+            running_stats, [np.array(5, dtype=np.int64)], np.array(19, dtype=np.int64)
+        )
+
+    def test_function_ir_does_not_retain_ast(self):
+        @script()
+        def neg(X):
+            return op.Neg(X)
+
+        (output,) = neg.function_ir.outputs
+        self.assertFalse(hasattr(output.info, "__dict__"))
+        self.assertEqual(output.info.function_name, "neg")
+        self.assertIs(output.info.code, neg.source)
+        message = output.info.msg("unexpected")
+        self.assertIn("line 3", message)
+        self.assertIn("return op.Neg(X)", message)
+        self.assertFalse(
+            any(isinstance(value, ast.AST) for value in gc.get_referents(output.info))
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
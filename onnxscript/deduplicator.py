@@ -0,0 +1,113 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+"""Deduplication of the identical model-local functions of a model.
+
+Models exported with torch_lib can contain several functions with the same body
+under different names, e.g. one function per call of the same module, recorded for
+each layer of a model. :func:`deduplicate_functions` keeps one of them and calls it
+instead of the others.
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import Dict, Iterable, Optional, Tuple
+
+import onnx
+
+from onnxscript._internal import graph_utils, structural_hashing
+from onnxscript.inliner import FunctionId
+
+
+@dataclasses.dataclass
+class DeduplicationResult:
+    """The functions merged by :func:`deduplicate_functions`.
+
+    Attributes:
+        merged: The removed functions, mapped to the function called instead.
+        num_bytes_saved: The decrease of the serialized size of the model.
+    """
+
+    merged: Dict[FunctionId, FunctionId] = dataclasses.field(default_factory=dict)
+    num_bytes_saved: int = 0
+
+    @property
+    def num_functions_removed(self) -> int:
+        return len(self.merged)
+
+
+def _rename_calls(
+    nodes: Iterable[onnx.NodeProto], renames: Dict[FunctionId, FunctionId]
+) -> bool:
+    """Makes the calls to the renamed functions call the new functions.
+
+    Returns whether a call was changed.
+    """
+    changed = False
+    for node in nodes:
+        new_id = renames.get((node.domain, node.op_type))
+        if new_id is not None:
+            node.domain, node.op_type = new_id
+            changed = True
+        for subgraph in graph_utils.subgraphs(node):
+            changed = _rename_calls(subgraph.node, renames) or changed
+    return changed
+
+
+def deduplicate_functions(model: onnx.ModelProto) -> DeduplicationResult:
+    """Merges the structurally identical model-local functions of a model, in place.
+
+    Functions of the same domain with the same structural hash compute the same
+    outputs: they have the same nodes up to the names of the nodes and values, the
+    same attributes and the same opset imports. Functions with two identical nodes
+    are never merged, as their hash does not tell which of the two nodes computes
+    each value, which matters for nondeterministic operators such as
+    RandomUniformLike or Bernoulli. The first of the functions in the model is
+    kept, and the calls to the others, in the graph and in the functions, call it
+    instead. Functions that call merged functions can become identical in turn,
+    so the functions are compared again until none are merged.
+
+    Functions of different domains are not merged, so that the functions calling
+    them do not need to import another domain.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The merged functions and the number of bytes saved.
+    """
+    result = DeduplicationResult()
+    if len(model.functions) < 2:
+        return result
+    size = model.ByteSize()
+    hashes: Dict[FunctionId, Optional[str]] = {}
+    while True:
+        kept: Dict[Tuple[str, str], FunctionId] = {}
+        renames: Dict[FunctionId, FunctionId] = {}
+        for function in model.functions:
+            function_id = (function.domain, function.name)
+            if function_id not in hashes:
+                hashes[function_id] = structural_hashing.unique_structural_hash(function)
+            function_hash = hashes[function_id]
+            if function_hash is None:
+                continue
+            kept_id = kept.setdefault((function.domain, function_hash), function_id)
+            if kept_id != function_id:
+                renames[function_id] = kept_id
+        if not renames:
+            break
+
+        functions = [f for f in model.functions if (f.domain, f.name) not in renames]
+        del model.functions[:]
+        model.functions.extend(functions)
+        _rename_calls(model.graph.node, renames)
+        for function in model.functions:
+            if _rename_calls(function.node, renames):
+                del hashes[(function.domain, function.name)]
+        for function_id, kept_id in result.merged.items():
+            result.merged[function_id] = renames.get(kept_id, kept_id)
+        result.merged.update(renames)
+
+    result.num_bytes_saved = size - model.ByteSize()
+    return result
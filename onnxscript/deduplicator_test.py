@@ -0,0 +1,189 @@
+import unittest
+
+import numpy as np
+import onnx
+import onnx.checker
+import onnx.parser
+import onnxruntime as ort
+
+from onnxscript import deduplicator
+
+_MODEL = """
+<ir_version: 8, opset_import: ["" : 18, "local" : 1, "other" : 1]>
+agraph (bool cond, float[N] x) => (float[N] y, float[N] z) {
+    a = local.layer_0 (x)
+    b = local.layer_1 (a)
+    c = local.layer_2 (b)
+    d = other.relu (c)
+    e = local.leaky_0 (d)
+    y = local.leaky_1 (e)
+    z = If (cond) <
+        then_branch = then_graph () => (float[N] then_z) {
+            then_z = local.relu_1 (y)
+        },
+        else_branch = else_graph () => (float[N] else_z) {
+            else_z = Neg (y)
+        }
+    >
+}
+<domain: "local", opset_import: ["" : 18]>
+relu_0 (a) => (b) {
+    b = Relu (a)
+}
+<domain: "local", opset_import: ["" : 18]>
+relu_1 (x) => (y) {
+    y = Relu (x)
+}
+<domain: "local", opset_import: ["" : 18, "local" : 1]>
+layer_0 (a) => (b) {
+    t = local.relu_0 (a)
+    b = Neg (t)
+}
+<domain: "local", opset_import: ["" : 18, "local" : 1]>
+layer_1 (a) => (b) {
+    r = local.relu_1 (a)
+    b = Neg (r)
+}
+<domain: "local", opset_import: ["" : 18, "local" : 1]>
+layer_2 (x) => (y) {
+    r = local.relu_1 (x)
+    y = Neg (r)
+}
+<domain: "other", opset_import: ["" : 18]>
+relu (a) => (b) {
+    b = Relu (a)
+}
+<domain: "local", opset_import: ["" : 18]>
+leaky_0 (a) => (b) {
+    b = LeakyRelu <alpha: float = 0.1> (a)
+}
+<domain: "local", opset_import: ["" : 18]>
+leaky_1 (a) => (b) {
+    b = LeakyRelu <alpha: float = 0.2> (a)
+}
+"""
+
+
+def _run(model: onnx.ModelProto, cond: bool, x: np.ndarray) -> list[np.ndarray]:
+    session = ort.InferenceSession(
+        model.SerializeToString(), providers=["CPUExecutionProvider"]
+    )
+    return session.run(None, {"cond": np.array(cond), "x": x})
+
+
+class DeduplicateFunctionsTest(unittest.TestCase):
+    def test_identical_functions_are_merged(self):
+        model = onnx.parser.parse_model(_MODEL)
+        size = model.ByteSize()
+        x = np.arange(-2, 2, dtype=np.float32)
+        expected = [_run(model, cond, x) for cond in (True, False)]
+
+        result = deduplicator.deduplicate_functions(model)
+
+        # layer_1 and layer_2 are identical to layer_0 once relu_1 is merged
+        self.assertEqual(
+            result.merged,
+            {
+                ("local", "relu_1"): ("local", "relu_0"),
+                ("local", "layer_1"): ("local", "layer_0"),
+                ("local", "layer_2"): ("local", "layer_0"),
+            },
+        )
+        self.assertEqual(result.num_functions_removed, 3)
+        self.assertEqual(result.num_bytes_saved, size - model.ByteSize())
+        self.assertGreater(result.num_bytes_saved, 0)
+        self.assertEqual(
+            [(function.domain, function.name) for function in model.functions],
+            [
+                ("local", "relu_0"),
+                ("local", "layer_0"),
+                ("other", "relu"),
+                ("local", "leaky_0"),
+                ("local", "leaky_1"),
+            ],
+        )
+        self.assertEqual(
+            [node.op_type for node in model.graph.node],
+            ["layer_0", "layer_0", "layer_0", "relu", "leaky_0", "leaky_1", "If"],
+        )
+        then_branch = model.graph.node[-1].attribute[0].g
+        self.assertEqual(then_branch.node[0].op_type, "relu_0")
+        onnx.checker.check_model(model, full_check=True)
+        for cond, expected_outputs in zip((True, False), expected):
+            for output, expected_output in zip(_run(model, cond, x), expected_outputs):
+                np.testing.assert_array_equal(output, expected_output)
+
+    def test_functions_with_identical_nodes_are_not_merged(self):
+        function = """
+            <domain: "local", opset_import: ["" : 18]>
+            {} (x) => (y, z) {{
+                a = RandomUniformLike (x)
+                b = RandomUniformLike (x)
+                y = Identity (a)
+                z = Identity ({})
+            }}
+        """
+        model = onnx.parser.parse_model(
+            """
+            <ir_version: 8, opset_import: ["" : 18, "local" : 1]>
+            agraph (float[N] x) => (float[N] y, float[N] z, float[N] u, float[N] v) {
+                y, z = local.same (x)
+                u, v = local.different (x)
+            }
+            """
+            + function.format("same", "a")
+            + function.format("different", "b")
+        )
+
+        result = deduplicator.deduplicate_functions(model)
+
+        self.assertEqual(result, deduplicator.DeduplicationResult())
+        self.assertEqual(len(model.functions), 2)
+
+    def test_functions_with_different_numbers_of_outputs_are_not_merged(self):
+        function = """
+            <domain: "local", opset_import: ["" : 13]>
+            {} (x) => (y) {{
+                {} = Split <axis = 0> (x)
+            }}
+        """
+        model = onnx.parser.parse_model(
+            """
+            <ir_version: 8, opset_import: ["" : 13, "local" : 1]>
+            agraph (float[6] x) => (float[M] y2, float[N] y3) {
+                y2 = local.split_2 (x)
+                y3 = local.split_3 (x)
+            }
+            """
+            + function.format("split_2", "a, y")
+            + function.format("split_3", "a, y, c")
+        )
+        x = np.arange(6, dtype=np.float32)
+        session = ort.InferenceSession(
+            model.SerializeToString(), providers=["CPUExecutionProvider"]
+        )
+        expected = session.run(None, {"x": x})
+
+        result = deduplicator.deduplicate_functions(model)
+
+        self.assertEqual(result, deduplicator.DeduplicationResult())
+        session = ort.InferenceSession(
+            model.SerializeToString(), providers=["CPUExecutionProvider"]
+        )
+        for output, expected_output in zip(session.run(None, {"x": x}), expected):
+            np.testing.assert_array_equal(output, expected_output)
+
+    def test_model_without_identical_functions_is_unchanged(self):
+        model = onnx.parser.parse_model(_MODEL)
+        deduplicator.deduplicate_functions(model)
+        expected = onnx.ModelProto()
+        expected.CopyFrom(model)
+
+        result = deduplicator.deduplicate_functions(model)
+
+        self.assertEqual(result, deduplicator.DeduplicationResult())
+        self.assertEqual(model, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
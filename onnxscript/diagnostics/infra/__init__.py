@@ -12,7 +12,12 @@ from ._infra import (
     ThreadFlowLocation,
     levels,
 )
-from .context import Diagnostic, DiagnosticContext, RuntimeErrorWithDiagnosticError
+from .context import (
+    Diagnostic,
+    DiagnosticContext,
+    RuntimeErrorWithDiagnosticError,
+    SarifWriter,
+)
 
 __all__ = [
     "Diagnostic",
@@ -26,6 +31,7 @@ __all__ = [
     "Rule",
     "RuleCollection",
     "RuntimeErrorWithDiagnosticError",
+    "SarifWriter",
     "Stack",
     "StackFrame",
     "Tag",
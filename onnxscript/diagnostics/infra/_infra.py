@@ -191,6 +191,18 @@ class Stack:
     frames: List[StackFrame] = dataclasses.field(default_factory=list)
     message: Optional[str] = None
 
+    def num_frames(self) -> int:
+        """Returns the number of frames in this stack."""
+        return len(self.frames)
+
+    def push(self, frame: StackFrame) -> None:
+        """Adds a frame on top of this stack."""
+        self.frames.insert(0, frame)
+
+    def truncate(self, max_frames: int) -> None:
+        """Keeps the newest `max_frames` frames of this stack."""
+        del self.frames[max_frames:]
+
     def sarif(self) -> sarif.Stack:
         """Returns the SARIF representation of this stack."""
         return sarif.Stack(
@@ -313,7 +325,24 @@ class Invocation:
 
 @dataclasses.dataclass
 class DiagnosticOptions:
-    """Options for diagnostic context."""
+    """Options for diagnostic context.
+
+    Attributes:
+        log_verbose: Whether to print the diagnostics in verbose mode.
+        log_level: The minimum level of diagnostics to print.
+        verbosity_level: The minimum level of the diagnostics of successful calls
+            (see `diagnose_call`) that record the signature and the return values of
+            the calls. The arguments and return values of the recorded calls are
+            referenced by the diagnostics until they are logged or serialized. The
+            diagnostics of failed calls always record them.
+        max_stack_frames: The maximum number of stack frames kept by the diagnostics
+            logged in the context. The stacks of the diagnostics logged after the
+            maximum is reached are truncated. No maximum if None. The diagnostics
+            streamed to a SARIF file (see `DiagnosticContext.stream_sarif`) are not
+            kept, and their stacks are not truncated.
+    """
 
     log_verbose: bool = dataclasses.field(default=False)
     log_level: Level = dataclasses.field(default=Level.ERROR)
+    verbosity_level: Level = dataclasses.field(default=Level.NONE)
+    max_stack_frames: Optional[int] = dataclasses.field(default=None)
@@ -5,8 +5,21 @@ from __future__ import annotations
 import contextlib
 import dataclasses
 import gzip
+import json
 import logging
-from typing import Callable, Generator, List, Literal, Mapping, Optional, TypeVar
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    TypeVar,
+)
 
 from onnxscript.diagnostics import infra
 from onnxscript.diagnostics.infra import formatter, sarif, utils
@@ -31,12 +44,16 @@ class Diagnostic:
     tags: List[infra.Tag] = dataclasses.field(default_factory=list)
     source_exception: Optional[Exception] = None
     """The exception that caused this diagnostic to be created."""
+    _deferred_additional_messages: List[formatter.LazyString] = dataclasses.field(
+        init=False, default_factory=list, repr=False
+    )
 
     def __post_init__(self) -> None:
         pass
 
     def sarif(self) -> sarif.Result:
         """Returns the SARIF Result representation of this diagnostic."""
+        self.format_deferred_messages()
         message = self.message or self.rule.message_default_template
         if self.additional_message:
             message_markdown = (
@@ -100,6 +117,24 @@ class Diagnostic:
             self.additional_message = f"{self.additional_message}\n{message}"
         return self
 
+    def with_deferred_additional_message(
+        self: _Diagnostic, message: formatter.LazyString
+    ) -> _Diagnostic:
+        """Adds an additional message that is formatted when it is first needed.
+
+        The message is formatted when the diagnostic is logged by an enabled logger,
+        printed or serialized to SARIF, see `format_deferred_messages`.
+        """
+        self._deferred_additional_messages.append(message)
+        return self
+
+    def format_deferred_messages(self) -> None:
+        """Formats the deferred additional messages into the additional message."""
+        deferred_messages = self._deferred_additional_messages
+        self._deferred_additional_messages = []
+        for message in deferred_messages:
+            self.with_additional_message(str(message))
+
     def with_source_exception(self: _Diagnostic, exception: Exception) -> _Diagnostic:
         """Adds the source exception to the diagnostic."""
         self.source_exception = exception
@@ -110,8 +145,9 @@ class Diagnostic:
         frames_to_skip += 1  # Skip this function.
         stack = utils.python_call_stack(frames_to_skip=frames_to_skip)
         self.with_stack(stack)
-        if len(stack.frames) > 0:
-            self.with_location(stack.frames[0].location)
+        location = stack.top_location()
+        if location is not None:
+            self.with_location(location)
         return stack
 
     def record_python_call(
@@ -127,7 +163,7 @@ class Diagnostic:
         location = utils.function_location(fn)
         location.message = message
         # Add function location to the top of the stack.
-        stack.frames.insert(0, infra.StackFrame(location=location))
+        stack.push(infra.StackFrame(location=location))
         thread_flow_location = infra.ThreadFlowLocation(
             location=location,
             state=state,
@@ -147,6 +183,7 @@ class Diagnostic:
         """
         if self.level.value < log_level.value:
             return
+        self.format_deferred_messages()
         formatter.pretty_print_item_title(f"{self.level.name}: {self.rule.name}")
         print(self.message)
         print(self.additional_message)
@@ -171,6 +208,92 @@ class Diagnostic:
         # TODO: print help url to rule at the end.
 
 
+def _sarif_tool(name: str, version: str, rules: Iterable[infra.Rule]) -> sarif.Tool:
+    return sarif.Tool(
+        driver=sarif.ToolComponent(
+            name=name,
+            version=version,
+            rules=[rule.sarif() for rule in rules],
+        )
+    )
+
+
+def _json_members(obj: Mapping[str, Any]) -> str:
+    """Returns the members of a JSON object, without the enclosing braces."""
+    return json.dumps(obj, separators=(",", ":"))[1:-1]
+
+
+class SarifWriter:
+    """Writes a SARIF log to a file incrementally, one diagnostic at a time.
+
+    Each diagnostic is serialized and written as a SARIF result when it is added, on
+    a line of its own. The tool and the rules of the results are written after the
+    results when the writer is closed, so that the memory used does not grow with
+    the number of results. The file is a complete SARIF log only once the writer is
+    closed.
+
+    Args:
+        file_path: The path of the SARIF file.
+        name: The name of the tool.
+        version: The version of the tool.
+        compress: Whether to compress the file with gzip.
+    """
+
+    def __init__(self, file_path: str, name: str, version: str, compress: bool = False):
+        self._file: IO[str] = (
+            gzip.open(file_path, "wt", encoding="utf-8")
+            if compress
+            else open(file_path, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+        )
+        self._name = name
+        self._version = version
+        # An ordered set of the rules of the results
+        self._rules: Dict[infra.Rule, None] = {}
+        self._num_results = 0
+        self._file.write('{"runs":[{"results":[')
+
+    @property
+    def num_results(self) -> int:
+        """The number of results written."""
+        return self._num_results
+
+    def write(self, diagnostic: Diagnostic) -> None:
+        """Writes a diagnostic as a SARIF result."""
+        if self._file.closed:
+            raise ValueError("The SARIF writer is closed")
+        result = formatter.sarif_to_json(diagnostic.sarif(), indent=None)
+        self._file.write(f"{',' if self._num_results else ''}\n{result}")
+        self._rules[diagnostic.rule] = None
+        self._num_results += 1
+
+    def close(self) -> None:
+        """Writes the tool and the rules and closes the file."""
+        if self._file.closed:
+            return
+        try:
+            run = formatter.sarif_to_dict(
+                sarif.Run(tool=_sarif_tool(self._name, self._version, self._rules), results=[])
+            )
+            del run["results"]
+            log = formatter.sarif_to_dict(
+                sarif.SarifLog(
+                    version=sarif_version.SARIF_VERSION,
+                    schema_uri=sarif_version.SARIF_SCHEMA_LINK,
+                    runs=[],
+                )
+            )
+            del log["runs"]
+            self._file.write(f"\n],{_json_members(run)}}}],{_json_members(log)}}}\n")
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> SarifWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
 class RuntimeErrorWithDiagnosticError(RuntimeError):
     """Runtime error with enclosed diagnostic information."""
 
@@ -195,6 +318,8 @@ class DiagnosticContext:
     _inflight_diagnostics: List[Diagnostic] = dataclasses.field(
         init=False, default_factory=list
     )
+    _sarif_writer: Optional[SarifWriter] = dataclasses.field(init=False, default=None)
+    _num_stack_frames: int = dataclasses.field(init=False, default=0)
 
     def __enter__(self):
         return self
@@ -206,13 +331,7 @@ class DiagnosticContext:
         """Returns the SARIF Run object."""
         unique_rules = {diagnostic.rule for diagnostic in self.diagnostics}
         return sarif.Run(
-            tool=sarif.Tool(
-                driver=sarif.ToolComponent(
-                    name=self.name,
-                    version=self.version,
-                    rules=[rule.sarif() for rule in unique_rules],
-                )
-            ),
+            tool=_sarif_tool(self.name, self.version, unique_rules),
             results=[diagnostic.sarif() for diagnostic in self.diagnostics],
         )
 
@@ -228,18 +347,46 @@ class DiagnosticContext:
         return formatter.sarif_to_json(self.sarif_log())
 
     def dump(self, file_path: str, compress: bool = False) -> None:
-        """Dumps the SARIF log to a file."""
-        if compress:
-            with gzip.open(file_path, "wt", encoding="utf-8") as f:
-                f.write(self.to_json())
-        else:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(self.to_json())
+        """Dumps the SARIF log to a file.
+
+        The results are serialized and written one at a time, see `SarifWriter`.
+        """
+        with SarifWriter(file_path, self.name, self.version, compress=compress) as writer:
+            for diagnostic in self.diagnostics:
+                writer.write(diagnostic)
+
+    @contextlib.contextmanager
+    def stream_sarif(
+        self, file_path: str, compress: bool = False
+    ) -> Generator[SarifWriter, None, None]:
+        """Streams the diagnostics to a SARIF file as they are logged.
+
+        The diagnostics already in the context are written first. The diagnostics
+        logged in the scope of the context manager are written when they are logged
+        and are not added to `diagnostics`, so that the memory used does not grow
+        with their number. The file is a complete SARIF log on exit.
+
+        Args:
+            file_path: The path of the SARIF file.
+            compress: Whether to compress the file with gzip.
+        """
+        if self._sarif_writer is not None:
+            raise RuntimeError("The diagnostics are already streamed to a SARIF file")
+        with SarifWriter(file_path, self.name, self.version, compress=compress) as writer:
+            for diagnostic in self.diagnostics:
+                writer.write(diagnostic)
+            self._sarif_writer = writer
+            try:
+                yield writer
+            finally:
+                self._sarif_writer = None
 
     def log(self, diagnostic: Diagnostic) -> None:
         """Adds a diagnostic to the context.
 
         Use this method to add diagnostics that are not created by the context.
+        When the diagnostics are streamed (see `stream_sarif`), the diagnostic is
+        written to the SARIF file instead.
 
         Args:
             diagnostic: The diagnostic to add.
@@ -248,9 +395,29 @@ class DiagnosticContext:
             raise TypeError(
                 f"Expected diagnostic of type {Diagnostic}, got {type(diagnostic)}"
             )
-        self.diagnostics.append(diagnostic)
-        self.logger.log(diagnostic.level, diagnostic.message)
-        self.logger.log(diagnostic.level, diagnostic.additional_message)
+        if self._sarif_writer is not None:
+            self._sarif_writer.write(diagnostic)
+        else:
+            self._limit_stack_frames(diagnostic)
+            self.diagnostics.append(diagnostic)
+        if self.logger.isEnabledFor(diagnostic.level):
+            diagnostic.format_deferred_messages()
+            self.logger.log(diagnostic.level, diagnostic.message)
+            self.logger.log(diagnostic.level, diagnostic.additional_message)
+
+    def _limit_stack_frames(self, diagnostic: Diagnostic) -> None:
+        """Truncates the stacks of the diagnostic to `options.max_stack_frames`."""
+        max_stack_frames = self.options.max_stack_frames
+        if max_stack_frames is None:
+            return
+        stacks = diagnostic.stacks + [
+            location.stack
+            for location in diagnostic.thread_flow_locations
+            if location.stack is not None
+        ]
+        for stack in stacks:
+            stack.truncate(max(max_stack_frames - self._num_stack_frames, 0))
+            self._num_stack_frames += stack.num_frames()
 
     def log_and_raise_if_error(self, diagnostic: Diagnostic) -> None:
         self.log(diagnostic)
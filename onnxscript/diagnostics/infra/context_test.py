@@ -0,0 +1,134 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from onnxscript.diagnostics import infra
+
+_RULES = [
+    infra.Rule(id=f"TEST000{i}", name=f"rule-{i}", message_default_template=f"rule {i}")
+    for i in range(3)
+]
+
+
+def _diagnostic(index: int) -> infra.Diagnostic:
+    diagnostic = infra.Diagnostic(
+        _RULES[index % len(_RULES)], infra.Level.WARNING, f"#{index}"
+    )
+    diagnostic.with_location(infra.Location(uri="file.py", line=index, snippet="x = 1"))
+    diagnostic.with_additional_message(f"Additional message of #{index}")
+    return diagnostic
+
+
+def _normalized(sarif_log: dict) -> dict:
+    # The order of the rules is unspecified
+    for run in sarif_log["runs"]:
+        run["tool"]["driver"]["rules"].sort(key=lambda rule: rule["id"])
+    return sarif_log
+
+
+class SarifWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "diagnostics.sarif")
+        self.context = infra.DiagnosticContext("test", "1.0")
+
+    def _load(self, compress: bool = False) -> dict:
+        if compress:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                return _normalized(json.load(f))
+        with open(self.path, encoding="utf-8") as f:
+            return _normalized(json.load(f))
+
+    def test_dump_writes_the_same_sarif_log_as_to_json(self):
+        for i in range(5):
+            self.context.log(_diagnostic(i))
+
+        for compress in (False, True):
+            self.context.dump(self.path, compress=compress)
+            self.assertEqual(
+                self._load(compress=compress), _normalized(json.loads(self.context.to_json()))
+            )
+
+    def test_dump_of_empty_context_is_a_sarif_log(self):
+        self.context.dump(self.path)
+
+        sarif_log = self._load()
+        self.assertEqual(sarif_log, _normalized(json.loads(self.context.to_json())))
+        self.assertEqual(sarif_log["runs"][0]["results"], [])
+
+    def test_stream_sarif_writes_the_diagnostics_as_they_are_logged(self):
+        self.context.log(_diagnostic(0))
+        with self.context.stream_sarif(self.path) as writer:
+            self.assertEqual(writer.num_results, 1)
+            for i in range(1, 5):
+                self.context.log(_diagnostic(i))
+            self.assertEqual(writer.num_results, 5)
+            self.assertEqual(len(self.context.diagnostics), 1)
+        self.context.log(_diagnostic(5))
+
+        expected = infra.DiagnosticContext("test", "1.0")
+        for i in range(5):
+            expected.log(_diagnostic(i))
+        self.assertEqual(self._load(), _normalized(json.loads(expected.to_json())))
+        self.assertEqual(len(self.context.diagnostics), 2)
+
+    def test_stream_sarif_completes_the_log_when_an_error_is_raised(self):
+        with self.assertRaises(infra.RuntimeErrorWithDiagnosticError):
+            with self.context.stream_sarif(self.path, compress=True):
+                self.context.log(_diagnostic(0))
+                error = infra.Diagnostic(_RULES[1], infra.Level.ERROR, "failed")
+                self.context.log_and_raise_if_error(error)
+
+        results = self._load(compress=True)["runs"][0]["results"]
+        self.assertEqual([result["level"] for result in results], ["warning", "error"])
+
+    def test_stream_sarif_cannot_be_nested(self):
+        with self.context.stream_sarif(self.path):
+            with self.assertRaises(RuntimeError):
+                with self.context.stream_sarif(self.path + ".nested"):
+                    pass
+
+
+class DiagnosticContextTest(unittest.TestCase):
+    def test_stacks_are_truncated_to_max_stack_frames(self):
+        context = infra.DiagnosticContext(
+            "test", "1.0", options=infra.DiagnosticOptions(max_stack_frames=12)
+        )
+        for i in range(3):
+            diagnostic = _diagnostic(i)
+            diagnostic.record_python_call_stack(frames_to_skip=0)
+            diagnostic.record_python_call(_diagnostic, {}, frames_to_skip=0)
+            context.log(diagnostic)
+
+        num_frames = [
+            [len(stack.frames) for stack in diagnostic.stacks]
+            + [
+                len(location.stack.frames)
+                for location in diagnostic.thread_flow_locations
+                if location.stack is not None
+            ]
+            for diagnostic in context.diagnostics
+        ]
+        # A Python call stack has up to 16 frames and a thread flow stack up to 6
+        self.assertEqual(num_frames, [[12, 0], [0, 0], [0, 0]])
+        (location,) = context.diagnostics[1].locations[1:]
+        self.assertEqual(location.function, self._testMethodName)
+
+    def test_stacks_are_not_truncated_by_default(self):
+        context = infra.DiagnosticContext("test", "1.0")
+        for i in range(3):
+            diagnostic = _diagnostic(i)
+            diagnostic.record_python_call_stack(frames_to_skip=0)
+            context.log(diagnostic)
+
+        for diagnostic in context.diagnostics:
+            (stack,) = diagnostic.stacks
+            self.assertGreater(len(stack.frames), 1)
+            self.assertEqual(stack.frames[0].location.function, self._testMethodName)
+
+
+if __name__ == "__main__":
+    unittest.main()
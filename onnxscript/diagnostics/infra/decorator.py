@@ -116,19 +116,31 @@ def diagnose_call(
             diag.locations.insert(0, fn_location)
             # Add function location to the top of the stack.
             if stack is not None:
-                stack.frames.insert(0, infra.StackFrame(location=fn_location))
-
-            additional_messages = [
-                format_function_signature_in_markdown(fn, args, kwargs, format_argument),
-            ]
+                stack.push(infra.StackFrame(location=fn_location))
 
             return_values: Any = None
             with ctx.add_inflight_diagnostic(diag) as diag:
                 try:
                     return_values = fn(*args, **kwargs)
-                    additional_messages.append(
-                        format_return_values_in_markdown(return_values, format_argument)
-                    )
+                    # The signature and the return values are formatted only if the
+                    # diagnostic is logged or serialized.
+                    if diag.level >= ctx.options.verbosity_level:
+                        diag.with_deferred_additional_message(
+                            formatter.LazyString(
+                                format_function_signature_in_markdown,
+                                fn,
+                                args,
+                                kwargs,
+                                format_argument,
+                            )
+                        )
+                        diag.with_deferred_additional_message(
+                            formatter.LazyString(
+                                format_return_values_in_markdown,
+                                return_values,
+                                format_argument,
+                            )
+                        )
                     return return_values
                 except Exception as e:  # pylint: disable=broad-exception-caught
                     # Record exception.
@@ -137,9 +149,14 @@ def diagnose_call(
                     diag.message = diag.message or ""
                     diag.message += f"Raised from:\n    {type(e).__name__}: {e}"
                     diag.with_source_exception(e)
-                    additional_messages.append(format_exception_in_markdown(e))
-                finally:
+                    additional_messages = [
+                        format_function_signature_in_markdown(
+                            fn, args, kwargs, format_argument
+                        ),
+                        format_exception_in_markdown(e),
+                    ]
                     diag.with_additional_message("\n".join(additional_messages).strip())
+                finally:
                     ctx.log_and_raise_if_error(diag)
 
         return wrapper
@@ -0,0 +1,95 @@
+import logging
+import unittest
+from unittest import mock
+
+from onnxscript.diagnostics import infra
+from onnxscript.diagnostics.infra import decorator, formatter, utils
+
+_RULE = infra.Rule(id="TEST0001", name="test-rule", message_default_template="test")
+
+
+def _add_one(diagnostic_context: infra.DiagnosticContext, x: int) -> int:
+    del diagnostic_context  # Unused
+    if x < 0:
+        raise ValueError("x must be non-negative")
+    return x + 1
+
+
+class DiagnoseCallTest(unittest.TestCase):
+    def _diagnose_add_one(self, options: infra.DiagnosticOptions):
+        context = infra.DiagnosticContext("test", "1.0", options=options)
+        format_argument = mock.Mock(side_effect=formatter.format_argument)
+        add_one = decorator.diagnose_call(_RULE, format_argument=format_argument)(_add_one)
+        return context, add_one, format_argument
+
+    def test_arguments_are_formatted_when_the_diagnostic_is_serialized(self):
+        context, add_one, format_argument = self._diagnose_add_one(infra.DiagnosticOptions())
+        self.assertEqual(add_one(context, 1), 2)
+        format_argument.assert_not_called()
+
+        (diagnostic,) = context.diagnostics
+        result = diagnostic.sarif()
+        self.assertEqual(
+            diagnostic.additional_message,
+            "### Function Signature _add_one\n"
+            "- diagnostic_context: "
+            "<class 'onnxscript.diagnostics.infra.context.DiagnosticContext'>\n"
+            "- x: <class 'int'>\n"
+            "- Return value: <class 'int'>",
+        )
+        self.assertIn(diagnostic.additional_message, result.message.markdown)
+        self.assertEqual(format_argument.call_count, 3)
+        # The messages are formatted once
+        diagnostic.sarif()
+        self.assertEqual(format_argument.call_count, 3)
+
+    def test_arguments_are_formatted_when_the_diagnostic_is_logged(self):
+        context, add_one, format_argument = self._diagnose_add_one(infra.DiagnosticOptions())
+        with self.assertLogs(context.logger, logging.DEBUG) as logs:
+            add_one(context, 1)
+
+        self.assertIn("- Return value: <class 'int'>", logs.output[-1])
+        self.assertEqual(format_argument.call_count, 3)
+
+    def test_calls_below_verbosity_level_do_not_record_arguments(self):
+        context, add_one, format_argument = self._diagnose_add_one(
+            infra.DiagnosticOptions(verbosity_level=infra.Level.NOTE)
+        )
+        add_one(context, 1)
+
+        (diagnostic,) = context.diagnostics
+        diagnostic.sarif()
+        self.assertIsNone(diagnostic.additional_message)
+        format_argument.assert_not_called()
+
+    def test_failed_calls_record_arguments_and_exception(self):
+        context, add_one, _ = self._diagnose_add_one(
+            infra.DiagnosticOptions(verbosity_level=infra.Level.ERROR)
+        )
+        with self.assertRaises(infra.RuntimeErrorWithDiagnosticError) as cm:
+            add_one(context, -1)
+
+        diagnostic = cm.exception.diagnostic
+        self.assertEqual(diagnostic.level, infra.Level.ERROR)
+        self.assertIn("ValueError: x must be non-negative", str(diagnostic.message))
+        self.assertIn("- x: <class 'int'>", str(diagnostic.additional_message))
+        self.assertIn("### Exception log", str(diagnostic.additional_message))
+
+    def test_function_location_is_inspected_once_per_function(self):
+        def function():
+            pass
+
+        with mock.patch.object(
+            utils.inspect, "getsourcelines", wraps=utils.inspect.getsourcelines
+        ) as getsourcelines:
+            first = utils.function_location(function)
+            second = utils.function_location(function)
+
+        getsourcelines.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertTrue(str(first.message).endswith("<locals>.function"))
+
+
+if __name__ == "__main__":
+    unittest.main()
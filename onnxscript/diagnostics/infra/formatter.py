@@ -3,7 +3,7 @@ from __future__ import annotations
 import dataclasses
 import json
 import re
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 from onnxscript._internal import runtime_typing
 from onnxscript.diagnostics.infra import sarif
@@ -15,9 +15,34 @@ _SarifClass = Union[
     sarif.Run,
     sarif.ReportingDescriptor,
     sarif.Result,
+    sarif.Tool,
 ]
 
 
+class LazyString:
+    """A string formatted by calling a function when it is first converted with str().
+
+    The function and its arguments are released once the string is formatted.
+    """
+
+    __slots__ = ("_func", "_args", "_kwargs", "_value")
+
+    def __init__(self, func: Callable[..., str], *args: Any, **kwargs: Any):
+        self._func: Optional[Callable[..., str]] = func
+        self._args = args
+        self._kwargs = kwargs
+        self._value: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            assert self._func is not None
+            self._value = self._func(*self._args, **self._kwargs)
+            self._func = None
+            self._args = ()
+            self._kwargs = {}
+        return self._value
+
+
 @runtime_typing.checked
 def snake_case_to_camel_case(s: str) -> str:
     splits = s.split("_")
@@ -36,50 +61,73 @@ def kebab_case_to_snake_case(s: str) -> str:
     return s.replace("-", "_")
 
 
-@runtime_typing.checked
-def _convert_key(
-    object: Union[Dict[str, Any], Any], convert: Callable[[str], str]
-) -> Union[Dict[str, Any], Any]:
-    """Convert and update keys in a dictionary with "convert".
+_camel_case_keys: Dict[str, str] = {}
 
-    Any value that is a dictionary will be recursively updated.
-    Any value that is a list will be recursively searched.
 
-    Args:
-        object: The object to update.
-        convert: The function to convert the keys, e.g. `kebab_case_to_snake_case`.
+def _camel_case_key(key: str) -> str:
+    camel_case_key = _camel_case_keys.get(key)
+    if camel_case_key is None:
+        camel_case_key = _camel_case_keys[key] = snake_case_to_camel_case(key)
+    return camel_case_key
 
-    Returns:
-        The updated object.
-    """
-    if not isinstance(object, Dict):
-        return object
+
+_dataclass_field_names: Dict[type, Optional[Tuple[str, ...]]] = {}
+
+
+def _field_names(cls: type) -> Optional[Tuple[str, ...]]:
+    """Returns the names of the fields of a dataclass, or None for other classes."""
+    try:
+        return _dataclass_field_names[cls]
+    except KeyError:
+        field_names = (
+            tuple(field.name for field in dataclasses.fields(cls))
+            if dataclasses.is_dataclass(cls)
+            else None
+        )
+        _dataclass_field_names[cls] = field_names
+        return field_names
+
+
+def _sarif_value(value: Any) -> Any:
+    if isinstance(value, (str, int, float)):
+        return value
+    field_names = _field_names(type(value))
+    if field_names is not None:
+        return _sarif_dict((name, getattr(value, name)) for name in field_names)
+    if isinstance(value, dict):
+        return _sarif_dict(value.items())
+    if isinstance(value, (list, tuple)):
+        return [_sarif_value(elem) for elem in value]
+    return value
+
+
+def _sarif_dict(items: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
     new_dict = {}
-    for k, v in object.items():
-        new_k = convert(k)
-        if isinstance(v, Dict):
-            new_v = _convert_key(v, convert)
-        elif isinstance(v, List):
-            new_v = [_convert_key(elem, convert) for elem in v]
-        else:
-            new_v = v
-        if new_v is None:
+    for key, value in items:
+        if value is None:
             # Otherwise unnesseraily bloated sarif log with "null"s.
             continue
-        if new_v == -1:
+        if value == -1:
             # WAR: -1 as default value shouldn't be logged into sarif.
             continue
+        new_dict[_camel_case_key(key)] = _sarif_value(value)
+    return new_dict
 
-        new_dict[new_k] = new_v
 
-    return new_dict
+@runtime_typing.checked
+def sarif_to_dict(attr_cls_obj: _SarifClass) -> Dict[str, Any]:
+    """Returns the JSON object of a SARIF object.
+
+    The keys are converted to camel case, and the fields that are None or -1 are
+    omitted. The SARIF objects are converted directly, without copying them with
+    `dataclasses.asdict` first.
+    """
+    return _sarif_value(attr_cls_obj)
 
 
 @runtime_typing.checked
 def sarif_to_json(attr_cls_obj: _SarifClass, indent: Optional[str] = " ") -> str:
-    dict = dataclasses.asdict(attr_cls_obj)
-    dict = _convert_key(dict, snake_case_to_camel_case)
-    return json.dumps(dict, indent=indent, separators=(",", ":"))
+    return json.dumps(sarif_to_dict(attr_cls_obj), indent=indent, separators=(",", ":"))
 
 
 @runtime_typing.checked
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import functools
 import inspect
+import linecache
+import sys
 import traceback
-from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+import types
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from onnxscript._internal import runtime_typing
 from onnxscript.diagnostics.infra import _infra, formatter
@@ -25,21 +28,106 @@ def python_frame(frame: traceback.FrameSummary) -> _infra.StackFrame:
     )
 
 
-@runtime_typing.checked
-def python_call_stack(frames_to_skip: int = 0, frames_to_log: int = 16) -> _infra.Stack:
-    """Returns the current Python call stack."""
+def _code_frame(code: types.CodeType, line: Optional[int]) -> _infra.StackFrame:
+    """Returns a StackFrame for the given line of the given code object."""
+    snippet = linecache.getline(code.co_filename, line).strip() if line is not None else None
+
+    return _infra.StackFrame(
+        location=_infra.Location(
+            uri=code.co_filename,
+            line=line,
+            snippet=snippet,
+            function=code.co_name,
+            message=snippet,
+        )
+    )
+
+
+class PythonCallStack(_infra.Stack):
+    """A Python call stack whose frames are created when they are first accessed.
+
+    The stack holds the code object and the line number of each Python frame. The
+    StackFrames, with the source lines of the frames, are created when `frames` is
+    first accessed, e.g. when the stack is serialized to SARIF or printed. Counting,
+    pushing and truncating the frames does not create them.
+    """
+
+    # pylint: disable-next=super-init-not-called
+    def __init__(
+        self,
+        code_lines: List[Tuple[types.CodeType, Optional[int]]],
+        message: Optional[str] = None,
+    ):
+        self._code_lines = code_lines
+        self._top_frames: List[_infra.StackFrame] = []
+        self._frames: Optional[List[_infra.StackFrame]] = None
+        self.message = message
+
+    @property
+    def frames(self) -> List[_infra.StackFrame]:
+        if self._frames is None:
+            self._frames = self._top_frames + [
+                _code_frame(code, line) for code, line in self._code_lines
+            ]
+            self._top_frames = []
+            self._code_lines = []
+        return self._frames
+
+    @frames.setter
+    def frames(self, frames: List[_infra.StackFrame]) -> None:
+        self._frames = frames
+        self._top_frames = []
+        self._code_lines = []
+
+    def top_location(self) -> Optional[_infra.Location]:
+        """Returns the location of the top frame, without creating the other frames."""
+        if self._frames is not None or self._top_frames:
+            return self.frames[0].location if self.frames else None
+        if not self._code_lines:
+            return None
+        return _code_frame(*self._code_lines[0]).location
+
+    def num_frames(self) -> int:
+        if self._frames is not None:
+            return len(self._frames)
+        return len(self._top_frames) + len(self._code_lines)
+
+    def push(self, frame: _infra.StackFrame) -> None:
+        if self._frames is not None:
+            self._frames.insert(0, frame)
+        else:
+            self._top_frames.insert(0, frame)
+
+    def truncate(self, max_frames: int) -> None:
+        if self._frames is not None:
+            del self._frames[max_frames:]
+        else:
+            del self._top_frames[max_frames:]
+            del self._code_lines[max(max_frames - len(self._top_frames), 0) :]
+
+
+def python_call_stack(frames_to_skip: int = 0, frames_to_log: int = 16) -> PythonCallStack:
+    """Returns the current Python call stack.
+
+    Only the code objects and the line numbers of the frames are captured, see
+    `PythonCallStack`.
+    """
     if frames_to_skip < 0:
         raise ValueError("frames_to_skip must be non-negative")
     if frames_to_log < 0:
         raise ValueError("frames_to_log must be non-negative")
-    frames_to_skip += 2  # Skip this function and beartype.
-    stack = _infra.Stack()
-    # Frames are returned in order of oldest to newest.
-    frames = traceback.extract_stack(limit=frames_to_skip + frames_to_log)
-    frames.reverse()
-    stack.frames = [python_frame(frame) for frame in frames[frames_to_skip:]]
-    stack.message = "Python call stack"
-    return stack
+    frames_to_skip += 1  # Skip this function.
+    # Frames are walked in order of newest to oldest.
+    frame: Optional[types.FrameType] = sys._getframe()  # pylint: disable=protected-access
+    for _ in range(frames_to_skip):
+        if frame is None:
+            break
+        frame = frame.f_back
+    code_lines: List[Tuple[types.CodeType, Optional[int]]] = []
+    while frame is not None and len(code_lines) < frames_to_log:
+        code_lines.append((frame.f_code, frame.f_lineno))
+        frame = frame.f_back
+    return PythonCallStack(code_lines, message="Python call stack")
 
 
 @functools.lru_cache
@@ -53,16 +141,27 @@ def _function_source_info(fn: Callable) -> Tuple[Sequence[str], int, Optional[st
     return source_lines, lineno, inspect.getsourcefile(fn)
 
 
+@functools.lru_cache(maxsize=1024)
+def _function_location_info(fn: Callable) -> Tuple[Optional[str], int, str, str]:
+    """Returns the source file path, line number, snippet and display name of a function.
+
+    Cached per callable, as diagnosed functions are called many times. The cache is
+    bounded, since it keeps the callables alive.
+    """
+    source_lines, lineno, uri = _function_source_info(fn)
+    snippet = source_lines[0].strip() if len(source_lines) > 0 else "<unknown>"
+    return uri, lineno, snippet, formatter.display_name(fn)
+
+
 @runtime_typing.checked
 def function_location(fn: Callable) -> _infra.Location:
     """Returns a Location for the given function."""
-    source_lines, lineno, uri = _function_source_info(fn)
-    snippet = source_lines[0].strip() if len(source_lines) > 0 else "<unknown>"
+    uri, lineno, snippet, name = _function_location_info(fn)
     return _infra.Location(
         uri=uri,
         line=lineno,
         snippet=snippet,
-        message=formatter.display_name(fn),
+        message=name,
     )
 
 
@@ -0,0 +1,57 @@
+import traceback
+import unittest
+from unittest import mock
+
+from onnxscript.diagnostics import infra
+from onnxscript.diagnostics.infra import utils
+
+
+class PythonCallStackTest(unittest.TestCase):
+    def test_frames_are_the_frames_of_the_traceback(self):
+        for skip, limit in ((0, 16), (1, 3), (0, 0), (2, 1000)):
+            # Captured on the same line, so that the line numbers are the same
+            stack, expected = utils.python_call_stack(skip, limit), traceback.extract_stack()
+            expected.reverse()
+            self.assertEqual(
+                stack.frames,
+                [utils.python_frame(frame) for frame in expected[skip : skip + limit]],
+            )
+            self.assertEqual(stack.message, "Python call stack")
+
+    def test_source_lines_are_read_when_the_frames_are_accessed(self):
+        with mock.patch.object(
+            utils.linecache, "getline", wraps=utils.linecache.getline
+        ) as getline:
+            stack = utils.python_call_stack(frames_to_log=4)
+            stack.push(infra.StackFrame(location=infra.Location(uri="pushed.py")))
+            self.assertEqual(stack.num_frames(), 5)
+            getline.assert_not_called()
+
+            sarif_stack = stack.sarif()
+
+        self.assertEqual(getline.call_count, 4)
+        self.assertEqual(len(sarif_stack.frames), 5)
+        self.assertEqual(stack.frames[0].location.uri, "pushed.py")
+        self.assertEqual(stack.frames[1].location.function, self._testMethodName)
+        self.assertEqual(
+            stack.frames[1].location.snippet,
+            "stack = utils.python_call_stack(frames_to_log=4)",
+        )
+
+    def test_truncate_keeps_the_newest_frames(self):
+        for materialize in (False, True):
+            stack = utils.python_call_stack(frames_to_log=4)
+            stack.push(infra.StackFrame(location=infra.Location(uri="pushed.py")))
+            if materialize:
+                self.assertEqual(len(stack.frames), 5)
+            stack.truncate(2)
+
+            self.assertEqual(stack.num_frames(), 2)
+            self.assertEqual(
+                [frame.location.function for frame in stack.frames],
+                [None, self._testMethodName],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
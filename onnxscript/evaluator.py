@@ -5,11 +5,18 @@
 from __future__ import annotations
 
 import abc
+import collections
 import contextlib
+import dataclasses
+import itertools
+import logging
 import pprint
+import struct
+import threading
 from typing import (
     Any,
     Callable,
+    Iterable,
     Mapping,
     Optional,
     Protocol,
@@ -24,10 +31,12 @@ import onnx
 import onnx.defs
 import onnx.helper
 import onnx.reference
+import onnx.shape_inference
+from onnx.defs import onnx_opset_version
 from typing_extensions import TypeAlias
 
 from onnxscript import irbuilder, onnx_opset, tensor, values
-from onnxscript._internal import autocast, param_manipulation, utils
+from onnxscript._internal import autocast, utils
 
 UserModeValue: TypeAlias = Union[Optional[np.ndarray], Sequence["UserModeValue"]]
 
@@ -45,6 +54,8 @@ ExtendedModeValue: TypeAlias = Union[
 
 _T = TypeVar("_T")
 
+logger = logging.getLogger("onnxscript")
+
 
 def _adapt_to_eager_mode(inputs: ExtendedModeValue) -> tuple[EagerModeValue, bool]:
     """Adapts inputs into representation used by onnxscript eager mode.
@@ -276,11 +287,11 @@ class BaseEvaluator(Evaluator, abc.ABC):
             args: The positional arguments to the function.
             kwargs: The keyword arguments to the function.
         """
-        param_schemas = function.param_schemas()
+        param_binder = function.param_binder()
+        assert param_binder is not None
         # Split happens in the evaluator instead of the OnnxFunction __call__ method
         # so that evaluators can control behaviors like whether to fill in default values for attributes.
-        tagged_args, tagged_kwargs = param_manipulation.tag_arguments_with_param_schemas(
-            param_schemas,
+        tagged_args, tagged_kwargs = param_binder.tag_arguments(
             args,
             kwargs,
             fill_defaults=False,
@@ -400,12 +411,37 @@ def _numpy_to_onnxscript_value(
     )
 
 
+def _relax_type_proto_shape(type_proto: onnx.TypeProto) -> None:
+    """Replaces all dimensions in a TypeProto with unknown dimensions, keeping the rank."""
+    if type_proto.HasField("tensor_type"):
+        if type_proto.tensor_type.HasField("shape"):
+            rank = len(type_proto.tensor_type.shape.dim)
+            type_proto.tensor_type.shape.ClearField("dim")
+            for _ in range(rank):
+                type_proto.tensor_type.shape.dim.add()
+    elif type_proto.HasField("sequence_type"):
+        _relax_type_proto_shape(type_proto.sequence_type.elem_type)
+    elif type_proto.HasField("optional_type"):
+        _relax_type_proto_shape(type_proto.optional_type.elem_type)
+
+
 def _prepare_model_and_inputs_for_eager(
     schema: onnx.defs.OpSchema,
     args: Sequence[Any],
     kwargs: Mapping[str, Any],
     implicit_args: Optional[Mapping[str, Any]],
+    relax_input_shapes: bool = False,
 ):
+    """Builds a single-node model for the op call and the inputs to run it with.
+
+    Args:
+        schema: The schema of the op to call.
+        args: The ONNX inputs to the op.
+        kwargs: The ONNX attributes to the op.
+        implicit_args: Outer scope values referenced by graph-valued attributes.
+        relax_input_shapes: If True, the model inputs only specify the rank of
+            the values, so that the model can be reused for inputs of other shapes.
+    """
     implicit_args = implicit_args or {}
     # Convert input values to ORT representation-type:
     args = [_onnxscript_to_numpy_value(x) for x in args]
@@ -432,6 +468,9 @@ def _prepare_model_and_inputs_for_eager(
     )
     input_value_infos = utils.values_to_value_infos(zip(inputs, args))
     implicit_value_infos = utils.values_to_value_infos(implicit_args.items())
+    if relax_input_shapes:
+        for value_info in (*input_value_infos, *implicit_value_infos):
+            _relax_type_proto_shape(value_info.type)
     output_value_infos = [
         onnx.helper.make_value_info(name, onnx.TypeProto()) for name in outputs
     ]
@@ -453,12 +492,146 @@ def _prepare_model_and_inputs_for_eager(
     return model, session_run_input, inputs
 
 
-def _call_ort(
+def _value_signature(value: Any, static_shape: bool = False) -> Any:
+    """Returns a hashable signature of the ONNX type of a runtime value.
+
+    By default only the element type and rank of tensors are considered, since
+    the models built for cached sessions do not specify concrete dimensions.
+    """
+    if value is None:
+        return None
+    if isinstance(value, tensor.Tensor):
+        value = value.value
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape if static_shape else value.ndim)
+    if isinstance(value, list):
+        # The type of a sequence is determined by its first element. See utils.value_to_type_proto.
+        return ("sequence", _value_signature(value[0], static_shape) if value else None)
+    raise TypeError(f"Unexpected onnxscript value type '{type(value)}'.")
+
+
+def _attribute_signature(value: Any) -> Any:
+    """Returns a hashable representation of an attribute value."""
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, tensor.Tensor):
+        return _attribute_signature(value.value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_attribute_signature(v) for v in value)
+    if hasattr(value, "SerializeToString"):
+        # Protobuf messages such as GraphProto and TensorProto
+        return (type(value).__name__, value.SerializeToString())
+    if isinstance(value, (float, np.floating)):
+        # Floats are keyed by their bits, since 0.0 == -0.0 and nan != nan
+        return ("float", struct.pack("<d", value))
+    return (type(value).__name__, value)
+
+
+@dataclasses.dataclass(frozen=True)
+class SessionCacheInfo:
+    """Statistics of the InferenceSession cache of an :class:`ORTEvaluator`.
+
+    Attributes:
+        hits: Number of op calls that reused a cached session.
+        misses: Number of op calls that required creating a new session.
+        evictions: Number of sessions discarded because the cache was full.
+        maxsize: Maximum number of sessions kept in the cache.
+        currsize: Number of sessions currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _SessionCache:
+    """A bounded LRU cache of InferenceSessions keyed by op call signature."""
+
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}.")
+        self._maxsize = maxsize
+        self._entries: collections.OrderedDict[
+            Any, tuple[Any, onnx.ModelProto]
+        ] = collections.OrderedDict()
+        # Keys of op calls whose model cannot be created without concrete input shapes.
+        self._static_shape_keys: set[Any] = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Any) -> Optional[tuple[Any, onnx.ModelProto]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(self, key: Any, session: Any, model: onnx.ModelProto) -> None:
+        with self._lock:
+            self._entries[key] = (session, model)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def requires_static_shapes(self, key: Any) -> bool:
+        return key in self._static_shape_keys
+
+    def mark_requires_static_shapes(self, key: Any) -> None:
+        with self._lock:
+            self._static_shape_keys.add(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._static_shape_keys.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> SessionCacheInfo:
+        with self._lock:
+            return SessionCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+
+def _session_cache_key(
     schema: onnx.defs.OpSchema,
     args: Sequence[Any],
     kwargs: Mapping[str, Any],
     implicit_args: Optional[Mapping[str, Any]],
-):
+    static_shape: bool = False,
+) -> tuple[Any, ...]:
+    implicit_args = implicit_args or {}
+    return (
+        _schema_id(schema),
+        tuple(_value_signature(arg, static_shape) for arg in args),
+        tuple(
+            (name, _value_signature(value, static_shape))
+            for name, value in implicit_args.items()
+        ),
+        tuple(
+            (name, _attribute_signature(value))
+            for name, value in sorted(kwargs.items())
+            if value is not None
+        ),
+        compute_num_outputs(schema, args, kwargs),
+    )
+
+
+def _create_ort_session(schema: onnx.defs.OpSchema, model: onnx.ModelProto):
     # Delay import onnxruntime so that onnxscript can be used without
     # installing onnxruntime.
     import onnxruntime as ort  # pylint: disable=import-outside-toplevel
@@ -468,12 +641,8 @@ def _call_ort(
         InvalidGraph,
     )
 
-    model, session_run_input, inputs = _prepare_model_and_inputs_for_eager(
-        schema, args, kwargs, implicit_args
-    )
-
     try:
-        session = ort.InferenceSession(
+        return ort.InferenceSession(
             model.SerializeToString(), providers=("CPUExecutionProvider",)
         )
     except (Fail, InvalidGraph, InvalidArgument) as e:
@@ -483,6 +652,91 @@ def _call_ort(
             f"with onnx model\n{utils.proto2text(model)}"
         ) from e
 
+
+def _ort_errors() -> tuple[type[Exception], ...]:
+    """Returns the exceptions raised by onnxruntime, which do not derive from RuntimeError."""
+    from onnxruntime.capi.onnxruntime_pybind11_state import (  # pylint: disable=import-outside-toplevel,redefined-builtin
+        Fail,
+        InvalidArgument,
+        InvalidGraph,
+        NotImplemented,
+        RuntimeException,
+    )
+
+    return (Fail, InvalidArgument, InvalidGraph, NotImplemented, RuntimeException)
+
+
+def _run_errors() -> tuple[type[Exception], ...]:
+    """Returns the exceptions raised when a session fails to run."""
+    return (RuntimeError, *_ort_errors())
+
+
+def _compilation_errors() -> tuple[type[Exception], ...]:
+    """Returns the exceptions raised when a function cannot be compiled into a session."""
+    return (EagerModeError, onnx.shape_inference.InferenceError, *_ort_errors())
+
+
+def _get_or_create_cached_session(
+    session_cache: _SessionCache,
+    schema: onnx.defs.OpSchema,
+    args: Sequence[Any],
+    kwargs: Mapping[str, Any],
+    implicit_args: Optional[Mapping[str, Any]],
+):
+    """Returns a session for the op call from the cache, creating it on a miss."""
+    cache_key = _session_cache_key(schema, args, kwargs, implicit_args)
+    if session_cache.requires_static_shapes(cache_key):
+        cache_key = _session_cache_key(schema, args, kwargs, implicit_args, static_shape=True)
+    cached = session_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    model, _, _ = _prepare_model_and_inputs_for_eager(
+        schema, args, kwargs, implicit_args, relax_input_shapes=True
+    )
+    try:
+        session = _create_ort_session(schema, model)
+    except EagerModeError:
+        # Shape inference of some ops (e.g. Resize with a 'sizes' input) fails
+        # when the input dimensions are unknown. Specialize on the concrete shapes.
+        session_cache.mark_requires_static_shapes(cache_key)
+        cache_key = _session_cache_key(schema, args, kwargs, implicit_args, static_shape=True)
+        model, _, _ = _prepare_model_and_inputs_for_eager(schema, args, kwargs, implicit_args)
+        session = _create_ort_session(schema, model)
+    session_cache.put(cache_key, session, model)
+    return session, model
+
+
+def _call_ort(
+    schema: onnx.defs.OpSchema,
+    args: Sequence[Any],
+    kwargs: Mapping[str, Any],
+    implicit_args: Optional[Mapping[str, Any]],
+    session_cache: Optional[_SessionCache] = None,
+):
+    from onnxruntime.capi.onnxruntime_pybind11_state import (  # pylint: disable=import-outside-toplevel
+        Fail,
+    )
+
+    if session_cache is None:
+        model, session_run_input, inputs = _prepare_model_and_inputs_for_eager(
+            schema, args, kwargs, implicit_args
+        )
+        session = _create_ort_session(schema, model)
+    else:
+        session, model = _get_or_create_cached_session(
+            session_cache, schema, args, kwargs, implicit_args
+        )
+        inputs = [_rename_io("input", i, arg) for i, arg in enumerate(args)]
+        session_run_input = {
+            name: _onnxscript_to_numpy_value(arg)
+            for name, arg in zip(inputs, args)
+            if name != ""
+        }
+        session_run_input.update(
+            {k: _onnxscript_to_numpy_value(v) for k, v in (implicit_args or {}).items()}
+        )
+
     try:
         result = session.run(None, session_run_input)
     except (RuntimeError, Fail) as e:
@@ -504,10 +758,45 @@ def _schema_id(schema: onnx.defs.OpSchema) -> tuple[str, str, int]:
 
 
 class ORTEvaluator(BaseEvaluator):
-    """Evaluates ONNX ops using ONNX Runtime."""
+    """Evaluates ONNX ops using ONNX Runtime.
+
+    InferenceSessions created for op calls are kept in a bounded LRU cache, keyed
+    by the op schema, the element types and ranks of the inputs, the attribute
+    values and the number of outputs. Calls with a matching signature reuse the
+    cached session instead of building a new model and session.
+    """
+
+    def __init__(
+        self,
+        ignore_unknown_function_kwargs: bool = False,
+        session_cache_size: int = 256,
+    ):
+        """Initializes an ORTEvaluator.
+
+        Args:
+            ignore_unknown_function_kwargs: Whether to ignore unknown keyword arguments
+                when evaluating an OnnxFunction.
+            session_cache_size: Maximum number of InferenceSessions to cache.
+                Set to 0 to disable caching.
+        """
+        super().__init__(ignore_unknown_function_kwargs=ignore_unknown_function_kwargs)
+        self._session_cache: Optional[_SessionCache] = (
+            _SessionCache(session_cache_size) if session_cache_size > 0 else None
+        )
+
+    def session_cache_info(self) -> SessionCacheInfo:
+        """Returns the hit/miss/eviction statistics of the session cache."""
+        if self._session_cache is None:
+            return SessionCacheInfo(hits=0, misses=0, evictions=0, maxsize=0, currsize=0)
+        return self._session_cache.info()
+
+    def clear_session_cache(self) -> None:
+        """Discards all cached sessions and resets the statistics."""
+        if self._session_cache is not None:
+            self._session_cache.clear()
 
     def _eval(self, schema, inputs, attributes, closure):
-        return _call_ort(schema, inputs, attributes, closure)
+        return _call_ort(schema, inputs, attributes, closure, self._session_cache)
 
 
 class OnnxReferenceRuntimeEvaluator(BaseEvaluator):
@@ -536,6 +825,540 @@ class OnnxReferenceRuntimeEvaluator(BaseEvaluator):
 ort_evaluator = ORTEvaluator()
 
 
+def _prepare_model_for_function(
+    function: values.OnnxFunction,
+    inputs: Sequence[Any],
+    attributes: Mapping[str, Any],
+    symbolic_batch_dim: bool = False,
+) -> tuple[onnx.ModelProto, list[str]]:
+    """Builds a model with a single call to the function, specialized on the inputs.
+
+    Functions called by the function are included as model-local functions.
+    If ``symbolic_batch_dim`` is True, the first dimension of the inputs is left
+    unspecified, so that the model accepts batches of any size.
+
+    Returns:
+        The model and the names of its inputs, which is an empty string
+        for omitted optional inputs.
+    """
+    function_proto = function.to_function_proto()
+    function_ir = function.function_ir
+
+    args = [_onnxscript_to_numpy_value(x) for x in inputs]
+    input_names = [_rename_io("input", i, arg) for i, arg in enumerate(args)]
+    while input_names and input_names[-1] == "":
+        input_names.pop()
+    output_names = [f"output{i}" for i in range(len(function_proto.output))]
+
+    attr_types = {attr.name: attr.type for attr in function_ir.attrs}
+    attr_protos = []
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        attr_type = attr_types[key]
+        # Cast int to float if needed
+        if attr_type == onnx.AttributeProto.FLOAT:
+            value = float(value)
+        elif attr_type == onnx.AttributeProto.FLOATS:
+            value = [float(v) for v in value]
+        attr_protos.append(
+            autocast.pyvalue_to_onnx_attribute(
+                key, value, lambda key=key: f"attr_{key}", attr_type
+            )
+        )
+
+    node = onnx.helper.make_node(
+        function_proto.name, input_names, output_names, domain=function_proto.domain
+    )
+    node.attribute.extend(attr_protos)
+    input_value_infos = utils.values_to_value_infos(zip(input_names, args))
+    if symbolic_batch_dim:
+        for value_info in input_value_infos:
+            value_info.type.tensor_type.shape.dim[0].dim_param = "batch"
+    graph = onnx.helper.make_graph(
+        [node],
+        "function_graph",
+        input_value_infos,
+        [onnx.helper.make_value_info(name, onnx.TypeProto()) for name in output_names],
+    )
+
+    local_functions = [*function_ir.called_functions.values(), function_proto]
+    opsets: dict[str, int] = {function_proto.domain: function.opset.version}
+    for local_function in local_functions:
+        for opset_id in local_function.opset_import:
+            opsets[opset_id.domain] = max(opsets.get(opset_id.domain, 1), opset_id.version)
+    if "" not in opsets:
+        opsets[""] = onnx_opset_version()
+    model = onnx.helper.make_model(
+        graph,
+        functions=local_functions,
+        opset_imports=[
+            onnx.helper.make_opsetid(domain, version) for domain, version in opsets.items()
+        ],
+        ir_version=irbuilder.select_ir_version(opsets[""]),
+    )
+    model = onnx.shape_inference.infer_shapes(model)
+    return model, input_names
+
+
+def _split_function_arguments(
+    function: values.OnnxFunction,
+    args: Sequence[ExtendedModeValue],
+    kwargs: Mapping[str, ExtendedModeValue],
+    allow_extra_kwargs: bool = False,
+) -> tuple[list[EagerModeValue], dict[str, ExtendedModeValue], bool]:
+    """Splits the arguments of a function call into ONNX inputs and attributes.
+
+    Returns:
+        The inputs in the order of the function inputs, converted to eager mode
+        values, the attributes, and whether any input was a numpy array.
+    """
+    param_binder = function.param_binder()
+    assert param_binder is not None
+    tagged_args, tagged_kwargs = param_binder.tag_arguments(
+        args,
+        kwargs,
+        fill_defaults=True,
+        allow_extra_kwargs=allow_extra_kwargs,
+    )
+
+    named_inputs: dict[str, EagerModeValue] = {}
+    attributes: dict[str, ExtendedModeValue] = {}
+    has_array = False
+    for arg, param_schema in (*tagged_args, *tagged_kwargs.values()):
+        if param_schema.is_input:
+            adapted_arg, _has_array = _adapt_to_eager_mode(arg)
+            has_array = has_array or _has_array
+            named_inputs[param_schema.name] = adapted_arg
+        else:
+            attributes[param_schema.name] = arg
+    inputs = [named_inputs.get(var.name) for var in function.function_ir.inputs]
+    return inputs, attributes, has_array
+
+
+class CompiledORTEvaluator(ORTEvaluator):
+    """Evaluates OnnxFunctions as a whole using ONNX Runtime.
+
+    Instead of running the Python body of an OnnxFunction and dispatching every
+    op call separately, the function is exported as a model containing a single
+    call to the function, with the functions it calls included as model-local
+    functions. The model is specialized on the concrete input types and shapes
+    and the attribute values, and executed with a single ``session.run``.
+    One InferenceSession is cached per specialization.
+
+    Op calls outside of OnnxFunctions are evaluated as in :class:`ORTEvaluator`.
+    Functions that cannot be compiled fall back to op-by-op evaluation.
+    """
+
+    def __init__(
+        self,
+        ignore_unknown_function_kwargs: bool = False,
+        session_cache_size: int = 256,
+    ):
+        """Initializes a CompiledORTEvaluator.
+
+        Args:
+            ignore_unknown_function_kwargs: Whether to ignore unknown keyword arguments
+                when evaluating an OnnxFunction.
+            session_cache_size: Maximum number of InferenceSessions to cache for
+                op calls and for function specializations, respectively.
+                Set to 0 to disable caching.
+        """
+        super().__init__(
+            ignore_unknown_function_kwargs=ignore_unknown_function_kwargs,
+            session_cache_size=session_cache_size,
+        )
+        self._function_session_cache: Optional[_SessionCache] = (
+            _SessionCache(session_cache_size) if session_cache_size > 0 else None
+        )
+        # Specializations of functions that could not be compiled and are evaluated
+        # op by op, by cache key, least recently used first. At most
+        # session_cache_size of them are kept.
+        self._uncompilable_specializations: collections.OrderedDict[
+            Any, None
+        ] = collections.OrderedDict()
+        self._uncompilable_specializations_maxsize = session_cache_size
+        self._uncompilable_specializations_lock = threading.Lock()
+
+    def function_session_cache_info(self) -> SessionCacheInfo:
+        """Returns the statistics of the cache of compiled function sessions."""
+        if self._function_session_cache is None:
+            return SessionCacheInfo(hits=0, misses=0, evictions=0, maxsize=0, currsize=0)
+        return self._function_session_cache.info()
+
+    def clear_session_cache(self) -> None:
+        super().clear_session_cache()
+        if self._function_session_cache is not None:
+            self._function_session_cache.clear()
+        with self._uncompilable_specializations_lock:
+            self._uncompilable_specializations.clear()
+
+    def _is_uncompilable(self, cache_key: Any) -> bool:
+        with self._uncompilable_specializations_lock:
+            if cache_key not in self._uncompilable_specializations:
+                return False
+            self._uncompilable_specializations.move_to_end(cache_key)
+            return True
+
+    def _mark_uncompilable(self, cache_key: Any) -> None:
+        with self._uncompilable_specializations_lock:
+            self._uncompilable_specializations[cache_key] = None
+            while (
+                len(self._uncompilable_specializations)
+                > self._uncompilable_specializations_maxsize
+            ):
+                self._uncompilable_specializations.popitem(last=False)
+
+    def _get_or_create_function_session(
+        self,
+        cache_key: Any,
+        function: values.OnnxFunction,
+        inputs: Sequence[Any],
+        attributes: Mapping[str, Any],
+    ):
+        if self._function_session_cache is not None:
+            cached = self._function_session_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        model, _ = _prepare_model_for_function(function, inputs, attributes)
+        session = _create_ort_session(function.op_schema, model)
+        if self._function_session_cache is not None:
+            self._function_session_cache.put(cache_key, session, model)
+        return session, model
+
+    def eval_function(
+        self,
+        function: values.OnnxFunction,
+        args: Sequence[ExtendedModeValue],
+        kwargs: Mapping[str, ExtendedModeValue],
+    ):
+        """Evaluates a function with a single ONNX Runtime session run.
+
+        Args:
+            function: The OnnxFunction to evaluate.
+            args: The positional arguments to the function.
+            kwargs: The keyword arguments to the function.
+        """
+        inputs, attributes, has_array = _split_function_arguments(
+            function, args, kwargs, self._ignore_unknown_function_kwargs
+        )
+        cache_key = (
+            function,
+            tuple(_value_signature(x, static_shape=True) for x in inputs),
+            tuple(
+                (name, _attribute_signature(value))
+                for name, value in sorted(attributes.items())
+                if value is not None
+            ),
+        )
+        if self._is_uncompilable(cache_key):
+            return super().eval_function(function, args, kwargs)
+
+        try:
+            session, model = self._get_or_create_function_session(
+                cache_key, function, inputs, attributes
+            )
+        except _compilation_errors() as e:
+            logger.warning(
+                "Unable to compile function '%s', falling back to op-by-op evaluation: %s",
+                function.name,
+                e,
+            )
+            self._mark_uncompilable(cache_key)
+            return super().eval_function(function, args, kwargs)
+
+        session_run_input = {
+            name: _onnxscript_to_numpy_value(arg)
+            for name, arg in zip(
+                (_rename_io("input", i, arg) for i, arg in enumerate(inputs)), inputs
+            )
+            if name != ""
+        }
+        try:
+            result = session.run(None, session_run_input)
+        except _run_errors() as e:
+            raise EagerModeError(
+                f"Unable to execute function {function.name!r} due to {e!r}"
+                f"\ninputs:\n{pprint.pformat(session_run_input)}"
+                f"\n{utils.proto2text(model)}"
+            ) from e
+
+        outputs = tuple(_numpy_to_onnxscript_value(x) for x in result)
+        output = outputs[0] if len(outputs) == 1 else outputs
+        return _adapt_to_user_mode(output) if has_array else output
+
+
+# Ops of the default domain whose outputs are computed element by element from
+# their inputs broadcast together. A function made of these ops can be evaluated
+# on a stack of samples as a single batch.
+_ELEMENTWISE_OPS = frozenset(
+    [
+        "Abs",
+        "Acos",
+        "Acosh",
+        "Add",
+        "And",
+        "Asin",
+        "Asinh",
+        "Atan",
+        "Atanh",
+        "BitShift",
+        "BitwiseAnd",
+        "BitwiseNot",
+        "BitwiseOr",
+        "BitwiseXor",
+        "Cast",
+        "Ceil",
+        "Celu",
+        "Cos",
+        "Cosh",
+        "Div",
+        "Elu",
+        "Equal",
+        "Erf",
+        "Exp",
+        "Floor",
+        "Greater",
+        "GreaterOrEqual",
+        "HardSigmoid",
+        "HardSwish",
+        "Identity",
+        "IsInf",
+        "IsNaN",
+        "LeakyRelu",
+        "Less",
+        "LessOrEqual",
+        "Log",
+        "Max",
+        "Mean",
+        "Min",
+        "Mish",
+        "Mod",
+        "Mul",
+        "Neg",
+        "Not",
+        "Or",
+        "Pow",
+        "Reciprocal",
+        "Relu",
+        "Round",
+        "Selu",
+        "Sigmoid",
+        "Sign",
+        "Sin",
+        "Sinh",
+        "Softplus",
+        "Softsign",
+        "Sqrt",
+        "Sub",
+        "Sum",
+        "Tan",
+        "Tanh",
+        "ThresholdedRelu",
+        "Where",
+        "Xor",
+    ]
+)
+
+
+def _constant_shape(node: onnx.NodeProto) -> Optional[tuple[int, ...]]:
+    """Returns the shape of the output of a Constant node, or None if it is unknown."""
+    for attr in node.attribute:
+        if attr.name in ("value_float", "value_int", "value_string"):
+            return ()
+        if attr.name == "value" and not attr.ref_attr_name:
+            return tuple(attr.t.dims)
+        if attr.name in ("value_floats", "value_ints", "value_strings"):
+            if attr.ref_attr_name:
+                return None
+            return (len(attr.floats or attr.ints or attr.strings),)
+    return None
+
+
+def _elementwise_output_shapes(
+    function_proto: onnx.FunctionProto, input_shapes: Sequence[tuple[int, ...]]
+) -> Optional[list[tuple[int, ...]]]:
+    """Returns the output shapes of a function that only computes elementwise ops.
+
+    Returns None if the function uses other ops, or constants that are not scalars,
+    since the function could then not be evaluated on a batch of samples.
+    """
+    shapes: dict[str, tuple[int, ...]] = dict(zip(function_proto.input, input_shapes))
+    for node in function_proto.node:
+        if node.domain not in ("", "ai.onnx"):
+            return None
+        if node.op_type == "Constant":
+            shape = _constant_shape(node)
+            if shape != ():
+                # Constants of higher rank would broadcast with the batch dimension
+                return None
+        elif node.op_type == "CastLike":
+            shape = shapes[node.input[0]]
+        elif node.op_type in _ELEMENTWISE_OPS:
+            try:
+                shape = np.broadcast_shapes(*(shapes[name] for name in node.input if name))
+            except ValueError:
+                return None
+        else:
+            return None
+        for name in node.output:
+            shapes[name] = shape
+    return [shapes[name] for name in function_proto.output]
+
+
+def _stack_batch_inputs(
+    samples: Sequence[Sequence[EagerModeValue]],
+) -> list[tensor.Tensor]:
+    """Stacks the inputs of samples with identical input shapes along a new leading axis.
+
+    The inputs are padded with leading dimensions of size 1 up to the highest input
+    rank, so that they broadcast with each other as the inputs of a sample do.
+    """
+    shapes = [tuple(x.shape) for x in samples[0]]  # type: ignore[union-attr]
+    rank = max(len(shape) for shape in shapes)
+    batch_size = len(samples)
+    return [
+        tensor.Tensor(
+            np.stack([sample[i].value for sample in samples]).reshape(  # type: ignore[union-attr]
+                (batch_size,) + (1,) * (rank - len(shape)) + shape
+            )
+        )
+        for i, shape in enumerate(shapes)
+    ]
+
+
+def map_batch(
+    function: values.OnnxFunction,
+    inputs: Iterable[Any],
+    batch_size: int = 64,
+    **kwargs: Any,
+) -> list[Any]:
+    """Evaluates a function on many samples with ONNX Runtime.
+
+    The samples of each chunk of ``batch_size`` samples are grouped by the type and
+    shape of their inputs. If the function only computes elementwise ops, the inputs
+    of each group are stacked along a new leading axis and evaluated with a single
+    ``session.run``. One InferenceSession is created per group and reused for all
+    batches. Other functions are evaluated sample by sample, with one InferenceSession
+    per input signature as in :class:`CompiledORTEvaluator`.
+
+    Args:
+        function: The OnnxFunction to evaluate.
+        inputs: The samples. Each sample is a tuple of positional arguments to the
+            function, or a single argument.
+        batch_size: The maximum number of samples evaluated together.
+        kwargs: Keyword arguments passed to the function for every sample.
+
+    Returns:
+        The outputs of the function for each sample, in the order of the samples.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    function_proto = function.to_function_proto()
+    per_sample_evaluator = CompiledORTEvaluator()
+    # Batched sessions and the output shapes of a sample, per input signature.
+    # None if the samples of the signature are evaluated one by one.
+    batched_sessions: dict[Any, Optional[tuple[Any, list[tuple[int, ...]]]]] = {}
+    results: list[Any] = []
+    iterator = iter(inputs)
+    while True:
+        chunk = list(itertools.islice(iterator, batch_size))
+        if not chunk:
+            break
+        samples = []
+        groups: dict[Any, list[int]] = collections.defaultdict(list)
+        for index, sample in enumerate(chunk):
+            args = sample if isinstance(sample, tuple) else (sample,)
+            sample_inputs, attributes, has_array = _split_function_arguments(
+                function, args, kwargs
+            )
+            samples.append((args, sample_inputs, attributes, has_array))
+            key = (
+                tuple(_value_signature(x, static_shape=True) for x in sample_inputs),
+                tuple(
+                    (name, _attribute_signature(value))
+                    for name, value in sorted(attributes.items())
+                    if value is not None
+                ),
+            )
+            groups[key].append(index)
+
+        chunk_results: list[Any] = [None] * len(chunk)
+        for key, indices in groups.items():
+            if key not in batched_sessions:
+                _, sample_inputs, attributes, _ = samples[indices[0]]
+                batched_sessions[key] = _create_batched_session(
+                    function, function_proto, sample_inputs, attributes
+                )
+            batched_session = batched_sessions[key]
+            if batched_session is None:
+                for index in indices:
+                    chunk_results[index] = per_sample_evaluator.eval_function(
+                        function, samples[index][0], kwargs
+                    )
+                continue
+
+            session, output_shapes = batched_session
+            batch_inputs = _stack_batch_inputs([samples[index][1] for index in indices])
+            session_run_input = {
+                _rename_io("input", i, x): x.value for i, x in enumerate(batch_inputs)
+            }
+            try:
+                batch_outputs = session.run(None, session_run_input)
+            except _run_errors() as e:
+                raise EagerModeError(
+                    f"Unable to execute function {function.name!r} on a batch due to {e!r}"
+                ) from e
+            for position, index in enumerate(indices):
+                outputs = tuple(
+                    tensor.Tensor(np.reshape(batch_output[position], shape))
+                    for batch_output, shape in zip(batch_outputs, output_shapes)
+                )
+                output = outputs[0] if len(outputs) == 1 else outputs
+                chunk_results[index] = (
+                    _adapt_to_user_mode(output) if samples[index][3] else output
+                )
+        results.extend(chunk_results)
+    return results
+
+
+def _create_batched_session(
+    function: values.OnnxFunction,
+    function_proto: onnx.FunctionProto,
+    inputs: Sequence[EagerModeValue],
+    attributes: Mapping[str, Any],
+) -> Optional[tuple[Any, list[tuple[int, ...]]]]:
+    """Creates a session evaluating the function on batches of samples like ``inputs``.
+
+    Returns:
+        The session and the shapes of the outputs for one sample, or None if the
+        function cannot be evaluated on a batch of such samples.
+    """
+    if not inputs or not all(isinstance(x, tensor.Tensor) for x in inputs):
+        return None
+    input_shapes = [tuple(x.shape) for x in inputs]  # type: ignore[union-attr]
+    output_shapes = _elementwise_output_shapes(function_proto, input_shapes)
+    if output_shapes is None:
+        return None
+    batch_inputs = _stack_batch_inputs([inputs])
+    try:
+        model, _ = _prepare_model_for_function(
+            function, batch_inputs, attributes, symbolic_batch_dim=True
+        )
+        session = _create_ort_session(function.op_schema, model)
+    except _compilation_errors() as e:
+        logger.warning(
+            "Unable to evaluate function '%s' on a batch, falling back to "
+            "evaluating samples one by one: %s",
+            function.name,
+            e,
+        )
+        return None
+    return session, output_shapes
+
+
 class ORTMixedEvaluator(ORTEvaluator):
     """Evaluates ONNX ops using ONNX Runtime, unless an overriding python implementation is registered.
 
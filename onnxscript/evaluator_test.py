@@ -1,6 +1,9 @@
 import unittest
+from unittest import mock
 
 import numpy as np
+import onnx
+from onnxruntime.capi import onnxruntime_pybind11_state as ort_state
 
 from onnxscript import evaluator, graph, script
 from onnxscript.onnx_opset import opset17 as op
@@ -60,5 +63,248 @@ class ORTEvaluatorTest(unittest.TestCase):
                 _ = test_function(x, unknown=42)  # pylint: disable=unexpected-keyword-arg
 
 
+class ORTEvaluatorSessionCacheTest(unittest.TestCase):
+    def test_session_is_reused_for_inputs_of_same_dtype_and_rank(self):
+        ort_evaluator = evaluator.ORTEvaluator()
+        with evaluator.default_as(ort_evaluator):
+            x = op.Add(np.ones((2, 3), dtype=np.float32), np.ones((2, 3), dtype=np.float32))
+            y = op.Add(np.ones((4, 5), dtype=np.float32), np.ones((4, 5), dtype=np.float32))
+
+        np.testing.assert_equal(x.value, np.full((2, 3), 2, dtype=np.float32))
+        np.testing.assert_equal(y.value, np.full((4, 5), 2, dtype=np.float32))
+        info = ort_evaluator.session_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.currsize, 1)
+
+    def test_session_is_not_reused_when_dtype_or_attributes_differ(self):
+        ort_evaluator = evaluator.ORTEvaluator()
+        x = np.arange(6, dtype=np.float32).reshape(2, 3)
+        with evaluator.default_as(ort_evaluator):
+            op.ReduceSum(x, keepdims=0)
+            op.ReduceSum(x, keepdims=1)
+            op.ReduceSum(x.astype(np.float64), keepdims=1)
+
+        info = ort_evaluator.session_cache_info()
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(info.misses, 3)
+
+    def test_session_is_not_reused_for_float_attributes_of_other_sign(self):
+        ort_evaluator = evaluator.ORTEvaluator()
+        with evaluator.default_as(ort_evaluator):
+            positive_zero = op.Constant(value_float=0.0)
+            negative_zero = op.Constant(value_float=-0.0)
+
+        self.assertFalse(np.signbit(positive_zero.value))
+        self.assertTrue(np.signbit(negative_zero.value))
+        self.assertEqual(ort_evaluator.session_cache_info().misses, 2)
+
+    def test_least_recently_used_session_is_evicted(self):
+        ort_evaluator = evaluator.ORTEvaluator(session_cache_size=1)
+        x = np.ones((2,), dtype=np.float32)
+        with evaluator.default_as(ort_evaluator):
+            op.Relu(x)
+            op.Neg(x)
+            op.Relu(x)
+
+        info = ort_evaluator.session_cache_info()
+        self.assertEqual(info.misses, 3)
+        self.assertEqual(info.evictions, 2)
+        self.assertEqual(info.currsize, 1)
+
+    def test_session_is_specialized_on_shapes_when_inference_requires_them(self):
+        ort_evaluator = evaluator.ORTEvaluator()
+        x = np.ones((1, 1, 2, 2), dtype=np.float32)
+        with evaluator.default_as(ort_evaluator):
+            y = op.Resize(x, None, None, np.array([1, 1, 4, 4], dtype=np.int64))
+            z = op.Resize(x, None, None, np.array([1, 1, 4, 4], dtype=np.int64))
+
+        np.testing.assert_equal(y.value, np.ones((1, 1, 4, 4), dtype=np.float32))
+        np.testing.assert_equal(z.value, y.value)
+        info = ort_evaluator.session_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+
+    def test_session_cache_can_be_disabled(self):
+        ort_evaluator = evaluator.ORTEvaluator(session_cache_size=0)
+        x = np.ones((2,), dtype=np.float32)
+        with evaluator.default_as(ort_evaluator):
+            np.testing.assert_equal(op.Relu(x).value, x)
+            np.testing.assert_equal(op.Relu(x).value, x)
+
+        self.assertEqual(ort_evaluator.session_cache_info().currsize, 0)
+
+
+@script()
+def _scale(x, alpha: float = 2.0):
+    return op.Mul(x, alpha)
+
+
+@script()
+def _scale_and_shift(x, y, alpha: float):
+    scaled = _scale(x, alpha=alpha)
+    return op.Add(scaled, y), op.Relu(scaled)
+
+
+class CompiledORTEvaluatorTest(unittest.TestCase):
+    def test_function_with_nested_function_call_is_evaluated_in_one_session(self):
+        compiled_evaluator = evaluator.CompiledORTEvaluator()
+        x = np.arange(6, dtype=np.float32).reshape(2, 3)
+        with evaluator.default_as(compiled_evaluator):
+            shifted, scaled = _scale_and_shift(x, x, alpha=3)
+
+        np.testing.assert_allclose(shifted, x * 4)
+        np.testing.assert_allclose(scaled, x * 3)
+        self.assertEqual(compiled_evaluator.function_session_cache_info().misses, 1)
+        # No op was evaluated individually
+        self.assertEqual(compiled_evaluator.session_cache_info().misses, 0)
+
+    def test_session_is_cached_per_specialization(self):
+        compiled_evaluator = evaluator.CompiledORTEvaluator()
+        x = np.ones((2, 3), dtype=np.float32)
+        with evaluator.default_as(compiled_evaluator):
+            _scale(x)
+            _scale(x + 1)
+            np.testing.assert_allclose(_scale(x, alpha=5.0), x * 5)
+            _scale(np.ones((4,), dtype=np.float32))
+
+        info = compiled_evaluator.function_session_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 3)
+
+    def test_failed_specialization_falls_back_to_op_by_op_evaluation(self):
+        compiled_evaluator = evaluator.CompiledORTEvaluator()
+        create_ort_session = evaluator._create_ort_session  # pylint: disable=protected-access
+
+        def fail_for_function_with_double_input(schema, model):
+            if (
+                schema.name == "_scale"
+                and model.graph.input[0].type.tensor_type.elem_type == onnx.TensorProto.DOUBLE
+            ):
+                raise ort_state.NotImplemented("No kernel")
+            return create_ort_session(schema, model)
+
+        with mock.patch.object(
+            evaluator, "_create_ort_session", side_effect=fail_for_function_with_double_input
+        ), evaluator.default_as(compiled_evaluator):
+            for _ in range(2):
+                np.testing.assert_allclose(_scale(np.ones(3)), np.full(3, 2.0))
+                np.testing.assert_allclose(
+                    _scale(np.ones(3, dtype=np.float32)), np.full(3, 2.0)
+                )
+
+        info = compiled_evaluator.function_session_cache_info()
+        # The specialization for float inputs is still compiled
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        self.assertGreater(compiled_evaluator.session_cache_info().misses, 0)
+
+    def test_least_recently_failed_specialization_is_compiled_again(self):
+        compiled_evaluator = evaluator.CompiledORTEvaluator(session_cache_size=1)
+        create_ort_session = evaluator._create_ort_session  # pylint: disable=protected-access
+        failed_shapes = []
+
+        def fail_for_function(schema, model):
+            if schema.name != "_scale":
+                return create_ort_session(schema, model)
+            failed_shapes.append(model.graph.input[0].type.tensor_type.shape.dim[0].dim_value)
+            raise ort_state.NotImplemented("No kernel")
+
+        with mock.patch.object(
+            evaluator, "_create_ort_session", side_effect=fail_for_function
+        ), evaluator.default_as(compiled_evaluator):
+            for size in (3, 3, 4, 3):
+                np.testing.assert_allclose(_scale(np.ones(size)), np.full(size, 2.0))
+
+        # Only the last failed specialization is remembered
+        self.assertEqual(failed_shapes, [3, 4, 3])
+
+    def test_onnxruntime_errors_during_run_are_wrapped(self):
+        @script()
+        def reshape(x, shape):
+            return op.Reshape(x, shape)
+
+        with evaluator.default_as(evaluator.CompiledORTEvaluator()):
+            with self.assertRaises(evaluator.EagerModeError):
+                reshape(np.ones(6, dtype=np.float32), np.array([4], dtype=np.int64))
+
+    def test_outputs_match_op_by_op_evaluation(self):
+        x = np.random.rand(3, 4).astype(np.float32)
+        y = np.random.rand(3, 4).astype(np.float32)
+        expected = _scale_and_shift[evaluator.ORTEvaluator()](x, y, 0.5)
+        actual = _scale_and_shift[evaluator.CompiledORTEvaluator()](x, y, 0.5)
+        for expected_output, actual_output in zip(expected, actual):
+            np.testing.assert_allclose(actual_output, expected_output)
+
+
+@script()
+def _leaky_relu_shift(x, y, alpha: float = 0.1):
+    return op.Add(op.LeakyRelu(x, alpha=alpha), y), op.Neg(y)
+
+
+@script()
+def _row_sum(x):
+    return op.ReduceSum(x, op.Constant(value_ints=[-1]), keepdims=0)
+
+
+class MapBatchTest(unittest.TestCase):
+    def test_elementwise_function_is_evaluated_in_batches(self):
+        samples = [
+            (np.random.randn(3, 4).astype(np.float32), np.array(i, np.float32))
+            for i in range(10)
+        ]
+        with mock.patch.object(
+            evaluator,
+            "_create_ort_session",
+            wraps=evaluator._create_ort_session,  # pylint: disable=protected-access
+        ) as create_session:
+            results = _leaky_relu_shift.map_batch(samples, batch_size=4, alpha=0.5)
+
+        # One session for all batches, including the last smaller one
+        create_session.assert_called_once()
+        self.assertEqual(len(results), len(samples))
+        for (x, y), (shifted, negated) in zip(samples, results):
+            np.testing.assert_allclose(shifted, np.where(x > 0, x, 0.5 * x) + y, rtol=1e-6)
+            # The scalar input broadcasts as in the evaluation of a single sample
+            self.assertEqual(negated.shape, ())
+            np.testing.assert_allclose(negated, -y)
+
+    def test_samples_of_different_shapes_keep_their_order(self):
+        samples = [
+            np.ones((2,), np.float32),
+            np.ones((3, 2), np.float32),
+            np.zeros((2,), np.float32),
+        ]
+        results = _leaky_relu_shift.map_batch([(x, x) for x in samples])
+        for x, (shifted, negated) in zip(samples, results):
+            np.testing.assert_allclose(shifted, 2 * x)
+            np.testing.assert_allclose(negated, -x)
+
+    def test_other_functions_are_evaluated_per_sample(self):
+        samples = [np.random.rand(2, 5).astype(np.float32) for _ in range(5)]
+        with mock.patch.object(
+            evaluator,
+            "_create_ort_session",
+            wraps=evaluator._create_ort_session,  # pylint: disable=protected-access
+        ) as create_session:
+            results = _row_sum.map_batch(samples, batch_size=2)
+
+        create_session.assert_called_once()
+        for x, result in zip(samples, results):
+            np.testing.assert_allclose(result, x.sum(axis=-1), rtol=1e-6)
+
+    def test_onnxruntime_errors_during_batch_run_are_wrapped(self):
+        session = mock.Mock()
+        session.run.side_effect = ort_state.Fail("Run failed")
+        samples = [(np.ones(2, np.float32), np.ones(2, np.float32))] * 2
+        with mock.patch.object(evaluator, "_create_ort_session", return_value=session):
+            with self.assertRaises(evaluator.EagerModeError):
+                _leaky_relu_shift.map_batch(samples)
+
+    def test_batch_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            _row_sum.map_batch([], batch_size=0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,736 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+"""A persistent on-disk cache of converted onnxscript functions.
+
+Converting the Python source of a function into ONNX is done again by every
+process that defines the function. The cache stores the serialized FunctionProto,
+the parameter schemas and the OpSchema of converted functions so that other
+processes can use them without running the converter.
+
+The cache is disabled unless the ``ONNXSCRIPT_FUNCTION_CACHE_DIR`` environment
+variable is set to a directory. Entries are keyed by the source of the module
+defining the function, the location of the function in it, the values of the
+globals it refers to (including the parameter schemas of the functions it calls),
+the opset, the source of the converter and the versions of onnxscript and onnx.
+Functions with closures, or referring to global values of unknown kinds, are never
+cached because the values they use are not part of the key.
+
+Entries are written to a temporary file and atomically renamed, so many processes
+can share the same directory. Entries are pickled: only use a directory that is
+writable by trusted users.
+
+Usage:
+
+    python -m onnxscript.function_cache warm [--workers N] [modules ...]
+    python -m onnxscript.function_cache info
+    python -m onnxscript.function_cache prune [--max-age-days N] [--max-size-mb N]
+    python -m onnxscript.function_cache clear
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import dataclasses
+import hashlib
+import importlib
+import logging
+import os
+import pickle
+import pkgutil
+import re
+import sys
+import tempfile
+import threading
+import time
+import types
+import typing
+from typing import Any, Optional, Sequence
+
+import onnx
+import onnx.defs
+
+import onnxscript
+from onnxscript import onnx_types, values
+
+logger = logging.getLogger("onnxscript")
+
+CACHE_DIR_ENV = "ONNXSCRIPT_FUNCTION_CACHE_DIR"
+
+# Bump when the content of the entries changes
+_FORMAT_VERSION = 1
+_ENTRY_SUFFIX = ".entry"
+_TEMP_SUFFIX = ".tmp"
+# Temporary files older than this are left over by killed writers
+_TEMP_FILE_MAX_AGE = 3600.0
+
+# Modules and packages whose source determines the result of a conversion
+_CONVERTER_MODULES = (
+    "converter.py",
+    "irbuilder.py",
+    "type_annotation.py",
+    "values.py",
+    "function_cache.py",
+    "onnx_types.py",
+    "sourceinfo.py",
+    "_internal/analysis.py",
+    "_internal/ast_utils.py",
+    "_internal/autocast.py",
+    "_internal/param_manipulation.py",
+    "onnx_opset",
+)
+
+_TORCH_LIB_OPS = "onnxscript.function_libs.torch_lib.ops"
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """A converted function loaded from the cache.
+
+    Attributes:
+        function_proto: The serialized FunctionProto.
+        param_schemas: The parameter schemas of the function.
+        op_schema: The OpSchema of the function.
+    """
+
+    function_proto: bytes
+    param_schemas: tuple[values.ParamSchema, ...]
+    op_schema: onnx.defs.OpSchema
+
+
+@dataclasses.dataclass(frozen=True)
+class EntryInfo:
+    """Information about an entry of the cache.
+
+    Attributes:
+        path: Path of the entry.
+        size: Size of the entry in bytes.
+        mtime: Time the entry was last written or used.
+        name: Qualified name of the function, or None if the entry is unreadable.
+        stale: Whether the entry can no longer be used by this installation.
+    """
+
+    path: str
+    size: int
+    mtime: float
+    name: Optional[str]
+    stale: bool
+
+
+_file_hashes: dict[tuple[str, int, int], str] = {}
+
+
+def _file_hash(path: str) -> Optional[str]:
+    """Returns the sha256 of a file, memoized by path, size and modification time."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    digest = _file_hashes.get(key)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        _file_hashes[key] = digest
+    return digest
+
+
+def _source_hash(path: str) -> str:
+    """Returns the hash of a source file, or of the Python files of a package."""
+    if not os.path.isdir(path):
+        return str(_file_hash(path))
+    files = sorted(
+        os.path.join(directory, name)
+        for directory, _, names in os.walk(path)
+        for name in names
+        if name.endswith(".py")
+    )
+    return hashlib.sha256(
+        "\n".join(
+            f"{os.path.relpath(file, path)}:{_file_hash(file)}" for file in files
+        ).encode()
+    ).hexdigest()
+
+
+_converter_fingerprint: Optional[str] = None
+
+
+def _get_converter_fingerprint() -> str:
+    """Returns a hash of the versions and sources the conversion depends on."""
+    global _converter_fingerprint  # pylint: disable=global-statement
+    if _converter_fingerprint is None:
+        package_dir = os.path.dirname(onnxscript.__file__)
+        parts = [
+            str(_FORMAT_VERSION),
+            getattr(onnxscript, "__version__", ""),
+            onnx.__version__,
+            *(_source_hash(os.path.join(package_dir, name)) for name in _CONVERTER_MODULES),
+        ]
+        _converter_fingerprint = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    return _converter_fingerprint
+
+
+def _opset_key(opset: Optional[values.Opset]) -> str:
+    return "" if opset is None else f"{opset.domain}:{opset.version}"
+
+
+class _UnhashableValueError(Exception):
+    """Raised for global values whose effect on a conversion is not known."""
+
+
+_CONSTANT_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _module_hash(module_name: str) -> Optional[str]:
+    module = sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    return None if path is None else _file_hash(path)
+
+
+def _value_fingerprint(value: Any) -> Any:
+    """Returns a picklable summary of everything in a global value used by the converter.
+
+    Raises:
+        _UnhashableValueError: If the value is not one of the kinds of values known
+            to be used by the converter.
+    """
+    if isinstance(value, _CONSTANT_TYPES):
+        return (type(value).__name__, repr(value))
+    if isinstance(value, (tuple, list)):
+        return (type(value).__name__, *(_value_fingerprint(item) for item in value))
+    if isinstance(value, (values.OnnxFunction, values.TracedOnnxFunction)):
+        # Calls are converted according to the split of the parameters of the callee
+        return (
+            "function",
+            _opset_key(value.opset),
+            value.name,
+            tuple(_param_schema_to_tuple(param) for param in value.param_schemas()),
+        )
+    if isinstance(value, values.Op):
+        return ("op", _opset_key(value.opset), value.name)
+    if isinstance(value, values.Opset):
+        return ("opset", _opset_key(value))
+    if isinstance(value, types.ModuleType):
+        # E.g. constants referred to as module.NAME
+        return ("module", value.__name__, _module_hash(value.__name__))
+    if isinstance(value, typing.TypeVar):
+        return (
+            "type_var",
+            value.__name__,
+            tuple(_value_fingerprint(constraint) for constraint in value.__constraints__),
+            _value_fingerprint(value.__bound__),
+        )
+    if isinstance(value, type):
+        if issubclass(value, onnx_types.TensorType):
+            return ("tensor_type", value.__name__, repr(getattr(value, "shape", None)))
+        return ("type", value.__module__, value.__qualname__, _module_hash(value.__module__))
+    if typing.get_origin(value) is not None:
+        # E.g. Optional[FLOAT] or Sequence[INT64]
+        return (
+            "generic",
+            repr(typing.get_origin(value)),
+            tuple(_value_fingerprint(arg) for arg in typing.get_args(value)),
+        )
+    if getattr(value, "__module__", None) == "typing":
+        # E.g. Optional, used in annotations
+        return ("typing", repr(value))
+    if isinstance(value, (types.FunctionType, types.BuiltinFunctionType)):
+        # E.g. the graph decorator of the bodies of Scan and Loop
+        return (
+            "callable",
+            value.__module__,
+            value.__qualname__,
+            _module_hash(value.__module__),
+        )
+    raise _UnhashableValueError(f"{type(value).__name__} {value!r}")
+
+
+def _code_names(code: types.CodeType) -> set[str]:
+    """Returns the names of the globals and attributes used by code and nested code."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(_code_names(const))
+    return names
+
+
+def _globals_fingerprint(pyfun: types.FunctionType) -> str:
+    """Returns a hash of the global values a function and its annotations refer to.
+
+    The values come from the module defining the function, or from other modules.
+    Constants are folded into the converted function, and the called functions
+    determine which arguments of the calls are inputs and which are attributes.
+
+    Raises:
+        _UnhashableValueError: If a global value cannot be hashed.
+    """
+    names = _code_names(pyfun.__code__)
+    for annotation in pyfun.__annotations__.values():
+        if isinstance(annotation, str):
+            names.update(re.findall(r"[A-Za-z_]\w*", annotation))
+    global_values = pyfun.__globals__
+    parts = [
+        (name, _value_fingerprint(global_values[name]))
+        for name in sorted(names)
+        if name in global_values and global_values[name] is not pyfun
+    ]
+    for annotation in pyfun.__annotations__.values():
+        if not isinstance(annotation, str):
+            parts.append(("annotation", _value_fingerprint(annotation)))
+    for default in (*(pyfun.__defaults__ or ()), *(pyfun.__kwdefaults__ or {}).values()):
+        parts.append(("default", _value_fingerprint(default)))
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+# The functions whose key is being computed. Computing the key of a function
+# computes the keys of the functions it calls, which must not call it in turn.
+_keys_in_progress = threading.local()
+
+
+def _formal_parameter_to_tuple(param: onnx.defs.OpSchema.FormalParameter) -> tuple:
+    return (
+        param.name,
+        param.type_str,
+        param.description,
+        int(param.option),
+        param.is_homogeneous,
+        param.min_arity,
+        int(param.differentiation_category),
+    )
+
+
+def _formal_parameter_from_tuple(param: tuple) -> onnx.defs.OpSchema.FormalParameter:
+    name, type_str, description, option, is_homogeneous, min_arity, category = param
+    return onnx.defs.OpSchema.FormalParameter(
+        name,
+        type_str,
+        description,
+        param_option=onnx.defs.OpSchema.FormalParameterOption(option),
+        is_homogeneous=is_homogeneous,
+        min_arity=min_arity,
+        differentiation_category=onnx.defs.OpSchema.DifferentiationCategory(category),
+    )
+
+
+def _op_schema_to_dict(schema: onnx.defs.OpSchema) -> dict[str, Any]:
+    """Returns the arguments needed to reconstruct an OpSchema."""
+    return {
+        "name": schema.name,
+        "domain": schema.domain,
+        "since_version": schema.since_version,
+        "doc": schema.doc or "",
+        "inputs": [_formal_parameter_to_tuple(param) for param in schema.inputs],
+        "outputs": [_formal_parameter_to_tuple(param) for param in schema.outputs],
+        "type_constraints": [
+            (
+                constraint.type_param_str,
+                list(constraint.allowed_type_strs),
+                constraint.description,
+            )
+            for constraint in schema.type_constraints
+        ],
+        "attributes": [
+            (
+                attr.name,
+                int(attr.type),
+                attr.description,
+                attr.required,
+                attr.default_value.SerializeToString(),
+            )
+            for attr in schema.attributes.values()
+        ],
+    }
+
+
+def _op_schema_from_dict(data: dict[str, Any]) -> onnx.defs.OpSchema:
+    attributes = []
+    for name, type_, description, required, default_value in data["attributes"]:
+        default = onnx.AttributeProto.FromString(default_value)
+        if default.type == onnx.AttributeProto.UNDEFINED:
+            attributes.append(
+                onnx.defs.OpSchema.Attribute(
+                    name,
+                    onnx.defs.OpSchema.AttrType(type_),  # type: ignore[call-arg]
+                    description,
+                    required=required,
+                )
+            )
+        else:
+            attributes.append(
+                onnx.defs.OpSchema.Attribute(
+                    name, default_value=default, description=description
+                )
+            )
+    return onnx.defs.OpSchema(
+        data["name"],
+        data["domain"],
+        since_version=data["since_version"],
+        doc=data["doc"],
+        inputs=[_formal_parameter_from_tuple(param) for param in data["inputs"]],
+        outputs=[_formal_parameter_from_tuple(param) for param in data["outputs"]],
+        type_constraints=data["type_constraints"],
+        attributes=attributes,
+    )
+
+
+def _param_schema_to_tuple(param: values.ParamSchema) -> tuple:
+    # The empty default is a sentinel object that does not survive pickling
+    has_default = param.default is not values._EmptyDefault  # pylint: disable=protected-access
+    return (
+        param.name,
+        param.type,
+        has_default,
+        param.default if has_default else None,
+        param.required,
+        param.is_input,
+        param.is_variadic_input,
+    )
+
+
+def _param_schema_from_tuple(param: tuple) -> values.ParamSchema:
+    name, type_, has_default, default, required, is_input, is_variadic_input = param
+    return values.ParamSchema(
+        name=name,
+        type=type_,
+        default=default
+        if has_default
+        else values._EmptyDefault,  # pylint: disable=protected-access
+        required=required,
+        is_input=is_input,
+        is_variadic_input=is_variadic_input,
+    )
+
+
+def _conversion_to_dict(function: values.OnnxFunction) -> dict[str, Any]:
+    """Returns the result of the conversion of a function in a picklable form."""
+    return {
+        "function_proto": function.to_function_proto().SerializeToString(),
+        "param_schemas": [_param_schema_to_tuple(param) for param in function.param_schemas()],
+        "op_schema": _op_schema_to_dict(function.op_schema),
+    }
+
+
+def _conversion_from_dict(payload: dict[str, Any]) -> CacheEntry:
+    return CacheEntry(
+        function_proto=payload["function_proto"],
+        param_schemas=tuple(
+            _param_schema_from_tuple(param) for param in payload["param_schemas"]
+        ),
+        op_schema=_op_schema_from_dict(payload["op_schema"]),
+    )
+
+
+def _source_file(pyfun: types.FunctionType) -> Optional[str]:
+    filename = pyfun.__code__.co_filename
+    if not os.path.isfile(filename):
+        # E.g. functions defined in an interactive session
+        return None
+    return filename
+
+
+def _is_stale(payload: dict[str, Any]) -> bool:
+    return payload.get("fingerprint") != _get_converter_fingerprint() or (
+        _file_hash(payload["source_file"]) != payload["source_hash"]
+    )
+
+
+class FunctionCache:
+    """A directory of converted functions shared by processes.
+
+    Args:
+        directory: The directory of the cache. It is created on first write.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(directory)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.directory!r})"
+
+    def key(
+        self,
+        pyfun: types.FunctionType,
+        opset: values.Opset,
+        default_opset: Optional[values.Opset] = None,
+    ) -> Optional[str]:
+        """Returns the key of a function in the cache, or None if it cannot be cached."""
+        if pyfun.__closure__:
+            return None
+        source_file = _source_file(pyfun)
+        if source_file is None:
+            return None
+        in_progress = getattr(_keys_in_progress, "functions", None)
+        if in_progress is None:
+            in_progress = _keys_in_progress.functions = set()
+        if pyfun in in_progress:
+            return None
+        in_progress.add(pyfun)
+        try:
+            globals_fingerprint = _globals_fingerprint(pyfun)
+        except _UnhashableValueError as e:
+            logger.debug("Function '%s' cannot be cached: it uses %s.", pyfun.__qualname__, e)
+            return None
+        finally:
+            in_progress.discard(pyfun)
+        parts = (
+            _get_converter_fingerprint(),
+            _file_hash(source_file),
+            globals_fingerprint,
+            pyfun.__module__,
+            pyfun.__qualname__,
+            str(pyfun.__code__.co_firstlineno),
+            _opset_key(opset),
+            _opset_key(default_opset),
+        )
+        return hashlib.sha256("\n".join(str(part) for part in parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    def load(
+        self,
+        pyfun: types.FunctionType,
+        opset: values.Opset,
+        default_opset: Optional[values.Opset] = None,
+    ) -> Optional[CacheEntry]:
+        """Returns the cached conversion of a function, or None on a miss."""
+        key = self.key(pyfun, opset, default_opset)
+        if key is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+            entry = _conversion_from_dict(payload)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # A corrupted entry, or one that refers to names that no longer exist
+            logger.debug("Ignoring unreadable function cache entry '%s'.", path, exc_info=True)
+            return None
+        # Record the use so that pruning by size removes the least recently used entries
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry
+
+    def store(
+        self, function: values.OnnxFunction, default_opset: Optional[values.Opset] = None
+    ) -> bool:
+        """Stores a converted function. Returns False if it cannot be cached."""
+        pyfun = function.function
+        key = self.key(pyfun, function.opset, default_opset)
+        if key is None:
+            return False
+        source_file = _source_file(pyfun)
+        try:
+            data = pickle.dumps(
+                {
+                    "fingerprint": _get_converter_fingerprint(),
+                    "source_file": source_file,
+                    "source_hash": _file_hash(source_file),  # type: ignore[arg-type]
+                    "name": f"{pyfun.__module__}.{pyfun.__qualname__}",
+                    **_conversion_to_dict(function),
+                },
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception:  # pylint: disable=broad-except
+            # E.g. parameter types that cannot be pickled
+            logger.debug("Function '%s' cannot be cached.", function.name, exc_info=True)
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{key}.", suffix=_TEMP_SUFFIX, dir=self.directory
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # Atomic: concurrent readers see either no entry or a complete one
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+        return True
+
+    def entries(self) -> list[EntryInfo]:
+        """Returns information about the entries of the cache."""
+        if not os.path.isdir(self.directory):
+            return []
+        infos = []
+        for file_name in sorted(os.listdir(self.directory)):
+            if not file_name.endswith(_ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.directory, file_name)
+            try:
+                stat = os.stat(path)
+                with open(path, "rb") as f:
+                    payload = pickle.load(f)
+                name, stale = payload["name"], _is_stale(payload)
+            except FileNotFoundError:
+                # Removed by another process
+                continue
+            except Exception:  # pylint: disable=broad-except
+                name, stale = None, True
+            infos.append(EntryInfo(path, stat.st_size, stat.st_mtime, name, stale))
+        return infos
+
+    def prune(
+        self, max_age: Optional[float] = None, max_size: Optional[int] = None
+    ) -> list[str]:
+        """Removes stale entries and returns the paths of the removed files.
+
+        Args:
+            max_age: If set, entries not used for that many seconds are also removed.
+            max_size: If set, the least recently used entries are removed until the
+                total size of the entries is at most that many bytes.
+        """
+        now = time.time()
+        removed = []
+        if os.path.isdir(self.directory):
+            for file_name in os.listdir(self.directory):
+                path = os.path.join(self.directory, file_name)
+                if file_name.endswith(_TEMP_SUFFIX):
+                    with contextlib.suppress(OSError):
+                        if now - os.stat(path).st_mtime > _TEMP_FILE_MAX_AGE:
+                            os.unlink(path)
+                            removed.append(path)
+
+        kept = []
+        for info in self.entries():
+            if info.stale or (max_age is not None and now - info.mtime > max_age):
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(info.path)
+                removed.append(info.path)
+            else:
+                kept.append(info)
+
+        if max_size is not None:
+            total_size = sum(info.size for info in kept)
+            for info in sorted(kept, key=lambda info: info.mtime):
+                if total_size <= max_size:
+                    break
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(info.path)
+                removed.append(info.path)
+                total_size -= info.size
+        return removed
+
+    def clear(self) -> int:
+        """Removes all entries and returns the number of removed entries."""
+        count = 0
+        for info in self.entries():
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(info.path)
+                count += 1
+        return count
+
+
+_caches: dict[str, FunctionCache] = {}
+
+
+def default_cache() -> Optional[FunctionCache]:
+    """Returns the cache in ``ONNXSCRIPT_FUNCTION_CACHE_DIR``, or None if it is not set."""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if not directory:
+        return None
+    cache = _caches.get(directory)
+    if cache is None:
+        cache = _caches[directory] = FunctionCache(directory)
+    return cache
+
+
+def _iter_modules(module_name: str) -> list[types.ModuleType]:
+    module = importlib.import_module(module_name)
+    modules = [module]
+    if hasattr(module, "__path__"):
+        for submodule in pkgutil.walk_packages(module.__path__, prefix=f"{module_name}."):
+            modules.append(importlib.import_module(submodule.name))
+    return modules
+
+
+def warm(module_names: Sequence[str], workers: int = 1) -> int:
+    """Converts and caches the functions defined in modules and their submodules.
+
+    The cache must be enabled. Returns the number of functions found.
+
+    Args:
+        module_names: The names of the modules.
+        workers: The number of processes converting the functions of each module
+            (see :func:`onnxscript.compile_module`).
+    """
+    if default_cache() is None:
+        raise ValueError(f"The function cache is disabled. Set {CACHE_DIR_ENV}.")
+    count = 0
+    for module_name in module_names:
+        for module in _iter_modules(module_name):
+            if workers > 1:
+                onnxscript.compile_module(module, workers=workers)
+            for value in vars(module).values():
+                if isinstance(
+                    value, values.LazyOnnxFunction
+                ) and value.function.__module__ == (module.__name__):
+                    if not value.load_cached():
+                        value.compile()
+                    count += 1
+    return count
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m onnxscript.function_cache",
+        description="Manage the on-disk cache of converted onnxscript functions.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get(CACHE_DIR_ENV),
+        help=f"directory of the cache (default: ${CACHE_DIR_ENV})",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    warm_parser = subparsers.add_parser("warm", help="convert and cache functions of modules")
+    warm_parser.add_argument(
+        "modules", nargs="*", default=[_TORCH_LIB_OPS], help=f"default: {_TORCH_LIB_OPS}"
+    )
+    warm_parser.add_argument(
+        "-j", "--workers", type=int, default=1, help="number of converting processes"
+    )
+    info_parser = subparsers.add_parser("info", help="show the entries of the cache")
+    info_parser.add_argument("-v", "--verbose", action="store_true", help="list each entry")
+    prune_parser = subparsers.add_parser("prune", help="remove stale and old entries")
+    prune_parser.add_argument(
+        "--max-age-days", type=float, help="remove entries unused for longer"
+    )
+    prune_parser.add_argument("--max-size-mb", type=float, help="limit the size of the cache")
+    subparsers.add_parser("clear", help="remove all entries")
+    args = parser.parse_args(argv)
+
+    if not args.cache_dir:
+        parser.error(f"--cache-dir or {CACHE_DIR_ENV} is required")
+    cache = FunctionCache(args.cache_dir)
+    if args.command == "warm":
+        # Functions find the cache through the environment
+        os.environ[CACHE_DIR_ENV] = cache.directory
+        count = warm(args.modules, workers=args.workers)
+        print(f"Warmed {count} functions in {cache.directory}")
+    elif args.command == "info":
+        infos = cache.entries()
+        stale = sum(info.stale for info in infos)
+        size = sum(info.size for info in infos)
+        print(f"Cache directory: {cache.directory}")
+        print(f"Entries: {len(infos)} ({stale} stale), {size / 2**20:.2f} MiB")
+        if args.verbose:
+            for info in infos:
+                status = " (stale)" if info.stale else ""
+                print(f"  {os.path.basename(info.path)} {info.name}{status}")
+    elif args.command == "prune":
+        max_age = None if args.max_age_days is None else args.max_age_days * 86400
+        max_size = None if args.max_size_mb is None else int(args.max_size_mb * 2**20)
+        removed = cache.prune(max_age=max_age, max_size=max_size)
+        print(f"Removed {len(removed)} files from {cache.directory}")
+    else:
+        print(f"Removed {cache.clear()} entries from {cache.directory}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
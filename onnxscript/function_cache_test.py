@@ -0,0 +1,159 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import onnxscript
+from onnxscript import FLOAT, INT64, function_cache, values
+from onnxscript.onnx_opset import opset18 as op
+
+_OPSET = values.Opset("test.function_cache", 1)
+
+
+def _scaled_sum(x: FLOAT, y: FLOAT, axis: int, alpha: float = 1.0) -> FLOAT:
+    """Sums x and y and scales the result."""
+    return op.Flatten(op.Mul(op.Add(x, y), alpha), axis=axis)
+
+
+def _shape(x: FLOAT) -> INT64:
+    return op.Shape(x)
+
+
+_SCALE = 2.0
+_NOT_A_CONSTANT = object()
+
+
+def _scale(x: FLOAT) -> FLOAT:
+    return op.Mul(x, _SCALE)
+
+
+def _call_scaled_sum(x: FLOAT) -> FLOAT:
+    return _CALLEE(x, x, 1)
+
+
+def _use_unknown_value(x: FLOAT) -> FLOAT:
+    return op.Add(x, _NOT_A_CONSTANT)
+
+
+def _add_input(x: FLOAT, y: FLOAT, axis: int) -> FLOAT:
+    return op.Flatten(op.Add(x, y), axis=axis)
+
+
+def _add_attribute(x: FLOAT, y: float, axis: int) -> FLOAT:
+    return op.Flatten(op.Add(x, y), axis=axis)
+
+
+_CALLEE = values.LazyOnnxFunction(_OPSET, _add_input)
+
+
+class FunctionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache = function_cache.FunctionCache(self.temp_dir.name)
+        env = mock.patch.dict(os.environ, {function_cache.CACHE_DIR_ENV: self.temp_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_loaded_function_matches_converted_function(self):
+        converted = values.LazyOnnxFunction(_OPSET, _scaled_sum)
+        converted.compile()
+        self.assertEqual(len(self.cache.entries()), 1)
+
+        loaded = values.LazyOnnxFunction(_OPSET, _scaled_sum)
+        self.assertTrue(loaded.load_cached())
+        self.assertEqual(loaded.to_function_proto(), converted.to_function_proto())
+        self.assertEqual(loaded.param_schemas(), converted.param_schemas())
+        # Required attributes keep the sentinel used for parameters without a default
+        self.assertIs(
+            loaded.param_schemas()[2].default,
+            values._EmptyDefault,  # pylint: disable=protected-access
+        )
+        self.assertEqual(loaded.op_schema.name, "_scaled_sum")
+        self.assertEqual(loaded.op_schema.doc, converted.op_schema.doc)
+        self.assertEqual([param.name for param in loaded.op_schema.inputs], ["x", "y"])
+        self.assertEqual(
+            loaded.op_schema.attributes["alpha"].default_value,
+            converted.op_schema.attributes["alpha"].default_value,
+        )
+        self.assertTrue(loaded.op_schema.attributes["axis"].required)
+        self.assertFalse(loaded.is_compiled)
+
+    def test_script_loads_from_cache_without_converting(self):
+        first = onnxscript.script(_OPSET)(_shape)
+        self.assertTrue(first.is_compiled)
+        second = onnxscript.script(_OPSET)(_shape)
+        self.assertFalse(second.is_compiled)
+        self.assertEqual(second.to_function_proto(), first.to_function_proto())
+        # The IR is still available, by converting on demand
+        self.assertEqual(second.function_ir.name, "_shape")
+
+    def test_key_depends_on_opset(self):
+        other_opset = values.Opset("test.function_cache", 2)
+        self.assertNotEqual(
+            self.cache.key(_shape, _OPSET), self.cache.key(_shape, other_opset)
+        )
+
+    def test_key_depends_on_global_values(self):
+        key = self.cache.key(_scale, _OPSET)
+        with mock.patch(f"{__name__}._SCALE", 3.0):
+            self.assertNotEqual(self.cache.key(_scale, _OPSET), key)
+
+    def test_key_depends_on_schemas_of_called_functions(self):
+        key = self.cache.key(_call_scaled_sum, _OPSET)
+        callee = values.LazyOnnxFunction(_OPSET, _add_attribute)
+        callee._name = _CALLEE.name  # pylint: disable=protected-access
+        with mock.patch(f"{__name__}._CALLEE", callee):
+            self.assertNotEqual(self.cache.key(_call_scaled_sum, _OPSET), key)
+
+    def test_functions_using_unknown_global_values_are_not_cached(self):
+        self.assertIsNone(self.cache.key(_use_unknown_value, _OPSET))
+
+    def test_functions_with_closures_are_not_cached(self):
+        axis = 0
+
+        def reduce(x):
+            return op.ReduceSum(x, op.Constant(value_ints=[axis]))
+
+        self.assertIsNone(self.cache.key(reduce, _OPSET))
+        function = values.LazyOnnxFunction(_OPSET, reduce)
+        function.compile()
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_concurrent_writers_leave_a_readable_entry(self):
+        function = values.LazyOnnxFunction(_OPSET, _scaled_sum)
+        function.compile()
+        threads = [
+            threading.Thread(target=self.cache.store, args=(function,)) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+        self.assertIsNotNone(self.cache.load(_scaled_sum, _OPSET))
+
+    def test_prune_removes_unreadable_and_least_recently_used_entries(self):
+        values.LazyOnnxFunction(_OPSET, _scaled_sum).compile()
+        values.LazyOnnxFunction(_OPSET, _shape).compile()
+        paths = {info.name: info.path for info in self.cache.entries()}
+        scaled_sum_path = paths[f"{__name__}._scaled_sum"]
+        os.utime(scaled_sum_path, (0, 0))
+        corrupted_path = os.path.join(self.temp_dir.name, "corrupted.entry")
+        with open(corrupted_path, "wb") as f:
+            f.write(b"not a pickle")
+        self.assertEqual(sum(info.stale for info in self.cache.entries()), 1)
+
+        self.assertEqual(self.cache.prune(), [corrupted_path])
+        shape_size = os.path.getsize(paths[f"{__name__}._shape"])
+        self.assertEqual(self.cache.prune(max_size=shape_size), [scaled_sum_path])
+        self.assertEqual([info.name for info in self.cache.entries()], [f"{__name__}._shape"])
+        self.assertEqual(self.cache.clear(), 1)
+        self.assertEqual(self.cache.entries(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
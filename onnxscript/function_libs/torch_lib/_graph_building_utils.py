@@ -0,0 +1,252 @@
+"""Helpers shared by the graph builders of torch_lib.
+
+Used by :mod:`graph_building` and :mod:`onnx_graph_building`.
+"""
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import struct
+import warnings
+from typing import Any, BinaryIO, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import onnx
+import onnx.checker
+import onnx.helper
+import onnx.numpy_helper
+import onnx.shape_inference
+import torch
+from typing_extensions import Literal, TypeAlias
+
+import onnxscript
+from onnxscript import deduplicator, inliner, specializer
+
+# Be sure to leave ample room for the rest of the proto fields.
+LARGE_MODEL_SIZE_THRESHOLD = int(2**30 * 1.8)  # 1.8GB
+
+# How exported models are validated:
+# - "none": no validation
+# - "fast": shape inference and the checker, without the full check which runs
+#   shape inference a second time
+# - "full": shape inference and the full checker
+ValidationLevel: TypeAlias = Literal["none", "fast", "full"]
+
+
+def infer_shapes_and_check_model(
+    model: Union[onnx.ModelProto, bytes], validation: ValidationLevel
+) -> onnx.ModelProto:
+    """Returns the model with inferred shapes. Raises if the model is invalid."""
+    model = onnx.shape_inference.infer_shapes(
+        model, check_type=True, strict_mode=False, data_prop=True
+    )
+    onnx.checker.check_model(model, full_check=validation == "full")
+    return model
+
+
+def function_inputs_and_attributes(
+    function: onnxscript.OnnxFunction, args: Sequence[Any], kwargs: Mapping[str, Any]
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """Separates the arguments of a function call into its inputs and attributes."""
+    param_binder = function.param_binder()
+    assert param_binder is not None
+    # Cast int to float if needed
+    return param_binder.separate_input_attributes(
+        args, kwargs, fill_defaults=True, allow_extra_kwargs=True, cast_float_attributes=True
+    )
+
+
+def constant_type(constant: Any) -> Tuple[torch.dtype, Tuple[int, ...]]:
+    """Returns the dtype and shape of the Constant node of a Python constant input."""
+    if isinstance(constant, bool):
+        # Be sure to put bool before int, because bool is a subclass of int
+        return torch.bool, ()
+    if isinstance(constant, float):
+        return torch.float, ()
+    if isinstance(constant, int):
+        return torch.int64, ()
+    if isinstance(constant, (tuple, list)) and all(isinstance(val, int) for val in constant):
+        return torch.int64, (len(constant),)
+    if isinstance(constant, (tuple, list)) and all(isinstance(val, float) for val in constant):
+        return torch.float, (len(constant),)
+    raise TypeError(f"Constant input '{constant}' of type '{type(constant)}' is not supported")
+
+
+# The struct formats of the values of the Constant nodes, by dtype
+_CONSTANT_STRUCT_FORMATS = {torch.bool: "?", torch.float: "f", torch.int64: "q"}
+
+ConstantKey: TypeAlias = Tuple[torch.dtype, Tuple[int, ...], bytes]
+
+
+def constant_key(
+    constant: Any, dtype: torch.dtype, shape: Tuple[int, ...]
+) -> Optional[ConstantKey]:
+    """Returns the key of a Python constant input in the constants of a graph.
+
+    The key is the dtype, the shape and the bytes of the value of the Constant node, so
+    that the inputs which create the same node share it. It is computed without creating
+    the tensor. None if the value cannot be stored in the dtype, e.g. an int
+    out of the int64 range.
+    """
+    values = constant if shape else (constant,)
+    try:
+        data = struct.pack(f"<{len(values)}{_CONSTANT_STRUCT_FORMATS[dtype]}", *values)
+    except (struct.error, OverflowError):
+        return None
+    return dtype, shape, data
+
+
+def tensor_rawdata_size(tensor: torch.Tensor) -> int:
+    """Estimate the size of a tensor in bytes.
+
+    Args:
+        tensor: The tensor to estimate the size of.
+
+    Returns:
+        The estimated size of the tensor in bytes.
+    """
+    return tensor.numel() * tensor.element_size()
+
+
+def tensor_bytes(tensor: torch.Tensor) -> np.ndarray:
+    """Returns the raw data of a tensor as a uint8 array.
+
+    The array shares the storage of contiguous CPU tensors, so no data is copied.
+    Viewing the data as bytes also handles dtypes numpy does not support, like bfloat16.
+    """
+    return tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy()
+
+
+def _attribute_proto(key: str, value: Any) -> Optional[onnx.AttributeProto]:
+    """Returns the AttributeProto of an attribute value, or None if it is not supported."""
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)) and not value:
+        # Treat empty sequences as empty list of ints, like the torchscript node
+        return onnx.AttributeProto(name=key, type=onnx.AttributeProto.INTS)
+    try:
+        if isinstance(value, torch.Tensor):
+            # Raises TypeError for dtypes numpy does not support, like bfloat16
+            value = onnx.numpy_helper.from_array(value.detach().cpu().numpy())
+        return onnx.helper.make_attribute(key, value)
+    except (TypeError, ValueError):
+        return None
+
+
+def specialize_function(
+    function_specializer: Optional[specializer.FunctionSpecializer],
+    onnx_function: onnxscript.OnnxFunction,
+    onnx_attributes: Mapping[str, Any],
+) -> Optional[onnx.FunctionProto]:
+    """Returns the variant of a function for the attributes of a call, if any."""
+    if function_specializer is None:
+        return None
+    attributes = {}
+    for key, value in onnx_attributes.items():
+        if value is None:
+            continue
+        attribute = _attribute_proto(key, value)
+        if attribute is None:
+            return None
+        attributes[key] = attribute
+    return function_specializer.specialize_call(
+        (onnx_function.opset.domain, onnx_function.name),
+        attributes,
+        onnx_function.to_function_proto,
+    )
+
+
+def tensor_proto_without_data(name: str, tensor: torch.Tensor) -> onnx.TensorProto:
+    from torch.onnx import _type_utils  # pylint: disable=import-outside-toplevel
+
+    tensor_proto = onnx.TensorProto()
+    tensor_proto.name = name
+    tensor_proto.dims.extend(tensor.shape)
+    tensor_proto.data_type = int(
+        _type_utils.JitScalarType.from_dtype(tensor.dtype).onnx_type()
+    )
+    return tensor_proto
+
+
+def inline_and_validate(
+    onnx_model: onnx.ModelProto,
+    validation: ValidationLevel,
+    inline_functions: bool,
+    deduplicate_functions: bool,
+    torch_graph: Optional[torch.Graph] = None,
+) -> onnx.ModelProto:
+    """Deduplicates and inlines the functions of a model if requested, and validates it.
+
+    Returns the model with inferred shapes if it is validated. Warns if it is invalid.
+    The TorchScript graph the model is exported from, if any, is logged with the model.
+    """
+    if deduplicate_functions:
+        deduplication = deduplicator.deduplicate_functions(onnx_model)
+        logging.debug(
+            "Removed %d functions identical to other functions, saving %d bytes: %s",
+            deduplication.num_functions_removed,
+            deduplication.num_bytes_saved,
+            deduplication.merged,
+        )
+    if inline_functions:
+        node_counts = inliner.inline_functions(onnx_model)
+        logging.debug("Nodes contributed by each inlined function: %s", node_counts)
+    if validation == "none":
+        return onnx_model
+    try:
+        return infer_shapes_and_check_model(onnx_model, validation)
+    except (onnx.checker.ValidationError, onnx.shape_inference.InferenceError) as e:
+        warnings.warn(f"ONNX model is invalid: {e}", stacklevel=1)
+        logging.debug("ONNX model:\n%s", onnxscript.proto2text(onnx_model))
+        if torch_graph is not None:
+            logging.debug("TorchScript graph:\n%s", torch_graph)
+    return onnx_model
+
+
+def move_initializers_to_external_data(
+    onnx_model: onnx.ModelProto,
+    initializers: Mapping[str, torch.Tensor],
+    external_data: Union[str, os.PathLike, BinaryIO],
+    location: Optional[str],
+    size_threshold: int,
+) -> None:
+    """Turns the initializer inputs of a model into initializers with external data.
+
+    See :meth:`graph_building.TorchScriptGraph.to_model_proto_with_external_data`.
+    """
+    if location is None:
+        if not isinstance(external_data, (str, os.PathLike)):
+            raise ValueError("location is required when external_data is a file object")
+        location = os.path.basename(external_data)
+
+    initializer_names = set(initializers)
+    graph_inputs = [
+        input_ for input_ in onnx_model.graph.input if input_.name not in initializer_names
+    ]
+    del onnx_model.graph.input[:]
+    onnx_model.graph.input.extend(graph_inputs)
+
+    with contextlib.ExitStack() as stack:
+        sink: BinaryIO
+        if isinstance(external_data, (str, os.PathLike)):
+            sink = stack.enter_context(open(external_data, "wb"))
+        else:
+            sink = external_data
+        offset = 0
+        for name, tensor in initializers.items():
+            tensor_proto = tensor_proto_without_data(name, tensor)
+            data = tensor_bytes(tensor)
+            if data.nbytes < size_threshold:
+                tensor_proto.raw_data = data.tobytes()
+            else:
+                sink.write(data.data)
+                tensor_proto.data_location = onnx.TensorProto.EXTERNAL
+                for key, value in (
+                    ("location", location),
+                    ("offset", offset),
+                    ("length", data.nbytes),
+                ):
+                    entry = tensor_proto.external_data.add()
+                    entry.key = key
+                    entry.value = str(value)
+                offset += data.nbytes
+            onnx_model.graph.initializer.append(tensor_proto)
@@ -1,31 +1,37 @@
 """Graph building functions for torchscript graph backend."""
 from __future__ import annotations
 
-import logging
+import collections
+import concurrent.futures
 import os
 import tempfile
+import time
 import typing
-import warnings
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, BinaryIO, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import onnx
 import onnx.checker
 import onnx.defs
 import onnx.helper
+import onnx.numpy_helper
 import onnx.shape_inference
 import torch
 from typing_extensions import TypeAlias
 
 import onnxscript
-from onnxscript import evaluator
+from onnxscript import evaluator, specializer
 from onnxscript import tensor as onnxscript_tensor
-from onnxscript._internal import param_manipulation, runtime_typing
+from onnxscript._internal import runtime_typing
+from onnxscript.function_libs.torch_lib import _graph_building_utils
+from onnxscript.function_libs.torch_lib._graph_building_utils import ValidationLevel
 
 __all__ = [
     "TorchScriptTensor",
     "TorchScriptGraph",
     "TorchScriptTracingEvaluator",
+    "TracingProfile",
+    "validate_model_async",
 ]
 
 
@@ -63,12 +69,64 @@ ValidTorchValueType: TypeAlias = Union[
     None,
 ]
 
-# Be sure to leave ample room for the rest of the proto fields.
-_LARGE_MODEL_SIZE_THRESHOLD = int(2**30 * 1.8)  # 1.8GB
+# Protobuf cannot serialize messages larger than 2GB
+_MAX_PROTO_SIZE = 2**31 - 1
+
+_validation_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
 
 # TODO(justinchuby): Build a context manager to handle source information.
 
 
+def _validation_messages(model_bytes: bytes, validation: ValidationLevel) -> List[str]:
+    try:
+        _graph_building_utils.infer_shapes_and_check_model(model_bytes, validation)
+    except (onnx.checker.ValidationError, onnx.shape_inference.InferenceError) as e:
+        return [f"ONNX model is invalid: {e}"]
+    return []
+
+
+def validate_model_async(
+    model: onnx.ModelProto,
+    validation: ValidationLevel = "full",
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> concurrent.futures.Future[List[str]]:
+    """Validates a model in the background.
+
+    The model is serialized before this function returns, so it can be modified
+    while it is validated.
+
+    Args:
+        model: The model to validate.
+        validation: The validation level. "none" returns a completed future.
+        executor: The executor to validate the model in. The ONNX checker holds the
+            GIL, so use a ProcessPoolExecutor to validate in parallel with other
+            Python code. By default, a thread shared by all calls is used.
+
+    Returns:
+        A future of the messages describing why the model is invalid. The list
+        is empty if the model is valid.
+    """
+    global _validation_executor  # pylint: disable=global-statement
+
+    if validation not in typing.get_args(ValidationLevel):
+        raise ValueError(f"Unknown validation level '{validation}'")
+    if validation == "none":
+        future: concurrent.futures.Future[List[str]] = concurrent.futures.Future()
+        future.set_result([])
+        return future
+    if model.ByteSize() > _MAX_PROTO_SIZE:
+        future = concurrent.futures.Future()
+        future.set_result(["Validation skipped because the model is larger than 2GB."])
+        return future
+    if executor is None:
+        if _validation_executor is None:
+            _validation_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="onnxscript_validation"
+            )
+        executor = _validation_executor
+    return executor.submit(_validation_messages, model.SerializeToString(), validation)
+
+
 def _rename_intermediate_value(name: str) -> str:
     """Prepend `_val_` to a numeric tensor name make it valid in ONNX.
 
@@ -248,6 +306,43 @@ def _unwrap_tensors_to_torch_values(tensors):
     return _unwrap_tensor_to_torch_value(tensors)
 
 
+class TracingProfile:
+    """The time spent in the stages of the calls traced into a graph.
+
+    Set it as the :attr:`TorchScriptGraph.profile` of a graph to measure the
+    overhead of tracing. The stages of a call are
+
+    - "bind": separating the arguments of a function into inputs and attributes,
+    - "specialize": looking up the variant of a function specialized for the attributes,
+    - "inputs": adding the Constant and SequenceConstruct nodes of the inputs,
+    - "node": creating the node and its attributes,
+    - "outputs": wrapping the outputs of the node into tensors,
+
+    and "call" is the total time of the op and function calls made by the evaluator,
+    which includes the time spent between the stages.
+    """
+
+    def __init__(self) -> None:
+        # The total time of the stages, in seconds
+        self.times: Dict[str, float] = collections.defaultdict(float)
+        self.counts: Dict[str, int] = collections.defaultdict(int)
+
+    def record(self, stage: str, start: float) -> float:
+        """Adds the time elapsed since `start` to a stage and returns the current time."""
+        now = time.perf_counter()
+        self.times[stage] += now - start
+        self.counts[stage] += 1
+        return now
+
+    def report(self) -> str:
+        """Returns a table of the total and average time spent in each stage."""
+        lines = [f"{'stage':12}{'count':>10}{'total (ms)':>14}{'average (us)':>14}"]
+        for stage, total in sorted(self.times.items(), key=lambda item: -item[1]):
+            count = self.counts[stage]
+            lines.append(f"{stage:12}{count:10}{total * 1e3:14.2f}{total / count * 1e6:14.2f}")
+        return "\n".join(lines)
+
+
 class TorchScriptTracingEvaluator(evaluator.Evaluator):
     """An onnxscript Evaluator that captures the graph into torchscript."""
 
@@ -259,7 +354,13 @@ class TorchScriptTracingEvaluator(evaluator.Evaluator):
         return self._graph
 
     def eval(self, schema, inputs, attributes):
-        return self._graph.add_op_call(schema, inputs, attributes)
+        profile = self._graph.profile
+        if profile is None:
+            return self._graph.add_op_call(schema, inputs, attributes)
+        start = time.perf_counter()
+        result = self._graph.add_op_call(schema, inputs, attributes)
+        profile.record("call", start)
+        return result
 
     @runtime_typing.checked
     def eval_function(  # type: ignore[override]
@@ -268,22 +369,21 @@ class TorchScriptTracingEvaluator(evaluator.Evaluator):
         args: Sequence[ValidArgumentType],
         kwargs: Mapping[str, ValidArgumentType],
     ):
-        # args/kwargs are TorchScriptTensor/python built-in based
-        param_schemas = function.param_schemas()
-        (
-            inputs,
-            attributes,
-        ) = param_manipulation.separate_input_attributes_from_arguments(
-            param_schemas, args, kwargs, fill_defaults=True, allow_extra_kwargs=True
+        profile = self._graph.profile
+        if profile is None:
+            # args/kwargs are TorchScriptTensor/python built-in based
+            inputs, attributes = _graph_building_utils.function_inputs_and_attributes(
+                function, args, kwargs
+            )
+            return self._graph.add_function_call(function, inputs, attributes)
+        start = time.perf_counter()
+        inputs, attributes = _graph_building_utils.function_inputs_and_attributes(
+            function, args, kwargs
         )
-        name_to_schema = {param.name: param for param in param_schemas}
-        for name, value in attributes.items():
-            param = name_to_schema[name]
-            # Cast int to float if needed
-            if param.type in {float, "float"}:
-                # FIXME(justinchuby): Create invariant on the type of param.type to simplify this
-                attributes[name] = float(value)
-        return self._graph.add_function_call(function, inputs, attributes)
+        profile.record("bind", start)
+        result = self._graph.add_function_call(function, inputs, attributes)
+        profile.record("call", start)
+        return result
 
 
 @runtime_typing.checked
@@ -341,9 +441,10 @@ def _create_op_call_in_torch_graph(
 
     node = graph.create(opname, inputs, n_outputs)
     node = graph.insertNode(node)
-    node_ouputs = tuple(node.outputs())
+    assert node.outputsSize() == n_outputs
+    # Node.outputs() is much slower than getting the outputs one by one
+    node_ouputs = tuple(node.outputsAt(i) for i in range(n_outputs))
 
-    assert len(node_ouputs) == n_outputs
     # Add all attributes
     for key, value in sorted(attributes.items()):
         _add_attribute_to_torchscript_node(node, key, value)
@@ -351,28 +452,28 @@ def _create_op_call_in_torch_graph(
     return node_ouputs
 
 
-def _tensor_rawdata_size(tensor: torch.Tensor) -> int:
-    """Estimate the size of a tensor in bytes.
-
-    Args:
-        tensor: The tensor to estimate the size of.
-
-    Returns:
-        The estimated size of the tensor in bytes.
-    """
-    return tensor.numel() * tensor.element_size()
-
-
 class TorchScriptGraph:
     def __init__(
         self,
         parent_torch_script_graph: Optional[TorchScriptGraph] = None,
         domain_name: Optional[str] = None,
+        function_specializer: Optional[specializer.FunctionSpecializer] = None,
     ):
         self._torch_graph = torch.Graph()
         # All the functions used, deduplicated by name
         # key: (name, domain)
         self._function_store: Dict[Tuple[str, str], onnxscript.OnnxFunction] = {}
+        # The specialized variants of the functions used
+        # key: (name, domain)
+        self._specialized_function_store: Dict[Tuple[str, str], onnx.FunctionProto] = {}
+        # Creates the specialized variants. Subgraphs use the one of their parent if None.
+        self._function_specializer = function_specializer
+        # Measures the time spent tracing. Subgraphs use the one of their parent if None.
+        self._profile: Optional[TracingProfile] = None
+        # The values of the Constant nodes, shared by the equal constant inputs.
+        self._constants: Dict[_graph_building_utils.ConstantKey, torch.Value] = {}
+        # The number of constant inputs which reused a Constant node
+        self._num_deduplicated_constants = 0
         # Mapping from intializer name to data(torch.Tensor).
         self._initializers: Dict[str, torch.Tensor] = {}
         # Mapping from intializer name to input(TorchScriptTensor).
@@ -421,10 +522,47 @@ class TorchScriptGraph:
     def num_outputs(self) -> int:
         return len(list(self._torch_graph.outputs()))
 
+    @property
+    def num_deduplicated_constants(self) -> int:
+        """The number of constant inputs which reused the Constant node of an equal input."""
+        return self._num_deduplicated_constants
+
     @property
     def domain_name(self) -> Optional[str]:
         return self._domain_name
 
+    @property
+    def function_specializer(self) -> Optional[specializer.FunctionSpecializer]:
+        """Specializes the torch_lib functions called for their attribute values.
+
+        When set, every call to a function with attributes calls a variant of the
+        function specialized for the attribute values of the call. None by default,
+        in which case subgraphs use the specializer of their parent graph.
+        """
+        if self._function_specializer is None and self._parent_torch_script_graph is not None:
+            return self._parent_torch_script_graph.function_specializer
+        return self._function_specializer
+
+    @function_specializer.setter
+    def function_specializer(
+        self, function_specializer: Optional[specializer.FunctionSpecializer]
+    ) -> None:
+        self._function_specializer = function_specializer
+
+    @property
+    def profile(self) -> Optional[TracingProfile]:
+        """Measures the time spent in the stages of the traced calls.
+
+        None by default, in which case subgraphs use the profile of their parent graph.
+        """
+        if self._profile is None and self._parent_torch_script_graph is not None:
+            return self._parent_torch_script_graph.profile
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: Optional[TracingProfile]) -> None:
+        self._profile = profile
+
     @runtime_typing.checked
     def add_input(
         self,
@@ -512,25 +650,12 @@ class TorchScriptGraph:
             value.setDebugName(_rename_intermediate_value(value.debugName()))
             return value
 
-        if isinstance(constant, bool):
-            # Be sure to put bool before int, because bool is a subclass of int
-            constant_tensor = torch.tensor(constant, dtype=torch.bool)
-        elif isinstance(constant, float):
-            constant_tensor = torch.tensor(constant, dtype=torch.float)
-        elif isinstance(constant, int):
-            constant_tensor = torch.tensor(constant, dtype=torch.int64)
-        elif isinstance(constant, (tuple, list)) and all(
-            isinstance(val, int) for val in constant
-        ):
-            constant_tensor = torch.tensor(constant, dtype=torch.int64)
-        elif isinstance(constant, (tuple, list)) and all(
-            isinstance(val, float) for val in constant
-        ):
-            constant_tensor = torch.tensor(constant, dtype=torch.float)
-        else:
-            raise TypeError(
-                f"Constant input '{constant}' of type '{type(constant)}' is not supported"
-            )
+        dtype, shape = _graph_building_utils.constant_type(constant)
+        key = _graph_building_utils.constant_key(constant, dtype, shape)
+        if key is not None and key in self._constants:
+            self._num_deduplicated_constants += 1
+            return self._constants[key]
+        constant_tensor = torch.tensor(constant, dtype=dtype)
         value = _create_op_call_in_torch_graph(
             self._torch_graph,
             "onnx::Constant",
@@ -538,6 +663,8 @@ class TorchScriptGraph:
             attributes=dict(value=constant_tensor),
         )[0]
         value.setDebugName(_rename_intermediate_value(value.debugName()))
+        if key is not None:
+            self._constants[key] = value
         return value
 
     @runtime_typing.checked
@@ -548,6 +675,8 @@ class TorchScriptGraph:
         onnx_attributes: Mapping[str, ValidArgumentType],
         n_outputs: int,
     ) -> Union[TorchScriptTensor, Tuple[TorchScriptTensor, ...]]:
+        profile = self.profile
+        start = time.perf_counter() if profile is not None else 0.0
         unwrapped_inputs = _unwrap_tensors_to_torch_values(onnx_inputs)
         graph_inputs = []
         assert isinstance(unwrapped_inputs, Sequence)
@@ -575,6 +704,8 @@ class TorchScriptGraph:
             assert not isinstance(
                 value, TorchScriptTensor
             ), f"ONNX attribute must not be a TorchScriptTensor, got {key}: {value}."
+        if profile is not None:
+            start = profile.record("inputs", start)
         result = _create_op_call_in_torch_graph(
             self._torch_graph,
             name,
@@ -583,13 +714,15 @@ class TorchScriptGraph:
             n_outputs=n_outputs,
         )
         assert result, "Expected at least one output from ONNX op call."
-        if len(result) == 1:
-            tensor = TorchScriptTensor(result[0])
-            tensor.name = _rename_intermediate_value(tensor.name)
-            return tensor
+        if profile is not None:
+            start = profile.record("node", start)
         tensors = tuple(TorchScriptTensor(v) for v in result)
         for tensor in tensors:
             tensor.name = _rename_intermediate_value(tensor.name)
+        if profile is not None:
+            profile.record("outputs", start)
+        if len(tensors) == 1:
+            return tensors[0]
         return tensors
 
     @runtime_typing.checked
@@ -620,6 +753,7 @@ class TorchScriptGraph:
         # Fetch torchlib function protos.
         for name_domain, function in self._function_store.items():
             function_proto_dict[name_domain] = function.to_function_proto()
+        function_proto_dict.update(self._specialized_function_store)
         return function_proto_dict
 
     @runtime_typing.checked
@@ -647,15 +781,37 @@ class TorchScriptGraph:
         onnx_inputs: Sequence[ValidInputType],
         onnx_attributes: Mapping[str, ValidArgumentType],
     ) -> Union[TorchScriptTensor, Tuple[TorchScriptTensor, ...]]:
-        identifier = (onnx_function.name, onnx_function.function_ir.domain)
+        # Use the schema instead of function_ir, which functions loaded from the
+        # function cache only build when needed
+        op_schema = onnx_function.op_schema
+        assert op_schema is not None
+        profile = self.profile
+        start = time.perf_counter() if profile is not None else 0.0
+        specialized = _graph_building_utils.specialize_function(
+            self.function_specializer, onnx_function, onnx_attributes
+        )
+        if profile is not None:
+            profile.record("specialize", start)
+        if specialized is not None:
+            self._specialized_function_store[
+                (specialized.name, specialized.domain)
+            ] = specialized
+            return self._add_torchscript_op_call(
+                f"{specialized.domain}::{specialized.name}",
+                onnx_inputs,
+                {},
+                n_outputs=len(op_schema.outputs),
+            )
+
+        identifier = (onnx_function.name, onnx_function.opset.domain)
         self._function_store[identifier] = onnx_function
 
         # Compute outputs from the function schema
         result = self._add_torchscript_op_call(
-            f"{onnx_function.function_ir.domain}::{onnx_function.name}",
+            f"{onnx_function.opset.domain}::{onnx_function.name}",
             onnx_inputs,
             onnx_attributes,
-            n_outputs=len(onnx_function.function_ir.outputs),
+            n_outputs=len(op_schema.outputs),
         )
 
         return result
@@ -722,8 +878,34 @@ class TorchScriptGraph:
 
     @runtime_typing.checked
     def to_model_proto(
-        self, opset_version: int, include_initializers: bool = True
+        self,
+        opset_version: int,
+        include_initializers: bool = True,
+        validation: ValidationLevel = "full",
+        inline_functions: bool = False,
+        deduplicate_functions: bool = False,
     ) -> onnx.ModelProto:
+        """Exports the graph as a ModelProto.
+
+        Args:
+            opset_version: The default ONNX opset version.
+            include_initializers: Whether to include the initializers in the model.
+            validation: How the model is validated. With "fast" and "full", the
+                returned model contains the inferred shapes and a warning is
+                emitted if the model is invalid. Use "none" to skip validation,
+                e.g. together with :func:`validate_model_async`. Large models
+                exported with their initializers are never validated.
+            inline_functions: Whether to inline the torch_lib functions into the
+                graph instead of adding them as model-local functions. Use
+                :func:`onnxscript.inliner.inline_functions` to inline only some
+                functions.
+            deduplicate_functions: Whether to merge the model-local functions that
+                are identical, e.g. the functions of the calls of a module in each
+                layer, and call the remaining one instead. See
+                :func:`onnxscript.deduplicator.deduplicate_functions`.
+        """
+        if validation not in typing.get_args(ValidationLevel):
+            raise ValueError(f"Unknown validation level '{validation}'")
         function_proto_dict: Mapping[
             Tuple[str, str], onnx.FunctionProto
         ] = self.fetch_function_proto_dict(opset_version)
@@ -734,10 +916,11 @@ class TorchScriptGraph:
             unique_custom_domains[function_proto.domain] = 1
 
         initializers_size = sum(
-            _tensor_rawdata_size(tensor) for tensor in self.initializers.values()
+            _graph_building_utils.tensor_rawdata_size(tensor)
+            for tensor in self.initializers.values()
         )
 
-        large_model = initializers_size > _LARGE_MODEL_SIZE_THRESHOLD
+        large_model = initializers_size > _graph_building_utils.LARGE_MODEL_SIZE_THRESHOLD
 
         export_kwargs: dict[str, Any] = dict(
             initializers=self.initializers if include_initializers else {},
@@ -801,20 +984,63 @@ class TorchScriptGraph:
             ]
         )
 
-        try:
-            if not cache_model_to_disk:
-                # Only check the model if it is in memory.
-                # Otherwise the checker and shape_inference will fail because
-                # we cannot serialize the model.
-                onnx_model = onnx.shape_inference.infer_shapes(
-                    onnx_model, check_type=True, strict_mode=False, data_prop=True
-                )
-                onnx.checker.check_model(onnx_model, full_check=True)
-        except (onnx.checker.ValidationError, onnx.shape_inference.InferenceError) as e:
-            warnings.warn(f"ONNX model is invalid: {e}", stacklevel=1)
-            logging.debug(
-                "ONNX model:\n%s\n\nTorchScript graph:\n%s",
-                onnxscript.proto2text(onnx_model),
-                self.torch_graph,
-            )
+        # Only check the model if it is in memory. Otherwise the checker and
+        # shape_inference will fail because we cannot serialize the model.
+        return _graph_building_utils.inline_and_validate(
+            onnx_model,
+            "none" if cache_model_to_disk else validation,
+            inline_functions,
+            deduplicate_functions,
+            self.torch_graph,
+        )
+
+    def to_model_proto_with_external_data(
+        self,
+        opset_version: int,
+        external_data: Union[str, os.PathLike, BinaryIO],
+        location: Optional[str] = None,
+        size_threshold: int = 1024,
+        validation: ValidationLevel = "full",
+        inline_functions: bool = False,
+        deduplicate_functions: bool = False,
+    ) -> onnx.ModelProto:
+        """Exports the graph as a ModelProto that keeps its initializers as external data.
+
+        Initializers of at least ``size_threshold`` bytes are streamed from the storage
+        of their tensors into ``external_data``, one after the other, without being
+        copied into the ModelProto. This keeps the memory used by the export close to
+        one copy of the weights, and supports models larger than 2GB. Smaller
+        initializers are stored in the model.
+
+        Args:
+            opset_version: The default ONNX opset version.
+            external_data: Path of the file the initializers are written to, or a
+                binary file object positioned at the start of the external data file.
+            location: Path of the external data file relative to the directory the
+                model is saved to. Defaults to the file name of ``external_data``.
+                Required if ``external_data`` is a file object.
+            size_threshold: Initializers smaller than this many bytes are stored in
+                the model.
+            validation: How the model is validated. See :meth:`to_model_proto`.
+            inline_functions: Whether to inline the torch_lib functions into the
+                graph. See :meth:`to_model_proto`.
+            deduplicate_functions: Whether to merge the identical model-local
+                functions. See :meth:`to_model_proto`.
+
+        Returns:
+            The model, which references the initializers stored in ``location``.
+        """
+        # The initializers are exported as graph inputs, which are replaced below.
+        # The model is validated before, since the checker cannot read the external
+        # data file of an in-memory model.
+        onnx_model = self.to_model_proto(
+            opset_version,
+            include_initializers=False,
+            validation=validation,
+            inline_functions=inline_functions,
+            deduplicate_functions=deduplicate_functions,
+        )
+        _graph_building_utils.move_initializers_to_external_data(
+            onnx_model, self._initializers, external_data, location, size_threshold
+        )
         return onnx_model
@@ -2,15 +2,25 @@
 # mypy: disable-error-code="arg-type,type-arg,valid-type"
 from __future__ import annotations
 
+import concurrent.futures
+import io
 import os
+import tempfile
 import unittest
+from unittest import mock
 
+import numpy as np
+import onnx
+import onnx.checker
+import onnx.numpy_helper
+import onnxruntime
 import torch
 
 import onnxscript
 import onnxscript.testing
 from onnxscript import FLOAT, evaluator
 from onnxscript import opset18 as op
+from onnxscript import specializer
 from onnxscript._internal import version_utils
 from onnxscript.function_libs.torch_lib import graph_building, ops
 
@@ -59,6 +69,27 @@ class TestTorchScriptTracingEvaluator(unittest.TestCase):
 
         onnxscript.testing.assert_isomorphic(traced, expected)
 
+    def test_function_proto_is_built_once_across_exports(self):
+        aten_relu = onnxscript.values.LazyOnnxFunction(
+            ops.nn.aten_relu.opset, ops.nn.aten_relu.function
+        )
+        with mock.patch.object(
+            aten_relu,
+            "_build_function_proto",
+            wraps=aten_relu._build_function_proto,  # pylint: disable=protected-access
+        ) as build_function_proto:
+            models = []
+            for shape in [(1, 2, 3), (2, 3)]:
+                graph = graph_building.TorchScriptGraph()
+                x = graph.add_input("x", shape, torch.float32)
+                with evaluator.default_as(graph_building.TorchScriptTracingEvaluator(graph)):
+                    output = aten_relu(x)
+                graph.register_outputs(output)
+                models.append(graph.to_model_proto(self.opset_version))
+
+        build_function_proto.assert_called_once()
+        self.assertEqual(models[0].functions, models[1].functions)
+
     @unittest.expectedFailure  # The scripted version does not have output type
     def test_traced_graph_on_single_node_multi_output_is_same_as_compiled_graph(self):
         aten_topk = ops.core.aten_topk
@@ -119,12 +150,175 @@ class TestTorchScriptTracingEvaluator(unittest.TestCase):
         expected = outer.to_model_proto()
         onnxscript.testing.assert_isomorphic(traced, expected)
 
+    def test_to_model_proto_inlines_functions_and_module_calls(self):
+        inner_graph = graph_building.TorchScriptGraph(domain_name="test_domain")
+        x = inner_graph.add_input("x", (1, 2, 3), torch.float32)
+        with evaluator.default_as(graph_building.TorchScriptTracingEvaluator(inner_graph)):
+            output = ops.core.aten_abs(x)
+        inner_graph.register_outputs(output)
+
+        x = self.onnxscript_graph.add_input("x", (1, 2, 3), torch.float32)
+        with evaluator.default_as(self.tracer):
+            output = ops.nn.aten_relu(x)
+        output = self.onnxscript_graph.add_module_call("inner", inner_graph, (output,))
+        self.onnxscript_graph.register_outputs(output)
+
+        model = self.onnxscript_graph.to_model_proto(self.opset_version, inline_functions=True)
+
+        self.assertEqual(len(model.functions), 0)
+        self.assertEqual([node.op_type for node in model.graph.node], ["Relu", "Abs"])
+        onnx.checker.check_model(model, full_check=True)
+
+    def test_to_model_proto_merges_identical_module_calls(self):
+        output = self.onnxscript_graph.add_input("x", (1, 2, 3), torch.float32)
+        for layer in range(3):
+            inner_graph = graph_building.TorchScriptGraph(domain_name="test_domain")
+            x = inner_graph.add_input("x", (1, 2, 3), torch.float32)
+            with evaluator.default_as(graph_building.TorchScriptTracingEvaluator(inner_graph)):
+                inner_output = ops.core.aten_abs(ops.nn.aten_relu(x))
+            inner_graph.register_outputs(inner_output)
+            output = self.onnxscript_graph.add_module_call(
+                f"layer_{layer}", inner_graph, (output,)
+            )
+        self.onnxscript_graph.register_outputs(output)
+
+        model = self.onnxscript_graph.to_model_proto(
+            self.opset_version, deduplicate_functions=True
+        )
+        expected = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        self.assertEqual(
+            [node.op_type for node in model.graph.node], ["layer_0", "layer_0", "layer_0"]
+        )
+        self.assertEqual(
+            sorted(function.name for function in model.functions),
+            ["aten_abs", "aten_relu", "layer_0"],
+        )
+        self.assertEqual(len(expected.functions), 5)
+        onnx.checker.check_model(model, full_check=True)
+        x_array = np.arange(-3, 3, dtype=np.float32).reshape(1, 2, 3)
+        outputs = [
+            onnxruntime.InferenceSession(
+                m.SerializeToString(), providers=["CPUExecutionProvider"]
+            ).run(None, {"x": x_array})[0]
+            for m in (model, expected)
+        ]
+        np.testing.assert_array_equal(outputs[0], outputs[1])
+
+    def test_function_calls_use_variants_specialized_for_their_attributes(self):
+        function_specializer = specializer.FunctionSpecializer(max_specializations=2)
+        self.onnxscript_graph.function_specializer = function_specializer
+        x = self.onnxscript_graph.add_input("x", (2, 3), torch.float32)
+        y = self.onnxscript_graph.add_input("y", (2, 3), torch.float32)
+        reductions = (1, 1, 2, 0)
+        with evaluator.default_as(self.tracer):
+            outputs = tuple(
+                ops.nn.aten_mse_loss(x, y, reduction=reduction) for reduction in reductions
+            )
+        for output, reduction in zip(outputs, reductions):
+            output.shape = (2, 3) if reduction == 0 else ()
+            output.dtype = torch.float32
+        self.onnxscript_graph.register_outputs(outputs)
+
+        model = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        self.assertEqual(
+            [node.op_type for node in model.graph.node],
+            [
+                "aten_mse_loss_specialized_0",
+                "aten_mse_loss_specialized_0",
+                "aten_mse_loss_specialized_1",
+                "aten_mse_loss",
+            ],
+        )
+        self.assertEqual(
+            sorted(function.name for function in model.functions),
+            ["aten_mse_loss", "aten_mse_loss_specialized_0", "aten_mse_loss_specialized_1"],
+        )
+        for function in model.functions:
+            if function.name != "aten_mse_loss":
+                self.assertNotIn("If", [node.op_type for node in function.node])
+        self.assertEqual(
+            function_specializer.fallback_counts,
+            {(ops.nn.aten_mse_loss.opset.domain, "aten_mse_loss"): 1},
+        )
+        onnx.checker.check_model(model, full_check=True)
+
     def test_add_input_with_optionaltype_does_not_raise_torch_internal_error(self):
         graph = graph_building.TorchScriptGraph()
         x = graph.add_input(input_name=None)
         with evaluator.default_as(self.tracer):
             _ = x.shape
 
+    def test_equal_constant_inputs_share_a_constant_node(self):
+        x = self.onnxscript_graph.add_input("x", (2, 3), torch.float32)
+        with evaluator.default_as(self.tracer):
+            output = op.Add(x, 1.0)
+            output = op.Mul(output, 1.0)
+            output = op.Reshape(output, [3, 2])
+            output = op.Reshape(output, (3, 2))
+            output = op.Reshape(output, [2, 3])
+            # Equal in Python, but not as the values of Constant nodes
+            output = op.Sub(output, -0.0)
+            output = op.Sub(output, 0.0)
+        self.onnxscript_graph.register_outputs(output)
+
+        model = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        constants = [
+            onnx.numpy_helper.to_array(node.attribute[0].t).tolist()
+            for node in model.graph.node
+            if node.op_type == "Constant"
+        ]
+        self.assertEqual(constants, [1.0, [3, 2], [2, 3], -0.0, 0.0])
+        self.assertEqual(self.onnxscript_graph.num_deduplicated_constants, 2)
+        session = onnxruntime.InferenceSession(
+            model.SerializeToString(), providers=["CPUExecutionProvider"]
+        )
+        x_array = np.arange(6, dtype=np.float32).reshape(2, 3)
+        np.testing.assert_array_equal(session.run(None, {"x": x_array})[0], x_array + 1.0)
+
+    def test_constant_inputs_are_not_shared_across_graphs(self):
+        inner_graph = graph_building.TorchScriptGraph(domain_name="test_domain")
+        x = inner_graph.add_input("x", (2, 3), torch.float32)
+        with evaluator.default_as(graph_building.TorchScriptTracingEvaluator(inner_graph)):
+            output = op.Add(x, 1.0)
+        inner_graph.register_outputs(output)
+
+        x = self.onnxscript_graph.add_input("x", (2, 3), torch.float32)
+        with evaluator.default_as(self.tracer):
+            output = op.Add(x, 1.0)
+        output = self.onnxscript_graph.add_module_call("inner", inner_graph, (output,))
+        self.onnxscript_graph.register_outputs(output)
+
+        model = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        self.assertEqual(
+            [node.op_type for node in model.graph.node], ["Constant", "Add", "inner"]
+        )
+        self.assertEqual(
+            [node.op_type for node in model.functions[0].node], ["Constant", "Add"]
+        )
+        self.assertEqual(self.onnxscript_graph.num_deduplicated_constants, 0)
+
+    def test_profile_records_the_stages_of_the_traced_calls(self):
+        profile = graph_building.TracingProfile()
+        self.onnxscript_graph.profile = profile
+        inner_graph = graph_building.TorchScriptGraph(
+            self.onnxscript_graph, domain_name="test_domain"
+        )
+        x = inner_graph.add_input("x", (2, 3), torch.float32)
+        with evaluator.default_as(graph_building.TorchScriptTracingEvaluator(inner_graph)):
+            ops.core.aten_add(op.Relu(x), 1.0, alpha=2)
+
+        self.assertIs(inner_graph.profile, profile)
+        self.assertEqual(
+            dict(profile.counts),
+            {"bind": 1, "specialize": 1, "inputs": 2, "node": 2, "outputs": 2, "call": 2},
+        )
+        self.assertTrue(all(time >= 0 for time in profile.times.values()))
+        self.assertEqual(len(profile.report().splitlines()), 7)
+
 
 class TestTorchScriptGraph(unittest.TestCase):
     def test_add_initializer_raises_when_the_same_name_used_for_different_tensors(self):
@@ -139,6 +333,103 @@ class TestTorchScriptGraph(unittest.TestCase):
         graph.add_initializer("x", x_tensor)
         graph.add_initializer("x", x_tensor)
 
+    def _relu_graph(self) -> graph_building.TorchScriptGraph:
+        graph = graph_building.TorchScriptGraph()
+        x = graph.add_input("x", (1, 2, 3), torch.float32)
+        with evaluator.default_as(graph_building.TorchScriptTracingEvaluator(graph)):
+            output = op.Relu(op.Relu(x))
+        graph.register_outputs(output)
+        return graph
+
+    def test_to_model_proto_without_validation_does_not_infer_shapes(self):
+        model = self._relu_graph().to_model_proto(18, validation="none")
+        self.assertEqual(len(model.graph.value_info), 0)
+
+    def test_to_model_proto_with_fast_validation_infers_shapes(self):
+        with mock.patch.object(
+            onnx.checker, "check_model", wraps=onnx.checker.check_model
+        ) as check_model:
+            model = self._relu_graph().to_model_proto(18, validation="fast")
+        check_model.assert_called_once_with(mock.ANY, full_check=False)
+        self.assertEqual(model, self._relu_graph().to_model_proto(18, validation="full"))
+        self.assertGreater(len(model.graph.value_info), 0)
+
+    def test_validate_model_async_returns_no_messages_for_valid_model(self):
+        model = self._relu_graph().to_model_proto(18, validation="none")
+        future = graph_building.validate_model_async(model)
+        # The model can be modified while it is validated
+        model.graph.node[0].op_type = "NotAnOp"
+        self.assertEqual(future.result(), [])
+
+    def test_validate_model_async_reports_invalid_model(self):
+        model = self._relu_graph().to_model_proto(18, validation="none")
+        model.graph.node[0].op_type = "NotAnOp"
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            messages = graph_building.validate_model_async(model, "fast", executor).result()
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(messages[0].startswith("ONNX model is invalid"))
+
+    def test_validate_model_async_raises_for_unknown_level(self):
+        with self.assertRaises(ValueError):
+            graph_building.validate_model_async(onnx.ModelProto(), "partial")
+
+    def _initializer_graph(self) -> graph_building.TorchScriptGraph:
+        graph = graph_building.TorchScriptGraph()
+        x = graph.add_input("x", (4, 256), torch.float32)
+        weight = graph.add_initializer(
+            "weight", torch.arange(1024, dtype=torch.float32).reshape(4, 256)
+        )
+        bias = graph.add_initializer("bias", torch.ones(4, 256, dtype=torch.bfloat16))
+        scale = graph.add_initializer("scale", torch.tensor([2.0]))
+        with evaluator.default_as(graph_building.TorchScriptTracingEvaluator(graph)):
+            output = op.Mul(op.Add(op.Add(x, weight), op.CastLike(bias, x)), scale)
+        graph.register_outputs(output)
+        return graph
+
+    def test_to_model_proto_with_external_data_writes_initializers_to_file(self):
+        graph = self._initializer_graph()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            model = graph.to_model_proto_with_external_data(
+                18, os.path.join(temp_dir, "model.data")
+            )
+            self.assertEqual([input_.name for input_ in model.graph.input], ["x"])
+            initializers = {tensor.name: tensor for tensor in model.graph.initializer}
+            self.assertEqual(initializers["weight"].data_location, onnx.TensorProto.EXTERNAL)
+            self.assertEqual(initializers["bias"].data_location, onnx.TensorProto.EXTERNAL)
+            # Small initializers are stored in the model
+            self.assertEqual(initializers["scale"].data_location, onnx.TensorProto.DEFAULT)
+
+            onnx.load_external_data_for_model(model, temp_dir)
+        expected = graph.to_model_proto(18)
+        self.assertEqual(
+            {
+                tensor.name: onnx.numpy_helper.to_array(tensor).tolist()
+                for tensor in model.graph.initializer
+            },
+            {
+                tensor.name: onnx.numpy_helper.to_array(tensor).tolist()
+                for tensor in expected.graph.initializer
+            },
+        )
+        onnx.checker.check_model(model, full_check=True)
+
+    def test_to_model_proto_with_external_data_writes_initializers_to_sink(self):
+        sink = io.BytesIO()
+        model = self._initializer_graph().to_model_proto_with_external_data(
+            18, sink, location="weights.bin", size_threshold=0
+        )
+        offsets = []
+        for tensor in model.graph.initializer:
+            external_data = {entry.key: entry.value for entry in tensor.external_data}
+            self.assertEqual(external_data["location"], "weights.bin")
+            offsets.append((int(external_data["offset"]), int(external_data["length"])))
+        self.assertEqual(offsets, [(0, 4096), (4096, 2048), (6144, 4)])
+        self.assertEqual(len(sink.getvalue()), 6148)
+
+    def test_to_model_proto_with_external_data_requires_location_for_sink(self):
+        with self.assertRaises(ValueError):
+            self._initializer_graph().to_model_proto_with_external_data(18, io.BytesIO())
+
 
 class TestModelSaving(unittest.TestCase):
     @unittest.skipIf(os.getenv("CI") == "true", "CI is not ready to run dyanmo_export.")
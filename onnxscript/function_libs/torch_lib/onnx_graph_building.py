@@ -0,0 +1,653 @@
+"""Graph building functions for a backend that builds the ONNX graph directly.
+
+:class:`OnnxGraph` has the interface of :class:`graph_building.TorchScriptGraph`, but
+records the op calls as nodes of a lightweight in-memory graph instead of a
+``torch.Graph``. The nodes refer to the :class:`OnnxGraphTensor` they use and produce,
+so values can be renamed or typed after they are used, and the NodeProtos are
+created from them when the graph is exported. This avoids creating a ``torch.Value``
+per output and serializing the graph with TorchScript before parsing it back.
+"""
+from __future__ import annotations
+
+import functools
+import os
+import typing
+from typing import Any, BinaryIO, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import onnx
+import onnx.defs
+import onnx.helper
+import onnx.numpy_helper
+import torch
+
+import onnxscript
+from onnxscript import evaluator, specializer
+from onnxscript import tensor as onnxscript_tensor
+from onnxscript.function_libs.torch_lib import _graph_building_utils, graph_building
+
+__all__ = [
+    "OnnxGraphTensor",
+    "OnnxGraph",
+    "OnnxGraphTracingEvaluator",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _onnx_dtype(dtype: torch.dtype) -> int:
+    from torch.onnx import _type_utils  # pylint: disable=import-outside-toplevel
+
+    return int(_type_utils.JitScalarType.from_dtype(dtype).onnx_type())
+
+
+class OnnxGraphTensor(onnxscript_tensor.Tensor):
+    """A onnxscript tensor that is a value of an :class:`OnnxGraph`.
+
+    The name of a tensor that represents a missing optional input is empty.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(None)
+        self._name = name
+        self._concrete_value: Optional[np.ndarray] = None
+        self._shape: Optional[Tuple[int | None, ...]] = None
+        self._torch_dtype: Optional[torch.dtype] = None
+        self._is_complex: bool = False
+        self._is_sequence: bool = False
+
+    def __repr__(self):
+        return f"OnnxGraphTensor('{self._name}')"
+
+    @property  # type: ignore[override]
+    def value(self) -> Optional[np.ndarray]:
+        return self._concrete_value
+
+    @value.setter
+    def value(self, value: np.ndarray):
+        self._concrete_value = value
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+
+    @property
+    def rank(self) -> int | None:  # type: ignore[override]
+        if self._shape is None:
+            return None
+        return len(self._shape)
+
+    @property  # type: ignore[override]
+    def shape(self) -> Tuple[int | None, ...] | None:
+        return self._shape
+
+    @shape.setter
+    def shape(self, shape: Tuple[int | None, ...]):
+        self._shape = tuple(shape)
+
+    @property  # type: ignore[override]
+    def dtype(self) -> torch.dtype | None:
+        return self._torch_dtype
+
+    @dtype.setter
+    def dtype(self, dtype: torch.dtype):
+        self._torch_dtype = dtype
+
+    @property
+    def is_complex(self) -> bool:
+        return self._is_complex
+
+    @is_complex.setter
+    def is_complex(self, is_complex: bool):
+        self._is_complex = is_complex
+
+    @property
+    def is_sequence(self) -> bool:
+        """Whether the tensor is a sequence of tensors of type :attr:`dtype`."""
+        return self._is_sequence
+
+    @is_sequence.setter
+    def is_sequence(self, is_sequence: bool):
+        self._is_sequence = is_sequence
+
+    @property
+    def onnx_dtype(self) -> int:
+        if self._torch_dtype is None:
+            return onnx.TensorProto.UNDEFINED
+        return _onnx_dtype(self._torch_dtype)
+
+    def value_info(self) -> onnx.ValueInfoProto:
+        """Returns the ValueInfoProto of the tensor, without type if it is unknown."""
+        if self._torch_dtype is None:
+            return onnx.helper.make_empty_tensor_value_info(self._name)
+        if self._is_sequence:
+            return onnx.helper.make_value_info(
+                self._name,
+                onnx.helper.make_sequence_type_proto(
+                    onnx.helper.make_tensor_type_proto(self.onnx_dtype, None)
+                ),
+            )
+        return onnx.helper.make_tensor_value_info(self._name, self.onnx_dtype, self._shape)
+
+
+class OnnxGraphTracingEvaluator(evaluator.Evaluator):
+    """An onnxscript Evaluator that captures the graph into an :class:`OnnxGraph`."""
+
+    def __init__(self, graph: OnnxGraph):
+        self._graph: OnnxGraph = graph
+
+    @property
+    def graph(self) -> OnnxGraph:
+        return self._graph
+
+    def eval(self, schema, inputs, attributes):
+        return self._graph.add_op_call(schema, inputs, attributes)
+
+    def eval_function(  # type: ignore[override]
+        self,
+        function: onnxscript.OnnxFunction,
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any],
+    ):
+        inputs, attributes = _graph_building_utils.function_inputs_and_attributes(
+            function, args, kwargs
+        )
+        return self._graph.add_function_call(function, inputs, attributes)
+
+
+def _tensor_proto(name: str, tensor: torch.Tensor) -> onnx.TensorProto:
+    # The raw data supports the dtypes numpy does not support, like bfloat16
+    tensor_proto = _graph_building_utils.tensor_proto_without_data(name, tensor)
+    tensor_proto.raw_data = _graph_building_utils.tensor_bytes(tensor).tobytes()
+    return tensor_proto
+
+
+def _make_attribute(key: str, value: Any) -> onnx.AttributeProto:
+    """Returns the AttributeProto of a value, typed like the TorchScript node attributes."""
+    if isinstance(value, float):
+        return onnx.helper.make_attribute(key, value)
+    if isinstance(value, int):
+        # Including bools
+        return onnx.AttributeProto(name=key, type=onnx.AttributeProto.INT, i=int(value))
+    if isinstance(value, (str, bytes)):
+        return onnx.helper.make_attribute(key, value)
+    if isinstance(value, torch.Tensor):
+        return onnx.helper.make_attribute(key, _tensor_proto("", value))
+    if isinstance(value, Sequence):
+        if not value or isinstance(value[0], int):
+            # Treat empty sequences as empty list of ints, like the torchscript node
+            return onnx.AttributeProto(name=key, type=onnx.AttributeProto.INTS, ints=value)
+        if isinstance(value[0], float):
+            return onnx.AttributeProto(name=key, type=onnx.AttributeProto.FLOATS, floats=value)
+        raise TypeError(f"Unsupported sequence type '{type(value)}' for attribute '{key}'")
+    raise TypeError(f"Unsupported attribute type '{type(value)}' for attribute '{key}'")
+
+
+# The numpy dtypes of the values of the Constant nodes
+_CONSTANT_NUMPY_DTYPES = {torch.bool: np.bool_, torch.float: np.float32, torch.int64: np.int64}
+
+
+class _Node:
+    """A node of an :class:`OnnxGraph`. Missing optional inputs are None."""
+
+    __slots__ = ("op_type", "domain", "name", "inputs", "outputs", "attributes")
+
+    def __init__(
+        self,
+        op_type: str,
+        domain: str,
+        name: str,
+        inputs: Sequence[Optional[OnnxGraphTensor]],
+        outputs: Sequence[OnnxGraphTensor],
+        attributes: Sequence[onnx.AttributeProto],
+    ) -> None:
+        self.op_type = op_type
+        self.domain = domain
+        self.name = name
+        self.inputs = inputs
+        self.outputs = outputs
+        self.attributes = attributes
+
+    def to_node_proto(self) -> onnx.NodeProto:
+        node = onnx.NodeProto(
+            op_type=self.op_type,
+            domain=self.domain,
+            name=self.name,
+            input=["" if input is None else input.name for input in self.inputs],
+            output=[output.name for output in self.outputs],
+        )
+        node.attribute.extend(self.attributes)
+        return node
+
+
+class OnnxGraph:
+    """A graph of ONNX op and function calls, with the interface of TorchScriptGraph.
+
+    Like :class:`graph_building.TorchScriptGraph`, the graph is built by tracing
+    onnxscript code with an :class:`OnnxGraphTracingEvaluator`, or by calling
+    :meth:`add_op_call`, :meth:`add_function_call` and :meth:`add_module_call`, and is
+    exported with :meth:`to_model_proto`. Subgraphs represent model-local functions.
+    """
+
+    def __init__(
+        self,
+        parent_graph: Optional[OnnxGraph] = None,
+        domain_name: Optional[str] = None,
+        function_specializer: Optional[specializer.FunctionSpecializer] = None,
+    ):
+        self._inputs: List[OnnxGraphTensor] = []
+        self._outputs: List[OnnxGraphTensor] = []
+        self._nodes: List[_Node] = []
+        # Values are named like the values of the TorchScript graph
+        self._value_count = 0
+        # All the functions used, deduplicated by name
+        # key: (name, domain)
+        self._function_store: Dict[Tuple[str, str], onnxscript.OnnxFunction] = {}
+        # The specialized variants of the functions used
+        # key: (name, domain)
+        self._specialized_function_store: Dict[Tuple[str, str], onnx.FunctionProto] = {}
+        # Creates the specialized variants. Subgraphs use the one of their parent if None.
+        self._function_specializer = function_specializer
+        # The outputs of the Constant nodes, shared by the equal constant inputs.
+        self._constants: Dict[_graph_building_utils.ConstantKey, OnnxGraphTensor] = {}
+        # The number of constant inputs which reused a Constant node
+        self._num_deduplicated_constants = 0
+        # Mapping from intializer name to data(torch.Tensor).
+        self._initializers: Dict[str, torch.Tensor] = {}
+        # Mapping from intializer name to input(OnnxGraphTensor).
+        self._initializers_inputs: Dict[str, OnnxGraphTensor] = {}
+        # Mapping from intializer name to input(OnnxGraphTensor) from parent graph.
+        self._initializers_inputs_from_parent: Dict[str, OnnxGraphTensor] = {}
+        # Mapping from model local function type name to function graph.
+        self._sub_graphs: Dict[str, OnnxGraph] = {}
+        # Parent graph. None if this is the top level graph.
+        self._parent_graph = parent_graph
+        # Domain name of the graph. None if this is the top level graph.
+        self._domain_name: Optional[str] = domain_name
+
+        if self._domain_name is None and self._parent_graph is not None:
+            raise RuntimeError(
+                "Domain name is not set. It is required because this 'OnnxGraph' instance "
+                "is a subgraph that represents an ONNX local function."
+            )
+
+    @property
+    def initializers(self) -> Mapping[str, torch.Tensor]:
+        return self._initializers
+
+    @initializers.setter
+    def initializers(self, initializers: Dict[str, torch.Tensor]):
+        self._initializers = initializers
+
+    @property
+    def initializers_inputs(self) -> Mapping[str, OnnxGraphTensor]:
+        return self._initializers_inputs
+
+    @property
+    def initializers_inputs_from_parent(self) -> Mapping[str, OnnxGraphTensor]:
+        return self._initializers_inputs_from_parent
+
+    @property
+    def num_outputs(self) -> int:
+        return len(self._outputs)
+
+    @property
+    def num_deduplicated_constants(self) -> int:
+        """See :attr:`graph_building.TorchScriptGraph.num_deduplicated_constants`."""
+        return self._num_deduplicated_constants
+
+    @property
+    def domain_name(self) -> Optional[str]:
+        return self._domain_name
+
+    @property
+    def function_specializer(self) -> Optional[specializer.FunctionSpecializer]:
+        """See :attr:`graph_building.TorchScriptGraph.function_specializer`."""
+        if self._function_specializer is None and self._parent_graph is not None:
+            return self._parent_graph.function_specializer
+        return self._function_specializer
+
+    @function_specializer.setter
+    def function_specializer(
+        self, function_specializer: Optional[specializer.FunctionSpecializer]
+    ) -> None:
+        self._function_specializer = function_specializer
+
+    def _new_tensor(self) -> OnnxGraphTensor:
+        name = f"_val_{self._value_count}"
+        self._value_count += 1
+        return OnnxGraphTensor(name)
+
+    def _add_graph_input(
+        self,
+        name: str,
+        shape: Optional[Sequence[Union[int, str, None]]],
+        dtype: Optional[torch.dtype],
+    ) -> OnnxGraphTensor:
+        tensor = OnnxGraphTensor(name)
+        self._value_count += 1
+        if shape is not None:
+            # Like the TorchScript graph, symbolic dimensions are unknown dimensions
+            tensor.shape = tuple(dim if isinstance(dim, int) else None for dim in shape)
+        if dtype is not None:
+            tensor.dtype = dtype
+        self._inputs.append(tensor)
+        return tensor
+
+    def add_input(
+        self,
+        input_name: Optional[str],
+        shape: Optional[Union[torch.Size, Sequence[Union[int, str, None]]]] = None,
+        dtype: Optional[torch.dtype] = None,
+    ) -> OnnxGraphTensor:
+        if input_name is None:
+            # This input argument is None, which is a missing optional input in ONNX
+            return OnnxGraphTensor("")
+        return self._add_graph_input(input_name, shape, dtype)
+
+    def add_initializer(self, name: str, value: torch.Tensor) -> OnnxGraphTensor:
+        if name in self._initializers_inputs:
+            # The initializer is added every time a submodule is called
+            if name in self._initializers and self._initializers[name] is not value:
+                raise ValueError(
+                    f"Initializer '{name}' exists already with a different value."
+                )
+            return self._initializers_inputs[name]
+
+        if self._parent_graph is not None:
+            # Only the root graph can have initializers. Add as initializer
+            # to root graph, and add as input to current graph.
+            self._initializers_inputs_from_parent[name] = self._parent_graph.add_initializer(
+                name, value
+            )
+        else:
+            self._initializers[name] = value
+        tensor = self._add_graph_input(name, value.shape, value.dtype)
+        self._initializers_inputs[name] = tensor
+        return tensor
+
+    def register_outputs(
+        self, outputs: Union[OnnxGraphTensor, Tuple[OnnxGraphTensor, ...]]
+    ) -> None:
+        if isinstance(outputs, OnnxGraphTensor):
+            outputs = (outputs,)
+        for output in outputs:
+            if not isinstance(output, OnnxGraphTensor):
+                raise TypeError(f"Output must be an OnnxGraphTensor, not {type(output)}")
+            self._outputs.append(output)
+
+    def _add_node(
+        self,
+        op_type: str,
+        domain: str,
+        inputs: Sequence[Optional[OnnxGraphTensor]],
+        attributes: Sequence[onnx.AttributeProto],
+        n_outputs: int,
+    ) -> Tuple[OnnxGraphTensor, ...]:
+        outputs = tuple(self._new_tensor() for _ in range(n_outputs))
+        name = f"{op_type}_{len(self._nodes)}"
+        self._nodes.append(_Node(op_type, domain, name, inputs, outputs, attributes))
+        return outputs
+
+    def _add_constant(self, constant: Any) -> Optional[OnnxGraphTensor]:
+        if constant is None:
+            return None
+        dtype, shape = _graph_building_utils.constant_type(constant)
+        key = _graph_building_utils.constant_key(constant, dtype, shape)
+        if key is not None and key in self._constants:
+            self._num_deduplicated_constants += 1
+            return self._constants[key]
+        value = onnx.numpy_helper.from_array(
+            np.array(constant, dtype=_CONSTANT_NUMPY_DTYPES[dtype])
+        )
+        (output,) = self._add_node(
+            "Constant", "", (), (onnx.helper.make_attribute("value", value),), 1
+        )
+        if key is not None:
+            self._constants[key] = output
+        return output
+
+    def _add_op_call(
+        self,
+        op_type: str,
+        domain: str,
+        onnx_inputs: Sequence[Any],
+        onnx_attributes: Mapping[str, Any],
+        n_outputs: int,
+    ) -> Union[OnnxGraphTensor, Tuple[OnnxGraphTensor, ...]]:
+        inputs: List[Optional[OnnxGraphTensor]] = []
+        for input in onnx_inputs:
+            if isinstance(input, OnnxGraphTensor):
+                # Missing optional inputs added with add_input(None) have no name
+                inputs.append(input if input.name else None)
+            elif (
+                isinstance(input, Sequence)
+                and input
+                and all(isinstance(elem, OnnxGraphTensor) for elem in input)
+            ):
+                # If all elements in the Sequence are tensors we know it
+                # should be a Sequence input in ONNX.
+                inputs.append(self._add_node("SequenceConstruct", "", input, (), 1)[0])
+            else:
+                inputs.append(self._add_constant(input))
+        attributes = []
+        for key, value in sorted(onnx_attributes.items()):
+            if value is None:
+                # Filter out None attributes, this can be convenient client side because
+                # now they can pass through None attributes, and have them not show up
+                continue
+            if isinstance(value, OnnxGraphTensor):
+                raise TypeError(
+                    f"ONNX attribute must not be an OnnxGraphTensor, got {key}: {value}."
+                )
+            attributes.append(_make_attribute(key, value))
+        result = self._add_node(op_type, domain, inputs, attributes, n_outputs)
+        assert result, "Expected at least one output from ONNX op call."
+        if len(result) == 1:
+            return result[0]
+        return result
+
+    def add_op_call(
+        self,
+        onnx_op_schema: onnx.defs.OpSchema,
+        onnx_inputs: Sequence[Any],
+        onnx_attributes: Mapping[str, Any],
+    ) -> Union[OnnxGraphTensor, Tuple[OnnxGraphTensor, ...]]:
+        # Compute outputs from the onnx_op op schema
+        n_outputs = evaluator.compute_num_outputs(onnx_op_schema, onnx_inputs, onnx_attributes)
+        return self._add_op_call(
+            onnx_op_schema.name, onnx_op_schema.domain, onnx_inputs, onnx_attributes, n_outputs
+        )
+
+    def add_function_call(
+        self,
+        onnx_function: onnxscript.OnnxFunction,
+        onnx_inputs: Sequence[Any],
+        onnx_attributes: Mapping[str, Any],
+    ) -> Union[OnnxGraphTensor, Tuple[OnnxGraphTensor, ...]]:
+        op_schema = onnx_function.op_schema
+        assert op_schema is not None
+        specialized = _graph_building_utils.specialize_function(
+            self.function_specializer, onnx_function, onnx_attributes
+        )
+        if specialized is not None:
+            self._specialized_function_store[
+                (specialized.name, specialized.domain)
+            ] = specialized
+            return self._add_op_call(
+                specialized.name,
+                specialized.domain,
+                onnx_inputs,
+                {},
+                len(op_schema.outputs),
+            )
+
+        identifier = (onnx_function.name, onnx_function.opset.domain)
+        self._function_store[identifier] = onnx_function
+        return self._add_op_call(
+            onnx_function.name,
+            onnx_function.opset.domain,
+            onnx_inputs,
+            onnx_attributes,
+            len(op_schema.outputs),
+        )
+
+    def add_module_call(
+        self,
+        name: str,
+        sub_graph: OnnxGraph,
+        onnx_inputs: Sequence[Any],
+    ) -> Union[OnnxGraphTensor, Tuple[OnnxGraphTensor, ...]]:
+        self._sub_graphs[name] = sub_graph
+        domain_name = sub_graph.domain_name
+        assert domain_name is not None
+        return self._add_op_call(
+            name,
+            domain_name,
+            (*onnx_inputs, *sub_graph.initializers_inputs_from_parent.values()),
+            {},
+            sub_graph.num_outputs,
+        )
+
+    def fetch_function_proto_dict(
+        self, opset_version: int
+    ) -> Mapping[Tuple[str, str], onnx.FunctionProto]:
+        function_proto_dict: Dict[Tuple[str, str], onnx.FunctionProto] = {}
+        # Fetch local function protos. E.g., local functions representing module calls.
+        for sub_graph_name, sub_graph in self._sub_graphs.items():
+            function_proto_dict.update(sub_graph.fetch_function_proto_dict(opset_version))
+            domain = sub_graph.domain_name
+            assert domain is not None
+            name_domain = (sub_graph_name, domain)
+            assert (
+                name_domain not in function_proto_dict
+            ), f"Sub graph name already exists. {name_domain}"
+            function_proto_dict[name_domain] = sub_graph.to_function_proto(
+                opset_version, sub_graph_name
+            )
+        # Fetch torchlib function protos.
+        for name_domain, function in self._function_store.items():
+            function_proto_dict[name_domain] = function.to_function_proto()
+        function_proto_dict.update(self._specialized_function_store)
+        return function_proto_dict
+
+    def _opset_imports(self, opset_version: int) -> Dict[str, int]:
+        """Returns the versions of the domains used by the nodes of the graph."""
+        # TODO(BowenBao): All local function domain versions are hardcoded as 1.
+        opset_imports = {node.domain: 1 for node in self._nodes}
+        opset_imports[""] = opset_version
+        return opset_imports
+
+    def to_function_proto(self, opset_version: int, function_name: str) -> onnx.FunctionProto:
+        assert len(self.initializers) == 0, "Model local functions cannot have initializers."
+        domain = self.domain_name
+        if domain is None:
+            raise RuntimeError("Domain name is not set.")
+        return onnx.helper.make_function(
+            domain=domain,
+            fname=function_name,
+            inputs=[input.name for input in self._inputs],
+            outputs=[output.name for output in self._outputs],
+            nodes=[node.to_node_proto() for node in self._nodes],
+            opset_imports=[
+                onnx.helper.make_opsetid(domain, version)
+                for domain, version in self._opset_imports(opset_version).items()
+            ],
+        )
+
+    def to_model_proto(
+        self,
+        opset_version: int,
+        include_initializers: bool = True,
+        validation: graph_building.ValidationLevel = "full",
+        inline_functions: bool = False,
+        deduplicate_functions: bool = False,
+    ) -> onnx.ModelProto:
+        """Exports the graph as a ModelProto.
+
+        See :meth:`graph_building.TorchScriptGraph.to_model_proto`.
+        """
+        if validation not in typing.get_args(graph_building.ValidationLevel):
+            raise ValueError(f"Unknown validation level '{validation}'")
+        function_proto_dict = self.fetch_function_proto_dict(opset_version)
+        opset_imports = self._opset_imports(opset_version)
+        for function_proto in function_proto_dict.values():
+            opset_imports.setdefault(function_proto.domain, 1)
+
+        inputs = self._inputs
+        initializers: List[onnx.TensorProto] = []
+        if include_initializers:
+            inputs = [input for input in inputs if input.name not in self._initializers]
+            initializers = [
+                _tensor_proto(name, tensor) for name, tensor in self._initializers.items()
+            ]
+        # Tensors are compared by identity, since == creates an Equal node
+        graph_values = {id(value) for value in (*self._inputs, *self._outputs)}
+        graph = onnx.helper.make_graph(
+            [node.to_node_proto() for node in self._nodes],
+            "main_graph",
+            [input.value_info() for input in inputs],
+            [output.value_info() for output in self._outputs],
+            initializer=initializers,
+            value_info=[
+                output.value_info()
+                for node in self._nodes
+                for output in node.outputs
+                if output.dtype is not None and id(output) not in graph_values
+            ],
+        )
+        opset_ids = [
+            onnx.helper.make_opsetid(domain, version)
+            for domain, version in opset_imports.items()
+        ]
+        onnx_model = onnx.helper.make_model(
+            graph,
+            ir_version=onnx.helper.find_min_ir_version_for(opset_ids, ignore_unknown=True),
+            opset_imports=opset_ids,
+            functions=function_proto_dict.values(),
+            producer_name="onnxscript",
+        )
+
+        # Models larger than 2GB cannot be serialized to be checked
+        large_model = include_initializers and (
+            sum(
+                _graph_building_utils.tensor_rawdata_size(tensor)
+                for tensor in self._initializers.values()
+            )
+            > _graph_building_utils.LARGE_MODEL_SIZE_THRESHOLD
+        )
+        return _graph_building_utils.inline_and_validate(
+            onnx_model,
+            "none" if large_model else validation,
+            inline_functions,
+            deduplicate_functions,
+        )
+
+    def to_model_proto_with_external_data(
+        self,
+        opset_version: int,
+        external_data: Union[str, os.PathLike, BinaryIO],
+        location: Optional[str] = None,
+        size_threshold: int = 1024,
+        validation: graph_building.ValidationLevel = "full",
+        inline_functions: bool = False,
+        deduplicate_functions: bool = False,
+    ) -> onnx.ModelProto:
+        """Exports the graph as a ModelProto that keeps its initializers as external data.
+
+        See :meth:`graph_building.TorchScriptGraph.to_model_proto_with_external_data`.
+        """
+        onnx_model = self.to_model_proto(
+            opset_version,
+            include_initializers=False,
+            validation=validation,
+            inline_functions=inline_functions,
+            deduplicate_functions=deduplicate_functions,
+        )
+        _graph_building_utils.move_initializers_to_external_data(
+            onnx_model, self._initializers, external_data, location, size_threshold
+        )
+        return onnx_model
@@ -0,0 +1,326 @@
+"""Test cases for building graphs with the ONNX graph builder."""
+# mypy: disable-error-code="arg-type,type-arg,type-var,valid-type"
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import onnx
+import onnx.checker
+import onnx.numpy_helper
+import onnx.printer
+import onnxruntime
+import torch
+
+import onnxscript
+import onnxscript.testing
+from onnxscript import FLOAT, evaluator
+from onnxscript import opset18 as op
+from onnxscript import specializer
+from onnxscript.function_libs.torch_lib import graph_building, onnx_graph_building, ops
+
+
+class TestOnnxGraphTracingEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.opset_version = 18
+        self.onnxscript_graph = onnx_graph_building.OnnxGraph()
+        self.tracer = onnx_graph_building.OnnxGraphTracingEvaluator(self.onnxscript_graph)
+
+    def test_traced_constant_op_is_same_as_compiled_graph(self):
+        with evaluator.default_as(self.tracer):
+            output = op.Constant(value_float=0.5)
+
+        self.onnxscript_graph.register_outputs(output)
+        traced = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        @onnxscript.script()
+        def expected_model():
+            return op.Constant(value_float=0.5)
+
+        expected = expected_model.to_model_proto()
+
+        onnxscript.testing.assert_isomorphic(traced, expected)
+
+    def test_traced_graph_on_single_node_is_same_as_compiled_graph(self):
+        aten_relu = ops.nn.aten_relu
+
+        x = self.onnxscript_graph.add_input("x", (1, 2, 3), torch.float32)
+        with evaluator.default_as(self.tracer):
+            output = aten_relu(x)
+
+        self.onnxscript_graph.register_outputs(output)
+        traced = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        @onnxscript.script(default_opset=op)
+        def expected_model(x: FLOAT[1, 2, 3]):
+            return aten_relu(x)
+
+        expected = expected_model.to_model_proto()
+
+        onnxscript.testing.assert_isomorphic(traced, expected)
+
+    def test_model_local_function_constructed_by_traced_graph_is_same_as_compiled_graph(
+        self,
+    ):
+        aten_abs = ops.core.aten_abs
+        aten_relu = ops.nn.aten_relu
+
+        inner_graph = onnx_graph_building.OnnxGraph(domain_name="test_domain")
+        inner_tracer = onnx_graph_building.OnnxGraphTracingEvaluator(inner_graph)
+        x = inner_graph.add_input("x", (1, 2, 3), torch.float32)
+        with evaluator.default_as(inner_tracer):
+            output = aten_abs(x)
+        inner_graph.register_outputs(output)
+
+        x = self.onnxscript_graph.add_input("x", (1, 2, 3), torch.float32)
+        with evaluator.default_as(self.tracer):
+            output = aten_relu(x)
+        output = self.onnxscript_graph.add_module_call("inner", inner_graph, (output,))
+        self.onnxscript_graph.register_outputs(output)
+        traced = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        @onnxscript.script(
+            opset=onnxscript.values.Opset("test_domain", 1),
+            default_opset=op,
+        )
+        def inner(x: FLOAT[1, 2, 3]):
+            return aten_abs(x)
+
+        @onnxscript.script(default_opset=op)
+        def outer(x: FLOAT[1, 2, 3]):
+            output = aten_relu(x)
+            return inner(output)
+
+        expected = outer.to_model_proto()
+        onnxscript.testing.assert_isomorphic(traced, expected)
+
+    def test_to_model_proto_inlines_functions_and_module_calls(self):
+        inner_graph = onnx_graph_building.OnnxGraph(domain_name="test_domain")
+        x = inner_graph.add_input("x", (1, 2, 3), torch.float32)
+        with evaluator.default_as(onnx_graph_building.OnnxGraphTracingEvaluator(inner_graph)):
+            output = ops.core.aten_abs(x)
+        inner_graph.register_outputs(output)
+
+        x = self.onnxscript_graph.add_input("x", (1, 2, 3), torch.float32)
+        with evaluator.default_as(self.tracer):
+            output = ops.nn.aten_relu(x)
+        output = self.onnxscript_graph.add_module_call("inner", inner_graph, (output,))
+        self.onnxscript_graph.register_outputs(output)
+
+        model = self.onnxscript_graph.to_model_proto(self.opset_version, inline_functions=True)
+
+        self.assertEqual(len(model.functions), 0)
+        self.assertEqual([node.op_type for node in model.graph.node], ["Relu", "Abs"])
+        onnx.checker.check_model(model, full_check=True)
+
+    def test_function_calls_use_variants_specialized_for_their_attributes(self):
+        self.onnxscript_graph.function_specializer = specializer.FunctionSpecializer(
+            max_specializations=2
+        )
+        x = self.onnxscript_graph.add_input("x", (2, 3), torch.float32)
+        y = self.onnxscript_graph.add_input("y", (2, 3), torch.float32)
+        reductions = (1, 1, 2, 0)
+        with evaluator.default_as(self.tracer):
+            outputs = tuple(
+                ops.nn.aten_mse_loss(x, y, reduction=reduction) for reduction in reductions
+            )
+        for output, reduction in zip(outputs, reductions):
+            output.shape = (2, 3) if reduction == 0 else ()
+            output.dtype = torch.float32
+        self.onnxscript_graph.register_outputs(outputs)
+
+        model = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        self.assertEqual(
+            [node.op_type for node in model.graph.node],
+            [
+                "aten_mse_loss_specialized_0",
+                "aten_mse_loss_specialized_0",
+                "aten_mse_loss_specialized_1",
+                "aten_mse_loss",
+            ],
+        )
+        onnx.checker.check_model(model, full_check=True)
+
+    def test_traced_graph_is_same_as_torchscript_traced_graph(self):
+        def trace(graph, tracer):
+            x = graph.add_input("x", (2, 3), torch.float32)
+            with evaluator.default_as(tracer):
+                values, indices = ops.core.aten_topk(ops.nn.aten_gelu(x), 2, dim=1)
+            values.shape, indices.shape = (2, 2), (2, 2)
+            values.dtype, indices.dtype = torch.float32, torch.int64
+            graph.register_outputs((values, indices))
+            return graph.to_model_proto(self.opset_version)
+
+        torchscript_graph = graph_building.TorchScriptGraph()
+        expected = trace(
+            torchscript_graph, graph_building.TorchScriptTracingEvaluator(torchscript_graph)
+        )
+        traced = trace(self.onnxscript_graph, self.tracer)
+
+        # TorchScript sets empty doc strings, so the graphs are compared as text
+        self.assertEqual(
+            onnx.printer.to_text(traced.graph), onnx.printer.to_text(expected.graph)
+        )
+        self.assertEqual(traced.functions, expected.functions)
+        inputs = {"x": np.random.rand(2, 3).astype(np.float32)}
+        np.testing.assert_allclose(
+            _run_model(traced, inputs), _run_model(expected, inputs), rtol=1e-6
+        )
+
+    def test_sequence_input_is_constructed_from_tensors(self):
+        x = self.onnxscript_graph.add_input("x", (2, 3), torch.float32)
+        y = self.onnxscript_graph.add_input("y", (2, 3), torch.float32)
+        with evaluator.default_as(self.tracer):
+            output = ops.core.aten_cat((x, y), dim=0)
+        output.shape = (4, 3)
+        output.dtype = torch.float32
+        self.onnxscript_graph.register_outputs(output)
+
+        model = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        self.assertEqual(
+            [node.op_type for node in model.graph.node], ["SequenceConstruct", "aten_cat"]
+        )
+        inputs = {
+            "x": np.ones((2, 3), dtype=np.float32),
+            "y": np.zeros((2, 3), dtype=np.float32),
+        }
+        np.testing.assert_array_equal(
+            _run_model(model, inputs)[0], np.concatenate([inputs["x"], inputs["y"]])
+        )
+
+    def test_equal_constant_inputs_share_a_constant_node(self):
+        x = self.onnxscript_graph.add_input("x", (2, 3), torch.float32)
+        with evaluator.default_as(self.tracer):
+            reshaped = op.Reshape(op.Reshape(x, [3, 2]), (3, 2))
+            output = op.Sub(op.Sub(reshaped, -0.0), 0.0)
+        self.onnxscript_graph.register_outputs(output)
+
+        model = self.onnxscript_graph.to_model_proto(self.opset_version)
+
+        self.assertEqual(
+            [node.op_type for node in model.graph.node],
+            ["Constant", "Reshape", "Reshape", "Constant", "Sub", "Constant", "Sub"],
+        )
+        self.assertEqual(self.onnxscript_graph.num_deduplicated_constants, 1)
+
+    def test_add_input_without_name_is_a_missing_input(self):
+        x = self.onnxscript_graph.add_input("x", (2, 3), torch.float32)
+        missing = self.onnxscript_graph.add_input(None)
+        with evaluator.default_as(self.tracer):
+            output = op.Clip(x, missing, op.Constant(value_float=0.5))
+        self.onnxscript_graph.register_outputs(output)
+
+        model = self.onnxscript_graph.to_model_proto(self.opset_version, validation="none")
+
+        self.assertEqual(model.graph.node[-1].input[1], "")
+        self.assertEqual([input_.name for input_ in model.graph.input], ["x"])
+
+
+def _run_model(model: onnx.ModelProto, inputs) -> list:
+    session = onnxruntime.InferenceSession(
+        model.SerializeToString(), providers=["CPUExecutionProvider"]
+    )
+    return session.run(None, inputs)
+
+
+class TestOnnxGraph(unittest.TestCase):
+    def test_add_initializer_raises_when_the_same_name_used_for_different_tensors(self):
+        graph = onnx_graph_building.OnnxGraph()
+        graph.add_initializer("x", torch.ones((1, 2, 3), dtype=torch.float32))
+        with self.assertRaises(ValueError):
+            graph.add_initializer("x", torch.ones((1, 2, 3), dtype=torch.float32))
+
+    def test_add_initializer_allows_adding_the_same_tensor_twice_using_same_name(self):
+        graph = onnx_graph_building.OnnxGraph()
+        x_tensor = torch.ones((1, 2, 3), dtype=torch.float32)
+        self.assertIs(
+            graph.add_initializer("x", x_tensor), graph.add_initializer("x", x_tensor)
+        )
+
+    def test_to_model_proto_raises_for_unknown_validation_level(self):
+        with self.assertRaises(ValueError):
+            onnx_graph_building.OnnxGraph().to_model_proto(18, validation="partial")
+
+    def _initializer_graph(self) -> onnx_graph_building.OnnxGraph:
+        graph = onnx_graph_building.OnnxGraph()
+        x = graph.add_input("x", (4, 256), torch.float32)
+        weight = graph.add_initializer(
+            "weight", torch.arange(1024, dtype=torch.float32).reshape(4, 256)
+        )
+        bias = graph.add_initializer("bias", torch.ones(4, 256, dtype=torch.bfloat16))
+        scale = graph.add_initializer("scale", torch.tensor([2.0]))
+        with evaluator.default_as(onnx_graph_building.OnnxGraphTracingEvaluator(graph)):
+            output = op.Mul(op.Add(op.Add(x, weight), op.CastLike(bias, x)), scale)
+        graph.register_outputs(output)
+        return graph
+
+    def test_to_model_proto_includes_initializers(self):
+        model = self._initializer_graph().to_model_proto(18)
+
+        self.assertEqual([input_.name for input_ in model.graph.input], ["x"])
+        initializers = {
+            tensor.name: onnx.numpy_helper.to_array(tensor)
+            for tensor in model.graph.initializer
+        }
+        np.testing.assert_array_equal(
+            initializers["weight"], np.arange(1024, dtype=np.float32).reshape(4, 256)
+        )
+        np.testing.assert_array_equal(initializers["scale"], np.array([2.0], dtype=np.float32))
+        self.assertEqual(
+            [tensor.data_type for tensor in model.graph.initializer],
+            [onnx.TensorProto.FLOAT, onnx.TensorProto.BFLOAT16, onnx.TensorProto.FLOAT],
+        )
+        onnx.checker.check_model(model, full_check=True)
+
+    def test_to_model_proto_without_initializers_makes_them_inputs(self):
+        model = self._initializer_graph().to_model_proto(18, include_initializers=False)
+
+        self.assertEqual(len(model.graph.initializer), 0)
+        self.assertEqual(
+            [input_.name for input_ in model.graph.input], ["x", "weight", "bias", "scale"]
+        )
+
+    def test_to_model_proto_with_external_data_writes_initializers_to_file(self):
+        graph = self._initializer_graph()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            model = graph.to_model_proto_with_external_data(
+                18, os.path.join(temp_dir, "model.data")
+            )
+            initializers = {tensor.name: tensor for tensor in model.graph.initializer}
+            self.assertEqual(initializers["weight"].data_location, onnx.TensorProto.EXTERNAL)
+            self.assertEqual(initializers["bias"].data_location, onnx.TensorProto.EXTERNAL)
+            self.assertEqual(initializers["scale"].data_location, onnx.TensorProto.DEFAULT)
+
+            onnx.load_external_data_for_model(model, temp_dir)
+        expected = graph.to_model_proto(18)
+        self.assertEqual(
+            {
+                tensor.name: onnx.numpy_helper.to_array(tensor).tolist()
+                for tensor in model.graph.initializer
+            },
+            {
+                tensor.name: onnx.numpy_helper.to_array(tensor).tolist()
+                for tensor in expected.graph.initializer
+            },
+        )
+
+    def test_to_model_proto_with_external_data_writes_initializers_to_sink(self):
+        sink = io.BytesIO()
+        model = self._initializer_graph().to_model_proto_with_external_data(
+            18, sink, location="weights.bin", size_threshold=0
+        )
+        offsets = []
+        for tensor in model.graph.initializer:
+            external_data = {entry.key: entry.value for entry in tensor.external_data}
+            offsets.append((int(external_data["offset"]), int(external_data["length"])))
+        self.assertEqual(offsets, [(0, 4096), (4096, 2048), (6144, 4)])
+        self.assertEqual(len(sink.getvalue()), 6148)
+
+
+if __name__ == "__main__":
+    unittest.main()
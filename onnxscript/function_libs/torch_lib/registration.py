@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from types import FunctionType
 from typing import Any, Callable, Generator, Optional
@@ -13,6 +14,10 @@ _QUALIFIED_OPERATOR_NAME_REGEX = re.compile(
     r"^(?P<namespace>[a-zA-Z0-9_]+)::(?P<name>[a-zA-Z0-9_]+)(?P<overload>\.[a-zA-Z0-9._]+)?$"
 )
 
+# Set to "1" to convert torch_lib functions when they are registered instead of on
+# first use, so that conversion errors surface at import time (e.g. in CI)
+EAGER_COMPILATION_ENV = "ONNXSCRIPT_TORCH_LIB_EAGER_COMPILATION"
+
 
 class OverloadedFunction:
     """Overloaded function.
@@ -91,6 +96,10 @@ def _check_and_normalize_names(name: str | tuple[str, ...]) -> tuple[str, ...]:
     return names
 
 
+def _eager_compilation_enabled() -> bool:
+    return os.environ.get(EAGER_COMPILATION_ENV, "0") == "1"
+
+
 def torch_op(
     name: str | tuple[str, ...],
     *,
@@ -108,6 +117,9 @@ def torch_op(
             i.e. "aten::relu" instead of "aten::relu.default".
         registry: Registry to register the function to. If None, the default registry is used.
         trace_only: Whether the function should only be traced and not compiled.
+            Functions that are not trace-only are compiled lazily on first use,
+            unless the ONNXSCRIPT_TORCH_LIB_EAGER_COMPILATION environment
+            variable is set to "1".
         private: Whether the function is private (not directly exposed). It should
             be true for all functions with names starting with "_".
         complex: Whether the function supports complex.
@@ -126,7 +138,10 @@ def torch_op(
             processed_func = onnxscript.values.TracedOnnxFunction(custom_opset, func)
         else:
             assert isinstance(func, FunctionType)
-            processed_func = onnxscript.script(opset=custom_opset)(func)
+            if _eager_compilation_enabled():
+                processed_func = onnxscript.script(opset=custom_opset)(func)
+            else:
+                processed_func = onnxscript.values.LazyOnnxFunction(custom_opset, func)
 
         assert registry is not None
         for name_ in _check_and_normalize_names(name):
@@ -0,0 +1,41 @@
+"""Unit tests for the torch_lib function registry."""
+
+import os
+import unittest
+from unittest import mock
+
+from onnxscript import values
+from onnxscript.function_libs.torch_lib import registration
+from onnxscript.onnx_opset import opset18 as op
+
+
+def aten_test_relu(self):
+    return op.Relu(self)
+
+
+class TorchOpTest(unittest.TestCase):
+    def test_registered_function_is_compiled_lazily(self):
+        registry = registration.Registry()
+        with mock.patch.dict(os.environ, {registration.EAGER_COMPILATION_ENV: "0"}):
+            function = registration.torch_op("aten::test_relu", registry=registry)(
+                aten_test_relu
+            )
+        self.assertIsInstance(function, values.LazyOnnxFunction)
+        self.assertFalse(function.is_compiled)
+        self.assertIs(registry["aten::test_relu"].overloads[0], function)
+        self.assertEqual(function.function_ir.domain, "pkg.onnxscript.torch_lib")
+        self.assertTrue(function.is_compiled)
+
+    def test_registered_function_is_compiled_eagerly_when_env_is_set(self):
+        registry = registration.Registry()
+        with mock.patch.dict(os.environ, {registration.EAGER_COMPILATION_ENV: "1"}):
+            function = registration.torch_op("aten::test_relu", registry=registry)(
+                aten_test_relu
+            )
+        self.assertNotIsInstance(function, values.LazyOnnxFunction)
+        self.assertIsInstance(function, values.OnnxFunction)
+        self.assertEqual(function.function_ir.domain, "pkg.onnxscript.torch_lib")
+
+
+if __name__ == "__main__":
+    unittest.main()
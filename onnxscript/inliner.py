@@ -0,0 +1,218 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+"""Inlining of model-local functions into the graph of a model.
+
+Models exported with torch_lib call their ops through model-local FunctionProtos.
+Some runtimes and graph optimizers cannot optimize across function boundaries;
+:func:`inline_functions` replaces the calls with the nodes of the functions.
+"""
+from __future__ import annotations
+
+import collections
+import logging
+from typing import Collection, Dict, Iterable, Optional, Tuple
+
+import onnx
+
+from onnxscript._internal import graph_utils
+
+logger = logging.getLogger("onnxscript")
+
+FunctionId = Tuple[str, str]
+"""The (domain, name) of a function."""
+
+
+def _graph_names(graph: onnx.GraphProto, names: set[str]) -> None:
+    """Adds the names of all values defined or used in a graph and its subgraphs."""
+    for value_info in (*graph.input, *graph.output, *graph.value_info):
+        names.add(value_info.name)
+    names.update(initializer.name for initializer in graph.initializer)
+    for node in graph.node:
+        names.update(node.input)
+        names.update(node.output)
+        if node.name:
+            names.add(node.name)
+        for subgraph in graph_utils.subgraphs(node):
+            _graph_names(subgraph, names)
+
+
+def _called_functions(nodes: Iterable[onnx.NodeProto], called: set[FunctionId]) -> None:
+    for node in nodes:
+        called.add((node.domain, node.op_type))
+        for subgraph in graph_utils.subgraphs(node):
+            _called_functions(subgraph.node, called)
+
+
+class _Inliner:
+    def __init__(
+        self, functions: Dict[FunctionId, onnx.FunctionProto], used_names: set[str]
+    ) -> None:
+        self._functions = functions
+        self._used_names = used_names
+        self.node_counts: Dict[FunctionId, int] = collections.defaultdict(int)
+
+    def _unique_name(self, name: str) -> str:
+        candidate = name
+        suffix = 0
+        while candidate in self._used_names:
+            suffix += 1
+            candidate = f"{name}_{suffix}"
+        self._used_names.add(candidate)
+        return candidate
+
+    def inline_nodes(
+        self, nodes: Iterable[onnx.NodeProto], call_stack: Tuple[FunctionId, ...] = ()
+    ) -> list[onnx.NodeProto]:
+        """Returns the nodes with the calls to the inlined functions expanded."""
+        result = []
+        for node in nodes:
+            function_id = (node.domain, node.op_type)
+            function = self._functions.get(function_id)
+            if function is None:
+                for subgraph in graph_utils.subgraphs(node):
+                    inlined = self.inline_nodes(subgraph.node, call_stack)
+                    del subgraph.node[:]
+                    subgraph.node.extend(inlined)
+                result.append(node)
+                continue
+            if function_id in call_stack:
+                raise ValueError(f"Function {function_id} calls itself recursively.")
+            result.extend(
+                self.inline_nodes(
+                    self._expand_call(node, function), (*call_stack, function_id)
+                )
+            )
+        return result
+
+    def _expand_call(
+        self, call: onnx.NodeProto, function: onnx.FunctionProto
+    ) -> list[onnx.NodeProto]:
+        """Returns the nodes of a function bound to the arguments of a call."""
+        renames: Dict[str, str] = {"": ""}
+        for i, name in enumerate(function.input):
+            renames[name] = call.input[i] if i < len(call.input) else ""
+        for i, name in enumerate(function.output):
+            if i < len(call.output) and call.output[i]:
+                renames[name] = call.output[i]
+
+        def rename(name: str) -> str:
+            if name not in renames:
+                renames[name] = self._unique_name(f"{function.name}_{name}")
+            return renames[name]
+
+        attributes = {attr.name: attr for attr in function.attribute_proto}
+        attributes.update((attr.name, attr) for attr in call.attribute)
+
+        nodes = []
+        for function_node in function.node:
+            node = onnx.NodeProto()
+            node.CopyFrom(function_node)
+            graph_utils.rename_node(node, rename)
+            graph_utils.bind_attributes(node, attributes)
+            node.name = self._unique_name(
+                f"{call.name or function.name}/{function_node.name or node.op_type}"
+            )
+            nodes.append(node)
+        self.node_counts[(function.domain, function.name)] += sum(
+            (node.domain, node.op_type) not in self._functions for node in nodes
+        )
+        return nodes
+
+
+def inline_functions(
+    model: onnx.ModelProto,
+    domains: Optional[Collection[str]] = None,
+    names: Optional[Collection[str]] = None,
+) -> Dict[FunctionId, int]:
+    """Inlines the model-local functions of a model into its graph, in place.
+
+    Calls to the selected functions are replaced with the nodes of the functions,
+    recursively. The values and nodes of the inlined functions are renamed to avoid
+    collisions, and references to function attributes are replaced with the
+    attributes of the calls, or their default values. Functions that are no longer
+    called are removed from the model.
+
+    Functions that import an opset at a version other than the one imported by the
+    model are not inlined, since their nodes would be interpreted differently.
+
+    Args:
+        model: The model.
+        domains: If set, only functions of these domains are inlined.
+        names: If set, only functions with these names are inlined.
+
+    Returns:
+        The number of nodes each inlined function contributed to the graph, summed
+        over all the calls to the function. Nodes of functions called by a function
+        are counted for the called function.
+    """
+    model_opsets = {opset.domain: opset.version for opset in model.opset_import}
+    functions: Dict[FunctionId, onnx.FunctionProto] = {}
+    for function in model.functions:
+        if domains is not None and function.domain not in domains:
+            continue
+        if names is not None and function.name not in names:
+            continue
+        mismatched_opsets = [
+            opset
+            for opset in function.opset_import
+            if model_opsets.get(opset.domain, opset.version) != opset.version
+        ]
+        if mismatched_opsets:
+            logger.debug(
+                "Not inlining function '%s::%s', which imports %s while the model imports %s",
+                function.domain,
+                function.name,
+                mismatched_opsets,
+                model_opsets,
+            )
+            continue
+        functions[(function.domain, function.name)] = function
+    if not functions:
+        return {}
+
+    used_names: set[str] = set()
+    _graph_names(model.graph, used_names)
+    inliner = _Inliner(functions, used_names)
+    nodes = inliner.inline_nodes(model.graph.node)
+    del model.graph.node[:]
+    model.graph.node.extend(nodes)
+
+    # Keep the functions that are still called, directly or by other functions
+    remaining = {(function.domain, function.name): function for function in model.functions}
+    called: set[FunctionId] = set()
+    _called_functions(model.graph.node, called)
+    pending = [function_id for function_id in called if function_id in remaining]
+    kept: set[FunctionId] = set()
+    while pending:
+        function_id = pending.pop()
+        if function_id in kept:
+            continue
+        kept.add(function_id)
+        function_called: set[FunctionId] = set()
+        _called_functions(remaining[function_id].node, function_called)
+        called.update(function_called)
+        pending.extend(f for f in function_called if f in remaining)
+    kept_functions = [f for f in model.functions if (f.domain, f.name) in kept]
+    del model.functions[:]
+    model.functions.extend(kept_functions)
+
+    # Import the opsets used by the inlined nodes, and drop the domains of the
+    # functions that are no longer used
+    used_domains = {domain for domain, _ in called}
+    for function in functions.values():
+        for opset in function.opset_import:
+            if opset.domain not in model_opsets and opset.domain in used_domains:
+                model.opset_import.append(opset)
+                model_opsets[opset.domain] = opset.version
+    inlined_domains = {domain for domain, _ in functions}
+    opset_imports = [
+        opset
+        for opset in model.opset_import
+        if opset.domain not in inlined_domains or opset.domain in used_domains
+    ]
+    del model.opset_import[:]
+    model.opset_import.extend(opset_imports)
+
+    return dict(inliner.node_counts)
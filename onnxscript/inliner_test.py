@@ -0,0 +1,108 @@
+import unittest
+
+import numpy as np
+import onnx
+import onnx.checker
+import onnx.helper
+import onnx.parser
+import onnxruntime as ort
+
+from onnxscript import inliner
+
+_MODEL = """
+<ir_version: 8, opset_import: ["" : 18, "local" : 1, "other" : 1]>
+agraph (float[N] x) => (float[N] y, float[N] scale_add_m) {
+    t = local.scale_add <alpha: float = 2.0> (x, x)
+    scale_add_m = other.neg (t)
+    y = local.scale_add (t, x)
+}
+<domain: "local", opset_import: ["" : 18, "local" : 1]>
+scale_add <alpha> (a, b) => (c) {
+    s = Constant <value_float: float = @alpha> ()
+    m = local.mul (a, s)
+    c = Add (m, b)
+}
+<domain: "local", opset_import: ["" : 18]>
+mul (a, b) => (c) {
+    c = Mul (a, b)
+}
+<domain: "other", opset_import: ["" : 18]>
+neg (a) => (b) {
+    b = Neg (a)
+}
+"""
+
+
+def _model() -> onnx.ModelProto:
+    model = onnx.parser.parse_model(_MODEL)
+    # The parser does not support default attribute values
+    model.functions[0].attribute_proto.append(onnx.helper.make_attribute("alpha", 3.0))
+    return model
+
+
+def _run(model: onnx.ModelProto, x: np.ndarray) -> list[np.ndarray]:
+    session = ort.InferenceSession(
+        model.SerializeToString(), providers=["CPUExecutionProvider"]
+    )
+    return session.run(None, {"x": x})
+
+
+class InlineFunctionsTest(unittest.TestCase):
+    def test_inlined_model_computes_the_same_outputs(self):
+        model = _model()
+        x = np.arange(4, dtype=np.float32)
+        expected = _run(model, x)
+
+        node_counts = inliner.inline_functions(model)
+
+        self.assertEqual(len(model.functions), 0)
+        self.assertEqual(
+            node_counts,
+            {("local", "scale_add"): 4, ("local", "mul"): 2, ("other", "neg"): 1},
+        )
+        self.assertEqual(
+            [node.op_type for node in model.graph.node],
+            ["Constant", "Mul", "Add", "Neg", "Constant", "Mul", "Add"],
+        )
+        onnx.checker.check_model(model, full_check=True)
+        for actual_output, expected_output in zip(_run(model, x), expected):
+            np.testing.assert_allclose(actual_output, expected_output)
+
+    def test_inlined_values_do_not_collide_with_graph_values(self):
+        model = _model()
+        inliner.inline_functions(model)
+        outputs = [name for node in model.graph.node for name in node.output]
+        self.assertEqual(len(outputs), len(set(outputs)))
+        # The value named like an inlined value is computed by the function call
+        (neg,) = [node for node in model.graph.node if node.op_type == "Neg"]
+        self.assertEqual(list(neg.output), ["scale_add_m"])
+
+    def test_attribute_references_are_bound_to_call_attributes_or_defaults(self):
+        model = _model()
+        inliner.inline_functions(model)
+        constants = [node for node in model.graph.node if node.op_type == "Constant"]
+        self.assertEqual([node.attribute[0].f for node in constants], [2.0, 3.0])
+        self.assertFalse(any(node.attribute[0].ref_attr_name for node in constants))
+
+    def test_only_functions_of_selected_domains_are_inlined(self):
+        model = _model()
+        x = np.arange(4, dtype=np.float32)
+        expected = _run(model, x)
+
+        node_counts = inliner.inline_functions(model, domains=["other"])
+
+        self.assertEqual(node_counts, {("other", "neg"): 1})
+        self.assertEqual([function.name for function in model.functions], ["scale_add", "mul"])
+        self.assertNotIn("other", [opset.domain for opset in model.opset_import])
+        for actual_output, expected_output in zip(_run(model, x), expected):
+            np.testing.assert_allclose(actual_output, expected_output)
+
+    def test_functions_importing_other_opset_versions_are_not_inlined(self):
+        model = _model()
+        model.opset_import[0].version = 17
+        self.assertEqual(inliner.inline_functions(model, names=["neg"]), {})
+        self.assertEqual(len(model.functions), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
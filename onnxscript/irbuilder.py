@@ -68,6 +68,8 @@ class IRTypeLike(Protocol):
 class IRVar:
     """A variable (representing a formal parameter)."""
 
+    __slots__ = ("name", "info", "typeinfo")
+
     def __init__(self, varname: str, typeinfo: IRTypeLike, sourceinfo: SourceInfo) -> None:
         if not isinstance(varname, str):
             raise ValueError(f"varname must be a string not {type(varname)!r}.")
@@ -118,6 +120,8 @@ class IRAttributeValue:
         attr_proto: The attribute proto.
     """
 
+    __slots__ = ("attr_proto",)
+
     def __init__(self, attrproto: onnx.AttributeProto) -> None:
         self.attr_proto = attrproto
 
@@ -150,12 +154,20 @@ class IRAttributeParameter:
         attr_proto: The attribute proto.
     """
 
+    # A default value for default_value would be a class variable conflicting with
+    # the slot, so it is always passed.
+    __slots__ = ("name", "type", "default_value")
+
     name: str
     type: onnx.AttributeProto.AttributeType
-    default_value: str | int | float | None = None
+    default_value: str | int | float | None
 
     # TODO(justinchuby): Validate the default_value is the same type as specified in AttributeType.
 
+    def __reduce__(self):
+        # The default reduction of slots assigns the fields, which frozen instances reject
+        return (self.__class__, (self.name, self.type, self.default_value))
+
     def __str__(self):
         if self.has_default:
             return helper.printable_attribute(self.attr_proto)
@@ -183,6 +195,8 @@ class IRAttributeParameter:
 
 
 class IRStmt:
+    __slots__ = ("result", "callee", "args", "attrs", "functions")
+
     def __init__(
         self,
         result: Sequence[str],
@@ -6,10 +6,14 @@
 from __future__ import annotations
 
 import ast
+import concurrent.futures
+import importlib
 import inspect
+import os
+import pickle
 import sys
 import types
-from typing import Any, Callable, Optional, Sequence
+from typing import Any, Callable, Optional, Sequence, Union
 
 import onnx.helper
 
@@ -82,6 +86,18 @@ def script(
         if not inspect.isfunction(f):
             raise TypeError("The ONNXScript decorator should be applied to functions only.")
 
+        # Imported here so that `python -m onnxscript.function_cache` does not find
+        # the module already imported by the onnxscript package
+        from onnxscript import function_cache  # pylint: disable=import-outside-toplevel
+
+        if function_cache.default_cache() is not None:
+            # Load the converted function from the on-disk cache, or convert it now
+            # and store it there
+            function = values.LazyOnnxFunction(opset, f, kwargs, default_opset=default_opset)
+            if not function.load_cached():
+                function.compile()
+            return function
+
         src, f_ast = ast_utils.get_src_and_ast(f)
         # The script should be compiled using the globals/locals at the definition site.
         # This allows the script to reference names defined outside the script,
@@ -156,6 +172,114 @@ def is_converted_fun(f: Any) -> bool:
     return isinstance(f, onnxscript.OnnxFunction)
 
 
+def _lazy_functions(module: types.ModuleType) -> list[tuple[str, values.LazyOnnxFunction]]:
+    """Returns the names and the lazy functions of a module that are not converted yet.
+
+    Functions found in the function cache are loaded from it and not returned.
+    """
+    functions = []
+    seen = set()
+    for name, value in vars(module).items():
+        if (
+            isinstance(value, values.LazyOnnxFunction)
+            and id(value) not in seen
+            and not value.is_compiled
+            and not value.load_cached()
+        ):
+            seen.add(id(value))
+            functions.append((name, value))
+    return functions
+
+
+def _convert_functions(module_name: str, names: Sequence[str]) -> list[Optional[bytes]]:
+    """Converts lazy functions of a module in a worker process of compile_module.
+
+    Returns the pickled conversions, or None for functions whose conversion cannot
+    be pickled, e.g. because of shaped tensor types in their parameter schemas.
+    """
+    from onnxscript import function_cache  # pylint: disable=import-outside-toplevel
+
+    module = importlib.import_module(module_name)
+    results: list[Optional[bytes]] = []
+    for name in names:
+        function = getattr(module, name)
+        # Stores the function in the function cache if it is enabled
+        function.compile()
+        try:
+            results.append(
+                pickle.dumps(
+                    function_cache._conversion_to_dict(  # pylint: disable=protected-access
+                        function
+                    ),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            )
+        except Exception:  # pylint: disable=broad-except
+            results.append(None)
+    return results
+
+
+def compile_module(
+    module: Union[types.ModuleType, str],
+    workers: Optional[int] = None,
+) -> int:
+    """Converts the lazily converted functions of a module in a pool of processes.
+
+    The :class:`onnxscript.values.LazyOnnxFunction` objects of the module, such as
+    the functions of ``onnxscript.function_libs.torch_lib.ops``, are converted in
+    ``workers`` processes, which send back the FunctionProtos and schemas of the
+    functions in serialized form. They are loaded in the functions of the module,
+    which convert their Python source again only if their IR is needed. Each
+    function is converted independently, so the result does not depend on the
+    number of workers. Functions found in the function cache are loaded from it,
+    and the converted functions are stored in it when it is enabled.
+
+    Args:
+        module: The module, or its name. It must be importable by its name in the
+            worker processes.
+        workers: The number of worker processes. Defaults to the number of CPUs.
+            With one worker, the functions are converted in this process.
+
+    Returns:
+        The number of functions converted.
+
+    Raises:
+        Exception: The error of the conversion of a function, if one fails.
+    """
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    functions = _lazy_functions(module)
+    if workers <= 1 or len(functions) <= 1:
+        for _, function in functions:
+            function.compile()
+        return len(functions)
+
+    # Imported here so that `python -m onnxscript.function_cache` does not find
+    # the module already imported by the onnxscript package
+    from onnxscript import function_cache  # pylint: disable=import-outside-toplevel
+
+    # Contiguous chunks of functions, a few per worker to balance the load
+    names = [name for name, _ in functions]
+    num_chunks = min(len(names), workers * 4)
+    bounds = [i * len(names) // num_chunks for i in range(num_chunks + 1)]
+    chunks = [names[start:end] for start, end in zip(bounds, bounds[1:])]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_convert_functions, [module.__name__] * num_chunks, chunks)
+        conversions = [conversion for chunk in results for conversion in chunk]
+    for (_, function), conversion in zip(functions, conversions):
+        if conversion is None:
+            function.compile()
+        else:
+            function.load_conversion(
+                function_cache._conversion_from_dict(  # pylint: disable=protected-access
+                    pickle.loads(conversion)
+                )
+            )
+    return len(functions)
+
+
 def export_onnx_lib(functions: Sequence[values.OnnxFunction], filename: str) -> None:
     # Since we don't yet have LibProto defined, we use a ModelProto as a temporary
     # container for the list of functions exported as a library, with an empty graph
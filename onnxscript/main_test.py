@@ -0,0 +1,129 @@
+import importlib
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+import onnxscript
+
+_MODULE_SOURCE = textwrap.dedent(
+    """
+    from onnxscript import FLOAT, values
+    from onnxscript.onnx_opset import opset18 as op
+
+    _OPSET = values.Opset("test.compile_module", 1)
+
+
+    def _add(x: FLOAT, y: FLOAT) -> FLOAT:
+        return op.Add(x, y)
+
+
+    def _scaled_sum(x: FLOAT, y: FLOAT, axis: int, alpha: float = 1.0) -> FLOAT:
+        return op.Flatten(op.Mul(op.Add(x, y), alpha), axis=axis)
+
+
+    def _add_twice(x: FLOAT) -> FLOAT:
+        return add(add(x, x), x)
+
+
+    def _relu(x: FLOAT) -> FLOAT:
+        return op.Relu(x)
+
+
+    add = values.LazyOnnxFunction(_OPSET, _add)
+    scaled_sum = values.LazyOnnxFunction(_OPSET, _scaled_sum)
+    add_twice = values.LazyOnnxFunction(_OPSET, _add_twice)
+    relu = values.LazyOnnxFunction(_OPSET, _relu)
+    # Aliases are converted once
+    relu_alias = relu
+    """
+)
+
+_FUNCTION_NAMES = ("add", "scaled_sum", "add_twice", "relu")
+
+
+class CompileModuleTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+        path = mock.patch.object(sys, "path", [self.temp_dir.name, *sys.path])
+        path.start()
+        self.addCleanup(path.stop)
+        self.num_modules = 0
+
+    def _import_new_module(self, source: str = _MODULE_SOURCE):
+        # A module importable by the worker processes, with new functions
+        self.num_modules += 1
+        module_name = f"compile_module_test_functions_{self.num_modules}"
+        with open(
+            os.path.join(self.temp_dir.name, f"{module_name}.py"), "w", encoding="utf-8"
+        ) as f:
+            f.write(source)
+        importlib.invalidate_caches()
+        self.addCleanup(sys.modules.pop, module_name, None)
+        return importlib.import_module(module_name)
+
+    def test_functions_converted_by_workers_are_the_same_as_converted_in_process(self):
+        expected = self._import_new_module()
+        for name in _FUNCTION_NAMES:
+            getattr(expected, name).compile()
+
+        for workers in (2, 3):
+            module = self._import_new_module()
+            self.assertEqual(onnxscript.compile_module(module, workers=workers), 4)
+            for name in _FUNCTION_NAMES:
+                function = getattr(module, name)
+                expected_function = getattr(expected, name)
+                self.assertFalse(function.is_compiled)
+                self.assertTrue(function.load_cached())
+                self.assertEqual(
+                    function.to_function_proto(), expected_function.to_function_proto()
+                )
+                self.assertEqual(function.param_schemas(), expected_function.param_schemas())
+                self.assertEqual(function.op_schema.name, expected_function.op_schema.name)
+
+    def test_function_ir_is_converted_on_demand_after_compile_module(self):
+        module = self._import_new_module()
+        onnxscript.compile_module(module, workers=2)
+
+        self.assertFalse(module.scaled_sum.is_compiled)
+        self.assertEqual(module.scaled_sum.function_ir.name, "_scaled_sum")
+        self.assertTrue(module.scaled_sum.is_compiled)
+
+    def test_one_worker_converts_in_process(self):
+        module = self._import_new_module()
+        with mock.patch("concurrent.futures.ProcessPoolExecutor") as executor:
+            self.assertEqual(onnxscript.compile_module(module.__name__, workers=1), 4)
+        executor.assert_not_called()
+        self.assertTrue(all(getattr(module, name).is_compiled for name in _FUNCTION_NAMES))
+
+    def test_converted_functions_are_skipped(self):
+        module = self._import_new_module()
+        module.add.compile()
+        module.relu.compile()
+
+        self.assertEqual(onnxscript.compile_module(module, workers=2), 2)
+        self.assertEqual(onnxscript.compile_module(module, workers=2), 0)
+
+    def test_conversion_errors_are_raised(self):
+        module = self._import_new_module(
+            _MODULE_SOURCE
+            + textwrap.dedent(
+                """
+
+                def _invalid(x: FLOAT) -> FLOAT:
+                    return [x for x in x]
+
+
+                invalid = values.LazyOnnxFunction(_OPSET, _invalid)
+                """
+            )
+        )
+        with self.assertRaises(ValueError):
+            onnxscript.compile_module(module, workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,7 +16,6 @@ from __future__ import annotations
 from typing import Optional, Sequence, Tuple, TypeVar, Union
 
 from onnx import GraphProto, TensorProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_types import (
@@ -36,7 +35,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset1(Opset):
@@ -60,9 +59,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Abs", 1, "")
-        op = Op(self, "Abs", schema)
-        return op(*self._prepare_inputs(schema, X), consumed_inputs=consumed_inputs)
+        op = self._get_op("Abs", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), consumed_inputs=consumed_inputs)
 
     T_Add = TypeVar("T_Add", DOUBLE, FLOAT, FLOAT16)
 
@@ -113,10 +111,9 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Add", 1, "")
-        op = Op(self, "Add", schema)
+        op = self._get_op("Add", 1)
         return op(
-            *self._prepare_inputs(schema, A, B),
+            *self._prepare_inputs(op.op_schema, A, B),
             axis=axis,
             broadcast=broadcast,
             consumed_inputs=consumed_inputs,
@@ -150,9 +147,8 @@ class Opset1(Opset):
             broadcast: Enable broadcasting
         """
 
-        schema = get_schema("And", 1, "")
-        op = Op(self, "And", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("And", 1)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
 
     T_ArgMax = TypeVar(
         "T_ArgMax",
@@ -187,9 +183,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ArgMax", 1, "")
-        op = Op(self, "ArgMax", schema)
-        return op(*self._prepare_inputs(schema, data), axis=axis, keepdims=keepdims)
+        op = self._get_op("ArgMax", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axis=axis, keepdims=keepdims)
 
     T_ArgMin = TypeVar(
         "T_ArgMin",
@@ -224,9 +219,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ArgMin", 1, "")
-        op = Op(self, "ArgMin", schema)
-        return op(*self._prepare_inputs(schema, data), axis=axis, keepdims=keepdims)
+        op = self._get_op("ArgMin", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axis=axis, keepdims=keepdims)
 
     T_AveragePool = TypeVar("T_AveragePool", DOUBLE, FLOAT, FLOAT16)
 
@@ -297,10 +291,9 @@ class Opset1(Opset):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("AveragePool", 1, "")
-        op = Op(self, "AveragePool", schema)
+        op = self._get_op("AveragePool", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             kernel_shape=kernel_shape,
             pads=pads,
@@ -370,10 +363,9 @@ class Opset1(Opset):
                 If false, compute the mean and variance across per feature.Default is 1.
         """
 
-        schema = get_schema("BatchNormalization", 1, "")
-        op = Op(self, "BatchNormalization", schema)
+        op = self._get_op("BatchNormalization", 1)
         return op(
-            *self._prepare_inputs(schema, X, scale, B, mean, var),
+            *self._prepare_inputs(op.op_schema, X, scale, B, mean, var),
             consumed_inputs=consumed_inputs,
             epsilon=epsilon,
             is_test=is_test,
@@ -419,9 +411,8 @@ class Opset1(Opset):
                 Strictly must be one of the types from DataType enum in TensorProto
         """
 
-        schema = get_schema("Cast", 1, "")
-        op = Op(self, "Cast", schema)
-        return op(*self._prepare_inputs(schema, input), to=to)
+        op = self._get_op("Cast", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), to=to)
 
     T_Ceil = TypeVar("T_Ceil", DOUBLE, FLOAT, FLOAT16)
 
@@ -440,9 +431,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Ceil", 1, "")
-        op = Op(self, "Ceil", schema)
-        return op(*self._prepare_inputs(schema, X), consumed_inputs=consumed_inputs)
+        op = self._get_op("Ceil", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), consumed_inputs=consumed_inputs)
 
     T_Clip = TypeVar("T_Clip", DOUBLE, FLOAT, FLOAT16)
 
@@ -472,10 +462,9 @@ class Opset1(Opset):
             min: Minimum value, under which element is replaced by min
         """
 
-        schema = get_schema("Clip", 1, "")
-        op = Op(self, "Clip", schema)
+        op = self._get_op("Clip", 1)
         return op(
-            *self._prepare_inputs(schema, input),
+            *self._prepare_inputs(op.op_schema, input),
             consumed_inputs=consumed_inputs,
             max=max,
             min=min,
@@ -494,9 +483,8 @@ class Opset1(Opset):
             axis: Which axis to concat on.  Default value is 1.
         """
 
-        schema = get_schema("Concat", 1, "")
-        op = Op(self, "Concat", schema)
-        return op(*self._prepare_inputs(schema, *inputs), axis=axis)
+        op = self._get_op("Concat", 1)
+        return op(*self._prepare_inputs(op.op_schema, *inputs), axis=axis)
 
     T_Constant: TypeAlias = Union[DOUBLE, FLOAT, FLOAT16]
 
@@ -509,8 +497,7 @@ class Opset1(Opset):
             value: The value for the elements of the output tensor.
         """
 
-        schema = get_schema("Constant", 1, "")
-        op = Op(self, "Constant", schema)
+        op = self._get_op("Constant", 1)
         return op(value=value)
 
     T_Conv = TypeVar("T_Conv", DOUBLE, FLOAT, FLOAT16)
@@ -585,10 +572,9 @@ class Opset1(Opset):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("Conv", 1, "")
-        op = Op(self, "Conv", schema)
+        op = self._get_op("Conv", 1)
         return op(
-            *self._prepare_inputs(schema, X, W, B),
+            *self._prepare_inputs(op.op_schema, X, W, B),
             auto_pad=auto_pad,
             dilations=dilations,
             group=group,
@@ -683,10 +669,9 @@ class Opset1(Opset):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("ConvTranspose", 1, "")
-        op = Op(self, "ConvTranspose", schema)
+        op = self._get_op("ConvTranspose", 1)
         return op(
-            *self._prepare_inputs(schema, X, W, B),
+            *self._prepare_inputs(op.op_schema, X, W, B),
             auto_pad=auto_pad,
             dilations=dilations,
             group=group,
@@ -732,9 +717,8 @@ class Opset1(Opset):
             blocksize: Blocks of [blocksize, blocksize] are moved.
         """
 
-        schema = get_schema("DepthToSpace", 1, "")
-        op = Op(self, "DepthToSpace", schema)
-        return op(*self._prepare_inputs(schema, input), blocksize=blocksize)
+        op = self._get_op("DepthToSpace", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), blocksize=blocksize)
 
     T_Div = TypeVar("T_Div", DOUBLE, FLOAT, FLOAT16)
 
@@ -785,10 +769,9 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Div", 1, "")
-        op = Op(self, "Div", schema)
+        op = self._get_op("Div", 1)
         return op(
-            *self._prepare_inputs(schema, A, B),
+            *self._prepare_inputs(op.op_schema, A, B),
             axis=axis,
             broadcast=broadcast,
             consumed_inputs=consumed_inputs,
@@ -825,10 +808,9 @@ class Opset1(Opset):
             ratio: (float, default 0.5) the ratio of random dropout
         """
 
-        schema = get_schema("Dropout", 1, "")
-        op = Op(self, "Dropout", schema)
+        op = self._get_op("Dropout", 1)
         return op(
-            *self._prepare_inputs(schema, data),
+            *self._prepare_inputs(op.op_schema, data),
             consumed_inputs=consumed_inputs,
             is_test=is_test,
             ratio=ratio,
@@ -856,10 +838,11 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Elu", 1, "")
-        op = Op(self, "Elu", schema)
+        op = self._get_op("Elu", 1)
         return op(
-            *self._prepare_inputs(schema, X), alpha=alpha, consumed_inputs=consumed_inputs
+            *self._prepare_inputs(op.op_schema, X),
+            alpha=alpha,
+            consumed_inputs=consumed_inputs,
         )
 
     T_Equal = TypeVar("T_Equal", BOOL, INT32, INT64)
@@ -890,9 +873,8 @@ class Opset1(Opset):
             broadcast: Enable broadcasting
         """
 
-        schema = get_schema("Equal", 1, "")
-        op = Op(self, "Equal", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("Equal", 1)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
 
     T_Exp = TypeVar("T_Exp", DOUBLE, FLOAT, FLOAT16)
 
@@ -909,9 +891,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Exp", 1, "")
-        op = Op(self, "Exp", schema)
-        return op(*self._prepare_inputs(schema, input), consumed_inputs=consumed_inputs)
+        op = self._get_op("Exp", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), consumed_inputs=consumed_inputs)
 
     T_Flatten = TypeVar("T_Flatten", DOUBLE, FLOAT, FLOAT16)
 
@@ -934,9 +915,8 @@ class Opset1(Opset):
                 shape of the input tensor is (d_0, d_1, ... d_n).
         """
 
-        schema = get_schema("Flatten", 1, "")
-        op = Op(self, "Flatten", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Flatten", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     T_Floor = TypeVar("T_Floor", DOUBLE, FLOAT, FLOAT16)
 
@@ -955,9 +935,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Floor", 1, "")
-        op = Op(self, "Floor", schema)
-        return op(*self._prepare_inputs(schema, X), consumed_inputs=consumed_inputs)
+        op = self._get_op("Floor", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), consumed_inputs=consumed_inputs)
 
     T_GRU = TypeVar("T_GRU", DOUBLE, FLOAT, FLOAT16)
 
@@ -1108,10 +1087,9 @@ class Opset1(Opset):
                 Default 0.
         """
 
-        schema = get_schema("GRU", 1, "")
-        op = Op(self, "GRU", schema)
+        op = self._get_op("GRU", 1)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h),
+            *self._prepare_inputs(op.op_schema, X, W, R, B, sequence_lens, initial_h),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -1205,9 +1183,8 @@ class Opset1(Opset):
                 the back. Accepted range is [-r, r-1]
         """
 
-        schema = get_schema("Gather", 1, "")
-        op = Op(self, "Gather", schema)
-        return op(*self._prepare_inputs(schema, data, indices), axis=axis)
+        op = self._get_op("Gather", 1)
+        return op(*self._prepare_inputs(op.op_schema, data, indices), axis=axis)
 
     T_Gemm = TypeVar("T_Gemm", DOUBLE, FLOAT, FLOAT16)
 
@@ -1254,10 +1231,9 @@ class Opset1(Opset):
             transB: Whether B should be transposed
         """
 
-        schema = get_schema("Gemm", 1, "")
-        op = Op(self, "Gemm", schema)
+        op = self._get_op("Gemm", 1)
         return op(
-            *self._prepare_inputs(schema, A, B, C),
+            *self._prepare_inputs(op.op_schema, A, B, C),
             alpha=alpha,
             beta=beta,
             broadcast=broadcast,
@@ -1283,9 +1259,8 @@ class Opset1(Opset):
                 x D2 ... Dn), where N is the batch size.
         """
 
-        schema = get_schema("GlobalAveragePool", 1, "")
-        op = Op(self, "GlobalAveragePool", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("GlobalAveragePool", 1)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_GlobalLpPool = TypeVar("T_GlobalLpPool", DOUBLE, FLOAT, FLOAT16)
 
@@ -1307,9 +1282,8 @@ class Opset1(Opset):
             p: p value of the Lp norm used to pool over the input data, default is 2.0.
         """
 
-        schema = get_schema("GlobalLpPool", 1, "")
-        op = Op(self, "GlobalLpPool", schema)
-        return op(*self._prepare_inputs(schema, X), p=p)
+        op = self._get_op("GlobalLpPool", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), p=p)
 
     T_GlobalMaxPool = TypeVar("T_GlobalMaxPool", DOUBLE, FLOAT, FLOAT16)
 
@@ -1329,9 +1303,8 @@ class Opset1(Opset):
                 x D2 ... Dn), where N is the batch size.
         """
 
-        schema = get_schema("GlobalMaxPool", 1, "")
-        op = Op(self, "GlobalMaxPool", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("GlobalMaxPool", 1)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Greater = TypeVar("T_Greater", DOUBLE, FLOAT, FLOAT16)
 
@@ -1361,9 +1334,8 @@ class Opset1(Opset):
             broadcast: Enable broadcasting
         """
 
-        schema = get_schema("Greater", 1, "")
-        op = Op(self, "Greater", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("Greater", 1)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
 
     T_HardSigmoid = TypeVar("T_HardSigmoid", DOUBLE, FLOAT, FLOAT16)
 
@@ -1393,10 +1365,9 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("HardSigmoid", 1, "")
-        op = Op(self, "HardSigmoid", schema)
+        op = self._get_op("HardSigmoid", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             alpha=alpha,
             beta=beta,
             consumed_inputs=consumed_inputs,
@@ -1433,9 +1404,8 @@ class Opset1(Opset):
                 because the 0th axis most likely describes the batch_size
         """
 
-        schema = get_schema("Hardmax", 1, "")
-        op = Op(self, "Hardmax", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Hardmax", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     T_Identity = TypeVar(
         "T_Identity",
@@ -1465,9 +1435,8 @@ class Opset1(Opset):
             input: Input tensor
         """
 
-        schema = get_schema("Identity", 1, "")
-        op = Op(self, "Identity", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Identity", 1)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     B_If: TypeAlias = BOOL
 
@@ -1506,10 +1475,9 @@ class Opset1(Opset):
                 match the number of outputs in the else_branch.
         """
 
-        schema = get_schema("If", 1, "")
-        op = Op(self, "If", schema)
+        op = self._get_op("If", 1)
         return op(
-            *self._prepare_inputs(schema, cond),
+            *self._prepare_inputs(op.op_schema, cond),
             else_branch=else_branch,
             then_branch=then_branch,
         )
@@ -1549,10 +1517,9 @@ class Opset1(Opset):
                 1e-5f.
         """
 
-        schema = get_schema("InstanceNormalization", 1, "")
-        op = Op(self, "InstanceNormalization", schema)
+        op = self._get_op("InstanceNormalization", 1)
         return op(
-            *self._prepare_inputs(schema, input, scale, B),
+            *self._prepare_inputs(op.op_schema, input, scale, B),
             consumed_inputs=consumed_inputs,
             epsilon=epsilon,
         )
@@ -1600,10 +1567,13 @@ class Opset1(Opset):
             size: The number of channels to sum over
         """
 
-        schema = get_schema("LRN", 1, "")
-        op = Op(self, "LRN", schema)
+        op = self._get_op("LRN", 1)
         return op(
-            *self._prepare_inputs(schema, X), alpha=alpha, beta=beta, bias=bias, size=size
+            *self._prepare_inputs(op.op_schema, X),
+            alpha=alpha,
+            beta=beta,
+            bias=bias,
+            size=size,
         )
 
     T_LSTM = TypeVar("T_LSTM", DOUBLE, FLOAT, FLOAT16)
@@ -1780,10 +1750,11 @@ class Opset1(Opset):
                 Default 0.
         """
 
-        schema = get_schema("LSTM", 1, "")
-        op = Op(self, "LSTM", schema)
+        op = self._get_op("LSTM", 1)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h, initial_c, P),
+            *self._prepare_inputs(
+                op.op_schema, X, W, R, B, sequence_lens, initial_h, initial_c, P
+            ),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -1819,10 +1790,11 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("LeakyRelu", 1, "")
-        op = Op(self, "LeakyRelu", schema)
+        op = self._get_op("LeakyRelu", 1)
         return op(
-            *self._prepare_inputs(schema, X), alpha=alpha, consumed_inputs=consumed_inputs
+            *self._prepare_inputs(op.op_schema, X),
+            alpha=alpha,
+            consumed_inputs=consumed_inputs,
         )
 
     T_Less = TypeVar("T_Less", DOUBLE, FLOAT, FLOAT16)
@@ -1853,9 +1825,8 @@ class Opset1(Opset):
             broadcast: Enable broadcasting
         """
 
-        schema = get_schema("Less", 1, "")
-        op = Op(self, "Less", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("Less", 1)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
 
     T_Log = TypeVar("T_Log", DOUBLE, FLOAT, FLOAT16)
 
@@ -1872,9 +1843,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Log", 1, "")
-        op = Op(self, "Log", schema)
-        return op(*self._prepare_inputs(schema, input), consumed_inputs=consumed_inputs)
+        op = self._get_op("Log", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), consumed_inputs=consumed_inputs)
 
     T_LogSoftmax = TypeVar("T_LogSoftmax", DOUBLE, FLOAT, FLOAT16)
 
@@ -1907,9 +1877,8 @@ class Opset1(Opset):
                 because the 0th axis most likely describes the batch_size
         """
 
-        schema = get_schema("LogSoftmax", 1, "")
-        op = Op(self, "LogSoftmax", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("LogSoftmax", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     I_Loop: TypeAlias = INT64
 
@@ -2074,9 +2043,8 @@ class Opset1(Opset):
                 iterations.
         """
 
-        schema = get_schema("Loop", 1, "")
-        op = Op(self, "Loop", schema)
-        return op(*self._prepare_inputs(schema, M, cond, *v_initial), body=body)
+        op = self._get_op("Loop", 1)
+        return op(*self._prepare_inputs(op.op_schema, M, cond, *v_initial), body=body)
 
     T_LpNormalization = TypeVar("T_LpNormalization", DOUBLE, FLOAT, FLOAT16)
 
@@ -2097,9 +2065,8 @@ class Opset1(Opset):
             p: The order of the normalization, only 1 or 2 are supported.
         """
 
-        schema = get_schema("LpNormalization", 1, "")
-        op = Op(self, "LpNormalization", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis, p=p)
+        op = self._get_op("LpNormalization", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis, p=p)
 
     T_LpPool = TypeVar("T_LpPool", DOUBLE, FLOAT, FLOAT16)
 
@@ -2154,10 +2121,9 @@ class Opset1(Opset):
             strides: Stride along each axis.
         """
 
-        schema = get_schema("LpPool", 1, "")
-        op = Op(self, "LpPool", schema)
+        op = self._get_op("LpPool", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             kernel_shape=kernel_shape,
             p=p,
@@ -2180,9 +2146,8 @@ class Opset1(Opset):
             B: N-dimensional matrix B
         """
 
-        schema = get_schema("MatMul", 1, "")
-        op = Op(self, "MatMul", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("MatMul", 1)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Max = TypeVar("T_Max", DOUBLE, FLOAT, FLOAT16)
 
@@ -2200,9 +2165,10 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Max", 1, "")
-        op = Op(self, "Max", schema)
-        return op(*self._prepare_inputs(schema, *data_0), consumed_inputs=consumed_inputs)
+        op = self._get_op("Max", 1)
+        return op(
+            *self._prepare_inputs(op.op_schema, *data_0), consumed_inputs=consumed_inputs
+        )
 
     T_MaxPool = TypeVar("T_MaxPool", DOUBLE, FLOAT, FLOAT16)
 
@@ -2273,10 +2239,9 @@ class Opset1(Opset):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("MaxPool", 1, "")
-        op = Op(self, "MaxPool", schema)
+        op = self._get_op("MaxPool", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             kernel_shape=kernel_shape,
             pads=pads,
@@ -2316,10 +2281,9 @@ class Opset1(Opset):
                 coordinates from their input scale to the scale used when pooling.
         """
 
-        schema = get_schema("MaxRoiPool", 1, "")
-        op = Op(self, "MaxRoiPool", schema)
+        op = self._get_op("MaxRoiPool", 1)
         return op(
-            *self._prepare_inputs(schema, X, rois),
+            *self._prepare_inputs(op.op_schema, X, rois),
             pooled_shape=pooled_shape,
             spatial_scale=spatial_scale,
         )
@@ -2340,9 +2304,10 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Mean", 1, "")
-        op = Op(self, "Mean", schema)
-        return op(*self._prepare_inputs(schema, *data_0), consumed_inputs=consumed_inputs)
+        op = self._get_op("Mean", 1)
+        return op(
+            *self._prepare_inputs(op.op_schema, *data_0), consumed_inputs=consumed_inputs
+        )
 
     T_Min = TypeVar("T_Min", DOUBLE, FLOAT, FLOAT16)
 
@@ -2360,9 +2325,10 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Min", 1, "")
-        op = Op(self, "Min", schema)
-        return op(*self._prepare_inputs(schema, *data_0), consumed_inputs=consumed_inputs)
+        op = self._get_op("Min", 1)
+        return op(
+            *self._prepare_inputs(op.op_schema, *data_0), consumed_inputs=consumed_inputs
+        )
 
     T_Mul = TypeVar("T_Mul", DOUBLE, FLOAT, FLOAT16)
 
@@ -2413,10 +2379,9 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Mul", 1, "")
-        op = Op(self, "Mul", schema)
+        op = self._get_op("Mul", 1)
         return op(
-            *self._prepare_inputs(schema, A, B),
+            *self._prepare_inputs(op.op_schema, A, B),
             axis=axis,
             broadcast=broadcast,
             consumed_inputs=consumed_inputs,
@@ -2439,9 +2404,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Neg", 1, "")
-        op = Op(self, "Neg", schema)
-        return op(*self._prepare_inputs(schema, X), consumed_inputs=consumed_inputs)
+        op = self._get_op("Neg", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), consumed_inputs=consumed_inputs)
 
     T_Not: TypeAlias = BOOL
 
@@ -2456,9 +2420,8 @@ class Opset1(Opset):
             X: (non-differentiable) Input tensor
         """
 
-        schema = get_schema("Not", 1, "")
-        op = Op(self, "Not", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Not", 1)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Or: TypeAlias = BOOL
 
@@ -2486,9 +2449,8 @@ class Opset1(Opset):
             broadcast: Enable broadcasting
         """
 
-        schema = get_schema("Or", 1, "")
-        op = Op(self, "Or", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("Or", 1)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
 
     T_PRelu = TypeVar("T_PRelu", DOUBLE, FLOAT, FLOAT16)
 
@@ -2514,9 +2476,10 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("PRelu", 1, "")
-        op = Op(self, "PRelu", schema)
-        return op(*self._prepare_inputs(schema, X, slope), consumed_inputs=consumed_inputs)
+        op = self._get_op("PRelu", 1)
+        return op(
+            *self._prepare_inputs(op.op_schema, X, slope), consumed_inputs=consumed_inputs
+        )
 
     T_Pad = TypeVar("T_Pad", DOUBLE, FLOAT, FLOAT16)
 
@@ -2564,10 +2527,12 @@ class Opset1(Opset):
             value: One float, indicates the value to be filled, default is 0
         """
 
-        schema = get_schema("Pad", 1, "")
-        op = Op(self, "Pad", schema)
+        op = self._get_op("Pad", 1)
         return op(
-            *self._prepare_inputs(schema, data), mode=mode, paddings=paddings, value=value
+            *self._prepare_inputs(op.op_schema, data),
+            mode=mode,
+            paddings=paddings,
+            value=value,
         )
 
     T_Pow = TypeVar("T_Pow", DOUBLE, FLOAT, FLOAT16)
@@ -2613,9 +2578,8 @@ class Opset1(Opset):
             broadcast: Pass 1 to enable broadcasting
         """
 
-        schema = get_schema("Pow", 1, "")
-        op = Op(self, "Pow", schema)
-        return op(*self._prepare_inputs(schema, X, Y), axis=axis, broadcast=broadcast)
+        op = self._get_op("Pow", 1)
+        return op(*self._prepare_inputs(op.op_schema, X, Y), axis=axis, broadcast=broadcast)
 
     T_RNN = TypeVar("T_RNN", DOUBLE, FLOAT, FLOAT16)
 
@@ -2756,10 +2720,9 @@ class Opset1(Opset):
                 Default 0.
         """
 
-        schema = get_schema("RNN", 1, "")
-        op = Op(self, "RNN", schema)
+        op = self._get_op("RNN", 1)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h),
+            *self._prepare_inputs(op.op_schema, X, W, R, B, sequence_lens, initial_h),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -2806,8 +2769,7 @@ class Opset1(Opset):
             shape: The shape of the output tensor.
         """
 
-        schema = get_schema("RandomNormal", 1, "")
-        op = Op(self, "RandomNormal", schema)
+        op = self._get_op("RandomNormal", 1)
         return op(dtype=dtype, mean=mean, scale=scale, seed=seed, shape=shape)
 
     T1_RandomNormalLike = TypeVar(
@@ -2866,10 +2828,9 @@ class Opset1(Opset):
                 generate one.
         """
 
-        schema = get_schema("RandomNormalLike", 1, "")
-        op = Op(self, "RandomNormalLike", schema)
+        op = self._get_op("RandomNormalLike", 1)
         return op(
-            *self._prepare_inputs(schema, input),
+            *self._prepare_inputs(op.op_schema, input),
             dtype=dtype,
             mean=mean,
             scale=scale,
@@ -2912,8 +2873,7 @@ class Opset1(Opset):
             shape: The shape of the output tensor.
         """
 
-        schema = get_schema("RandomUniform", 1, "")
-        op = Op(self, "RandomUniform", schema)
+        op = self._get_op("RandomUniform", 1)
         return op(dtype=dtype, high=high, low=low, seed=seed, shape=shape)
 
     T1_RandomUniformLike = TypeVar(
@@ -2972,10 +2932,13 @@ class Opset1(Opset):
                 generate one.
         """
 
-        schema = get_schema("RandomUniformLike", 1, "")
-        op = Op(self, "RandomUniformLike", schema)
+        op = self._get_op("RandomUniformLike", 1)
         return op(
-            *self._prepare_inputs(schema, input), dtype=dtype, high=high, low=low, seed=seed
+            *self._prepare_inputs(op.op_schema, input),
+            dtype=dtype,
+            high=high,
+            low=low,
+            seed=seed,
         )
 
     T_Reciprocal = TypeVar("T_Reciprocal", DOUBLE, FLOAT, FLOAT16)
@@ -2997,9 +2960,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Reciprocal", 1, "")
-        op = Op(self, "Reciprocal", schema)
-        return op(*self._prepare_inputs(schema, X), consumed_inputs=consumed_inputs)
+        op = self._get_op("Reciprocal", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), consumed_inputs=consumed_inputs)
 
     T_ReduceL1 = TypeVar("T_ReduceL1", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -3026,9 +2988,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceL1", 1, "")
-        op = Op(self, "ReduceL1", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceL1", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceL2 = TypeVar("T_ReduceL2", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -3055,9 +3016,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceL2", 1, "")
-        op = Op(self, "ReduceL2", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceL2", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceLogSum = TypeVar(
         "T_ReduceLogSum", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -3086,9 +3046,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceLogSum", 1, "")
-        op = Op(self, "ReduceLogSum", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceLogSum", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceLogSumExp = TypeVar(
         "T_ReduceLogSumExp", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -3121,9 +3080,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceLogSumExp", 1, "")
-        op = Op(self, "ReduceLogSumExp", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceLogSumExp", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMax = TypeVar("T_ReduceMax", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -3150,9 +3108,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceMax", 1, "")
-        op = Op(self, "ReduceMax", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMax", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMean = TypeVar(
         "T_ReduceMean", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -3181,9 +3138,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceMean", 1, "")
-        op = Op(self, "ReduceMean", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMean", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMin = TypeVar("T_ReduceMin", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -3210,9 +3166,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceMin", 1, "")
-        op = Op(self, "ReduceMin", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMin", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceProd = TypeVar(
         "T_ReduceProd", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -3241,9 +3196,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceProd", 1, "")
-        op = Op(self, "ReduceProd", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceProd", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceSum = TypeVar("T_ReduceSum", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -3270,9 +3224,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceSum", 1, "")
-        op = Op(self, "ReduceSum", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceSum", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceSumSquare = TypeVar(
         "T_ReduceSumSquare", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -3305,9 +3258,8 @@ class Opset1(Opset):
                 dimension.
         """
 
-        schema = get_schema("ReduceSumSquare", 1, "")
-        op = Op(self, "ReduceSumSquare", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceSumSquare", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_Relu = TypeVar("T_Relu", DOUBLE, FLOAT, FLOAT16)
 
@@ -3326,9 +3278,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Relu", 1, "")
-        op = Op(self, "Relu", schema)
-        return op(*self._prepare_inputs(schema, X), consumed_inputs=consumed_inputs)
+        op = self._get_op("Relu", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), consumed_inputs=consumed_inputs)
 
     T_Reshape = TypeVar("T_Reshape", DOUBLE, FLOAT, FLOAT16)
 
@@ -3358,10 +3309,11 @@ class Opset1(Opset):
             shape: New shape
         """
 
-        schema = get_schema("Reshape", 1, "")
-        op = Op(self, "Reshape", schema)
+        op = self._get_op("Reshape", 1)
         return op(
-            *self._prepare_inputs(schema, data), consumed_inputs=consumed_inputs, shape=shape
+            *self._prepare_inputs(op.op_schema, data),
+            consumed_inputs=consumed_inputs,
+            shape=shape,
         )
 
     T_Selu = TypeVar("T_Selu", DOUBLE, FLOAT, FLOAT16)
@@ -3393,10 +3345,9 @@ class Opset1(Opset):
             gamma: Coefficient of SELU default to 1.0507.
         """
 
-        schema = get_schema("Selu", 1, "")
-        op = Op(self, "Selu", schema)
+        op = self._get_op("Selu", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             alpha=alpha,
             consumed_inputs=consumed_inputs,
             gamma=gamma,
@@ -3434,9 +3385,8 @@ class Opset1(Opset):
             data: An input tensor.
         """
 
-        schema = get_schema("Shape", 1, "")
-        op = Op(self, "Shape", schema)
-        return op(*self._prepare_inputs(schema, data))
+        op = self._get_op("Shape", 1)
+        return op(*self._prepare_inputs(op.op_schema, data))
 
     T_Sigmoid = TypeVar("T_Sigmoid", DOUBLE, FLOAT, FLOAT16)
 
@@ -3457,9 +3407,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Sigmoid", 1, "")
-        op = Op(self, "Sigmoid", schema)
-        return op(*self._prepare_inputs(schema, X), consumed_inputs=consumed_inputs)
+        op = self._get_op("Sigmoid", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), consumed_inputs=consumed_inputs)
 
     T_Size = TypeVar(
         "T_Size",
@@ -3493,9 +3442,8 @@ class Opset1(Opset):
             data: An input tensor.
         """
 
-        schema = get_schema("Size", 1, "")
-        op = Op(self, "Size", schema)
-        return op(*self._prepare_inputs(schema, data))
+        op = self._get_op("Size", 1)
+        return op(*self._prepare_inputs(op.op_schema, data))
 
     T_Slice = TypeVar(
         "T_Slice",
@@ -3571,9 +3519,10 @@ class Opset1(Opset):
             starts: Starting indices of corresponding axis in `axes`
         """
 
-        schema = get_schema("Slice", 1, "")
-        op = Op(self, "Slice", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, ends=ends, starts=starts)
+        op = self._get_op("Slice", 1)
+        return op(
+            *self._prepare_inputs(op.op_schema, data), axes=axes, ends=ends, starts=starts
+        )
 
     T_Softmax = TypeVar("T_Softmax", DOUBLE, FLOAT, FLOAT16)
 
@@ -3606,9 +3555,8 @@ class Opset1(Opset):
                 because the 0th axis most likely describes the batch_size
         """
 
-        schema = get_schema("Softmax", 1, "")
-        op = Op(self, "Softmax", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Softmax", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     T_Softplus = TypeVar("T_Softplus", DOUBLE, FLOAT, FLOAT16)
 
@@ -3625,9 +3573,8 @@ class Opset1(Opset):
             X: (differentiable) 1D input tensor
         """
 
-        schema = get_schema("Softplus", 1, "")
-        op = Op(self, "Softplus", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Softplus", 1)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Softsign = TypeVar("T_Softsign", DOUBLE, FLOAT, FLOAT16)
 
@@ -3642,9 +3589,8 @@ class Opset1(Opset):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Softsign", 1, "")
-        op = Op(self, "Softsign", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Softsign", 1)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_SpaceToDepth = TypeVar(
         "T_SpaceToDepth",
@@ -3680,9 +3626,8 @@ class Opset1(Opset):
             blocksize: Blocks of [blocksize, blocksize] are moved.
         """
 
-        schema = get_schema("SpaceToDepth", 1, "")
-        op = Op(self, "SpaceToDepth", schema)
-        return op(*self._prepare_inputs(schema, input), blocksize=blocksize)
+        op = self._get_op("SpaceToDepth", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), blocksize=blocksize)
 
     T_Split = TypeVar("T_Split", DOUBLE, FLOAT, FLOAT16)
 
@@ -3712,9 +3657,8 @@ class Opset1(Opset):
             split: length of each output
         """
 
-        schema = get_schema("Split", 1, "")
-        op = Op(self, "Split", schema)
-        return op(*self._prepare_inputs(schema, input, split_), axis=axis, split=split)
+        op = self._get_op("Split", 1)
+        return op(*self._prepare_inputs(op.op_schema, input, split_), axis=axis, split=split)
 
     T_Sqrt = TypeVar("T_Sqrt", DOUBLE, FLOAT, FLOAT16)
 
@@ -3733,9 +3677,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Sqrt", 1, "")
-        op = Op(self, "Sqrt", schema)
-        return op(*self._prepare_inputs(schema, X), consumed_inputs=consumed_inputs)
+        op = self._get_op("Sqrt", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), consumed_inputs=consumed_inputs)
 
     T_Squeeze = TypeVar(
         "T_Squeeze",
@@ -3772,9 +3715,8 @@ class Opset1(Opset):
             axes: List of non-negative integers, indicate the dimensions to squeeze.
         """
 
-        schema = get_schema("Squeeze", 1, "")
-        op = Op(self, "Squeeze", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes)
+        op = self._get_op("Squeeze", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes)
 
     T_Sub = TypeVar("T_Sub", DOUBLE, FLOAT, FLOAT16)
 
@@ -3825,10 +3767,9 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Sub", 1, "")
-        op = Op(self, "Sub", schema)
+        op = self._get_op("Sub", 1)
         return op(
-            *self._prepare_inputs(schema, A, B),
+            *self._prepare_inputs(op.op_schema, A, B),
             axis=axis,
             broadcast=broadcast,
             consumed_inputs=consumed_inputs,
@@ -3850,9 +3791,10 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Sum", 1, "")
-        op = Op(self, "Sum", schema)
-        return op(*self._prepare_inputs(schema, *data_0), consumed_inputs=consumed_inputs)
+        op = self._get_op("Sum", 1)
+        return op(
+            *self._prepare_inputs(op.op_schema, *data_0), consumed_inputs=consumed_inputs
+        )
 
     T_Tanh = TypeVar("T_Tanh", DOUBLE, FLOAT, FLOAT16)
 
@@ -3871,9 +3813,8 @@ class Opset1(Opset):
             consumed_inputs: legacy optimization attribute.
         """
 
-        schema = get_schema("Tanh", 1, "")
-        op = Op(self, "Tanh", schema)
-        return op(*self._prepare_inputs(schema, input), consumed_inputs=consumed_inputs)
+        op = self._get_op("Tanh", 1)
+        return op(*self._prepare_inputs(op.op_schema, input), consumed_inputs=consumed_inputs)
 
     T_Tile = TypeVar("T_Tile", DOUBLE, FLOAT, FLOAT16)
 
@@ -3890,9 +3831,8 @@ class Opset1(Opset):
             axis: Axis along which to repeat.
         """
 
-        schema = get_schema("Tile", 1, "")
-        op = Op(self, "Tile", schema)
-        return op(*self._prepare_inputs(schema, input, tiles, axis))
+        op = self._get_op("Tile", 1)
+        return op(*self._prepare_inputs(op.op_schema, input, tiles, axis))
 
     T_TopK = TypeVar("T_TopK", DOUBLE, FLOAT, FLOAT16)
 
@@ -3921,9 +3861,8 @@ class Opset1(Opset):
             k: Number of top elements to retrieve
         """
 
-        schema = get_schema("TopK", 1, "")
-        op = Op(self, "TopK", schema)
-        return op(*self._prepare_inputs(schema, X), axis=axis, k=k)
+        op = self._get_op("TopK", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), axis=axis, k=k)
 
     T_Transpose = TypeVar(
         "T_Transpose",
@@ -3962,9 +3901,8 @@ class Opset1(Opset):
                 permute the axes according to the values given.
         """
 
-        schema = get_schema("Transpose", 1, "")
-        op = Op(self, "Transpose", schema)
-        return op(*self._prepare_inputs(schema, data), perm=perm)
+        op = self._get_op("Transpose", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), perm=perm)
 
     T_Unsqueeze = TypeVar(
         "T_Unsqueeze",
@@ -4002,9 +3940,8 @@ class Opset1(Opset):
             axes: List of non-negative integers, indicate the dimensions to be inserted
         """
 
-        schema = get_schema("Unsqueeze", 1, "")
-        op = Op(self, "Unsqueeze", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes)
+        op = self._get_op("Unsqueeze", 1)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes)
 
     T_Upsample = TypeVar("T_Upsample", BOOL, DOUBLE, FLOAT, FLOAT16, INT32, INT64)
 
@@ -4048,10 +3985,9 @@ class Opset1(Opset):
                 equal to 1.
         """
 
-        schema = get_schema("Upsample", 1, "")
-        op = Op(self, "Upsample", schema)
+        op = self._get_op("Upsample", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             height_scale=height_scale,
             mode=mode,
             width_scale=width_scale,
@@ -4085,6 +4021,5 @@ class Opset1(Opset):
             broadcast: Enable broadcasting
         """
 
-        schema = get_schema("Xor", 1, "")
-        op = Op(self, "Xor", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("Xor", 1)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
@@ -15,7 +15,6 @@ from __future__ import annotations
 
 from typing import Optional, Sequence, Tuple, TypeVar
 
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset9 import Opset9
@@ -36,7 +35,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset10(Opset9):
@@ -127,10 +126,9 @@ class Opset10(Opset9):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("AveragePool", 10, "")
-        op = Op(self, "AveragePool", schema)
+        op = self._get_op("AveragePool", 10)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             ceil_mode=ceil_mode,
             count_include_pad=count_include_pad,
@@ -229,10 +227,9 @@ class Opset10(Opset9):
                 to 1 along each axis.
         """
 
-        schema = get_schema("ConvInteger", 10, "")
-        op = Op(self, "ConvInteger", schema)
+        op = self._get_op("ConvInteger", 10)
         return op(
-            *self._prepare_inputs(schema, x, w, x_zero_point, w_zero_point),
+            *self._prepare_inputs(op.op_schema, x, w, x_zero_point, w_zero_point),
             auto_pad=auto_pad,
             dilations=dilations,
             group=group,
@@ -269,9 +266,8 @@ class Opset10(Opset9):
                 value when it's not specified.
         """
 
-        schema = get_schema("DequantizeLinear", 10, "")
-        op = Op(self, "DequantizeLinear", schema)
-        return op(*self._prepare_inputs(schema, x, x_scale, x_zero_point))
+        op = self._get_op("DequantizeLinear", 10)
+        return op(*self._prepare_inputs(op.op_schema, x, x_scale, x_zero_point))
 
     T_Dropout = TypeVar("T_Dropout", DOUBLE, FLOAT, FLOAT16)
 
@@ -295,9 +291,8 @@ class Opset10(Opset9):
             ratio: The ratio of random dropout
         """
 
-        schema = get_schema("Dropout", 10, "")
-        op = Op(self, "Dropout", schema)
-        return op(*self._prepare_inputs(schema, data), ratio=ratio)
+        op = self._get_op("Dropout", 10)
+        return op(*self._prepare_inputs(op.op_schema, data), ratio=ratio)
 
     T1_IsInf = TypeVar("T1_IsInf", DOUBLE, FLOAT)
 
@@ -322,10 +317,9 @@ class Opset10(Opset9):
                 positive infinity should be mapped to false.
         """
 
-        schema = get_schema("IsInf", 10, "")
-        op = Op(self, "IsInf", schema)
+        op = self._get_op("IsInf", 10)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             detect_negative=detect_negative,
             detect_positive=detect_positive,
         )
@@ -372,9 +366,8 @@ class Opset10(Opset9):
                 shape [D1, D2, 1, N].
         """
 
-        schema = get_schema("MatMulInteger", 10, "")
-        op = Op(self, "MatMulInteger", schema)
-        return op(*self._prepare_inputs(schema, A, B, a_zero_point, b_zero_point))
+        op = self._get_op("MatMulInteger", 10)
+        return op(*self._prepare_inputs(op.op_schema, A, B, a_zero_point, b_zero_point))
 
     T_MaxPool = TypeVar("T_MaxPool", DOUBLE, FLOAT, FLOAT16)
 
@@ -465,10 +458,9 @@ class Opset10(Opset9):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("MaxPool", 10, "")
-        op = Op(self, "MaxPool", schema)
+        op = self._get_op("MaxPool", 10)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             ceil_mode=ceil_mode,
             dilations=dilations,
@@ -521,9 +513,8 @@ class Opset10(Opset9):
                 will do integer mods); Set this to 1 to force fmod treatment
         """
 
-        schema = get_schema("Mod", 10, "")
-        op = Op(self, "Mod", schema)
-        return op(*self._prepare_inputs(schema, A, B), fmod=fmod)
+        op = self._get_op("Mod", 10)
+        return op(*self._prepare_inputs(op.op_schema, A, B), fmod=fmod)
 
     def NonMaxSuppression(
         self,
@@ -574,11 +565,10 @@ class Opset10(Opset9):
                 Pytorch models.
         """
 
-        schema = get_schema("NonMaxSuppression", 10, "")
-        op = Op(self, "NonMaxSuppression", schema)
+        op = self._get_op("NonMaxSuppression", 10)
         return op(
             *self._prepare_inputs(
-                schema,
+                op.op_schema,
                 boxes,
                 scores,
                 max_output_boxes_per_class,
@@ -706,11 +696,10 @@ class Opset10(Opset9):
                 to 1 along each spatial axis.
         """
 
-        schema = get_schema("QLinearConv", 10, "")
-        op = Op(self, "QLinearConv", schema)
+        op = self._get_op("QLinearConv", 10)
         return op(
             *self._prepare_inputs(
-                schema,
+                op.op_schema,
                 x,
                 x_scale,
                 x_zero_point,
@@ -780,11 +769,10 @@ class Opset10(Opset9):
             y_zero_point: (non-differentiable) zero point of quantized output y
         """
 
-        schema = get_schema("QLinearMatMul", 10, "")
-        op = Op(self, "QLinearMatMul", schema)
+        op = self._get_op("QLinearMatMul", 10)
         return op(
             *self._prepare_inputs(
-                schema,
+                op.op_schema,
                 a,
                 a_scale,
                 a_zero_point,
@@ -825,9 +813,8 @@ class Opset10(Opset9):
                 uint8 typed 0 if it's not specified.
         """
 
-        schema = get_schema("QuantizeLinear", 10, "")
-        op = Op(self, "QuantizeLinear", schema)
-        return op(*self._prepare_inputs(schema, x, y_scale, y_zero_point))
+        op = self._get_op("QuantizeLinear", 10)
+        return op(*self._prepare_inputs(op.op_schema, x, y_scale, y_zero_point))
 
     T_Resize = TypeVar(
         "T_Resize",
@@ -869,9 +856,8 @@ class Opset10(Opset9):
                 bilinear, trilinear, etc)
         """
 
-        schema = get_schema("Resize", 10, "")
-        op = Op(self, "Resize", schema)
-        return op(*self._prepare_inputs(schema, X, scales), mode=mode)
+        op = self._get_op("Resize", 10)
+        return op(*self._prepare_inputs(op.op_schema, X, scales), mode=mode)
 
     T_ReverseSequence = TypeVar(
         "T_ReverseSequence",
@@ -951,10 +937,9 @@ class Opset10(Opset9):
                 (default), or 1.
         """
 
-        schema = get_schema("ReverseSequence", 10, "")
-        op = Op(self, "ReverseSequence", schema)
+        op = self._get_op("ReverseSequence", 10)
         return op(
-            *self._prepare_inputs(schema, input, sequence_lens),
+            *self._prepare_inputs(op.op_schema, input, sequence_lens),
             batch_axis=batch_axis,
             time_axis=time_axis,
         )
@@ -1023,10 +1008,9 @@ class Opset10(Opset9):
                 input image. E.g.; default is 1.0f.
         """
 
-        schema = get_schema("RoiAlign", 10, "")
-        op = Op(self, "RoiAlign", schema)
+        op = self._get_op("RoiAlign", 10)
         return op(
-            *self._prepare_inputs(schema, X, rois, batch_indices),
+            *self._prepare_inputs(op.op_schema, X, rois, batch_indices),
             mode=mode,
             output_height=output_height,
             output_width=output_width,
@@ -1116,9 +1100,8 @@ class Opset10(Opset9):
                 Default to 1.
         """
 
-        schema = get_schema("Slice", 10, "")
-        op = Op(self, "Slice", schema)
-        return op(*self._prepare_inputs(schema, data, starts, ends, axes, steps))
+        op = self._get_op("Slice", 10)
+        return op(*self._prepare_inputs(op.op_schema, data, starts, ends, axes, steps))
 
     def StringNormalizer(
         self,
@@ -1160,10 +1143,9 @@ class Opset10(Opset9):
             stopwords: List of stop words. If not set, no word would be removed from X.
         """
 
-        schema = get_schema("StringNormalizer", 10, "")
-        op = Op(self, "StringNormalizer", schema)
+        op = self._get_op("StringNormalizer", 10)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             case_change_action=case_change_action,
             is_case_sensitive=is_case_sensitive,
             locale=locale,
@@ -1189,9 +1171,8 @@ class Opset10(Opset9):
             alpha: Threshold value
         """
 
-        schema = get_schema("ThresholdedRelu", 10, "")
-        op = Op(self, "ThresholdedRelu", schema)
-        return op(*self._prepare_inputs(schema, X), alpha=alpha)
+        op = self._get_op("ThresholdedRelu", 10)
+        return op(*self._prepare_inputs(op.op_schema, X), alpha=alpha)
 
     T_TopK = TypeVar("T_TopK", DOUBLE, FLOAT, FLOAT16)
 
@@ -1222,6 +1203,5 @@ class Opset10(Opset9):
             axis: Dimension on which to do the sort.
         """
 
-        schema = get_schema("TopK", 10, "")
-        op = Op(self, "TopK", schema)
-        return op(*self._prepare_inputs(schema, X, K), axis=axis)
+        op = self._get_op("TopK", 10)
+        return op(*self._prepare_inputs(op.op_schema, X, K), axis=axis)
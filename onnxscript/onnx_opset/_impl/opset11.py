@@ -16,7 +16,6 @@ from __future__ import annotations
 from typing import Optional, Sequence, Tuple, TypeVar, Union
 
 from onnx import GraphProto, SparseTensorProto, TensorProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset10 import Opset10
@@ -37,7 +36,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset11(Opset10):
@@ -78,9 +77,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ArgMax", 11, "")
-        op = Op(self, "ArgMax", schema)
-        return op(*self._prepare_inputs(schema, data), axis=axis, keepdims=keepdims)
+        op = self._get_op("ArgMax", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axis=axis, keepdims=keepdims)
 
     T_ArgMin = TypeVar(
         "T_ArgMin",
@@ -116,9 +114,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ArgMin", 11, "")
-        op = Op(self, "ArgMin", schema)
-        return op(*self._prepare_inputs(schema, data), axis=axis, keepdims=keepdims)
+        op = self._get_op("ArgMin", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axis=axis, keepdims=keepdims)
 
     T_AveragePool = TypeVar("T_AveragePool", DOUBLE, FLOAT, FLOAT16)
 
@@ -207,10 +204,9 @@ class Opset11(Opset10):
                 to 1 along each spatial axis.
         """
 
-        schema = get_schema("AveragePool", 11, "")
-        op = Op(self, "AveragePool", schema)
+        op = self._get_op("AveragePool", 11)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             ceil_mode=ceil_mode,
             count_include_pad=count_include_pad,
@@ -247,9 +243,8 @@ class Opset11(Opset10):
                 shift) or "LEFT" (for left shift).
         """
 
-        schema = get_schema("BitShift", 11, "")
-        op = Op(self, "BitShift", schema)
-        return op(*self._prepare_inputs(schema, X, Y), direction=direction)
+        op = self._get_op("BitShift", 11)
+        return op(*self._prepare_inputs(op.op_schema, X, Y), direction=direction)
 
     T_Clip = TypeVar("T_Clip", DOUBLE, FLOAT, FLOAT16)
 
@@ -274,9 +269,8 @@ class Opset11(Opset10):
                 must be a scalar(tensor of empty shape).
         """
 
-        schema = get_schema("Clip", 11, "")
-        op = Op(self, "Clip", schema)
-        return op(*self._prepare_inputs(schema, input, min, max))
+        op = self._get_op("Clip", 11)
+        return op(*self._prepare_inputs(op.op_schema, input, min, max))
 
     T_Compress = TypeVar(
         "T_Compress",
@@ -325,9 +319,8 @@ class Opset11(Opset10):
                 rank(input).
         """
 
-        schema = get_schema("Compress", 11, "")
-        op = Op(self, "Compress", schema)
-        return op(*self._prepare_inputs(schema, input, condition), axis=axis)
+        op = self._get_op("Compress", 11)
+        return op(*self._prepare_inputs(op.op_schema, input, condition), axis=axis)
 
     T_Concat = TypeVar(
         "T_Concat",
@@ -360,9 +353,8 @@ class Opset11(Opset10):
                 from the back. Accepted range is [-r, r-1] where r = rank(inputs)..
         """
 
-        schema = get_schema("Concat", 11, "")
-        op = Op(self, "Concat", schema)
-        return op(*self._prepare_inputs(schema, *inputs), axis=axis)
+        op = self._get_op("Concat", 11)
+        return op(*self._prepare_inputs(op.op_schema, *inputs), axis=axis)
 
     S_ConcatFromSequence = TypeVar(
         "S_ConcatFromSequence",
@@ -424,9 +416,10 @@ class Opset11(Opset10):
                 not insert new axis.
         """
 
-        schema = get_schema("ConcatFromSequence", 11, "")
-        op = Op(self, "ConcatFromSequence", schema)
-        return op(*self._prepare_inputs(schema, input_sequence), axis=axis, new_axis=new_axis)
+        op = self._get_op("ConcatFromSequence", 11)
+        return op(
+            *self._prepare_inputs(op.op_schema, input_sequence), axis=axis, new_axis=new_axis
+        )
 
     T_Constant: TypeAlias = Union[
         BOOL,
@@ -466,8 +459,7 @@ class Opset11(Opset10):
             value: The value for the elements of the output tensor.
         """
 
-        schema = get_schema("Constant", 11, "")
-        op = Op(self, "Constant", schema)
+        op = self._get_op("Constant", 11)
         return op(sparse_value=sparse_value, value=value)
 
     T_Conv = TypeVar("T_Conv", DOUBLE, FLOAT, FLOAT16)
@@ -548,10 +540,9 @@ class Opset11(Opset10):
                 is 1 along each spatial axis.
         """
 
-        schema = get_schema("Conv", 11, "")
-        op = Op(self, "Conv", schema)
+        op = self._get_op("Conv", 11)
         return op(
-            *self._prepare_inputs(schema, X, W, B),
+            *self._prepare_inputs(op.op_schema, X, W, B),
             auto_pad=auto_pad,
             dilations=dilations,
             group=group,
@@ -658,10 +649,9 @@ class Opset11(Opset10):
                 to 1 along each spatial axis.
         """
 
-        schema = get_schema("ConvTranspose", 11, "")
-        op = Op(self, "ConvTranspose", schema)
+        op = self._get_op("ConvTranspose", 11)
         return op(
-            *self._prepare_inputs(schema, X, W, B),
+            *self._prepare_inputs(op.op_schema, X, W, B),
             auto_pad=auto_pad,
             dilations=dilations,
             group=group,
@@ -719,9 +709,10 @@ class Opset11(Opset10):
             reverse: If set to 1 will perform the sums in reverse direction.
         """
 
-        schema = get_schema("CumSum", 11, "")
-        op = Op(self, "CumSum", schema)
-        return op(*self._prepare_inputs(schema, x, axis), exclusive=exclusive, reverse=reverse)
+        op = self._get_op("CumSum", 11)
+        return op(
+            *self._prepare_inputs(op.op_schema, x, axis), exclusive=exclusive, reverse=reverse
+        )
 
     T_DepthToSpace = TypeVar(
         "T_DepthToSpace",
@@ -786,9 +777,8 @@ class Opset11(Opset10):
                 column-row-depth order.
         """
 
-        schema = get_schema("DepthToSpace", 11, "")
-        op = Op(self, "DepthToSpace", schema)
-        return op(*self._prepare_inputs(schema, input), blocksize=blocksize, mode=mode)
+        op = self._get_op("DepthToSpace", 11)
+        return op(*self._prepare_inputs(op.op_schema, input), blocksize=blocksize, mode=mode)
 
     T_Det = TypeVar("T_Det", DOUBLE, FLOAT, FLOAT16)
 
@@ -807,9 +797,8 @@ class Opset11(Opset10):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("Det", 11, "")
-        op = Op(self, "Det", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Det", 11)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T1_DynamicQuantizeLinear: TypeAlias = FLOAT
 
@@ -860,9 +849,8 @@ class Opset11(Opset10):
             x: Input tensor
         """
 
-        schema = get_schema("DynamicQuantizeLinear", 11, "")
-        op = Op(self, "DynamicQuantizeLinear", schema)
-        return op(*self._prepare_inputs(schema, x))
+        op = self._get_op("DynamicQuantizeLinear", 11)
+        return op(*self._prepare_inputs(op.op_schema, x))
 
     T_Equal = TypeVar(
         "T_Equal",
@@ -898,9 +886,8 @@ class Opset11(Opset10):
             B: Second input operand for the logical operator.
         """
 
-        schema = get_schema("Equal", 11, "")
-        op = Op(self, "Equal", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Equal", 11)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Flatten = TypeVar(
         "T_Flatten",
@@ -941,9 +928,8 @@ class Opset11(Opset10):
                 tensor is (d_0, d_1, ... d_n).
         """
 
-        schema = get_schema("Flatten", 11, "")
-        op = Op(self, "Flatten", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Flatten", 11)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     T_Gather = TypeVar(
         "T_Gather",
@@ -1042,9 +1028,8 @@ class Opset11(Opset10):
                 the back. Accepted range is [-r, r-1] where r = rank(data).
         """
 
-        schema = get_schema("Gather", 11, "")
-        op = Op(self, "Gather", schema)
-        return op(*self._prepare_inputs(schema, data, indices), axis=axis)
+        op = self._get_op("Gather", 11)
+        return op(*self._prepare_inputs(op.op_schema, data, indices), axis=axis)
 
     T_GatherElements = TypeVar(
         "T_GatherElements",
@@ -1148,9 +1133,8 @@ class Opset11(Opset10):
                 the back. Accepted range is [-r, r-1] where r = rank(data).
         """
 
-        schema = get_schema("GatherElements", 11, "")
-        op = Op(self, "GatherElements", schema)
-        return op(*self._prepare_inputs(schema, data, indices), axis=axis)
+        op = self._get_op("GatherElements", 11)
+        return op(*self._prepare_inputs(op.op_schema, data, indices), axis=axis)
 
     T_GatherND = TypeVar(
         "T_GatherND",
@@ -1250,9 +1234,8 @@ class Opset11(Opset10):
                 index values are out of bounds.
         """
 
-        schema = get_schema("GatherND", 11, "")
-        op = Op(self, "GatherND", schema)
-        return op(*self._prepare_inputs(schema, data, indices))
+        op = self._get_op("GatherND", 11)
+        return op(*self._prepare_inputs(op.op_schema, data, indices))
 
     T_Gemm = TypeVar("T_Gemm", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -1304,10 +1287,9 @@ class Opset11(Opset10):
             transB: Whether B should be transposed
         """
 
-        schema = get_schema("Gemm", 11, "")
-        op = Op(self, "Gemm", schema)
+        op = self._get_op("Gemm", 11)
         return op(
-            *self._prepare_inputs(schema, A, B, C),
+            *self._prepare_inputs(op.op_schema, A, B, C),
             alpha=alpha,
             beta=beta,
             transA=transA,
@@ -1346,9 +1328,8 @@ class Opset11(Opset10):
                 r-1] where r = rank(input).
         """
 
-        schema = get_schema("Hardmax", 11, "")
-        op = Op(self, "Hardmax", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Hardmax", 11)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     B_If: TypeAlias = BOOL
 
@@ -1387,10 +1368,9 @@ class Opset11(Opset10):
                 match the number of outputs in the else_branch.
         """
 
-        schema = get_schema("If", 11, "")
-        op = Op(self, "If", schema)
+        op = self._get_op("If", 11)
         return op(
-            *self._prepare_inputs(schema, cond),
+            *self._prepare_inputs(op.op_schema, cond),
             else_branch=else_branch,
             then_branch=then_branch,
         )
@@ -1427,9 +1407,8 @@ class Opset11(Opset10):
                 r-1] where r = rank(input).
         """
 
-        schema = get_schema("LogSoftmax", 11, "")
-        op = Op(self, "LogSoftmax", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("LogSoftmax", 11)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     I_Loop: TypeAlias = INT64
 
@@ -1614,9 +1593,8 @@ class Opset11(Opset10):
                 iterations.
         """
 
-        schema = get_schema("Loop", 11, "")
-        op = Op(self, "Loop", schema)
-        return op(*self._prepare_inputs(schema, M, cond, *v_initial), body=body)
+        op = self._get_op("Loop", 11)
+        return op(*self._prepare_inputs(op.op_schema, M, cond, *v_initial), body=body)
 
     T_LpPool = TypeVar("T_LpPool", DOUBLE, FLOAT, FLOAT16)
 
@@ -1673,10 +1651,9 @@ class Opset11(Opset10):
                 to 1 along each spatial axis.
         """
 
-        schema = get_schema("LpPool", 11, "")
-        op = Op(self, "LpPool", schema)
+        op = self._get_op("LpPool", 11)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             kernel_shape=kernel_shape,
             p=p,
@@ -1775,10 +1752,9 @@ class Opset11(Opset10):
                 to 1 along each spatial axis.
         """
 
-        schema = get_schema("MaxPool", 11, "")
-        op = Op(self, "MaxPool", schema)
+        op = self._get_op("MaxPool", 11)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             ceil_mode=ceil_mode,
             dilations=dilations,
@@ -1864,10 +1840,9 @@ class Opset11(Opset10):
                 to 1 along each spatial axis.
         """
 
-        schema = get_schema("MaxUnpool", 11, "")
-        op = Op(self, "MaxUnpool", schema)
+        op = self._get_op("MaxUnpool", 11)
         return op(
-            *self._prepare_inputs(schema, X, I, output_shape),
+            *self._prepare_inputs(op.op_schema, X, I, output_shape),
             kernel_shape=kernel_shape,
             pads=pads,
             strides=strides,
@@ -1922,8 +1897,7 @@ class Opset11(Opset10):
                 Pytorch models.
         """
 
-        schema = get_schema("NonMaxSuppression", 11, "")
-        op = Op(self, "NonMaxSuppression", schema)
+        op = self._get_op("NonMaxSuppression", 11)
         return op(
             *self._prepare_inputs(
                 schema,
@@ -2039,9 +2013,8 @@ class Opset11(Opset10):
                 rank(indices).
         """
 
-        schema = get_schema("OneHot", 11, "")
-        op = Op(self, "OneHot", schema)
-        return op(*self._prepare_inputs(schema, indices, depth, values), axis=axis)
+        op = self._get_op("OneHot", 11)
+        return op(*self._prepare_inputs(op.op_schema, indices, depth, values), axis=axis)
 
     T_Pad = TypeVar(
         "T_Pad",
@@ -2163,9 +2136,8 @@ class Opset11(Opset10):
             mode: Supported modes: `constant`(default), `reflect`, `edge`
         """
 
-        schema = get_schema("Pad", 11, "")
-        op = Op(self, "Pad", schema)
-        return op(*self._prepare_inputs(schema, data, pads, constant_value), mode=mode)
+        op = self._get_op("Pad", 11)
+        return op(*self._prepare_inputs(op.op_schema, data, pads, constant_value), mode=mode)
 
     T_Range = TypeVar("T_Range", DOUBLE, FLOAT, INT16, INT32, INT64)
 
@@ -2221,9 +2193,8 @@ class Opset11(Opset10):
             delta: Scalar. Value to step by.
         """
 
-        schema = get_schema("Range", 11, "")
-        op = Op(self, "Range", schema)
-        return op(*self._prepare_inputs(schema, start, limit, delta))
+        op = self._get_op("Range", 11)
+        return op(*self._prepare_inputs(op.op_schema, start, limit, delta))
 
     T_ReduceL1 = TypeVar("T_ReduceL1", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -2251,9 +2222,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceL1", 11, "")
-        op = Op(self, "ReduceL1", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceL1", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceL2 = TypeVar("T_ReduceL2", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -2281,9 +2251,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceL2", 11, "")
-        op = Op(self, "ReduceL2", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceL2", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceLogSum = TypeVar(
         "T_ReduceLogSum", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2313,9 +2282,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceLogSum", 11, "")
-        op = Op(self, "ReduceLogSum", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceLogSum", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceLogSumExp = TypeVar(
         "T_ReduceLogSumExp", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2349,9 +2317,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceLogSumExp", 11, "")
-        op = Op(self, "ReduceLogSumExp", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceLogSumExp", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMax = TypeVar("T_ReduceMax", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -2379,9 +2346,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceMax", 11, "")
-        op = Op(self, "ReduceMax", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMax", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMean = TypeVar(
         "T_ReduceMean", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2411,9 +2377,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceMean", 11, "")
-        op = Op(self, "ReduceMean", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMean", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMin = TypeVar("T_ReduceMin", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -2441,9 +2406,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceMin", 11, "")
-        op = Op(self, "ReduceMin", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMin", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceProd = TypeVar(
         "T_ReduceProd", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2473,9 +2437,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceProd", 11, "")
-        op = Op(self, "ReduceProd", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceProd", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceSum = TypeVar("T_ReduceSum", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -2503,9 +2466,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceSum", 11, "")
-        op = Op(self, "ReduceSum", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceSum", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceSumSquare = TypeVar(
         "T_ReduceSumSquare", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2539,9 +2501,8 @@ class Opset11(Opset10):
                 dimension.
         """
 
-        schema = get_schema("ReduceSumSquare", 11, "")
-        op = Op(self, "ReduceSumSquare", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceSumSquare", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T1_Resize = TypeVar(
         "T1_Resize",
@@ -2673,10 +2634,9 @@ class Opset11(Opset10):
                 if "mode" is "nearest".
         """
 
-        schema = get_schema("Resize", 11, "")
-        op = Op(self, "Resize", schema)
+        op = self._get_op("Resize", 11)
         return op(
-            *self._prepare_inputs(schema, X, roi, scales, sizes),
+            *self._prepare_inputs(op.op_schema, X, roi, scales, sizes),
             coordinate_transformation_mode=coordinate_transformation_mode,
             cubic_coeff_a=cubic_coeff_a,
             exclude_outside=exclude_outside,
@@ -2713,9 +2673,8 @@ class Opset11(Opset10):
             X: (non-differentiable) Input tensor
         """
 
-        schema = get_schema("Round", 11, "")
-        op = Op(self, "Round", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Round", 11)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     V_Scan = TypeVar(
         "V_Scan",
@@ -2911,10 +2870,9 @@ class Opset11(Opset10):
                 in each iteration.
         """
 
-        schema = get_schema("Scan", 11, "")
-        op = Op(self, "Scan", schema)
+        op = self._get_op("Scan", 11)
         return op(
-            *self._prepare_inputs(schema, *initial_state_and_scan_inputs),
+            *self._prepare_inputs(op.op_schema, *initial_state_and_scan_inputs),
             body=body,
             num_scan_inputs=num_scan_inputs,
             scan_input_axes=scan_input_axes,
@@ -3027,9 +2985,8 @@ class Opset11(Opset10):
                 from the back. Accepted range is [-r, r-1] where r = rank(data).
         """
 
-        schema = get_schema("ScatterElements", 11, "")
-        op = Op(self, "ScatterElements", schema)
-        return op(*self._prepare_inputs(schema, data, indices, updates), axis=axis)
+        op = self._get_op("ScatterElements", 11)
+        return op(*self._prepare_inputs(op.op_schema, data, indices, updates), axis=axis)
 
     T_ScatterND = TypeVar(
         "T_ScatterND",
@@ -3127,9 +3084,8 @@ class Opset11(Opset10):
             updates: Tensor of rank q + r - indices_shape[-1] - 1.
         """
 
-        schema = get_schema("ScatterND", 11, "")
-        op = Op(self, "ScatterND", schema)
-        return op(*self._prepare_inputs(schema, data, indices, updates))
+        op = self._get_op("ScatterND", 11)
+        return op(*self._prepare_inputs(op.op_schema, data, indices, updates))
 
     S_SequenceAt = TypeVar(
         "S_SequenceAt",
@@ -3189,9 +3145,8 @@ class Opset11(Opset10):
                 empty shape).
         """
 
-        schema = get_schema("SequenceAt", 11, "")
-        op = Op(self, "SequenceAt", schema)
-        return op(*self._prepare_inputs(schema, input_sequence, position))
+        op = self._get_op("SequenceAt", 11)
+        return op(*self._prepare_inputs(op.op_schema, input_sequence, position))
 
     T_SequenceConstruct = TypeVar(
         "T_SequenceConstruct",
@@ -3242,9 +3197,8 @@ class Opset11(Opset10):
             inputs: (variadic) Tensors.
         """
 
-        schema = get_schema("SequenceConstruct", 11, "")
-        op = Op(self, "SequenceConstruct", schema)
-        return op(*self._prepare_inputs(schema, *inputs))
+        op = self._get_op("SequenceConstruct", 11)
+        return op(*self._prepare_inputs(op.op_schema, *inputs))
 
     S_SequenceEmpty: TypeAlias = Union[
         Sequence[BOOL],
@@ -3276,8 +3230,7 @@ class Opset11(Opset10):
                 default type is 'float'.
         """
 
-        schema = get_schema("SequenceEmpty", 11, "")
-        op = Op(self, "SequenceEmpty", schema)
+        op = self._get_op("SequenceEmpty", 11)
         return op(dtype=dtype)
 
     S_SequenceErase = TypeVar(
@@ -3323,9 +3276,8 @@ class Opset11(Opset10):
                 of empty shape).
         """
 
-        schema = get_schema("SequenceErase", 11, "")
-        op = Op(self, "SequenceErase", schema)
-        return op(*self._prepare_inputs(schema, input_sequence, position))
+        op = self._get_op("SequenceErase", 11)
+        return op(*self._prepare_inputs(op.op_schema, input_sequence, position))
 
     S_SequenceInsert = TypeVar(
         "S_SequenceInsert",
@@ -3396,9 +3348,8 @@ class Opset11(Opset10):
                 bounds. It must be a scalar(tensor of empty shape).
         """
 
-        schema = get_schema("SequenceInsert", 11, "")
-        op = Op(self, "SequenceInsert", schema)
-        return op(*self._prepare_inputs(schema, input_sequence, tensor, position))
+        op = self._get_op("SequenceInsert", 11)
+        return op(*self._prepare_inputs(op.op_schema, input_sequence, tensor, position))
 
     S_SequenceLength = TypeVar(
         "S_SequenceLength",
@@ -3432,9 +3383,8 @@ class Opset11(Opset10):
             input_sequence: Input sequence.
         """
 
-        schema = get_schema("SequenceLength", 11, "")
-        op = Op(self, "SequenceLength", schema)
-        return op(*self._prepare_inputs(schema, input_sequence))
+        op = self._get_op("SequenceLength", 11)
+        return op(*self._prepare_inputs(op.op_schema, input_sequence))
 
     T_Slice = TypeVar(
         "T_Slice",
@@ -3523,9 +3473,8 @@ class Opset11(Opset10):
                 1.
         """
 
-        schema = get_schema("Slice", 11, "")
-        op = Op(self, "Slice", schema)
-        return op(*self._prepare_inputs(schema, data, starts, ends, axes, steps))
+        op = self._get_op("Slice", 11)
+        return op(*self._prepare_inputs(op.op_schema, data, starts, ends, axes, steps))
 
     T_Softmax = TypeVar("T_Softmax", DOUBLE, FLOAT, FLOAT16)
 
@@ -3559,9 +3508,8 @@ class Opset11(Opset10):
                 r-1] where r = rank(input).
         """
 
-        schema = get_schema("Softmax", 11, "")
-        op = Op(self, "Softmax", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Softmax", 11)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     T_Split = TypeVar(
         "T_Split",
@@ -3601,9 +3549,8 @@ class Opset11(Opset10):
             split: length of each output. Values should be >= 0.
         """
 
-        schema = get_schema("Split", 11, "")
-        op = Op(self, "Split", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis, split=split)
+        op = self._get_op("Split", 11)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis, split=split)
 
     T_SplitToSequence = TypeVar(
         "T_SplitToSequence",
@@ -3683,9 +3630,10 @@ class Opset11(Opset10):
                 ignored.
         """
 
-        schema = get_schema("SplitToSequence", 11, "")
-        op = Op(self, "SplitToSequence", schema)
-        return op(*self._prepare_inputs(schema, input, split), axis=axis, keepdims=keepdims)
+        op = self._get_op("SplitToSequence", 11)
+        return op(
+            *self._prepare_inputs(op.op_schema, input, split), axis=axis, keepdims=keepdims
+        )
 
     T_Squeeze = TypeVar(
         "T_Squeeze",
@@ -3724,9 +3672,8 @@ class Opset11(Opset10):
                 where r = rank(data).
         """
 
-        schema = get_schema("Squeeze", 11, "")
-        op = Op(self, "Squeeze", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes)
+        op = self._get_op("Squeeze", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes)
 
     T_TopK = TypeVar(
         "T_TopK",
@@ -3783,10 +3730,12 @@ class Opset11(Opset10):
             sorted: Whether to return the elements in sorted order.
         """
 
-        schema = get_schema("TopK", 11, "")
-        op = Op(self, "TopK", schema)
+        op = self._get_op("TopK", 11)
         return op(
-            *self._prepare_inputs(schema, X, K), axis=axis, largest=largest, sorted=sorted
+            *self._prepare_inputs(op.op_schema, X, K),
+            axis=axis,
+            largest=largest,
+            sorted=sorted,
         )
 
     T_Unique = TypeVar(
@@ -3947,9 +3896,8 @@ class Opset11(Opset10):
                 before returning as output. Must be one of 0, or 1 (default).
         """
 
-        schema = get_schema("Unique", 11, "")
-        op = Op(self, "Unique", schema)
-        return op(*self._prepare_inputs(schema, X), axis=axis, sorted=sorted)
+        op = self._get_op("Unique", 11)
+        return op(*self._prepare_inputs(op.op_schema, X), axis=axis, sorted=sorted)
 
     T_Unsqueeze = TypeVar(
         "T_Unsqueeze",
@@ -3996,6 +3944,5 @@ class Opset11(Opset10):
                 r-1] where r = rank(expanded).
         """
 
-        schema = get_schema("Unsqueeze", 11, "")
-        op = Op(self, "Unsqueeze", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes)
+        op = self._get_op("Unsqueeze", 11)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes)
@@ -16,7 +16,6 @@ from __future__ import annotations
 from typing import Optional, Sequence, Tuple, TypeVar, Union
 
 from onnx import SparseTensorProto, TensorProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset11 import Opset11
@@ -37,7 +36,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset12(Opset11):
@@ -86,10 +85,9 @@ class Opset12(Opset11):
                 the {name} appears in multiple indices, default is False (first index).
         """
 
-        schema = get_schema("ArgMax", 12, "")
-        op = Op(self, "ArgMax", schema)
+        op = self._get_op("ArgMax", 12)
         return op(
-            *self._prepare_inputs(schema, data),
+            *self._prepare_inputs(op.op_schema, data),
             axis=axis,
             keepdims=keepdims,
             select_last_index=select_last_index,
@@ -137,10 +135,9 @@ class Opset12(Opset11):
                 the {name} appears in multiple indices, default is False (first index).
         """
 
-        schema = get_schema("ArgMin", 12, "")
-        op = Op(self, "ArgMin", schema)
+        op = self._get_op("ArgMin", 12)
         return op(
-            *self._prepare_inputs(schema, data),
+            *self._prepare_inputs(op.op_schema, data),
             axis=axis,
             keepdims=keepdims,
             select_last_index=select_last_index,
@@ -170,9 +167,8 @@ class Opset12(Opset11):
                 The default value is 1.0.
         """
 
-        schema = get_schema("Celu", 12, "")
-        op = Op(self, "Celu", schema)
-        return op(*self._prepare_inputs(schema, X), alpha=alpha)
+        op = self._get_op("Celu", 12)
+        return op(*self._prepare_inputs(op.op_schema, X), alpha=alpha)
 
     T_Clip = TypeVar(
         "T_Clip",
@@ -210,9 +206,8 @@ class Opset12(Opset11):
                 must be a scalar(tensor of empty shape).
         """
 
-        schema = get_schema("Clip", 12, "")
-        op = Op(self, "Clip", schema)
-        return op(*self._prepare_inputs(schema, input, min, max))
+        op = self._get_op("Clip", 12)
+        return op(*self._prepare_inputs(op.op_schema, input, min, max))
 
     T_Constant: TypeAlias = Union[
         BOOL,
@@ -275,8 +270,7 @@ class Opset12(Opset11):
                 tensor.
         """
 
-        schema = get_schema("Constant", 12, "")
-        op = Op(self, "Constant", schema)
+        op = self._get_op("Constant", 12)
         return op(
             sparse_value=sparse_value,
             value=value,
@@ -342,9 +336,8 @@ class Opset12(Opset11):
                 generate one.
         """
 
-        schema = get_schema("Dropout", 12, "")
-        op = Op(self, "Dropout", schema)
-        return op(*self._prepare_inputs(schema, data, ratio, training_mode), seed=seed)
+        op = self._get_op("Dropout", 12)
+        return op(*self._prepare_inputs(op.op_schema, data, ratio, training_mode), seed=seed)
 
     T_Einsum = TypeVar(
         "T_Einsum",
@@ -400,9 +393,8 @@ class Opset12(Opset11):
             equation: Einsum expression string.
         """
 
-        schema = get_schema("Einsum", 12, "")
-        op = Op(self, "Einsum", schema)
-        return op(*self._prepare_inputs(schema, *Inputs), equation=equation)
+        op = self._get_op("Einsum", 12)
+        return op(*self._prepare_inputs(op.op_schema, *Inputs), equation=equation)
 
     T_GatherND = TypeVar(
         "T_GatherND",
@@ -531,9 +523,8 @@ class Opset12(Opset11):
                 from dimension of data[batch_dims:]
         """
 
-        schema = get_schema("GatherND", 12, "")
-        op = Op(self, "GatherND", schema)
-        return op(*self._prepare_inputs(schema, data, indices), batch_dims=batch_dims)
+        op = self._get_op("GatherND", 12)
+        return op(*self._prepare_inputs(op.op_schema, data, indices), batch_dims=batch_dims)
 
     T_GreaterOrEqual = TypeVar(
         "T_GreaterOrEqual",
@@ -568,9 +559,8 @@ class Opset12(Opset11):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("GreaterOrEqual", 12, "")
-        op = Op(self, "GreaterOrEqual", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("GreaterOrEqual", 12)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_LessOrEqual = TypeVar(
         "T_LessOrEqual",
@@ -605,9 +595,8 @@ class Opset12(Opset11):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("LessOrEqual", 12, "")
-        op = Op(self, "LessOrEqual", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("LessOrEqual", 12)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Max = TypeVar(
         "T_Max",
@@ -637,9 +626,8 @@ class Opset12(Opset11):
             data_0: (variadic) List of tensors for max.
         """
 
-        schema = get_schema("Max", 12, "")
-        op = Op(self, "Max", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Max", 12)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_MaxPool = TypeVar("T_MaxPool", DOUBLE, FLOAT, FLOAT16, INT8, UINT8)
 
@@ -731,10 +719,9 @@ class Opset12(Opset11):
                 to 1 along each spatial axis.
         """
 
-        schema = get_schema("MaxPool", 12, "")
-        op = Op(self, "MaxPool", schema)
+        op = self._get_op("MaxPool", 12)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             ceil_mode=ceil_mode,
             dilations=dilations,
@@ -772,9 +759,8 @@ class Opset12(Opset11):
             data_0: (variadic) List of tensors for min.
         """
 
-        schema = get_schema("Min", 12, "")
-        op = Op(self, "Min", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Min", 12)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_NegativeLogLikelihoodLoss = TypeVar(
         "T_NegativeLogLikelihoodLoss", DOUBLE, FLOAT, FLOAT16
@@ -882,10 +868,9 @@ class Opset12(Opset11):
                 applied weights.
         """
 
-        schema = get_schema("NegativeLogLikelihoodLoss", 12, "")
-        op = Op(self, "NegativeLogLikelihoodLoss", schema)
+        op = self._get_op("NegativeLogLikelihoodLoss", 12)
         return op(
-            *self._prepare_inputs(schema, input, target, weight),
+            *self._prepare_inputs(op.op_schema, input, target, weight),
             ignore_index=ignore_index,
             reduction=reduction,
         )
@@ -922,9 +907,8 @@ class Opset12(Opset11):
             Y: Second operand, power of the exponent.
         """
 
-        schema = get_schema("Pow", 12, "")
-        op = Op(self, "Pow", schema)
-        return op(*self._prepare_inputs(schema, X, Y))
+        op = self._get_op("Pow", 12)
+        return op(*self._prepare_inputs(op.op_schema, X, Y))
 
     T_ReduceMax = TypeVar(
         "T_ReduceMax", DOUBLE, FLOAT, FLOAT16, INT32, INT64, INT8, UINT32, UINT64, UINT8
@@ -954,9 +938,8 @@ class Opset12(Opset11):
                 dimension.
         """
 
-        schema = get_schema("ReduceMax", 12, "")
-        op = Op(self, "ReduceMax", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMax", 12)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMin = TypeVar(
         "T_ReduceMin", DOUBLE, FLOAT, FLOAT16, INT32, INT64, INT8, UINT32, UINT64, UINT8
@@ -986,9 +969,8 @@ class Opset12(Opset11):
                 dimension.
         """
 
-        schema = get_schema("ReduceMin", 12, "")
-        op = Op(self, "ReduceMin", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMin", 12)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_SoftmaxCrossEntropyLoss = TypeVar("T_SoftmaxCrossEntropyLoss", DOUBLE, FLOAT, FLOAT16)
 
@@ -1062,10 +1044,9 @@ class Opset12(Opset11):
                 in the output.
         """
 
-        schema = get_schema("SoftmaxCrossEntropyLoss", 12, "")
-        op = Op(self, "SoftmaxCrossEntropyLoss", schema)
+        op = self._get_op("SoftmaxCrossEntropyLoss", 12)
         return op(
-            *self._prepare_inputs(schema, scores, labels, weights),
+            *self._prepare_inputs(op.op_schema, scores, labels, weights),
             ignore_index=ignore_index,
             reduction=reduction,
         )
@@ -16,7 +16,6 @@ from __future__ import annotations
 from typing import Optional, Sequence, Tuple, TypeVar, Union
 
 from onnx import GraphProto, SparseTensorProto, TensorProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset12 import Opset12
@@ -38,7 +37,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset13(Opset12):
@@ -74,9 +73,8 @@ class Opset13(Opset12):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("Abs", 13, "")
-        op = Op(self, "Abs", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Abs", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Add = TypeVar("T_Add", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -95,9 +93,8 @@ class Opset13(Opset12):
             B: (differentiable) Second operand.
         """
 
-        schema = get_schema("Add", 13, "")
-        op = Op(self, "Add", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Add", 13)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_ArgMax = TypeVar(
         "T_ArgMax",
@@ -142,10 +139,9 @@ class Opset13(Opset12):
                 the {name} appears in multiple indices, default is False (first index).
         """
 
-        schema = get_schema("ArgMax", 13, "")
-        op = Op(self, "ArgMax", schema)
+        op = self._get_op("ArgMax", 13)
         return op(
-            *self._prepare_inputs(schema, data),
+            *self._prepare_inputs(op.op_schema, data),
             axis=axis,
             keepdims=keepdims,
             select_last_index=select_last_index,
@@ -194,10 +190,9 @@ class Opset13(Opset12):
                 the {name} appears in multiple indices, default is False (first index).
         """
 
-        schema = get_schema("ArgMin", 13, "")
-        op = Op(self, "ArgMin", schema)
+        op = self._get_op("ArgMin", 13)
         return op(
-            *self._prepare_inputs(schema, data),
+            *self._prepare_inputs(op.op_schema, data),
             axis=axis,
             keepdims=keepdims,
             select_last_index=select_last_index,
@@ -286,9 +281,8 @@ class Opset13(Opset12):
                 Strictly must be one of the types from DataType enum in TensorProto
         """
 
-        schema = get_schema("Cast", 13, "")
-        op = Op(self, "Cast", schema)
-        return op(*self._prepare_inputs(schema, input), to=to)
+        op = self._get_op("Cast", 13)
+        return op(*self._prepare_inputs(op.op_schema, input), to=to)
 
     T_Ceil = TypeVar("T_Ceil", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -305,9 +299,8 @@ class Opset13(Opset12):
             X: (non-differentiable) Input tensor
         """
 
-        schema = get_schema("Ceil", 13, "")
-        op = Op(self, "Ceil", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Ceil", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Clip = TypeVar(
         "T_Clip",
@@ -346,9 +339,8 @@ class Opset13(Opset12):
                 replaced by max. It must be a scalar(tensor of empty shape).
         """
 
-        schema = get_schema("Clip", 13, "")
-        op = Op(self, "Clip", schema)
-        return op(*self._prepare_inputs(schema, input, min, max))
+        op = self._get_op("Clip", 13)
+        return op(*self._prepare_inputs(op.op_schema, input, min, max))
 
     T_Concat = TypeVar(
         "T_Concat",
@@ -382,9 +374,8 @@ class Opset13(Opset12):
                 from the back. Accepted range is [-r, r-1] where r = rank(inputs)..
         """
 
-        schema = get_schema("Concat", 13, "")
-        op = Op(self, "Concat", schema)
-        return op(*self._prepare_inputs(schema, *inputs), axis=axis)
+        op = self._get_op("Concat", 13)
+        return op(*self._prepare_inputs(op.op_schema, *inputs), axis=axis)
 
     T_Constant: TypeAlias = Union[
         BFLOAT16,
@@ -448,8 +439,7 @@ class Opset13(Opset12):
                 tensor.
         """
 
-        schema = get_schema("Constant", 13, "")
-        op = Op(self, "Constant", schema)
+        op = self._get_op("Constant", 13)
         return op(
             sparse_value=sparse_value,
             value=value,
@@ -525,9 +515,8 @@ class Opset13(Opset12):
                 column-row-depth order.
         """
 
-        schema = get_schema("DepthToSpace", 13, "")
-        op = Op(self, "DepthToSpace", schema)
-        return op(*self._prepare_inputs(schema, input), blocksize=blocksize, mode=mode)
+        op = self._get_op("DepthToSpace", 13)
+        return op(*self._prepare_inputs(op.op_schema, input), blocksize=blocksize, mode=mode)
 
     T_DequantizeLinear = TypeVar("T_DequantizeLinear", INT32, INT8, UINT8)
 
@@ -565,9 +554,8 @@ class Opset13(Opset12):
                 rank(input).
         """
 
-        schema = get_schema("DequantizeLinear", 13, "")
-        op = Op(self, "DequantizeLinear", schema)
-        return op(*self._prepare_inputs(schema, x, x_scale, x_zero_point), axis=axis)
+        op = self._get_op("DequantizeLinear", 13)
+        return op(*self._prepare_inputs(op.op_schema, x, x_scale, x_zero_point), axis=axis)
 
     T_Div = TypeVar("T_Div", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -586,9 +574,8 @@ class Opset13(Opset12):
             B: (differentiable) Second operand.
         """
 
-        schema = get_schema("Div", 13, "")
-        op = Op(self, "Div", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Div", 13)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Dropout = TypeVar("T_Dropout", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -646,9 +633,8 @@ class Opset13(Opset12):
                 generate one.
         """
 
-        schema = get_schema("Dropout", 13, "")
-        op = Op(self, "Dropout", schema)
-        return op(*self._prepare_inputs(schema, data, ratio, training_mode), seed=seed)
+        op = self._get_op("Dropout", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, ratio, training_mode), seed=seed)
 
     T_Equal = TypeVar(
         "T_Equal",
@@ -685,9 +671,8 @@ class Opset13(Opset12):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("Equal", 13, "")
-        op = Op(self, "Equal", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Equal", 13)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Erf = TypeVar(
         "T_Erf",
@@ -716,9 +701,8 @@ class Opset13(Opset12):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Erf", 13, "")
-        op = Op(self, "Erf", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Erf", 13)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Exp = TypeVar("T_Exp", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -733,9 +717,8 @@ class Opset13(Opset12):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Exp", 13, "")
-        op = Op(self, "Exp", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Exp", 13)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Expand = TypeVar(
         "T_Expand",
@@ -778,9 +761,8 @@ class Opset13(Opset12):
                 expand to, following the broadcast rule
         """
 
-        schema = get_schema("Expand", 13, "")
-        op = Op(self, "Expand", schema)
-        return op(*self._prepare_inputs(schema, input, shape))
+        op = self._get_op("Expand", 13)
+        return op(*self._prepare_inputs(op.op_schema, input, shape))
 
     T_Flatten = TypeVar(
         "T_Flatten",
@@ -822,9 +804,8 @@ class Opset13(Opset12):
                 tensor is (d_0, d_1, ... d_n).
         """
 
-        schema = get_schema("Flatten", 13, "")
-        op = Op(self, "Flatten", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Flatten", 13)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     T_Floor = TypeVar("T_Floor", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -841,9 +822,8 @@ class Opset13(Opset12):
             X: (non-differentiable) Input tensor
         """
 
-        schema = get_schema("Floor", 13, "")
-        op = Op(self, "Floor", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Floor", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Gather = TypeVar(
         "T_Gather",
@@ -936,9 +916,8 @@ class Opset13(Opset12):
                 the back. Accepted range is [-r, r-1] where r = rank(data).
         """
 
-        schema = get_schema("Gather", 13, "")
-        op = Op(self, "Gather", schema)
-        return op(*self._prepare_inputs(schema, data, indices), axis=axis)
+        op = self._get_op("Gather", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, indices), axis=axis)
 
     T_GatherElements = TypeVar(
         "T_GatherElements",
@@ -1040,9 +1019,8 @@ class Opset13(Opset12):
                 the back. Accepted range is [-r, r-1] where r = rank(data).
         """
 
-        schema = get_schema("GatherElements", 13, "")
-        op = Op(self, "GatherElements", schema)
-        return op(*self._prepare_inputs(schema, data, indices), axis=axis)
+        op = self._get_op("GatherElements", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, indices), axis=axis)
 
     T_GatherND = TypeVar(
         "T_GatherND",
@@ -1172,9 +1150,8 @@ class Opset13(Opset12):
                 from dimension of data[batch_dims:]
         """
 
-        schema = get_schema("GatherND", 13, "")
-        op = Op(self, "GatherND", schema)
-        return op(*self._prepare_inputs(schema, data, indices), batch_dims=batch_dims)
+        op = self._get_op("GatherND", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, indices), batch_dims=batch_dims)
 
     T_Gemm = TypeVar("T_Gemm", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -1225,10 +1202,9 @@ class Opset13(Opset12):
             transB: Whether B should be transposed
         """
 
-        schema = get_schema("Gemm", 13, "")
-        op = Op(self, "Gemm", schema)
+        op = self._get_op("Gemm", 13)
         return op(
-            *self._prepare_inputs(schema, A, B, C),
+            *self._prepare_inputs(op.op_schema, A, B, C),
             alpha=alpha,
             beta=beta,
             transA=transA,
@@ -1269,9 +1245,8 @@ class Opset13(Opset12):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("Greater", 13, "")
-        op = Op(self, "Greater", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Greater", 13)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Hardmax = TypeVar("T_Hardmax", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -1299,9 +1274,8 @@ class Opset13(Opset12):
                 where r = rank(input).
         """
 
-        schema = get_schema("Hardmax", 13, "")
-        op = Op(self, "Hardmax", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Hardmax", 13)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     T_Identity = TypeVar(
         "T_Identity",
@@ -1332,9 +1306,8 @@ class Opset13(Opset12):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Identity", 13, "")
-        op = Op(self, "Identity", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Identity", 13)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     B_If: TypeAlias = BOOL
 
@@ -1388,10 +1361,9 @@ class Opset13(Opset12):
                 match the number of outputs in the else_branch.
         """
 
-        schema = get_schema("If", 13, "")
-        op = Op(self, "If", schema)
+        op = self._get_op("If", 13)
         return op(
-            *self._prepare_inputs(schema, cond),
+            *self._prepare_inputs(op.op_schema, cond),
             else_branch=else_branch,
             then_branch=then_branch,
         )
@@ -1409,9 +1381,8 @@ class Opset13(Opset12):
             X: (non-differentiable) input
         """
 
-        schema = get_schema("IsNaN", 13, "")
-        op = Op(self, "IsNaN", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("IsNaN", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_LRN = TypeVar("T_LRN", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -1456,10 +1427,13 @@ class Opset13(Opset12):
             size: The number of channels to sum over
         """
 
-        schema = get_schema("LRN", 13, "")
-        op = Op(self, "LRN", schema)
+        op = self._get_op("LRN", 13)
         return op(
-            *self._prepare_inputs(schema, X), alpha=alpha, beta=beta, bias=bias, size=size
+            *self._prepare_inputs(op.op_schema, X),
+            alpha=alpha,
+            beta=beta,
+            bias=bias,
+            size=size,
         )
 
     T_Less = TypeVar(
@@ -1496,9 +1470,8 @@ class Opset13(Opset12):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("Less", 13, "")
-        op = Op(self, "Less", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Less", 13)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Log = TypeVar("T_Log", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -1513,9 +1486,8 @@ class Opset13(Opset12):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Log", 13, "")
-        op = Op(self, "Log", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Log", 13)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_LogSoftmax = TypeVar("T_LogSoftmax", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -1543,9 +1515,8 @@ class Opset13(Opset12):
                 r-1] where r = rank(input).
         """
 
-        schema = get_schema("LogSoftmax", 13, "")
-        op = Op(self, "LogSoftmax", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("LogSoftmax", 13)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     I_Loop: TypeAlias = INT64
 
@@ -1747,9 +1718,8 @@ class Opset13(Opset12):
                 iterations.
         """
 
-        schema = get_schema("Loop", 13, "")
-        op = Op(self, "Loop", schema)
-        return op(*self._prepare_inputs(schema, M, cond, *v_initial), body=body)
+        op = self._get_op("Loop", 13)
+        return op(*self._prepare_inputs(op.op_schema, M, cond, *v_initial), body=body)
 
     T_MatMul = TypeVar(
         "T_MatMul", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -1768,9 +1738,8 @@ class Opset13(Opset12):
             B: (differentiable) N-dimensional matrix B
         """
 
-        schema = get_schema("MatMul", 13, "")
-        op = Op(self, "MatMul", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("MatMul", 13)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Max = TypeVar(
         "T_Max",
@@ -1801,9 +1770,8 @@ class Opset13(Opset12):
             data_0: (variadic, differentiable) List of tensors for max.
         """
 
-        schema = get_schema("Max", 13, "")
-        op = Op(self, "Max", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Max", 13)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_Mean = TypeVar("T_Mean", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -1820,9 +1788,8 @@ class Opset13(Opset12):
             data_0: (variadic, differentiable) List of tensors for mean.
         """
 
-        schema = get_schema("Mean", 13, "")
-        op = Op(self, "Mean", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Mean", 13)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_MeanVarianceNormalization = TypeVar(
         "T_MeanVarianceNormalization", BFLOAT16, DOUBLE, FLOAT, FLOAT16
@@ -1847,9 +1814,8 @@ class Opset13(Opset12):
                 mean and variance.
         """
 
-        schema = get_schema("MeanVarianceNormalization", 13, "")
-        op = Op(self, "MeanVarianceNormalization", schema)
-        return op(*self._prepare_inputs(schema, X), axes=axes)
+        op = self._get_op("MeanVarianceNormalization", 13)
+        return op(*self._prepare_inputs(op.op_schema, X), axes=axes)
 
     T_Min = TypeVar(
         "T_Min",
@@ -1880,9 +1846,8 @@ class Opset13(Opset12):
             data_0: (variadic, differentiable) List of tensors for min.
         """
 
-        schema = get_schema("Min", 13, "")
-        op = Op(self, "Min", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Min", 13)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_Mod = TypeVar(
         "T_Mod",
@@ -1928,9 +1893,8 @@ class Opset13(Opset12):
                 will do integer mods); Set this to 1 to force fmod treatment
         """
 
-        schema = get_schema("Mod", 13, "")
-        op = Op(self, "Mod", schema)
-        return op(*self._prepare_inputs(schema, A, B), fmod=fmod)
+        op = self._get_op("Mod", 13)
+        return op(*self._prepare_inputs(op.op_schema, A, B), fmod=fmod)
 
     T_Mul = TypeVar("T_Mul", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -1949,9 +1913,8 @@ class Opset13(Opset12):
             B: (differentiable) Second operand.
         """
 
-        schema = get_schema("Mul", 13, "")
-        op = Op(self, "Mul", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Mul", 13)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Neg = TypeVar("T_Neg", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT16, INT32, INT64, INT8)
 
@@ -1968,9 +1931,8 @@ class Opset13(Opset12):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("Neg", 13, "")
-        op = Op(self, "Neg", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Neg", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_NegativeLogLikelihoodLoss = TypeVar(
         "T_NegativeLogLikelihoodLoss", DOUBLE, FLOAT, FLOAT16
@@ -2131,10 +2093,9 @@ class Opset13(Opset12):
                 applied weights.
         """
 
-        schema = get_schema("NegativeLogLikelihoodLoss", 13, "")
-        op = Op(self, "NegativeLogLikelihoodLoss", schema)
+        op = self._get_op("NegativeLogLikelihoodLoss", 13)
         return op(
-            *self._prepare_inputs(schema, input, target, weight),
+            *self._prepare_inputs(op.op_schema, input, target, weight),
             ignore_index=ignore_index,
             reduction=reduction,
         )
@@ -2174,9 +2135,8 @@ class Opset13(Opset12):
             X: (non-differentiable) input
         """
 
-        schema = get_schema("NonZero", 13, "")
-        op = Op(self, "NonZero", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("NonZero", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Pad = TypeVar(
         "T_Pad",
@@ -2304,9 +2264,8 @@ class Opset13(Opset12):
             mode: Supported modes: `constant`(default), `reflect`, `edge`
         """
 
-        schema = get_schema("Pad", 13, "")
-        op = Op(self, "Pad", schema)
-        return op(*self._prepare_inputs(schema, data, pads, constant_value), mode=mode)
+        op = self._get_op("Pad", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, pads, constant_value), mode=mode)
 
     T_Pow = TypeVar("T_Pow", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64)
 
@@ -2340,9 +2299,8 @@ class Opset13(Opset12):
             Y: (differentiable) Second operand, power of the exponent.
         """
 
-        schema = get_schema("Pow", 13, "")
-        op = Op(self, "Pow", schema)
-        return op(*self._prepare_inputs(schema, X, Y))
+        op = self._get_op("Pow", 13)
+        return op(*self._prepare_inputs(op.op_schema, X, Y))
 
     T1_QuantizeLinear = TypeVar("T1_QuantizeLinear", FLOAT, INT32)
 
@@ -2383,9 +2341,8 @@ class Opset13(Opset12):
                 rank(input).
         """
 
-        schema = get_schema("QuantizeLinear", 13, "")
-        op = Op(self, "QuantizeLinear", schema)
-        return op(*self._prepare_inputs(schema, x, y_scale, y_zero_point), axis=axis)
+        op = self._get_op("QuantizeLinear", 13)
+        return op(*self._prepare_inputs(op.op_schema, x, y_scale, y_zero_point), axis=axis)
 
     T_Reciprocal = TypeVar("T_Reciprocal", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -2402,9 +2359,8 @@ class Opset13(Opset12):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("Reciprocal", 13, "")
-        op = Op(self, "Reciprocal", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Reciprocal", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_ReduceL1 = TypeVar(
         "T_ReduceL1", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2435,9 +2391,8 @@ class Opset13(Opset12):
                 dimension.
         """
 
-        schema = get_schema("ReduceL1", 13, "")
-        op = Op(self, "ReduceL1", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceL1", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceL2 = TypeVar(
         "T_ReduceL2", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2468,9 +2423,8 @@ class Opset13(Opset12):
                 dimension.
         """
 
-        schema = get_schema("ReduceL2", 13, "")
-        op = Op(self, "ReduceL2", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceL2", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceLogSum = TypeVar(
         "T_ReduceLogSum", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2501,9 +2455,8 @@ class Opset13(Opset12):
                 dimension.
         """
 
-        schema = get_schema("ReduceLogSum", 13, "")
-        op = Op(self, "ReduceLogSum", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceLogSum", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceLogSumExp = TypeVar(
         "T_ReduceLogSumExp", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2538,9 +2491,8 @@ class Opset13(Opset12):
                 dimension.
         """
 
-        schema = get_schema("ReduceLogSumExp", 13, "")
-        op = Op(self, "ReduceLogSumExp", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceLogSumExp", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMax = TypeVar(
         "T_ReduceMax",
@@ -2581,9 +2533,8 @@ class Opset13(Opset12):
                 dimension.
         """
 
-        schema = get_schema("ReduceMax", 13, "")
-        op = Op(self, "ReduceMax", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMax", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMean = TypeVar(
         "T_ReduceMean", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2614,9 +2565,8 @@ class Opset13(Opset12):
                 dimension.
         """
 
-        schema = get_schema("ReduceMean", 13, "")
-        op = Op(self, "ReduceMean", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMean", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceMin = TypeVar(
         "T_ReduceMin",
@@ -2657,9 +2607,8 @@ class Opset13(Opset12):
                 dimension.
         """
 
-        schema = get_schema("ReduceMin", 13, "")
-        op = Op(self, "ReduceMin", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceMin", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceProd = TypeVar(
         "T_ReduceProd", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2690,9 +2639,8 @@ class Opset13(Opset12):
                 dimension.
         """
 
-        schema = get_schema("ReduceProd", 13, "")
-        op = Op(self, "ReduceProd", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceProd", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_ReduceSum = TypeVar(
         "T_ReduceSum", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -2735,10 +2683,9 @@ class Opset13(Opset12):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceSum", 13, "")
-        op = Op(self, "ReduceSum", schema)
+        op = self._get_op("ReduceSum", 13)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -2776,9 +2723,8 @@ class Opset13(Opset12):
                 dimension.
         """
 
-        schema = get_schema("ReduceSumSquare", 13, "")
-        op = Op(self, "ReduceSumSquare", schema)
-        return op(*self._prepare_inputs(schema, data), axes=axes, keepdims=keepdims)
+        op = self._get_op("ReduceSumSquare", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), axes=axes, keepdims=keepdims)
 
     T_Relu = TypeVar("T_Relu", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -2795,9 +2741,8 @@ class Opset13(Opset12):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("Relu", 13, "")
-        op = Op(self, "Relu", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Relu", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Reshape = TypeVar(
         "T_Reshape",
@@ -2837,9 +2782,8 @@ class Opset13(Opset12):
             shape: (non-differentiable) Specified shape for output.
         """
 
-        schema = get_schema("Reshape", 13, "")
-        op = Op(self, "Reshape", schema)
-        return op(*self._prepare_inputs(schema, data, shape))
+        op = self._get_op("Reshape", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, shape))
 
     T1_Resize = TypeVar(
         "T1_Resize",
@@ -2973,10 +2917,9 @@ class Opset13(Opset12):
                 if "mode" is "nearest".
         """
 
-        schema = get_schema("Resize", 13, "")
-        op = Op(self, "Resize", schema)
+        op = self._get_op("Resize", 13)
         return op(
-            *self._prepare_inputs(schema, X, roi, scales, sizes),
+            *self._prepare_inputs(op.op_schema, X, roi, scales, sizes),
             coordinate_transformation_mode=coordinate_transformation_mode,
             cubic_coeff_a=cubic_coeff_a,
             exclude_outside=exclude_outside,
@@ -3092,9 +3035,8 @@ class Opset13(Opset12):
                 from the back. Accepted range is [-r, r-1] where r = rank(data).
         """
 
-        schema = get_schema("ScatterElements", 13, "")
-        op = Op(self, "ScatterElements", schema)
-        return op(*self._prepare_inputs(schema, data, indices, updates), axis=axis)
+        op = self._get_op("ScatterElements", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, indices, updates), axis=axis)
 
     T_ScatterND = TypeVar(
         "T_ScatterND",
@@ -3193,9 +3135,8 @@ class Opset13(Opset12):
             updates: (differentiable) Tensor of rank q + r - indices_shape[-1] - 1.
         """
 
-        schema = get_schema("ScatterND", 13, "")
-        op = Op(self, "ScatterND", schema)
-        return op(*self._prepare_inputs(schema, data, indices, updates))
+        op = self._get_op("ScatterND", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, indices, updates))
 
     T_Shape = TypeVar(
         "T_Shape",
@@ -3230,9 +3171,8 @@ class Opset13(Opset12):
             data: (non-differentiable) An input tensor.
         """
 
-        schema = get_schema("Shape", 13, "")
-        op = Op(self, "Shape", schema)
-        return op(*self._prepare_inputs(schema, data))
+        op = self._get_op("Shape", 13)
+        return op(*self._prepare_inputs(op.op_schema, data))
 
     T_Sigmoid = TypeVar("T_Sigmoid", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -3249,9 +3189,8 @@ class Opset13(Opset12):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("Sigmoid", 13, "")
-        op = Op(self, "Sigmoid", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Sigmoid", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Sign = TypeVar(
         "T_Sign",
@@ -3281,9 +3220,8 @@ class Opset13(Opset12):
             input: (non-differentiable) Input tensor
         """
 
-        schema = get_schema("Sign", 13, "")
-        op = Op(self, "Sign", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Sign", 13)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Size = TypeVar(
         "T_Size",
@@ -3318,9 +3256,8 @@ class Opset13(Opset12):
             data: (non-differentiable) An input tensor.
         """
 
-        schema = get_schema("Size", 13, "")
-        op = Op(self, "Size", schema)
-        return op(*self._prepare_inputs(schema, data))
+        op = self._get_op("Size", 13)
+        return op(*self._prepare_inputs(op.op_schema, data))
 
     T_Slice = TypeVar(
         "T_Slice",
@@ -3442,9 +3379,8 @@ class Opset13(Opset12):
                 'steps' cannot be 0. Defaults to 1s.
         """
 
-        schema = get_schema("Slice", 13, "")
-        op = Op(self, "Slice", schema)
-        return op(*self._prepare_inputs(schema, data, starts, ends, axes, steps))
+        op = self._get_op("Slice", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, starts, ends, axes, steps))
 
     T_Softmax = TypeVar("T_Softmax", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -3472,9 +3408,8 @@ class Opset13(Opset12):
                 where r = rank(input).
         """
 
-        schema = get_schema("Softmax", 13, "")
-        op = Op(self, "Softmax", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Softmax", 13)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     T_SoftmaxCrossEntropyLoss = TypeVar(
         "T_SoftmaxCrossEntropyLoss", BFLOAT16, DOUBLE, FLOAT, FLOAT16
@@ -3568,10 +3503,9 @@ class Opset13(Opset12):
                 in the output.
         """
 
-        schema = get_schema("SoftmaxCrossEntropyLoss", 13, "")
-        op = Op(self, "SoftmaxCrossEntropyLoss", schema)
+        op = self._get_op("SoftmaxCrossEntropyLoss", 13)
         return op(
-            *self._prepare_inputs(schema, scores, labels, weights),
+            *self._prepare_inputs(op.op_schema, scores, labels, weights),
             ignore_index=ignore_index,
             reduction=reduction,
         )
@@ -3611,9 +3545,8 @@ class Opset13(Opset12):
             blocksize: Blocks of [blocksize, blocksize] are moved.
         """
 
-        schema = get_schema("SpaceToDepth", 13, "")
-        op = Op(self, "SpaceToDepth", schema)
-        return op(*self._prepare_inputs(schema, input), blocksize=blocksize)
+        op = self._get_op("SpaceToDepth", 13)
+        return op(*self._prepare_inputs(op.op_schema, input), blocksize=blocksize)
 
     T_Split = TypeVar(
         "T_Split",
@@ -3656,9 +3589,8 @@ class Opset13(Opset12):
                 from the back. Accepted range is [-rank, rank-1] where r = rank(input).
         """
 
-        schema = get_schema("Split", 13, "")
-        op = Op(self, "Split", schema)
-        return op(*self._prepare_inputs(schema, input, split), axis=axis)
+        op = self._get_op("Split", 13)
+        return op(*self._prepare_inputs(op.op_schema, input, split), axis=axis)
 
     T_Sqrt = TypeVar("T_Sqrt", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -3675,9 +3607,8 @@ class Opset13(Opset12):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("Sqrt", 13, "")
-        op = Op(self, "Sqrt", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Sqrt", 13)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Squeeze = TypeVar(
         "T_Squeeze",
@@ -3717,9 +3648,8 @@ class Opset13(Opset12):
                 back. Accepted range is [-r, r-1] where r = rank(data).
         """
 
-        schema = get_schema("Squeeze", 13, "")
-        op = Op(self, "Squeeze", schema)
-        return op(*self._prepare_inputs(schema, data, axes))
+        op = self._get_op("Squeeze", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, axes))
 
     T_Sub = TypeVar("T_Sub", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -3738,9 +3668,8 @@ class Opset13(Opset12):
             B: (differentiable) Second operand.
         """
 
-        schema = get_schema("Sub", 13, "")
-        op = Op(self, "Sub", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Sub", 13)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Sum = TypeVar("T_Sum", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -3757,9 +3686,8 @@ class Opset13(Opset12):
             data_0: (variadic, differentiable) List of tensors for sum.
         """
 
-        schema = get_schema("Sum", 13, "")
-        op = Op(self, "Sum", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Sum", 13)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_Tanh = TypeVar("T_Tanh", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -3774,9 +3702,8 @@ class Opset13(Opset12):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Tanh", 13, "")
-        op = Op(self, "Tanh", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Tanh", 13)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Tile = TypeVar(
         "T_Tile",
@@ -3816,9 +3743,8 @@ class Opset13(Opset12):
                 dimensions.
         """
 
-        schema = get_schema("Tile", 13, "")
-        op = Op(self, "Tile", schema)
-        return op(*self._prepare_inputs(schema, input, repeats))
+        op = self._get_op("Tile", 13)
+        return op(*self._prepare_inputs(op.op_schema, input, repeats))
 
     T_Transpose = TypeVar(
         "T_Transpose",
@@ -3858,9 +3784,8 @@ class Opset13(Opset12):
                 permute the axes according to the values given.
         """
 
-        schema = get_schema("Transpose", 13, "")
-        op = Op(self, "Transpose", schema)
-        return op(*self._prepare_inputs(schema, data), perm=perm)
+        op = self._get_op("Transpose", 13)
+        return op(*self._prepare_inputs(op.op_schema, data), perm=perm)
 
     T_Unsqueeze = TypeVar(
         "T_Unsqueeze",
@@ -3906,6 +3831,5 @@ class Opset13(Opset12):
                 Accepted range is [-r, r-1] where r = rank(expanded).
         """
 
-        schema = get_schema("Unsqueeze", 13, "")
-        op = Op(self, "Unsqueeze", schema)
-        return op(*self._prepare_inputs(schema, data, axes))
+        op = self._get_op("Unsqueeze", 13)
+        return op(*self._prepare_inputs(op.op_schema, data, axes))
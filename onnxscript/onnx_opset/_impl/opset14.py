@@ -15,7 +15,6 @@ from __future__ import annotations
 
 from typing import Optional, Sequence, Tuple, TypeVar
 
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset13 import Opset13
@@ -37,7 +36,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset14(Opset13):
@@ -77,9 +76,8 @@ class Opset14(Opset13):
             B: (differentiable) Second operand.
         """
 
-        schema = get_schema("Add", 14, "")
-        op = Op(self, "Add", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Add", 14)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_BatchNormalization = TypeVar("T_BatchNormalization", BFLOAT16, DOUBLE, FLOAT, FLOAT16)
 
@@ -172,10 +170,9 @@ class Opset14(Opset13):
                 for training, and outputs 1, 2, 3, and 4 would be populated.
         """
 
-        schema = get_schema("BatchNormalization", 14, "")
-        op = Op(self, "BatchNormalization", schema)
+        op = self._get_op("BatchNormalization", 14)
         return op(
-            *self._prepare_inputs(schema, X, scale, B, input_mean, input_var),
+            *self._prepare_inputs(op.op_schema, X, scale, B, input_mean, input_var),
             epsilon=epsilon,
             momentum=momentum,
             training_mode=training_mode,
@@ -230,9 +227,10 @@ class Opset14(Opset13):
             reverse: If set to 1 will perform the sums in reverse direction.
         """
 
-        schema = get_schema("CumSum", 14, "")
-        op = Op(self, "CumSum", schema)
-        return op(*self._prepare_inputs(schema, x, axis), exclusive=exclusive, reverse=reverse)
+        op = self._get_op("CumSum", 14)
+        return op(
+            *self._prepare_inputs(op.op_schema, x, axis), exclusive=exclusive, reverse=reverse
+        )
 
     T_Div = TypeVar(
         "T_Div",
@@ -267,9 +265,8 @@ class Opset14(Opset13):
             B: (differentiable) Second operand.
         """
 
-        schema = get_schema("Div", 14, "")
-        op = Op(self, "Div", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Div", 14)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_GRU = TypeVar("T_GRU", DOUBLE, FLOAT, FLOAT16)
 
@@ -410,10 +407,9 @@ class Opset14(Opset13):
                 gate.
         """
 
-        schema = get_schema("GRU", 14, "")
-        op = Op(self, "GRU", schema)
+        op = self._get_op("GRU", 14)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h),
+            *self._prepare_inputs(op.op_schema, X, W, R, B, sequence_lens, initial_h),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -439,9 +435,8 @@ class Opset14(Opset13):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("HardSwish", 14, "")
-        op = Op(self, "HardSwish", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("HardSwish", 14)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     V_Identity = TypeVar(
         "V_Identity",
@@ -487,9 +482,8 @@ class Opset14(Opset13):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Identity", 14, "")
-        op = Op(self, "Identity", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Identity", 14)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_LSTM = TypeVar("T_LSTM", DOUBLE, FLOAT, FLOAT16)
 
@@ -644,10 +638,11 @@ class Opset14(Opset13):
                 initial_c.shape = Y_c.shape = [batch_size, num_directions, hidden_size].
         """
 
-        schema = get_schema("LSTM", 14, "")
-        op = Op(self, "LSTM", schema)
+        op = self._get_op("LSTM", 14)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h, initial_c, P),
+            *self._prepare_inputs(
+                op.op_schema, X, W, R, B, sequence_lens, initial_h, initial_c, P
+            ),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -691,9 +686,8 @@ class Opset14(Opset13):
             B: (differentiable) Second operand.
         """
 
-        schema = get_schema("Mul", 14, "")
-        op = Op(self, "Mul", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Mul", 14)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_RNN = TypeVar("T_RNN", DOUBLE, FLOAT, FLOAT16)
 
@@ -821,10 +815,9 @@ class Opset14(Opset13):
                 num_directions, hidden_size].
         """
 
-        schema = get_schema("RNN", 14, "")
-        op = Op(self, "RNN", schema)
+        op = self._get_op("RNN", 14)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h),
+            *self._prepare_inputs(op.op_schema, X, W, R, B, sequence_lens, initial_h),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -849,9 +842,8 @@ class Opset14(Opset13):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("Relu", 14, "")
-        op = Op(self, "Relu", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Relu", 14)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Reshape = TypeVar(
         "T_Reshape",
@@ -904,9 +896,8 @@ class Opset14(Opset13):
                 NumPy.
         """
 
-        schema = get_schema("Reshape", 14, "")
-        op = Op(self, "Reshape", schema)
-        return op(*self._prepare_inputs(schema, data, shape), allowzero=allowzero)
+        op = self._get_op("Reshape", 14)
+        return op(*self._prepare_inputs(op.op_schema, data, shape), allowzero=allowzero)
 
     T_Sub = TypeVar(
         "T_Sub",
@@ -941,9 +932,8 @@ class Opset14(Opset13):
             B: (differentiable) Second operand.
         """
 
-        schema = get_schema("Sub", 14, "")
-        op = Op(self, "Sub", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Sub", 14)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Trilu = TypeVar(
         "T_Trilu",
@@ -994,6 +984,5 @@ class Opset14(Opset13):
                 Default is true.
         """
 
-        schema = get_schema("Trilu", 14, "")
-        op = Op(self, "Trilu", schema)
-        return op(*self._prepare_inputs(schema, input, k), upper=upper)
+        op = self._get_op("Trilu", 14)
+        return op(*self._prepare_inputs(op.op_schema, input, k), upper=upper)
@@ -17,7 +17,6 @@ from typing import Optional as _Optional
 from typing import Sequence, Tuple, TypeVar, Union
 
 from onnx import TypeProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset14 import Opset14
@@ -39,7 +38,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset15(Opset14):
@@ -141,10 +140,9 @@ class Opset15(Opset14):
                 for training, and outputs 1, 2, 3, and 4 would be populated.
         """
 
-        schema = get_schema("BatchNormalization", 15, "")
-        op = Op(self, "BatchNormalization", schema)
+        op = self._get_op("BatchNormalization", 15)
         return op(
-            *self._prepare_inputs(schema, X, scale, B, input_mean, input_var),
+            *self._prepare_inputs(op.op_schema, X, scale, B, input_mean, input_var),
             epsilon=epsilon,
             momentum=momentum,
             training_mode=training_mode,
@@ -196,9 +194,8 @@ class Opset15(Opset14):
                 generate one.
         """
 
-        schema = get_schema("Bernoulli", 15, "")
-        op = Op(self, "Bernoulli", schema)
-        return op(*self._prepare_inputs(schema, input), dtype=dtype, seed=seed)
+        op = self._get_op("Bernoulli", 15)
+        return op(*self._prepare_inputs(op.op_schema, input), dtype=dtype, seed=seed)
 
     T1_CastLike = TypeVar(
         "T1_CastLike",
@@ -252,9 +249,8 @@ class Opset15(Opset14):
                 produce a tensor of the same type as this (second input) tensor.
         """
 
-        schema = get_schema("CastLike", 15, "")
-        op = Op(self, "CastLike", schema)
-        return op(*self._prepare_inputs(schema, input, target_type))
+        op = self._get_op("CastLike", 15)
+        return op(*self._prepare_inputs(op.op_schema, input, target_type))
 
     V_Optional = TypeVar(
         "V_Optional",
@@ -339,9 +335,8 @@ class Opset15(Opset14):
             type: Type of the element in the optional output
         """
 
-        schema = get_schema("Optional", 15, "")
-        op = Op(self, "Optional", schema)
-        return op(*self._prepare_inputs(schema, input), type=type)
+        op = self._get_op("Optional", 15)
+        return op(*self._prepare_inputs(op.op_schema, input), type=type)
 
     O_OptionalGetElement = TypeVar(
         "O_OptionalGetElement",
@@ -422,9 +417,8 @@ class Opset15(Opset14):
             input: The optional input.
         """
 
-        schema = get_schema("OptionalGetElement", 15, "")
-        op = Op(self, "OptionalGetElement", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("OptionalGetElement", 15)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     O_OptionalHasElement = TypeVar(
         "O_OptionalHasElement",
@@ -473,9 +467,8 @@ class Opset15(Opset14):
             input: The optional input.
         """
 
-        schema = get_schema("OptionalHasElement", 15, "")
-        op = Op(self, "OptionalHasElement", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("OptionalHasElement", 15)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Pow = TypeVar("T_Pow", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64)
 
@@ -510,9 +503,8 @@ class Opset15(Opset14):
             Y: (differentiable) Second operand, power of the exponent.
         """
 
-        schema = get_schema("Pow", 15, "")
-        op = Op(self, "Pow", schema)
-        return op(*self._prepare_inputs(schema, X, Y))
+        op = self._get_op("Pow", 15)
+        return op(*self._prepare_inputs(op.op_schema, X, Y))
 
     T_Shape = TypeVar(
         "T_Shape",
@@ -599,6 +591,5 @@ class Opset15(Opset14):
                 0.Negative value means counting dimensions from the back.
         """
 
-        schema = get_schema("Shape", 15, "")
-        op = Op(self, "Shape", schema)
-        return op(*self._prepare_inputs(schema, data), end=end, start=start)
+        op = self._get_op("Shape", 15)
+        return op(*self._prepare_inputs(op.op_schema, data), end=end, start=start)
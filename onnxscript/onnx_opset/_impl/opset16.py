@@ -16,7 +16,6 @@ from __future__ import annotations
 from typing import Optional, Sequence, TypeVar, Union
 
 from onnx import GraphProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset15 import Opset15
@@ -38,7 +37,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset16(Opset15):
@@ -79,9 +78,8 @@ class Opset16(Opset15):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("GreaterOrEqual", 16, "")
-        op = Op(self, "GreaterOrEqual", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("GreaterOrEqual", 16)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T1_GridSample = TypeVar(
         "T1_GridSample",
@@ -163,10 +161,9 @@ class Opset16(Opset15):
                 0.5.
         """
 
-        schema = get_schema("GridSample", 16, "")
-        op = Op(self, "GridSample", schema)
+        op = self._get_op("GridSample", 16)
         return op(
-            *self._prepare_inputs(schema, X, grid),
+            *self._prepare_inputs(op.op_schema, X, grid),
             align_corners=align_corners,
             mode=mode,
             padding_mode=padding_mode,
@@ -246,9 +243,8 @@ class Opset16(Opset15):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Identity", 16, "")
-        op = Op(self, "Identity", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Identity", 16)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     B_If: TypeAlias = BOOL
 
@@ -336,10 +332,9 @@ class Opset16(Opset15):
                 match the number of outputs in the else_branch.
         """
 
-        schema = get_schema("If", 16, "")
-        op = Op(self, "If", schema)
+        op = self._get_op("If", 16)
         return op(
-            *self._prepare_inputs(schema, cond),
+            *self._prepare_inputs(op.op_schema, cond),
             else_branch=else_branch,
             then_branch=then_branch,
         )
@@ -361,9 +356,8 @@ class Opset16(Opset15):
             alpha: Coefficient of leakage.
         """
 
-        schema = get_schema("LeakyRelu", 16, "")
-        op = Op(self, "LeakyRelu", schema)
-        return op(*self._prepare_inputs(schema, X), alpha=alpha)
+        op = self._get_op("LeakyRelu", 16)
+        return op(*self._prepare_inputs(op.op_schema, X), alpha=alpha)
 
     T_LessOrEqual = TypeVar(
         "T_LessOrEqual",
@@ -399,9 +393,8 @@ class Opset16(Opset15):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("LessOrEqual", 16, "")
-        op = Op(self, "LessOrEqual", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("LessOrEqual", 16)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     I_Loop: TypeAlias = INT64
 
@@ -637,9 +630,8 @@ class Opset16(Opset15):
                 iterations.
         """
 
-        schema = get_schema("Loop", 16, "")
-        op = Op(self, "Loop", schema)
-        return op(*self._prepare_inputs(schema, M, cond, *v_initial), body=body)
+        op = self._get_op("Loop", 16)
+        return op(*self._prepare_inputs(op.op_schema, M, cond, *v_initial), body=body)
 
     T_PRelu = TypeVar(
         "T_PRelu", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -662,9 +654,8 @@ class Opset16(Opset15):
                 X
         """
 
-        schema = get_schema("PRelu", 16, "")
-        op = Op(self, "PRelu", schema)
-        return op(*self._prepare_inputs(schema, X, slope))
+        op = self._get_op("PRelu", 16)
+        return op(*self._prepare_inputs(op.op_schema, X, slope))
 
     T1_RoiAlign = TypeVar("T1_RoiAlign", DOUBLE, FLOAT, FLOAT16)
 
@@ -737,10 +728,9 @@ class Opset16(Opset15):
                 input image. E.g.; default is 1.0f.
         """
 
-        schema = get_schema("RoiAlign", 16, "")
-        op = Op(self, "RoiAlign", schema)
+        op = self._get_op("RoiAlign", 16)
         return op(
-            *self._prepare_inputs(schema, X, rois, batch_indices),
+            *self._prepare_inputs(op.op_schema, X, rois, batch_indices),
             coordinate_transformation_mode=coordinate_transformation_mode,
             mode=mode,
             output_height=output_height,
@@ -944,10 +934,9 @@ class Opset16(Opset15):
                 in each iteration.
         """
 
-        schema = get_schema("Scan", 16, "")
-        op = Op(self, "Scan", schema)
+        op = self._get_op("Scan", 16)
         return op(
-            *self._prepare_inputs(schema, *initial_state_and_scan_inputs),
+            *self._prepare_inputs(op.op_schema, *initial_state_and_scan_inputs),
             body=body,
             num_scan_inputs=num_scan_inputs,
             scan_input_axes=scan_input_axes,
@@ -1081,10 +1070,9 @@ class Opset16(Opset15):
                 'mul': reduction using the multiplication operation.
         """
 
-        schema = get_schema("ScatterElements", 16, "")
-        op = Op(self, "ScatterElements", schema)
+        op = self._get_op("ScatterElements", 16)
         return op(
-            *self._prepare_inputs(schema, data, indices, updates),
+            *self._prepare_inputs(op.op_schema, data, indices, updates),
             axis=axis,
             reduction=reduction,
         )
@@ -1204,9 +1192,10 @@ class Opset16(Opset15):
                 'mul': reduction using the multiplication operation.
         """
 
-        schema = get_schema("ScatterND", 16, "")
-        op = Op(self, "ScatterND", schema)
-        return op(*self._prepare_inputs(schema, data, indices, updates), reduction=reduction)
+        op = self._get_op("ScatterND", 16)
+        return op(
+            *self._prepare_inputs(op.op_schema, data, indices, updates), reduction=reduction
+        )
 
     B_Where: TypeAlias = BOOL
 
@@ -1250,6 +1239,5 @@ class Opset16(Opset15):
             Y: (differentiable) values selected at indices where condition is False
         """
 
-        schema = get_schema("Where", 16, "")
-        op = Op(self, "Where", schema)
-        return op(*self._prepare_inputs(schema, condition, X, Y))
+        op = self._get_op("Where", 16)
+        return op(*self._prepare_inputs(op.op_schema, condition, X, Y))
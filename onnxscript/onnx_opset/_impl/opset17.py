@@ -16,7 +16,6 @@ from __future__ import annotations
 from typing import Optional, Sequence, Tuple, TypeVar, Union
 
 from onnx import GraphProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset16 import Opset16
@@ -38,7 +37,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset17(Opset16):
@@ -85,10 +84,9 @@ class Opset17(Opset16):
                 value is 1.
         """
 
-        schema = get_schema("BlackmanWindow", 17, "")
-        op = Op(self, "BlackmanWindow", schema)
+        op = self._get_op("BlackmanWindow", 17)
         return op(
-            *self._prepare_inputs(schema, size),
+            *self._prepare_inputs(op.op_schema, size),
             output_datatype=output_datatype,
             periodic=periodic,
         )
@@ -140,10 +138,9 @@ class Opset17(Opset16):
                 1.
         """
 
-        schema = get_schema("DFT", 17, "")
-        op = Op(self, "DFT", schema)
+        op = self._get_op("DFT", 17)
         return op(
-            *self._prepare_inputs(schema, input, dft_length),
+            *self._prepare_inputs(op.op_schema, input, dft_length),
             axis=axis,
             inverse=inverse,
             onesided=onesided,
@@ -189,10 +186,9 @@ class Opset17(Opset16):
                 value is 1.
         """
 
-        schema = get_schema("HammingWindow", 17, "")
-        op = Op(self, "HammingWindow", schema)
+        op = self._get_op("HammingWindow", 17)
         return op(
-            *self._prepare_inputs(schema, size),
+            *self._prepare_inputs(op.op_schema, size),
             output_datatype=output_datatype,
             periodic=periodic,
         )
@@ -237,10 +233,9 @@ class Opset17(Opset16):
                 value is 1.
         """
 
-        schema = get_schema("HannWindow", 17, "")
-        op = Op(self, "HannWindow", schema)
+        op = self._get_op("HannWindow", 17)
         return op(
-            *self._prepare_inputs(schema, size),
+            *self._prepare_inputs(op.op_schema, size),
             output_datatype=output_datatype,
             periodic=periodic,
         )
@@ -320,10 +315,9 @@ class Opset17(Opset16):
                 computation precision.
         """
 
-        schema = get_schema("LayerNormalization", 17, "")
-        op = Op(self, "LayerNormalization", schema)
+        op = self._get_op("LayerNormalization", 17)
         return op(
-            *self._prepare_inputs(schema, X, Scale, B),
+            *self._prepare_inputs(op.op_schema, X, Scale, B),
             axis=axis,
             epsilon=epsilon,
             stash_type=stash_type,
@@ -396,11 +390,10 @@ class Opset17(Opset16):
                 T3. The default value is 1 = FLOAT.
         """
 
-        schema = get_schema("MelWeightMatrix", 17, "")
-        op = Op(self, "MelWeightMatrix", schema)
+        op = self._get_op("MelWeightMatrix", 17)
         return op(
             *self._prepare_inputs(
-                schema,
+                op.op_schema,
                 num_mel_bins,
                 dft_length,
                 sample_rate,
@@ -456,10 +449,9 @@ class Opset17(Opset16):
                 1.
         """
 
-        schema = get_schema("STFT", 17, "")
-        op = Op(self, "STFT", schema)
+        op = self._get_op("STFT", 17)
         return op(
-            *self._prepare_inputs(schema, signal, frame_step, window, frame_length),
+            *self._prepare_inputs(op.op_schema, signal, frame_step, window, frame_length),
             onesided=onesided,
         )
 
@@ -550,6 +542,7 @@ class Opset17(Opset16):
                 function.
         """
 
-        schema = get_schema("SequenceMap", 17, "")
-        op = Op(self, "SequenceMap", schema)
-        return op(*self._prepare_inputs(schema, input_sequence, *additional_inputs), body=body)
+        op = self._get_op("SequenceMap", 17)
+        return op(
+            *self._prepare_inputs(op.op_schema, input_sequence, *additional_inputs), body=body
+        )
@@ -15,7 +15,6 @@ from __future__ import annotations
 
 from typing import Optional, Sequence, TypeVar, Union
 
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset17 import Opset17
@@ -37,7 +36,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset18(Opset17):
@@ -64,9 +63,8 @@ class Opset18(Opset17):
             B: (non-differentiable) Second input operand for the bitwise operator.
         """
 
-        schema = get_schema("BitwiseAnd", 18, "")
-        op = Op(self, "BitwiseAnd", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("BitwiseAnd", 18)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_BitwiseNot = TypeVar(
         "T_BitwiseNot", INT16, INT32, INT64, INT8, UINT16, UINT32, UINT64, UINT8
@@ -83,9 +81,8 @@ class Opset18(Opset17):
             X: (non-differentiable) Input tensor
         """
 
-        schema = get_schema("BitwiseNot", 18, "")
-        op = Op(self, "BitwiseNot", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("BitwiseNot", 18)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_BitwiseOr = TypeVar(
         "T_BitwiseOr", INT16, INT32, INT64, INT8, UINT16, UINT32, UINT64, UINT8
@@ -107,9 +104,8 @@ class Opset18(Opset17):
             B: (non-differentiable) Second input operand for the bitwise operator.
         """
 
-        schema = get_schema("BitwiseOr", 18, "")
-        op = Op(self, "BitwiseOr", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("BitwiseOr", 18)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_BitwiseXor = TypeVar(
         "T_BitwiseXor", INT16, INT32, INT64, INT8, UINT16, UINT32, UINT64, UINT8
@@ -131,9 +127,8 @@ class Opset18(Opset17):
             B: (non-differentiable) Second input operand for the bitwise operator.
         """
 
-        schema = get_schema("BitwiseXor", 18, "")
-        op = Op(self, "BitwiseXor", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("BitwiseXor", 18)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_CenterCropPad = TypeVar(
         "T_CenterCropPad",
@@ -190,9 +185,8 @@ class Opset18(Opset17):
                 if an axis is repeated.
         """
 
-        schema = get_schema("CenterCropPad", 18, "")
-        op = Op(self, "CenterCropPad", schema)
-        return op(*self._prepare_inputs(schema, input_data, shape), axes=axes)
+        op = self._get_op("CenterCropPad", 18)
+        return op(*self._prepare_inputs(op.op_schema, input_data, shape), axes=axes)
 
     T_Col2Im = TypeVar(
         "T_Col2Im",
@@ -277,10 +271,9 @@ class Opset18(Opset17):
                 not present, the stride defaults to 1 along each spatial axis.
         """
 
-        schema = get_schema("Col2Im", 18, "")
-        op = Op(self, "Col2Im", schema)
+        op = self._get_op("Col2Im", 18)
         return op(
-            *self._prepare_inputs(schema, input, image_shape, block_shape),
+            *self._prepare_inputs(op.op_schema, input, image_shape, block_shape),
             dilations=dilations,
             pads=pads,
             strides=strides,
@@ -337,10 +330,9 @@ class Opset18(Opset17):
                 number of channels `C`.
         """
 
-        schema = get_schema("GroupNormalization", 18, "")
-        op = Op(self, "GroupNormalization", schema)
+        op = self._get_op("GroupNormalization", 18)
         return op(
-            *self._prepare_inputs(schema, X, scale, bias),
+            *self._prepare_inputs(op.op_schema, X, scale, bias),
             epsilon=epsilon,
             num_groups=num_groups,
         )
@@ -426,10 +418,9 @@ class Opset18(Opset17):
                 to 1 along each spatial axis.
         """
 
-        schema = get_schema("LpPool", 18, "")
-        op = Op(self, "LpPool", schema)
+        op = self._get_op("LpPool", 18)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             ceil_mode=ceil_mode,
             dilations=dilations,
@@ -460,9 +451,8 @@ class Opset18(Opset17):
             X: (differentiable) Input tensor
         """
 
-        schema = get_schema("Mish", 18, "")
-        op = Op(self, "Mish", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Mish", 18)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     O_OptionalGetElement = TypeVar(
         "O_OptionalGetElement",
@@ -574,9 +564,8 @@ class Opset18(Opset17):
             input: The optional input.
         """
 
-        schema = get_schema("OptionalGetElement", 18, "")
-        op = Op(self, "OptionalGetElement", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("OptionalGetElement", 18)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     O_OptionalHasElement = TypeVar(
         "O_OptionalHasElement",
@@ -659,9 +648,8 @@ class Opset18(Opset17):
             input: (optional) The optional input.
         """
 
-        schema = get_schema("OptionalHasElement", 18, "")
-        op = Op(self, "OptionalHasElement", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("OptionalHasElement", 18)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Pad = TypeVar(
         "T_Pad",
@@ -806,9 +794,10 @@ class Opset18(Opset17):
             mode: Supported modes: `constant`(default), `reflect`, `edge`
         """
 
-        schema = get_schema("Pad", 18, "")
-        op = Op(self, "Pad", schema)
-        return op(*self._prepare_inputs(schema, data, pads, constant_value, axes), mode=mode)
+        op = self._get_op("Pad", 18)
+        return op(
+            *self._prepare_inputs(op.op_schema, data, pads, constant_value, axes), mode=mode
+        )
 
     T_ReduceL1 = TypeVar(
         "T_ReduceL1", BFLOAT16, DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64
@@ -851,10 +840,9 @@ class Opset18(Opset17):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceL1", 18, "")
-        op = Op(self, "ReduceL1", schema)
+        op = self._get_op("ReduceL1", 18)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -900,10 +888,9 @@ class Opset18(Opset17):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceL2", 18, "")
-        op = Op(self, "ReduceL2", schema)
+        op = self._get_op("ReduceL2", 18)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -949,10 +936,9 @@ class Opset18(Opset17):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceLogSum", 18, "")
-        op = Op(self, "ReduceLogSum", schema)
+        op = self._get_op("ReduceLogSum", 18)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -998,10 +984,9 @@ class Opset18(Opset17):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceLogSumExp", 18, "")
-        op = Op(self, "ReduceLogSumExp", schema)
+        op = self._get_op("ReduceLogSumExp", 18)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -1057,10 +1042,9 @@ class Opset18(Opset17):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceMax", 18, "")
-        op = Op(self, "ReduceMax", schema)
+        op = self._get_op("ReduceMax", 18)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -1106,10 +1090,9 @@ class Opset18(Opset17):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceMean", 18, "")
-        op = Op(self, "ReduceMean", schema)
+        op = self._get_op("ReduceMean", 18)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -1165,10 +1148,9 @@ class Opset18(Opset17):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceMin", 18, "")
-        op = Op(self, "ReduceMin", schema)
+        op = self._get_op("ReduceMin", 18)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -1214,10 +1196,9 @@ class Opset18(Opset17):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceProd", 18, "")
-        op = Op(self, "ReduceProd", schema)
+        op = self._get_op("ReduceProd", 18)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -1263,10 +1244,9 @@ class Opset18(Opset17):
                 output tensor would be equivalent to input tensor.
         """
 
-        schema = get_schema("ReduceSumSquare", 18, "")
-        op = Op(self, "ReduceSumSquare", schema)
+        op = self._get_op("ReduceSumSquare", 18)
         return op(
-            *self._prepare_inputs(schema, data, axes),
+            *self._prepare_inputs(op.op_schema, data, axes),
             keepdims=keepdims,
             noop_with_empty_axes=noop_with_empty_axes,
         )
@@ -1452,10 +1432,9 @@ class Opset18(Opset17):
                 valid only if "mode" is "nearest".
         """
 
-        schema = get_schema("Resize", 18, "")
-        op = Op(self, "Resize", schema)
+        op = self._get_op("Resize", 18)
         return op(
-            *self._prepare_inputs(schema, X, roi, scales, sizes),
+            *self._prepare_inputs(op.op_schema, X, roi, scales, sizes),
             antialias=antialias,
             axes=axes,
             coordinate_transformation_mode=coordinate_transformation_mode,
@@ -1594,10 +1573,9 @@ class Opset18(Opset17):
                 operation.
         """
 
-        schema = get_schema("ScatterElements", 18, "")
-        op = Op(self, "ScatterElements", schema)
+        op = self._get_op("ScatterElements", 18)
         return op(
-            *self._prepare_inputs(schema, data, indices, updates),
+            *self._prepare_inputs(op.op_schema, data, indices, updates),
             axis=axis,
             reduction=reduction,
         )
@@ -1732,9 +1710,10 @@ class Opset18(Opset17):
                 operation.
         """
 
-        schema = get_schema("ScatterND", 18, "")
-        op = Op(self, "ScatterND", schema)
-        return op(*self._prepare_inputs(schema, data, indices, updates), reduction=reduction)
+        op = self._get_op("ScatterND", 18)
+        return op(
+            *self._prepare_inputs(op.op_schema, data, indices, updates), reduction=reduction
+        )
 
     T_Split = TypeVar(
         "T_Split",
@@ -1787,8 +1766,9 @@ class Opset18(Opset17):
                 tensor is not evenly splittable the last chunk will be smaller.
         """
 
-        schema = get_schema("Split", 18, "")
-        op = Op(self, "Split", schema)
+        op = self._get_op("Split", 18)
         return op(
-            *self._prepare_inputs(schema, input, split), axis=axis, num_outputs=num_outputs
+            *self._prepare_inputs(op.op_schema, input, split),
+            axis=axis,
+            num_outputs=num_outputs,
         )
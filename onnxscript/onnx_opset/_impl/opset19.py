@@ -16,7 +16,6 @@ from __future__ import annotations
 from typing import Optional, Sequence, TypeVar, Union
 
 from onnx import GraphProto, SparseTensorProto, TensorProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset18 import Opset18
@@ -42,7 +41,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset19(Opset18):
@@ -136,10 +135,9 @@ class Opset19(Opset18):
                 to 1 along each spatial axis.
         """
 
-        schema = get_schema("AveragePool", 19, "")
-        op = Op(self, "AveragePool", schema)
+        op = self._get_op("AveragePool", 19)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             ceil_mode=ceil_mode,
             count_include_pad=count_include_pad,
@@ -275,9 +273,8 @@ class Opset19(Opset18):
                 Strictly must be one of the types from DataType enum in TensorProto
         """
 
-        schema = get_schema("Cast", 19, "")
-        op = Op(self, "Cast", schema)
-        return op(*self._prepare_inputs(schema, input), saturate=saturate, to=to)
+        op = self._get_op("Cast", 19)
+        return op(*self._prepare_inputs(op.op_schema, input), saturate=saturate, to=to)
 
     T1_CastLike = TypeVar(
         "T1_CastLike",
@@ -347,9 +344,8 @@ class Opset19(Opset18):
                 further details.
         """
 
-        schema = get_schema("CastLike", 19, "")
-        op = Op(self, "CastLike", schema)
-        return op(*self._prepare_inputs(schema, input, target_type), saturate=saturate)
+        op = self._get_op("CastLike", 19)
+        return op(*self._prepare_inputs(op.op_schema, input, target_type), saturate=saturate)
 
     T_Constant: TypeAlias = Union[
         BFLOAT16,
@@ -417,8 +413,7 @@ class Opset19(Opset18):
                 tensor.
         """
 
-        schema = get_schema("Constant", 19, "")
-        op = Op(self, "Constant", schema)
+        op = self._get_op("Constant", 19)
         return op(
             sparse_value=sparse_value,
             value=value,
@@ -503,10 +498,9 @@ class Opset19(Opset18):
             strides: Stride along each spatial axis. Default is 1 along each axis.
         """
 
-        schema = get_schema("DeformConv", 19, "")
-        op = Op(self, "DeformConv", schema)
+        op = self._get_op("DeformConv", 19)
         return op(
-            *self._prepare_inputs(schema, X, W, offset, B, mask),
+            *self._prepare_inputs(op.op_schema, X, W, offset, B, mask),
             dilations=dilations,
             group=group,
             kernel_shape=kernel_shape,
@@ -564,9 +558,8 @@ class Opset19(Opset18):
                 rank(input).
         """
 
-        schema = get_schema("DequantizeLinear", 19, "")
-        op = Op(self, "DequantizeLinear", schema)
-        return op(*self._prepare_inputs(schema, x, x_scale, x_zero_point), axis=axis)
+        op = self._get_op("DequantizeLinear", 19)
+        return op(*self._prepare_inputs(op.op_schema, x, x_scale, x_zero_point), axis=axis)
 
     T_Equal = TypeVar(
         "T_Equal",
@@ -604,9 +597,8 @@ class Opset19(Opset18):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("Equal", 19, "")
-        op = Op(self, "Equal", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Equal", 19)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     V_Identity = TypeVar(
         "V_Identity",
@@ -686,9 +678,8 @@ class Opset19(Opset18):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Identity", 19, "")
-        op = Op(self, "Identity", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Identity", 19)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     B_If: TypeAlias = BOOL
 
@@ -788,10 +779,9 @@ class Opset19(Opset18):
                 match the number of outputs in the else_branch.
         """
 
-        schema = get_schema("If", 19, "")
-        op = Op(self, "If", schema)
+        op = self._get_op("If", 19)
         return op(
-            *self._prepare_inputs(schema, cond),
+            *self._prepare_inputs(op.op_schema, cond),
             else_branch=else_branch,
             then_branch=then_branch,
         )
@@ -1042,9 +1032,8 @@ class Opset19(Opset18):
                 iterations.
         """
 
-        schema = get_schema("Loop", 19, "")
-        op = Op(self, "Loop", schema)
-        return op(*self._prepare_inputs(schema, M, cond, *v_initial), body=body)
+        op = self._get_op("Loop", 19)
+        return op(*self._prepare_inputs(op.op_schema, M, cond, *v_initial), body=body)
 
     T_Pad = TypeVar(
         "T_Pad",
@@ -1216,9 +1205,10 @@ class Opset19(Opset18):
             mode: Supported modes: `constant`(default), `reflect`, `edge`, `wrap`
         """
 
-        schema = get_schema("Pad", 19, "")
-        op = Op(self, "Pad", schema)
-        return op(*self._prepare_inputs(schema, data, pads, constant_value, axes), mode=mode)
+        op = self._get_op("Pad", 19)
+        return op(
+            *self._prepare_inputs(op.op_schema, data, pads, constant_value, axes), mode=mode
+        )
 
     T1_QuantizeLinear = TypeVar("T1_QuantizeLinear", BFLOAT16, FLOAT, FLOAT16, INT32)
 
@@ -1278,10 +1268,9 @@ class Opset19(Opset18):
                 inserted in the operator description.
         """
 
-        schema = get_schema("QuantizeLinear", 19, "")
-        op = Op(self, "QuantizeLinear", schema)
+        op = self._get_op("QuantizeLinear", 19)
         return op(
-            *self._prepare_inputs(schema, x, y_scale, y_zero_point),
+            *self._prepare_inputs(op.op_schema, x, y_scale, y_zero_point),
             axis=axis,
             saturate=saturate,
         )
@@ -1341,9 +1330,8 @@ class Opset19(Opset18):
                 NumPy.
         """
 
-        schema = get_schema("Reshape", 19, "")
-        op = Op(self, "Reshape", schema)
-        return op(*self._prepare_inputs(schema, data, shape), allowzero=allowzero)
+        op = self._get_op("Reshape", 19)
+        return op(*self._prepare_inputs(op.op_schema, data, shape), allowzero=allowzero)
 
     T1_Resize = TypeVar(
         "T1_Resize",
@@ -1573,10 +1561,9 @@ class Opset19(Opset18):
                 valid only if "mode" is "nearest".
         """
 
-        schema = get_schema("Resize", 19, "")
-        op = Op(self, "Resize", schema)
+        op = self._get_op("Resize", 19)
         return op(
-            *self._prepare_inputs(schema, X, roi, scales, sizes),
+            *self._prepare_inputs(op.op_schema, X, roi, scales, sizes),
             antialias=antialias,
             axes=axes,
             coordinate_transformation_mode=coordinate_transformation_mode,
@@ -1787,10 +1774,9 @@ class Opset19(Opset18):
                 in each iteration.
         """
 
-        schema = get_schema("Scan", 19, "")
-        op = Op(self, "Scan", schema)
+        op = self._get_op("Scan", 19)
         return op(
-            *self._prepare_inputs(schema, *initial_state_and_scan_inputs),
+            *self._prepare_inputs(op.op_schema, *initial_state_and_scan_inputs),
             body=body,
             num_scan_inputs=num_scan_inputs,
             scan_input_axes=scan_input_axes,
@@ -1888,9 +1874,8 @@ class Opset19(Opset18):
                 0.Negative value means counting dimensions from the back.
         """
 
-        schema = get_schema("Shape", 19, "")
-        op = Op(self, "Shape", schema)
-        return op(*self._prepare_inputs(schema, data), end=end, start=start)
+        op = self._get_op("Shape", 19)
+        return op(*self._prepare_inputs(op.op_schema, data), end=end, start=start)
 
     T_Size = TypeVar(
         "T_Size",
@@ -1929,6 +1914,5 @@ class Opset19(Opset18):
             data: (non-differentiable) An input tensor.
         """
 
-        schema = get_schema("Size", 19, "")
-        op = Op(self, "Size", schema)
-        return op(*self._prepare_inputs(schema, data))
+        op = self._get_op("Size", 19)
+        return op(*self._prepare_inputs(op.op_schema, data))
@@ -15,8 +15,6 @@ from __future__ import annotations
 
 from typing import Optional, Sequence, TypeVar
 
-from onnx.defs import get_schema
-
 from onnxscript.onnx_opset._impl.opset1 import Opset1
 from onnxscript.onnx_types import (
     BOOL,
@@ -35,7 +33,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset2(Opset1):
@@ -62,9 +60,8 @@ class Opset2(Opset1):
             p: p value of the Lp norm used to pool over the input data.
         """
 
-        schema = get_schema("GlobalLpPool", 2, "")
-        op = Op(self, "GlobalLpPool", schema)
-        return op(*self._prepare_inputs(schema, X), p=p)
+        op = self._get_op("GlobalLpPool", 2)
+        return op(*self._prepare_inputs(op.op_schema, X), p=p)
 
     T_LpPool = TypeVar("T_LpPool", DOUBLE, FLOAT, FLOAT16)
 
@@ -118,10 +115,9 @@ class Opset2(Opset1):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("LpPool", 2, "")
-        op = Op(self, "LpPool", schema)
+        op = self._get_op("LpPool", 2)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             kernel_shape=kernel_shape,
             p=p,
@@ -171,9 +167,8 @@ class Opset2(Opset1):
             value: One float, indicates the value to be filled.
         """
 
-        schema = get_schema("Pad", 2, "")
-        op = Op(self, "Pad", schema)
-        return op(*self._prepare_inputs(schema, data), mode=mode, pads=pads, value=value)
+        op = self._get_op("Pad", 2)
+        return op(*self._prepare_inputs(op.op_schema, data), mode=mode, pads=pads, value=value)
 
     T_Split = TypeVar(
         "T_Split",
@@ -212,6 +207,5 @@ class Opset2(Opset1):
             split: length of each output
         """
 
-        schema = get_schema("Split", 2, "")
-        op = Op(self, "Split", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis, split=split)
+        op = self._get_op("Split", 2)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis, split=split)
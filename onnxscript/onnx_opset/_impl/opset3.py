@@ -15,12 +15,11 @@ from __future__ import annotations
 
 from typing import Optional, Sequence, Tuple, TypeVar
 
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset2 import Opset2
 from onnxscript.onnx_types import DOUBLE, FLOAT, FLOAT16, INT32
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset3(Opset2):
@@ -184,10 +183,9 @@ class Opset3(Opset2):
                 Default 0.
         """
 
-        schema = get_schema("GRU", 3, "")
-        op = Op(self, "GRU", schema)
+        op = self._get_op("GRU", 3)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h),
+            *self._prepare_inputs(op.op_schema, X, W, R, B, sequence_lens, initial_h),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -15,8 +15,6 @@ from __future__ import annotations
 
 from typing import TypeVar
 
-from onnx.defs import get_schema
-
 from onnxscript.onnx_opset._impl.opset3 import Opset3
 from onnxscript.onnx_types import (
     BOOL,
@@ -35,7 +33,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset4(Opset3):
@@ -72,6 +70,5 @@ class Opset4(Opset3):
             axis: Which axis to concat on
         """
 
-        schema = get_schema("Concat", 4, "")
-        op = Op(self, "Concat", schema)
-        return op(*self._prepare_inputs(schema, *inputs), axis=axis)
+        op = self._get_op("Concat", 4)
+        return op(*self._prepare_inputs(op.op_schema, *inputs), axis=axis)
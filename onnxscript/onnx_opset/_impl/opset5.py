@@ -15,8 +15,6 @@ from __future__ import annotations
 
 from typing import TypeVar
 
-from onnx.defs import get_schema
-
 from onnxscript.onnx_opset._impl.opset4 import Opset4
 from onnxscript.onnx_types import (
     BOOL,
@@ -35,7 +33,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset5(Opset4):
@@ -79,6 +77,5 @@ class Opset5(Opset4):
             shape: Specified shape for output.
         """
 
-        schema = get_schema("Reshape", 5, "")
-        op = Op(self, "Reshape", schema)
-        return op(*self._prepare_inputs(schema, data, shape))
+        op = self._get_op("Reshape", 5)
+        return op(*self._prepare_inputs(op.op_schema, data, shape))
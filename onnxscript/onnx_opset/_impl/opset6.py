@@ -15,7 +15,6 @@ from __future__ import annotations
 
 from typing import Optional, Tuple, TypeVar, Union
 
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset5 import Opset5
@@ -36,7 +35,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset6(Opset5):
@@ -71,9 +70,8 @@ class Opset6(Opset5):
             X: Input tensor
         """
 
-        schema = get_schema("Abs", 6, "")
-        op = Op(self, "Abs", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Abs", 6)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Add = TypeVar("T_Add", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -116,9 +114,8 @@ class Opset6(Opset5):
             broadcast: Pass 1 to enable broadcasting
         """
 
-        schema = get_schema("Add", 6, "")
-        op = Op(self, "Add", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("Add", 6)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
 
     T_BatchNormalization = TypeVar("T_BatchNormalization", DOUBLE, FLOAT, FLOAT16)
 
@@ -184,10 +181,9 @@ class Opset6(Opset5):
                 If false, compute the mean and variance across per feature.Default is 1.
         """
 
-        schema = get_schema("BatchNormalization", 6, "")
-        op = Op(self, "BatchNormalization", schema)
+        op = self._get_op("BatchNormalization", 6)
         return op(
-            *self._prepare_inputs(schema, X, scale, B, mean, var),
+            *self._prepare_inputs(op.op_schema, X, scale, B, mean, var),
             epsilon=epsilon,
             is_test=is_test,
             momentum=momentum,
@@ -232,9 +228,8 @@ class Opset6(Opset5):
                 Strictly must be one of the types from DataType enum in TensorProto
         """
 
-        schema = get_schema("Cast", 6, "")
-        op = Op(self, "Cast", schema)
-        return op(*self._prepare_inputs(schema, input), to=to)
+        op = self._get_op("Cast", 6)
+        return op(*self._prepare_inputs(op.op_schema, input), to=to)
 
     T_Ceil = TypeVar("T_Ceil", DOUBLE, FLOAT, FLOAT16)
 
@@ -251,9 +246,8 @@ class Opset6(Opset5):
             X: Input tensor
         """
 
-        schema = get_schema("Ceil", 6, "")
-        op = Op(self, "Ceil", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Ceil", 6)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Clip = TypeVar("T_Clip", DOUBLE, FLOAT, FLOAT16)
 
@@ -280,9 +274,8 @@ class Opset6(Opset5):
             min: Minimum value, under which element is replaced by min
         """
 
-        schema = get_schema("Clip", 6, "")
-        op = Op(self, "Clip", schema)
-        return op(*self._prepare_inputs(schema, input), max=max, min=min)
+        op = self._get_op("Clip", 6)
+        return op(*self._prepare_inputs(op.op_schema, input), max=max, min=min)
 
     T_Div = TypeVar("T_Div", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -325,9 +318,8 @@ class Opset6(Opset5):
             broadcast: Pass 1 to enable broadcasting
         """
 
-        schema = get_schema("Div", 6, "")
-        op = Op(self, "Div", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("Div", 6)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
 
     T_Dropout = TypeVar("T_Dropout", DOUBLE, FLOAT, FLOAT16)
 
@@ -353,9 +345,8 @@ class Opset6(Opset5):
             ratio: (float, default 0.5) the ratio of random dropout
         """
 
-        schema = get_schema("Dropout", 6, "")
-        op = Op(self, "Dropout", schema)
-        return op(*self._prepare_inputs(schema, data), is_test=is_test, ratio=ratio)
+        op = self._get_op("Dropout", 6)
+        return op(*self._prepare_inputs(op.op_schema, data), is_test=is_test, ratio=ratio)
 
     T_Elu = TypeVar("T_Elu", DOUBLE, FLOAT, FLOAT16)
 
@@ -375,9 +366,8 @@ class Opset6(Opset5):
             alpha: Coefficient of ELU.
         """
 
-        schema = get_schema("Elu", 6, "")
-        op = Op(self, "Elu", schema)
-        return op(*self._prepare_inputs(schema, X), alpha=alpha)
+        op = self._get_op("Elu", 6)
+        return op(*self._prepare_inputs(op.op_schema, X), alpha=alpha)
 
     T_Exp = TypeVar("T_Exp", DOUBLE, FLOAT, FLOAT16)
 
@@ -392,9 +382,8 @@ class Opset6(Opset5):
             input: Input tensor
         """
 
-        schema = get_schema("Exp", 6, "")
-        op = Op(self, "Exp", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Exp", 6)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Floor = TypeVar("T_Floor", DOUBLE, FLOAT, FLOAT16)
 
@@ -411,9 +400,8 @@ class Opset6(Opset5):
             X: Input tensor
         """
 
-        schema = get_schema("Floor", 6, "")
-        op = Op(self, "Floor", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Floor", 6)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Gemm = TypeVar("T_Gemm", DOUBLE, FLOAT, FLOAT16)
 
@@ -460,10 +448,9 @@ class Opset6(Opset5):
             transB: Whether B should be transposed
         """
 
-        schema = get_schema("Gemm", 6, "")
-        op = Op(self, "Gemm", schema)
+        op = self._get_op("Gemm", 6)
         return op(
-            *self._prepare_inputs(schema, A, B, C),
+            *self._prepare_inputs(op.op_schema, A, B, C),
             alpha=alpha,
             beta=beta,
             broadcast=broadcast,
@@ -492,9 +479,8 @@ class Opset6(Opset5):
             beta: Value of beta.
         """
 
-        schema = get_schema("HardSigmoid", 6, "")
-        op = Op(self, "HardSigmoid", schema)
-        return op(*self._prepare_inputs(schema, X), alpha=alpha, beta=beta)
+        op = self._get_op("HardSigmoid", 6)
+        return op(*self._prepare_inputs(op.op_schema, X), alpha=alpha, beta=beta)
 
     T_InstanceNormalization = TypeVar("T_InstanceNormalization", DOUBLE, FLOAT, FLOAT16)
 
@@ -531,9 +517,8 @@ class Opset6(Opset5):
             epsilon: The epsilon value to use to avoid division by zero.
         """
 
-        schema = get_schema("InstanceNormalization", 6, "")
-        op = Op(self, "InstanceNormalization", schema)
-        return op(*self._prepare_inputs(schema, input, scale, B), epsilon=epsilon)
+        op = self._get_op("InstanceNormalization", 6)
+        return op(*self._prepare_inputs(op.op_schema, input, scale, B), epsilon=epsilon)
 
     T_LeakyRelu = TypeVar("T_LeakyRelu", DOUBLE, FLOAT, FLOAT16)
 
@@ -552,9 +537,8 @@ class Opset6(Opset5):
             alpha: Coefficient of leakage.
         """
 
-        schema = get_schema("LeakyRelu", 6, "")
-        op = Op(self, "LeakyRelu", schema)
-        return op(*self._prepare_inputs(schema, X), alpha=alpha)
+        op = self._get_op("LeakyRelu", 6)
+        return op(*self._prepare_inputs(op.op_schema, X), alpha=alpha)
 
     T_Log = TypeVar("T_Log", DOUBLE, FLOAT, FLOAT16)
 
@@ -569,9 +553,8 @@ class Opset6(Opset5):
             input: Input tensor
         """
 
-        schema = get_schema("Log", 6, "")
-        op = Op(self, "Log", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Log", 6)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Max = TypeVar("T_Max", DOUBLE, FLOAT, FLOAT16)
 
@@ -587,9 +570,8 @@ class Opset6(Opset5):
             data_0: (variadic) List of tensors for Max.
         """
 
-        schema = get_schema("Max", 6, "")
-        op = Op(self, "Max", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Max", 6)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_Mean = TypeVar("T_Mean", DOUBLE, FLOAT, FLOAT16)
 
@@ -605,9 +587,8 @@ class Opset6(Opset5):
             data_0: (variadic) List of tensors for Mean.
         """
 
-        schema = get_schema("Mean", 6, "")
-        op = Op(self, "Mean", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Mean", 6)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_Min = TypeVar("T_Min", DOUBLE, FLOAT, FLOAT16)
 
@@ -623,9 +604,8 @@ class Opset6(Opset5):
             data_0: (variadic) List of tensors for Min
         """
 
-        schema = get_schema("Min", 6, "")
-        op = Op(self, "Min", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Min", 6)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_Mul = TypeVar("T_Mul", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -668,9 +648,8 @@ class Opset6(Opset5):
             broadcast: Pass 1 to enable broadcasting
         """
 
-        schema = get_schema("Mul", 6, "")
-        op = Op(self, "Mul", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("Mul", 6)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
 
     T_Neg = TypeVar("T_Neg", DOUBLE, FLOAT, FLOAT16, INT16, INT32, INT64, INT8)
 
@@ -687,9 +666,8 @@ class Opset6(Opset5):
             X: Input tensor
         """
 
-        schema = get_schema("Neg", 6, "")
-        op = Op(self, "Neg", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Neg", 6)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_PRelu = TypeVar("T_PRelu", DOUBLE, FLOAT, FLOAT16)
 
@@ -711,9 +689,8 @@ class Opset6(Opset5):
                 different channels
         """
 
-        schema = get_schema("PRelu", 6, "")
-        op = Op(self, "PRelu", schema)
-        return op(*self._prepare_inputs(schema, X, slope))
+        op = self._get_op("PRelu", 6)
+        return op(*self._prepare_inputs(op.op_schema, X, slope))
 
     T_Reciprocal = TypeVar("T_Reciprocal", DOUBLE, FLOAT, FLOAT16)
 
@@ -730,9 +707,8 @@ class Opset6(Opset5):
             X: Input tensor
         """
 
-        schema = get_schema("Reciprocal", 6, "")
-        op = Op(self, "Reciprocal", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Reciprocal", 6)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Relu = TypeVar("T_Relu", DOUBLE, FLOAT, FLOAT16)
 
@@ -749,9 +725,8 @@ class Opset6(Opset5):
             X: Input tensor
         """
 
-        schema = get_schema("Relu", 6, "")
-        op = Op(self, "Relu", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Relu", 6)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Selu = TypeVar("T_Selu", DOUBLE, FLOAT, FLOAT16)
 
@@ -781,9 +756,8 @@ class Opset6(Opset5):
                 float32 approximation of 1.0507009873554804934193349852946).
         """
 
-        schema = get_schema("Selu", 6, "")
-        op = Op(self, "Selu", schema)
-        return op(*self._prepare_inputs(schema, X), alpha=alpha, gamma=gamma)
+        op = self._get_op("Selu", 6)
+        return op(*self._prepare_inputs(op.op_schema, X), alpha=alpha, gamma=gamma)
 
     T_Sigmoid = TypeVar("T_Sigmoid", DOUBLE, FLOAT, FLOAT16)
 
@@ -800,9 +774,8 @@ class Opset6(Opset5):
             X: Input tensor
         """
 
-        schema = get_schema("Sigmoid", 6, "")
-        op = Op(self, "Sigmoid", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Sigmoid", 6)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Sqrt = TypeVar("T_Sqrt", DOUBLE, FLOAT, FLOAT16)
 
@@ -819,9 +792,8 @@ class Opset6(Opset5):
             X: Input tensor
         """
 
-        schema = get_schema("Sqrt", 6, "")
-        op = Op(self, "Sqrt", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("Sqrt", 6)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Sub = TypeVar("T_Sub", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -864,9 +836,8 @@ class Opset6(Opset5):
             broadcast: Pass 1 to enable broadcasting
         """
 
-        schema = get_schema("Sub", 6, "")
-        op = Op(self, "Sub", schema)
-        return op(*self._prepare_inputs(schema, A, B), axis=axis, broadcast=broadcast)
+        op = self._get_op("Sub", 6)
+        return op(*self._prepare_inputs(op.op_schema, A, B), axis=axis, broadcast=broadcast)
 
     T_Sum = TypeVar("T_Sum", DOUBLE, FLOAT, FLOAT16)
 
@@ -882,9 +853,8 @@ class Opset6(Opset5):
             data_0: (variadic) List of tensors for Sum.
         """
 
-        schema = get_schema("Sum", 6, "")
-        op = Op(self, "Sum", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Sum", 6)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_Tanh = TypeVar("T_Tanh", DOUBLE, FLOAT, FLOAT16)
 
@@ -899,9 +869,8 @@ class Opset6(Opset5):
             input: Input tensor
         """
 
-        schema = get_schema("Tanh", 6, "")
-        op = Op(self, "Tanh", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Tanh", 6)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Tile = TypeVar(
         "T_Tile",
@@ -939,6 +908,5 @@ class Opset6(Opset5):
                 includes numbers of repeated copies along input's dimensions.
         """
 
-        schema = get_schema("Tile", 6, "")
-        op = Op(self, "Tile", schema)
-        return op(*self._prepare_inputs(schema, input, repeats))
+        op = self._get_op("Tile", 6)
+        return op(*self._prepare_inputs(op.op_schema, input, repeats))
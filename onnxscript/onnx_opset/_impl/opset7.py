@@ -15,7 +15,6 @@ from __future__ import annotations
 
 from typing import Optional, Sequence, Tuple, TypeVar, Union
 
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset6 import Opset6
@@ -36,7 +35,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset7(Opset6):
@@ -56,9 +55,8 @@ class Opset7(Opset6):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Acos", 7, "")
-        op = Op(self, "Acos", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Acos", 7)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Add = TypeVar("T_Add", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -77,9 +75,8 @@ class Opset7(Opset6):
             B: Second operand.
         """
 
-        schema = get_schema("Add", 7, "")
-        op = Op(self, "Add", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Add", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_And: TypeAlias = BOOL
 
@@ -101,9 +98,8 @@ class Opset7(Opset6):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("And", 7, "")
-        op = Op(self, "And", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("And", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Asin = TypeVar("T_Asin", DOUBLE, FLOAT, FLOAT16)
 
@@ -118,9 +114,8 @@ class Opset7(Opset6):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Asin", 7, "")
-        op = Op(self, "Asin", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Asin", 7)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Atan = TypeVar("T_Atan", DOUBLE, FLOAT, FLOAT16)
 
@@ -135,9 +130,8 @@ class Opset7(Opset6):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Atan", 7, "")
-        op = Op(self, "Atan", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Atan", 7)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_AveragePool = TypeVar("T_AveragePool", DOUBLE, FLOAT, FLOAT16)
 
@@ -212,10 +206,9 @@ class Opset7(Opset6):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("AveragePool", 7, "")
-        op = Op(self, "AveragePool", schema)
+        op = self._get_op("AveragePool", 7)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             count_include_pad=count_include_pad,
             kernel_shape=kernel_shape,
@@ -288,10 +281,9 @@ class Opset7(Opset6):
                 mini-batch.
         """
 
-        schema = get_schema("BatchNormalization", 7, "")
-        op = Op(self, "BatchNormalization", schema)
+        op = self._get_op("BatchNormalization", 7)
         return op(
-            *self._prepare_inputs(schema, X, scale, B, mean, var),
+            *self._prepare_inputs(op.op_schema, X, scale, B, mean, var),
             epsilon=epsilon,
             momentum=momentum,
             spatial=spatial,
@@ -310,9 +302,8 @@ class Opset7(Opset6):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Cos", 7, "")
-        op = Op(self, "Cos", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Cos", 7)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Div = TypeVar("T_Div", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -331,9 +322,8 @@ class Opset7(Opset6):
             B: Second operand.
         """
 
-        schema = get_schema("Div", 7, "")
-        op = Op(self, "Div", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Div", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Dropout = TypeVar("T_Dropout", DOUBLE, FLOAT, FLOAT16)
 
@@ -355,9 +345,8 @@ class Opset7(Opset6):
             ratio: The ratio of random dropout
         """
 
-        schema = get_schema("Dropout", 7, "")
-        op = Op(self, "Dropout", schema)
-        return op(*self._prepare_inputs(schema, data), ratio=ratio)
+        op = self._get_op("Dropout", 7)
+        return op(*self._prepare_inputs(op.op_schema, data), ratio=ratio)
 
     T_Equal = TypeVar("T_Equal", BOOL, INT32, INT64)
 
@@ -379,9 +368,8 @@ class Opset7(Opset6):
             B: Second input operand for the logical operator.
         """
 
-        schema = get_schema("Equal", 7, "")
-        op = Op(self, "Equal", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Equal", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_GRU = TypeVar("T_GRU", DOUBLE, FLOAT, FLOAT16)
 
@@ -537,10 +525,9 @@ class Opset7(Opset6):
                 gate.
         """
 
-        schema = get_schema("GRU", 7, "")
-        op = Op(self, "GRU", schema)
+        op = self._get_op("GRU", 7)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h),
+            *self._prepare_inputs(op.op_schema, X, W, R, B, sequence_lens, initial_h),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -597,10 +584,9 @@ class Opset7(Opset6):
             transB: Whether B should be transposed
         """
 
-        schema = get_schema("Gemm", 7, "")
-        op = Op(self, "Gemm", schema)
+        op = self._get_op("Gemm", 7)
         return op(
-            *self._prepare_inputs(schema, A, B, C),
+            *self._prepare_inputs(op.op_schema, A, B, C),
             alpha=alpha,
             beta=beta,
             transA=transA,
@@ -627,9 +613,8 @@ class Opset7(Opset6):
             B: Second input operand for the logical operator.
         """
 
-        schema = get_schema("Greater", 7, "")
-        op = Op(self, "Greater", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Greater", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_LSTM = TypeVar("T_LSTM", DOUBLE, FLOAT, FLOAT16)
 
@@ -802,10 +787,11 @@ class Opset7(Opset6):
             input_forget: Couple the input and forget gates if 1.
         """
 
-        schema = get_schema("LSTM", 7, "")
-        op = Op(self, "LSTM", schema)
+        op = self._get_op("LSTM", 7)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h, initial_c, P),
+            *self._prepare_inputs(
+                op.op_schema, X, W, R, B, sequence_lens, initial_h, initial_c, P
+            ),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -835,9 +821,8 @@ class Opset7(Opset6):
             B: Second input operand for the logical operator.
         """
 
-        schema = get_schema("Less", 7, "")
-        op = Op(self, "Less", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Less", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Mul = TypeVar("T_Mul", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -856,9 +841,8 @@ class Opset7(Opset6):
             B: Second operand.
         """
 
-        schema = get_schema("Mul", 7, "")
-        op = Op(self, "Mul", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Mul", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T1_Multinomial = TypeVar("T1_Multinomial", DOUBLE, FLOAT, FLOAT16)
 
@@ -894,10 +878,9 @@ class Opset7(Opset6):
                 generate one.
         """
 
-        schema = get_schema("Multinomial", 7, "")
-        op = Op(self, "Multinomial", schema)
+        op = self._get_op("Multinomial", 7)
         return op(
-            *self._prepare_inputs(schema, input),
+            *self._prepare_inputs(op.op_schema, input),
             dtype=dtype,
             sample_size=sample_size,
             seed=seed,
@@ -923,9 +906,8 @@ class Opset7(Opset6):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("Or", 7, "")
-        op = Op(self, "Or", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Or", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_PRelu = TypeVar("T_PRelu", DOUBLE, FLOAT, FLOAT16)
 
@@ -945,9 +927,8 @@ class Opset7(Opset6):
                 if so, its shape must be unidirectional broadcastable to X
         """
 
-        schema = get_schema("PRelu", 7, "")
-        op = Op(self, "PRelu", schema)
-        return op(*self._prepare_inputs(schema, X, slope))
+        op = self._get_op("PRelu", 7)
+        return op(*self._prepare_inputs(op.op_schema, X, slope))
 
     T_Pow = TypeVar("T_Pow", DOUBLE, FLOAT, FLOAT16)
 
@@ -966,9 +947,8 @@ class Opset7(Opset6):
             Y: Second operand, power of the exponent.
         """
 
-        schema = get_schema("Pow", 7, "")
-        op = Op(self, "Pow", schema)
-        return op(*self._prepare_inputs(schema, X, Y))
+        op = self._get_op("Pow", 7)
+        return op(*self._prepare_inputs(op.op_schema, X, Y))
 
     T_RNN = TypeVar("T_RNN", DOUBLE, FLOAT, FLOAT16)
 
@@ -1106,10 +1086,9 @@ class Opset7(Opset6):
             hidden_size: Number of neurons in the hidden layer
         """
 
-        schema = get_schema("RNN", 7, "")
-        op = Op(self, "RNN", schema)
+        op = self._get_op("RNN", 7)
         return op(
-            *self._prepare_inputs(schema, X, W, R, B, sequence_lens, initial_h),
+            *self._prepare_inputs(op.op_schema, X, W, R, B, sequence_lens, initial_h),
             activation_alpha=activation_alpha,
             activation_beta=activation_beta,
             activations=activations,
@@ -1131,9 +1110,8 @@ class Opset7(Opset6):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Sin", 7, "")
-        op = Op(self, "Sin", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Sin", 7)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Sub = TypeVar("T_Sub", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -1152,9 +1130,8 @@ class Opset7(Opset6):
             B: Second operand.
         """
 
-        schema = get_schema("Sub", 7, "")
-        op = Op(self, "Sub", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Sub", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_Tan = TypeVar("T_Tan", DOUBLE, FLOAT, FLOAT16)
 
@@ -1169,9 +1146,8 @@ class Opset7(Opset6):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Tan", 7, "")
-        op = Op(self, "Tan", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Tan", 7)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Upsample = TypeVar(
         "T_Upsample",
@@ -1214,9 +1190,8 @@ class Opset7(Opset6):
                 rank of input 'X'.
         """
 
-        schema = get_schema("Upsample", 7, "")
-        op = Op(self, "Upsample", schema)
-        return op(*self._prepare_inputs(schema, X), mode=mode, scales=scales)
+        op = self._get_op("Upsample", 7)
+        return op(*self._prepare_inputs(op.op_schema, X), mode=mode, scales=scales)
 
     T_Xor: TypeAlias = BOOL
 
@@ -1238,6 +1213,5 @@ class Opset7(Opset6):
             B: (non-differentiable) Second input operand for the logical operator.
         """
 
-        schema = get_schema("Xor", 7, "")
-        op = Op(self, "Xor", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Xor", 7)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
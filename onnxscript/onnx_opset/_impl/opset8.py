@@ -16,7 +16,6 @@ from __future__ import annotations
 from typing import Optional, Sequence, Tuple, TypeVar
 
 from onnx import GraphProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset7 import Opset7
@@ -37,7 +36,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset8(Opset7):
@@ -84,9 +83,8 @@ class Opset8(Opset7):
                 broadcast rule
         """
 
-        schema = get_schema("Expand", 8, "")
-        op = Op(self, "Expand", schema)
-        return op(*self._prepare_inputs(schema, input, shape))
+        op = self._get_op("Expand", 8)
+        return op(*self._prepare_inputs(op.op_schema, input, shape))
 
     T_Max = TypeVar("T_Max", DOUBLE, FLOAT, FLOAT16)
 
@@ -103,9 +101,8 @@ class Opset8(Opset7):
             data_0: (variadic) List of tensors for max.
         """
 
-        schema = get_schema("Max", 8, "")
-        op = Op(self, "Max", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Max", 8)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_MaxPool = TypeVar("T_MaxPool", DOUBLE, FLOAT, FLOAT16)
 
@@ -182,10 +179,9 @@ class Opset8(Opset7):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("MaxPool", 8, "")
-        op = Op(self, "MaxPool", schema)
+        op = self._get_op("MaxPool", 8)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             auto_pad=auto_pad,
             kernel_shape=kernel_shape,
             pads=pads,
@@ -208,9 +204,8 @@ class Opset8(Opset7):
             data_0: (variadic) List of tensors for mean.
         """
 
-        schema = get_schema("Mean", 8, "")
-        op = Op(self, "Mean", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Mean", 8)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     T_Min = TypeVar("T_Min", DOUBLE, FLOAT, FLOAT16)
 
@@ -227,9 +222,8 @@ class Opset8(Opset7):
             data_0: (variadic) List of tensors for min.
         """
 
-        schema = get_schema("Min", 8, "")
-        op = Op(self, "Min", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Min", 8)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
 
     I_Scan: TypeAlias = INT64
 
@@ -415,10 +409,9 @@ class Opset8(Opset7):
             num_scan_inputs: An attribute specifying the number of scan_inputs M.
         """
 
-        schema = get_schema("Scan", 8, "")
-        op = Op(self, "Scan", schema)
+        op = self._get_op("Scan", 8)
         return op(
-            *self._prepare_inputs(schema, sequence_lens, *initial_state_and_scan_inputs),
+            *self._prepare_inputs(op.op_schema, sequence_lens, *initial_state_and_scan_inputs),
             body=body,
             directions=directions,
             num_scan_inputs=num_scan_inputs,
@@ -439,6 +432,5 @@ class Opset8(Opset7):
             data_0: (variadic) List of tensors for sum.
         """
 
-        schema = get_schema("Sum", 8, "")
-        op = Op(self, "Sum", schema)
-        return op(*self._prepare_inputs(schema, *data_0))
+        op = self._get_op("Sum", 8)
+        return op(*self._prepare_inputs(op.op_schema, *data_0))
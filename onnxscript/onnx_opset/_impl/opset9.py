@@ -16,7 +16,6 @@ from __future__ import annotations
 from typing import Optional, Sequence, Tuple, TypeVar, Union
 
 from onnx import GraphProto, TensorProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset8 import Opset8
@@ -37,7 +36,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset9(Opset8):
@@ -57,9 +56,8 @@ class Opset9(Opset8):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Acosh", 9, "")
-        op = Op(self, "Acosh", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Acosh", 9)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Asinh = TypeVar("T_Asinh", DOUBLE, FLOAT, FLOAT16)
 
@@ -74,9 +72,8 @@ class Opset9(Opset8):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Asinh", 9, "")
-        op = Op(self, "Asinh", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Asinh", 9)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Atanh = TypeVar("T_Atanh", DOUBLE, FLOAT, FLOAT16)
 
@@ -91,9 +88,8 @@ class Opset9(Opset8):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Atanh", 9, "")
-        op = Op(self, "Atanh", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Atanh", 9)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_BatchNormalization = TypeVar("T_BatchNormalization", DOUBLE, FLOAT, FLOAT16)
 
@@ -153,10 +149,9 @@ class Opset9(Opset8):
                 running_mean = running_mean * momentum + mean * (1 - momentum).
         """
 
-        schema = get_schema("BatchNormalization", 9, "")
-        op = Op(self, "BatchNormalization", schema)
+        op = self._get_op("BatchNormalization", 9)
         return op(
-            *self._prepare_inputs(schema, X, scale, B, mean, var),
+            *self._prepare_inputs(op.op_schema, X, scale, B, mean, var),
             epsilon=epsilon,
             momentum=momentum,
         )
@@ -226,9 +221,8 @@ class Opset9(Opset8):
                 Strictly must be one of the types from DataType enum in TensorProto
         """
 
-        schema = get_schema("Cast", 9, "")
-        op = Op(self, "Cast", schema)
-        return op(*self._prepare_inputs(schema, input), to=to)
+        op = self._get_op("Cast", 9)
+        return op(*self._prepare_inputs(op.op_schema, input), to=to)
 
     T_Compress = TypeVar(
         "T_Compress",
@@ -275,9 +269,8 @@ class Opset9(Opset8):
                 flattened before elements being selected.
         """
 
-        schema = get_schema("Compress", 9, "")
-        op = Op(self, "Compress", schema)
-        return op(*self._prepare_inputs(schema, input, condition), axis=axis)
+        op = self._get_op("Compress", 9)
+        return op(*self._prepare_inputs(op.op_schema, input, condition), axis=axis)
 
     T_Constant: TypeAlias = Union[
         BOOL,
@@ -306,8 +299,7 @@ class Opset9(Opset8):
             value: The value for the elements of the output tensor.
         """
 
-        schema = get_schema("Constant", 9, "")
-        op = Op(self, "Constant", schema)
+        op = self._get_op("Constant", 9)
         return op(value=value)
 
     T1_ConstantOfShape: TypeAlias = INT64
@@ -334,9 +326,8 @@ class Opset9(Opset8):
                 datatype float32
         """
 
-        schema = get_schema("ConstantOfShape", 9, "")
-        op = Op(self, "ConstantOfShape", schema)
-        return op(*self._prepare_inputs(schema, input), value=value)
+        op = self._get_op("ConstantOfShape", 9)
+        return op(*self._prepare_inputs(op.op_schema, input), value=value)
 
     T_Cosh = TypeVar("T_Cosh", DOUBLE, FLOAT, FLOAT16)
 
@@ -351,9 +342,8 @@ class Opset9(Opset8):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Cosh", 9, "")
-        op = Op(self, "Cosh", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Cosh", 9)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Erf = TypeVar(
         "T_Erf",
@@ -381,9 +371,8 @@ class Opset9(Opset8):
             input: Input tensor
         """
 
-        schema = get_schema("Erf", 9, "")
-        op = Op(self, "Erf", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Erf", 9)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T1_EyeLike = TypeVar(
         "T1_EyeLike",
@@ -433,9 +422,8 @@ class Opset9(Opset8):
                 lower diagonal.
         """
 
-        schema = get_schema("EyeLike", 9, "")
-        op = Op(self, "EyeLike", schema)
-        return op(*self._prepare_inputs(schema, input), dtype=dtype, k=k)
+        op = self._get_op("EyeLike", 9)
+        return op(*self._prepare_inputs(op.op_schema, input), dtype=dtype, k=k)
 
     T_Flatten = TypeVar(
         "T_Flatten",
@@ -475,9 +463,8 @@ class Opset9(Opset8):
                 shape of the input tensor is (d_0, d_1, ... d_n).
         """
 
-        schema = get_schema("Flatten", 9, "")
-        op = Op(self, "Flatten", schema)
-        return op(*self._prepare_inputs(schema, input), axis=axis)
+        op = self._get_op("Flatten", 9)
+        return op(*self._prepare_inputs(op.op_schema, input), axis=axis)
 
     T_Gemm = TypeVar("T_Gemm", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -526,10 +513,9 @@ class Opset9(Opset8):
             transB: Whether B should be transposed
         """
 
-        schema = get_schema("Gemm", 9, "")
-        op = Op(self, "Gemm", schema)
+        op = self._get_op("Gemm", 9)
         return op(
-            *self._prepare_inputs(schema, A, B, C),
+            *self._prepare_inputs(op.op_schema, A, B, C),
             alpha=alpha,
             beta=beta,
             transA=transA,
@@ -569,9 +555,8 @@ class Opset9(Opset8):
             B: Second input operand for the logical operator.
         """
 
-        schema = get_schema("Greater", 9, "")
-        op = Op(self, "Greater", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Greater", 9)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T1_IsNaN = TypeVar("T1_IsNaN", DOUBLE, FLOAT, FLOAT16)
 
@@ -586,9 +571,8 @@ class Opset9(Opset8):
             X: input
         """
 
-        schema = get_schema("IsNaN", 9, "")
-        op = Op(self, "IsNaN", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("IsNaN", 9)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T_Less = TypeVar(
         "T_Less",
@@ -623,9 +607,8 @@ class Opset9(Opset8):
             B: Second input operand for the logical operator.
         """
 
-        schema = get_schema("Less", 9, "")
-        op = Op(self, "Less", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("Less", 9)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T_MatMul = TypeVar("T_MatMul", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -642,9 +625,8 @@ class Opset9(Opset8):
             B: N-dimensional matrix B
         """
 
-        schema = get_schema("MatMul", 9, "")
-        op = Op(self, "MatMul", schema)
-        return op(*self._prepare_inputs(schema, A, B))
+        op = self._get_op("MatMul", 9)
+        return op(*self._prepare_inputs(op.op_schema, A, B))
 
     T1_MaxUnpool = TypeVar("T1_MaxUnpool", DOUBLE, FLOAT, FLOAT16)
 
@@ -721,10 +703,9 @@ class Opset9(Opset8):
             strides: Stride along each spatial axis.
         """
 
-        schema = get_schema("MaxUnpool", 9, "")
-        op = Op(self, "MaxUnpool", schema)
+        op = self._get_op("MaxUnpool", 9)
         return op(
-            *self._prepare_inputs(schema, X, I, output_shape),
+            *self._prepare_inputs(op.op_schema, X, I, output_shape),
             kernel_shape=kernel_shape,
             pads=pads,
             strides=strides,
@@ -753,9 +734,8 @@ class Opset9(Opset8):
                 mean and variance.
         """
 
-        schema = get_schema("MeanVarianceNormalization", 9, "")
-        op = Op(self, "MeanVarianceNormalization", schema)
-        return op(*self._prepare_inputs(schema, X), axes=axes)
+        op = self._get_op("MeanVarianceNormalization", 9)
+        return op(*self._prepare_inputs(op.op_schema, X), axes=axes)
 
     T_NonZero = TypeVar(
         "T_NonZero",
@@ -791,9 +771,8 @@ class Opset9(Opset8):
             X: input
         """
 
-        schema = get_schema("NonZero", 9, "")
-        op = Op(self, "NonZero", schema)
-        return op(*self._prepare_inputs(schema, X))
+        op = self._get_op("NonZero", 9)
+        return op(*self._prepare_inputs(op.op_schema, X))
 
     T1_OneHot = TypeVar(
         "T1_OneHot",
@@ -889,9 +868,8 @@ class Opset9(Opset8):
                 the innermost/last dimension in the output tensor.
         """
 
-        schema = get_schema("OneHot", 9, "")
-        op = Op(self, "OneHot", schema)
-        return op(*self._prepare_inputs(schema, indices, depth, values), axis=axis)
+        op = self._get_op("OneHot", 9)
+        return op(*self._prepare_inputs(op.op_schema, indices, depth, values), axis=axis)
 
     T_PRelu = TypeVar("T_PRelu", DOUBLE, FLOAT, FLOAT16, INT32, INT64, UINT32, UINT64)
 
@@ -912,9 +890,8 @@ class Opset9(Opset8):
                 X
         """
 
-        schema = get_schema("PRelu", 9, "")
-        op = Op(self, "PRelu", schema)
-        return op(*self._prepare_inputs(schema, X, slope))
+        op = self._get_op("PRelu", 9)
+        return op(*self._prepare_inputs(op.op_schema, X, slope))
 
     V_Scan = TypeVar(
         "V_Scan",
@@ -1108,10 +1085,9 @@ class Opset9(Opset8):
                 in each iteration.
         """
 
-        schema = get_schema("Scan", 9, "")
-        op = Op(self, "Scan", schema)
+        op = self._get_op("Scan", 9)
         return op(
-            *self._prepare_inputs(schema, *initial_state_and_scan_inputs),
+            *self._prepare_inputs(op.op_schema, *initial_state_and_scan_inputs),
             body=body,
             num_scan_inputs=num_scan_inputs,
             scan_input_axes=scan_input_axes,
@@ -1191,9 +1167,8 @@ class Opset9(Opset8):
                 from the back. Accepted range is [-r, r-1]
         """
 
-        schema = get_schema("Scatter", 9, "")
-        op = Op(self, "Scatter", schema)
-        return op(*self._prepare_inputs(schema, data, indices, updates), axis=axis)
+        op = self._get_op("Scatter", 9)
+        return op(*self._prepare_inputs(op.op_schema, data, indices, updates), axis=axis)
 
     T_Shrink = TypeVar(
         "T_Shrink",
@@ -1228,9 +1203,8 @@ class Opset9(Opset8):
             lambd: The lambd value for the Shrink formulation. Default is 0.5.
         """
 
-        schema = get_schema("Shrink", 9, "")
-        op = Op(self, "Shrink", schema)
-        return op(*self._prepare_inputs(schema, input), bias=bias, lambd=lambd)
+        op = self._get_op("Shrink", 9)
+        return op(*self._prepare_inputs(op.op_schema, input), bias=bias, lambd=lambd)
 
     T_Sign = TypeVar(
         "T_Sign",
@@ -1259,9 +1233,8 @@ class Opset9(Opset8):
             input: Input tensor
         """
 
-        schema = get_schema("Sign", 9, "")
-        op = Op(self, "Sign", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Sign", 9)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_Sinh = TypeVar("T_Sinh", DOUBLE, FLOAT, FLOAT16)
 
@@ -1276,9 +1249,8 @@ class Opset9(Opset8):
             input: (differentiable) Input tensor
         """
 
-        schema = get_schema("Sinh", 9, "")
-        op = Op(self, "Sinh", schema)
-        return op(*self._prepare_inputs(schema, input))
+        op = self._get_op("Sinh", 9)
+        return op(*self._prepare_inputs(op.op_schema, input))
 
     T_TfIdfVectorizer = TypeVar("T_TfIdfVectorizer", INT32, INT64, STRING)
 
@@ -1381,10 +1353,9 @@ class Opset9(Opset8):
                 or "TFIDF" to scale the associated word counts.
         """
 
-        schema = get_schema("TfIdfVectorizer", 9, "")
-        op = Op(self, "TfIdfVectorizer", schema)
+        op = self._get_op("TfIdfVectorizer", 9)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             max_gram_length=max_gram_length,
             max_skip_count=max_skip_count,
             min_gram_length=min_gram_length,
@@ -1435,9 +1406,8 @@ class Opset9(Opset8):
                 bilinear, trilinear, etc)
         """
 
-        schema = get_schema("Upsample", 9, "")
-        op = Op(self, "Upsample", schema)
-        return op(*self._prepare_inputs(schema, X, scales), mode=mode)
+        op = self._get_op("Upsample", 9)
+        return op(*self._prepare_inputs(op.op_schema, X, scales), mode=mode)
 
     B_Where: TypeAlias = BOOL
 
@@ -1480,6 +1450,5 @@ class Opset9(Opset8):
             Y: (differentiable) values selected at indices where condition is False
         """
 
-        schema = get_schema("Where", 9, "")
-        op = Op(self, "Where", schema)
-        return op(*self._prepare_inputs(schema, condition, X, Y))
+        op = self._get_op("Where", 9)
+        return op(*self._prepare_inputs(op.op_schema, condition, X, Y))
@@ -15,11 +15,10 @@ from __future__ import annotations
 
 from typing import Mapping, Optional, Sequence, Tuple, TypeVar, Union
 
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_types import DOUBLE, FLOAT, INT32, INT64, STRING
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset_ai_onnx_ml1(Opset):
@@ -47,9 +46,8 @@ class Opset_ai_onnx_ml1(Opset):
             Y: The indices, based on 0 as the first index of any dimension.
         """
 
-        schema = get_schema("ArrayFeatureExtractor", 1, "ai.onnx.ml")
-        op = Op(self, "ArrayFeatureExtractor", schema)
-        return op(*self._prepare_inputs(schema, X, Y))
+        op = self._get_op("ArrayFeatureExtractor", 1)
+        return op(*self._prepare_inputs(op.op_schema, X, Y))
 
     T_Binarizer = TypeVar("T_Binarizer", DOUBLE, FLOAT, INT32, INT64)
 
@@ -66,9 +64,8 @@ class Opset_ai_onnx_ml1(Opset):
             threshold: Values greater than this are mapped to 1, others to 0.
         """
 
-        schema = get_schema("Binarizer", 1, "ai.onnx.ml")
-        op = Op(self, "Binarizer", schema)
-        return op(*self._prepare_inputs(schema, X), threshold=threshold)
+        op = self._get_op("Binarizer", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), threshold=threshold)
 
     T1_CastMap = TypeVar("T1_CastMap", Mapping[int, FLOAT], Mapping[int, STRING])
 
@@ -106,10 +103,9 @@ class Opset_ai_onnx_ml1(Opset):
                 total length of the output tensor.
         """
 
-        schema = get_schema("CastMap", 1, "ai.onnx.ml")
-        op = Op(self, "CastMap", schema)
+        op = self._get_op("CastMap", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             cast_to=cast_to,
             map_form=map_form,
             max_map=max_map,
@@ -162,10 +158,9 @@ class Opset_ai_onnx_ml1(Opset):
                 defined.
         """
 
-        schema = get_schema("CategoryMapper", 1, "ai.onnx.ml")
-        op = Op(self, "CategoryMapper", schema)
+        op = self._get_op("CategoryMapper", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             cats_int64s=cats_int64s,
             cats_strings=cats_strings,
             default_int64=default_int64,
@@ -220,10 +215,9 @@ class Opset_ai_onnx_ml1(Opset):
                 vocabularies must be defined.
         """
 
-        schema = get_schema("DictVectorizer", 1, "ai.onnx.ml")
-        op = Op(self, "DictVectorizer", schema)
+        op = self._get_op("DictVectorizer", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             int64_vocabulary=int64_vocabulary,
             string_vocabulary=string_vocabulary,
         )
@@ -251,9 +245,8 @@ class Opset_ai_onnx_ml1(Opset):
             inputdimensions: The size of each input in the input list
         """
 
-        schema = get_schema("FeatureVectorizer", 1, "ai.onnx.ml")
-        op = Op(self, "FeatureVectorizer", schema)
-        return op(*self._prepare_inputs(schema, *X), inputdimensions=inputdimensions)
+        op = self._get_op("FeatureVectorizer", 1)
+        return op(*self._prepare_inputs(op.op_schema, *X), inputdimensions=inputdimensions)
 
     T_Imputer = TypeVar("T_Imputer", DOUBLE, FLOAT, INT32, INT64)
 
@@ -295,10 +288,9 @@ class Opset_ai_onnx_ml1(Opset):
             replaced_value_int64: A value that needs replacing.
         """
 
-        schema = get_schema("Imputer", 1, "ai.onnx.ml")
-        op = Op(self, "Imputer", schema)
+        op = self._get_op("Imputer", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             imputed_value_floats=imputed_value_floats,
             imputed_value_int64s=imputed_value_int64s,
             replaced_value_float=replaced_value_float,
@@ -350,10 +342,9 @@ class Opset_ai_onnx_ml1(Opset):
                 defined.
         """
 
-        schema = get_schema("LabelEncoder", 1, "ai.onnx.ml")
-        op = Op(self, "LabelEncoder", schema)
+        op = self._get_op("LabelEncoder", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             classes_strings=classes_strings,
             default_int64=default_int64,
             default_string=default_string,
@@ -401,10 +392,9 @@ class Opset_ai_onnx_ml1(Opset):
                 'PROBIT'
         """
 
-        schema = get_schema("LinearClassifier", 1, "ai.onnx.ml")
-        op = Op(self, "LinearClassifier", schema)
+        op = self._get_op("LinearClassifier", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             classlabels_ints=classlabels_ints,
             classlabels_strings=classlabels_strings,
             coefficients=coefficients,
@@ -452,10 +442,9 @@ class Opset_ai_onnx_ml1(Opset):
             targets: The total number of regression targets, 1 if not defined.
         """
 
-        schema = get_schema("LinearRegressor", 1, "ai.onnx.ml")
-        op = Op(self, "LinearRegressor", schema)
+        op = self._get_op("LinearRegressor", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             coefficients=coefficients,
             intercepts=intercepts,
             post_transform=post_transform,
@@ -492,9 +481,8 @@ class Opset_ai_onnx_ml1(Opset):
             norm: One of 'MAX,' 'L1,' 'L2'
         """
 
-        schema = get_schema("Normalizer", 1, "ai.onnx.ml")
-        op = Op(self, "Normalizer", schema)
-        return op(*self._prepare_inputs(schema, X), norm=norm)
+        op = self._get_op("Normalizer", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), norm=norm)
 
     T_OneHotEncoder = TypeVar("T_OneHotEncoder", DOUBLE, FLOAT, INT32, INT64, STRING)
 
@@ -535,10 +523,9 @@ class Opset_ai_onnx_ml1(Opset):
                 and a category if not found, the operator will fail.
         """
 
-        schema = get_schema("OneHotEncoder", 1, "ai.onnx.ml")
-        op = Op(self, "OneHotEncoder", schema)
+        op = self._get_op("OneHotEncoder", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             cats_int64s=cats_int64s,
             cats_strings=cats_strings,
             zeros=zeros,
@@ -594,10 +581,9 @@ class Opset_ai_onnx_ml1(Opset):
                 estimates, otherwise they are raw scores.
         """
 
-        schema = get_schema("SVMClassifier", 1, "ai.onnx.ml")
-        op = Op(self, "SVMClassifier", schema)
+        op = self._get_op("SVMClassifier", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             classlabels_ints=classlabels_ints,
             classlabels_strings=classlabels_strings,
             coefficients=coefficients,
@@ -652,10 +638,9 @@ class Opset_ai_onnx_ml1(Opset):
             support_vectors: Chosen support vectors
         """
 
-        schema = get_schema("SVMRegressor", 1, "ai.onnx.ml")
-        op = Op(self, "SVMRegressor", schema)
+        op = self._get_op("SVMRegressor", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             coefficients=coefficients,
             kernel_params=kernel_params,
             kernel_type=kernel_type,
@@ -693,9 +678,8 @@ class Opset_ai_onnx_ml1(Opset):
                 of dimension count.<br>Must be same length as 'offset'
         """
 
-        schema = get_schema("Scaler", 1, "ai.onnx.ml")
-        op = Op(self, "Scaler", schema)
-        return op(*self._prepare_inputs(schema, X), offset=offset, scale=scale)
+        op = self._get_op("Scaler", 1)
+        return op(*self._prepare_inputs(op.op_schema, X), offset=offset, scale=scale)
 
     T1_TreeEnsembleClassifier = TypeVar(
         "T1_TreeEnsembleClassifier", DOUBLE, FLOAT, INT32, INT64
@@ -793,10 +777,9 @@ class Opset_ai_onnx_ml1(Opset):
                 'NONE,' 'SOFTMAX,' 'LOGISTIC,' 'SOFTMAX_ZERO,' or 'PROBIT.'
         """
 
-        schema = get_schema("TreeEnsembleClassifier", 1, "ai.onnx.ml")
-        op = Op(self, "TreeEnsembleClassifier", schema)
+        op = self._get_op("TreeEnsembleClassifier", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             base_values=base_values,
             class_ids=class_ids,
             class_nodeids=class_nodeids,
@@ -911,10 +894,9 @@ class Opset_ai_onnx_ml1(Opset):
             target_weights: The weight for each target
         """
 
-        schema = get_schema("TreeEnsembleRegressor", 1, "ai.onnx.ml")
-        op = Op(self, "TreeEnsembleRegressor", schema)
+        op = self._get_op("TreeEnsembleRegressor", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             aggregate_function=aggregate_function,
             base_values=base_values,
             n_targets=n_targets,
@@ -965,10 +947,9 @@ class Opset_ai_onnx_ml1(Opset):
                 the 'classlabels_*' attributes must be defined.
         """
 
-        schema = get_schema("ZipMap", 1, "ai.onnx.ml")
-        op = Op(self, "ZipMap", schema)
+        op = self._get_op("ZipMap", 1)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             classlabels_int64s=classlabels_int64s,
             classlabels_strings=classlabels_strings,
         )
@@ -15,12 +15,11 @@ from __future__ import annotations
 
 from typing import Optional, Sequence, TypeVar, Union
 
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset_ai_onnx_ml1 import Opset_ai_onnx_ml1
 from onnxscript.onnx_types import FLOAT, INT64, STRING
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset_ai_onnx_ml2(Opset_ai_onnx_ml1):
@@ -96,10 +95,9 @@ class Opset_ai_onnx_ml2(Opset_ai_onnx_ml1):
                 set.
         """
 
-        schema = get_schema("LabelEncoder", 2, "ai.onnx.ml")
-        op = Op(self, "LabelEncoder", schema)
+        op = self._get_op("LabelEncoder", 2)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             default_float=default_float,
             default_int64=default_int64,
             default_string=default_string,
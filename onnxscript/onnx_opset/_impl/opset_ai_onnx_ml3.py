@@ -16,12 +16,11 @@ from __future__ import annotations
 from typing import Optional, Sequence, Tuple, TypeVar, Union
 
 from onnx import TensorProto
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_opset._impl.opset_ai_onnx_ml2 import Opset_ai_onnx_ml2
 from onnxscript.onnx_types import DOUBLE, FLOAT, INT32, INT64, STRING
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset_ai_onnx_ml3(Opset_ai_onnx_ml2):
@@ -141,10 +140,9 @@ class Opset_ai_onnx_ml3(Opset_ai_onnx_ml2):
                 'NONE,' 'SOFTMAX,' 'LOGISTIC,' 'SOFTMAX_ZERO,' or 'PROBIT.'
         """
 
-        schema = get_schema("TreeEnsembleClassifier", 3, "ai.onnx.ml")
-        op = Op(self, "TreeEnsembleClassifier", schema)
+        op = self._get_op("TreeEnsembleClassifier", 3)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             base_values=base_values,
             base_values_as_tensor=base_values_as_tensor,
             class_ids=class_ids,
@@ -280,10 +278,9 @@ class Opset_ai_onnx_ml3(Opset_ai_onnx_ml2):
             target_weights_as_tensor: The weight for each target
         """
 
-        schema = get_schema("TreeEnsembleRegressor", 3, "ai.onnx.ml")
-        op = Op(self, "TreeEnsembleRegressor", schema)
+        op = self._get_op("TreeEnsembleRegressor", 3)
         return op(
-            *self._prepare_inputs(schema, X),
+            *self._prepare_inputs(op.op_schema, X),
             aggregate_function=aggregate_function,
             base_values=base_values,
             base_values_as_tensor=base_values_as_tensor,
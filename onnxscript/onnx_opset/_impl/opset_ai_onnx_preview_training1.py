@@ -15,7 +15,6 @@ from __future__ import annotations
 
 from typing import Optional, Sequence, TypeVar, Union
 
-from onnx.defs import get_schema
 from typing_extensions import TypeAlias
 
 from onnxscript.onnx_types import (
@@ -35,7 +34,7 @@ from onnxscript.onnx_types import (
     UINT32,
     UINT64,
 )
-from onnxscript.values import Op, Opset
+from onnxscript.values import Opset
 
 
 class Opset_ai_onnx_preview_training1(Opset):
@@ -135,10 +134,9 @@ class Opset_ai_onnx_preview_training1(Opset):
                 ||X||_2^2. Default to 0, which means no regularization.
         """
 
-        schema = get_schema("Adagrad", 1, "ai.onnx.preview.training")
-        op = Op(self, "Adagrad", schema)
+        op = self._get_op("Adagrad", 1)
         return op(
-            *self._prepare_inputs(schema, R, T, *inputs),
+            *self._prepare_inputs(op.op_schema, R, T, *inputs),
             decay_factor=decay_factor,
             epsilon=epsilon,
             norm_coefficient=norm_coefficient,
@@ -256,10 +254,9 @@ class Opset_ai_onnx_preview_training1(Opset):
                 * ||X||_2^2. Default to 0, which means no regularization.
         """
 
-        schema = get_schema("Adam", 1, "ai.onnx.preview.training")
-        op = Op(self, "Adam", schema)
+        op = self._get_op("Adam", 1)
         return op(
-            *self._prepare_inputs(schema, R, T, *inputs),
+            *self._prepare_inputs(op.op_schema, R, T, *inputs),
             alpha=alpha,
             beta=beta,
             epsilon=epsilon,
@@ -458,9 +455,8 @@ class Opset_ai_onnx_preview_training1(Opset):
                 be included in this attribute.
         """
 
-        schema = get_schema("Gradient", 1, "ai.onnx.preview.training")
-        op = Op(self, "Gradient", schema)
-        return op(*self._prepare_inputs(schema, *Inputs), xs=xs, y=y, zs=zs)
+        op = self._get_op("Gradient", 1)
+        return op(*self._prepare_inputs(op.op_schema, *Inputs), xs=xs, y=y, zs=zs)
 
     T1_Momentum = TypeVar("T1_Momentum", DOUBLE, FLOAT)
 
@@ -566,10 +562,9 @@ class Opset_ai_onnx_preview_training1(Opset):
             norm_coefficient: Coefficient of 0.5 * norm_coefficient * ||X||^2.
         """
 
-        schema = get_schema("Momentum", 1, "ai.onnx.preview.training")
-        op = Op(self, "Momentum", schema)
+        op = self._get_op("Momentum", 1)
         return op(
-            *self._prepare_inputs(schema, R, T, *inputs),
+            *self._prepare_inputs(op.op_schema, R, T, *inputs),
             alpha=alpha,
             beta=beta,
             mode=mode,
@@ -0,0 +1,437 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+"""Optimization passes over the IR of OnnxFunctions.
+
+The converter emits one statement per Python expression: a Constant node for every
+occurrence of a literal, Identity nodes for copies, and it does not remove unused
+values. The passes in this module simplify an :class:`~onnxscript.irbuilder.IRFunction`
+before it is converted into a FunctionProto.
+
+Usage::
+
+    results = optimizer.PassManager(disable=["fold_constants"]).run(function_ir)
+
+The passes rely on the top-level statements of the function assigning each name
+once, which is what the converter generates. Names used inside graph attributes,
+like the branches of If and the body of Loop, are neither renamed nor removed.
+"""
+from __future__ import annotations
+
+import dataclasses
+import logging
+from typing import Callable, Collection, Dict, Optional, Sequence
+
+import numpy as np
+import onnx
+import onnx.helper
+import onnx.numpy_helper
+
+from onnxscript import irbuilder, onnx_types, values
+from onnxscript._internal import graph_utils
+
+logger = logging.getLogger("onnxscript")
+
+# Ops whose outputs differ between two calls with the same inputs
+_NONDETERMINISTIC_OPS = frozenset(
+    [
+        "Bernoulli",
+        "Dropout",
+        "Multinomial",
+        "RandomNormal",
+        "RandomNormalLike",
+        "RandomUniform",
+        "RandomUniformLike",
+    ]
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class PassResult:
+    """The outcome of running a pass over a function.
+
+    Attributes:
+        name: The name of the pass.
+        nodes_removed: The number of statements removed by the pass.
+    """
+
+    name: str
+    nodes_removed: int
+
+
+def _stmt_captures(stmt: irbuilder.IRStmt) -> set[str]:
+    """Returns the names that the graph attributes of a statement may capture."""
+    names: set[str] = set()
+    for attr in stmt.attrs:
+        if attr.attr_proto.HasField("g"):
+            names.update(graph_utils.graph_references(attr.attr_proto.g))
+        for subgraph in attr.attr_proto.graphs:
+            names.update(graph_utils.graph_references(subgraph))
+    return names
+
+
+def _pinned_names(function: irbuilder.IRFunction) -> set[str]:
+    """Returns the names that must not be renamed: outputs and captured names."""
+    names = {output.name for output in function.outputs}
+    for stmt in function.stmts:
+        names.update(_stmt_captures(stmt))
+    return names
+
+
+def _has_single_assignments(function: irbuilder.IRFunction) -> bool:
+    assigned = [name for name in function.assigned_names if name]
+    names = set(assigned)
+    return len(names) == len(assigned) and not names & {x.name for x in function.inputs}
+
+
+def _arg_names(stmt: irbuilder.IRStmt) -> list[str]:
+    """Returns the names of the arguments of a statement, "" for omitted ones."""
+    # The converter passes some arguments as Variables rather than names
+    return ["" if arg is None else str(arg) for arg in stmt.args]
+
+
+def _with_renamed_args(stmt: irbuilder.IRStmt, renames: Dict[str, str]) -> irbuilder.IRStmt:
+    """Returns the statement with its arguments renamed, without modifying it."""
+    args = _arg_names(stmt)
+    if not any(arg in renames for arg in args):
+        return stmt
+    return irbuilder.IRStmt(
+        stmt.result,
+        stmt.callee,
+        [renames.get(arg, arg) for arg in args],
+        stmt.attrs,
+        sub_functions=stmt.functions,
+    )
+
+
+def _attribute_key(attr: irbuilder.IRAttributeValue) -> bytes:
+    attr_proto = attr.attr_proto
+    if attr_proto.HasField("t") and attr_proto.t.name:
+        # The converter names constant tensors after the variable they are assigned to
+        attr_proto = onnx.AttributeProto()
+        attr_proto.CopyFrom(attr.attr_proto)
+        attr_proto.t.ClearField("name")
+    return attr_proto.SerializeToString(deterministic=True)
+
+
+def _stmt_key(stmt: irbuilder.IRStmt) -> tuple:
+    return (
+        stmt.callee.opset.domain,
+        stmt.callee.opset.version,
+        stmt.callee.name,
+        tuple(_arg_names(stmt)),
+        tuple(sorted(_attribute_key(attr) for attr in stmt.attrs)),
+        len(stmt.result),
+    )
+
+
+def _merge_equivalent_stmts(
+    function: irbuilder.IRFunction, is_candidate: Callable[[irbuilder.IRStmt], bool]
+) -> int:
+    """Removes candidate statements equivalent to an earlier statement.
+
+    Uses of the results of a removed statement are replaced with the results of the
+    earlier one.
+    """
+    pinned = _pinned_names(function)
+    first_stmts: dict[tuple, irbuilder.IRStmt] = {}
+    renames: dict[str, str] = {}
+    stmts = []
+    for stmt in function.stmts:
+        stmt = _with_renamed_args(stmt, renames)
+        if is_candidate(stmt):
+            key = _stmt_key(stmt)
+            first = first_stmts.get(key)
+            if first is not None and not pinned.intersection(stmt.output_names):
+                renames.update(zip(stmt.output_names, first.output_names))
+                continue
+            first_stmts.setdefault(key, stmt)
+        stmts.append(stmt)
+    removed = len(function.stmts) - len(stmts)
+    function.stmts = stmts
+    return removed
+
+
+def deduplicate_constants(function: irbuilder.IRFunction) -> int:
+    """Replaces Constant statements with an earlier Constant of the same value.
+
+    Returns:
+        The number of statements removed.
+    """
+
+    def is_constant(stmt: irbuilder.IRStmt) -> bool:
+        return stmt.callee.name == "Constant" and graph_utils.is_standard_domain(
+            stmt.callee.opset.domain
+        )
+
+    return _merge_equivalent_stmts(function, is_constant)
+
+
+def eliminate_common_subexpressions(function: irbuilder.IRFunction) -> int:
+    """Replaces op calls with an earlier call of the same op on the same arguments.
+
+    Calls to functions and to ops with random outputs are kept.
+
+    Returns:
+        The number of statements removed.
+    """
+
+    def is_pure(stmt: irbuilder.IRStmt) -> bool:
+        return (
+            not isinstance(stmt.callee, values.OnnxFunction)
+            and stmt.callee.name not in _NONDETERMINISTIC_OPS
+        )
+
+    return _merge_equivalent_stmts(function, is_pure)
+
+
+def forward_identities(function: irbuilder.IRFunction) -> int:
+    """Removes Identity statements by using their input in place of their output.
+
+    An Identity whose output is a function output is removed by renaming the value
+    it copies instead, if that value is computed by the function.
+
+    Returns:
+        The number of statements removed.
+    """
+    pinned = _pinned_names(function)
+    produced = set(function.assigned_names)
+    # Uses of the output of a removed Identity are replaced with its input
+    renames: dict[str, str] = {}
+    # Values renamed to the output of a removed Identity
+    result_renames: dict[str, str] = {}
+    stmts = []
+    for stmt in function.stmts:
+        args = _arg_names(stmt)
+        if (
+            stmt.callee.name != "Identity"
+            or not graph_utils.is_standard_domain(stmt.callee.opset.domain)
+            or not args
+            or not args[0]
+        ):
+            stmts.append(stmt)
+            continue
+        source = renames.get(args[0], args[0])
+        target = stmt.output_names[0]
+        if target not in pinned:
+            renames[target] = source
+        elif source in produced and source not in pinned and source not in result_renames:
+            result_renames[source] = target
+        else:
+            stmts.append(stmt)
+    removed = len(function.stmts) - len(stmts)
+
+    renames = {name: result_renames.get(source, source) for name, source in renames.items()}
+    renames.update(result_renames)
+    function.stmts = []
+    for stmt in stmts:
+        if result_renames.keys() & set(stmt.output_names):
+            stmt = irbuilder.IRStmt(
+                [result_renames.get(name, name) for name in stmt.output_names],
+                stmt.callee,
+                stmt.args,
+                stmt.attrs,
+                sub_functions=stmt.functions,
+            )
+        function.stmts.append(_with_renamed_args(stmt, renames))
+    return removed
+
+
+def eliminate_dead_nodes(function: irbuilder.IRFunction) -> int:
+    """Removes statements whose results are not used.
+
+    Returns:
+        The number of statements removed.
+    """
+    live = {output.name for output in function.outputs}
+    stmts = []
+    for stmt in reversed(function.stmts):
+        if not live.intersection(stmt.output_names):
+            continue
+        live.update(_arg_names(stmt))
+        live.update(_stmt_captures(stmt))
+        stmts.append(stmt)
+    stmts.reverse()
+    removed = len(function.stmts) - len(stmts)
+    function.stmts = stmts
+    return removed
+
+
+def _constant_value(stmt: irbuilder.IRStmt) -> Optional[np.ndarray]:
+    """Returns the value of a Constant statement, or None if it is not known."""
+    if len(stmt.attrs) != 1:
+        return None
+    return graph_utils.constant_attribute_value(stmt.attrs[0].attr_proto)
+
+
+def _static_shape(var: irbuilder.IRVar) -> Optional[list[int]]:
+    """Returns the shape of a function input if all its dimensions are annotated."""
+    typeinfo = var.typeinfo
+    if not isinstance(typeinfo, type) or not issubclass(typeinfo, onnx_types.TensorType):
+        return None
+    # Unlike FLOAT[...], FLOAT is not used consistently for scalars only
+    shape = getattr(typeinfo, "shape", None)
+    if shape is None or shape is Ellipsis:
+        return None
+    dims = shape if isinstance(shape, tuple) else (shape,)
+    if not all(isinstance(dim, int) for dim in dims):
+        return None
+    return list(dims)
+
+
+def _evaluate(stmt: irbuilder.IRStmt, inputs: Sequence[np.ndarray]) -> Sequence[np.ndarray]:
+    opset = onnx.helper.make_opsetid(stmt.callee.opset.domain, stmt.callee.opset.version)
+    return graph_utils.evaluate_node(stmt.to_node_proto("node"), [opset], inputs)
+
+
+def _constant_stmt(stmt: irbuilder.IRStmt, name: str, value: np.ndarray) -> irbuilder.IRStmt:
+    constant = values.Op(stmt.callee.opset, "Constant")
+    tensor = onnx.numpy_helper.from_array(value, name)
+    return irbuilder.IRStmt(
+        [name],
+        constant,
+        [],
+        [irbuilder.IRAttributeValue(onnx.helper.make_attribute("value", tensor))],
+    )
+
+
+def fold_constants(function: irbuilder.IRFunction, assume_static_shapes: bool = False) -> int:
+    """Evaluates shape computations whose inputs are known, and stores their results.
+
+    Calls to the ops used to compute shapes, like Shape, Concat, Gather and Reshape,
+    are replaced with Constant statements when all their inputs are constants.
+    Constant statements that are no longer used are removed.
+
+    Args:
+        function: The function to optimize.
+        assume_static_shapes: Whether to also fold the Shape calls on the function
+            inputs annotated with a static shape, like ``FLOAT[2, 3]``. Type
+            annotations are not checked when the function is called, so this is
+            only correct if the function is never called with inputs of other
+            shapes. Not enabled by :class:`PassManager`.
+
+    Returns:
+        The number of statements removed.
+    """
+    constants: dict[str, np.ndarray] = {}
+    static_shapes = (
+        {var.name: _static_shape(var) for var in function.inputs}
+        if assume_static_shapes
+        else {}
+    )
+    stmts = []
+    folded_inputs: set[str] = set()
+    for stmt in function.stmts:
+        if not graph_utils.is_standard_domain(stmt.callee.opset.domain):
+            stmts.append(stmt)
+            continue
+        if stmt.callee.name == "Constant":
+            value = _constant_value(stmt)
+            if value is not None:
+                constants[stmt.output_names[0]] = value
+            stmts.append(stmt)
+            continue
+        if stmt.callee.name not in graph_utils.FOLDABLE_OPS or any(
+            attr.attr_proto.ref_attr_name for attr in stmt.attrs
+        ):
+            stmts.append(stmt)
+            continue
+
+        args = [arg for arg in _arg_names(stmt) if arg]
+        static_shape = static_shapes.get(args[0]) if args else None
+        if stmt.callee.name == "Shape" and static_shape is not None:
+            # Only the shape of the input is needed
+            inputs = [np.empty(static_shape, dtype=np.uint8)]
+        elif all(arg in constants for arg in args):
+            inputs = [constants[arg] for arg in args]
+        else:
+            stmts.append(stmt)
+            continue
+        try:
+            outputs = _evaluate(stmt, inputs)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Unable to fold '%s': %s", stmt, e)
+            stmts.append(stmt)
+            continue
+        if any(np.asarray(output).size > graph_utils.MAX_FOLDED_SIZE for output in outputs):
+            stmts.append(stmt)
+            continue
+        for name, output in zip(stmt.output_names, outputs):
+            output = np.asarray(output)
+            constants[name] = output
+            stmts.append(_constant_stmt(stmt, name, output))
+        folded_inputs.update(args)
+
+    # Remove the constants that were only used by folded statements
+    used = {output.name for output in function.outputs}
+    for stmt in stmts:
+        used.update(_arg_names(stmt))
+        used.update(_stmt_captures(stmt))
+    function.stmts = [
+        stmt
+        for stmt in stmts
+        if not (
+            stmt.callee.name == "Constant"
+            and stmt.output_names[0] in folded_inputs
+            and stmt.output_names[0] not in used
+        )
+    ]
+    return len(stmts) - len(function.stmts)
+
+
+PASSES: Dict[str, Callable[[irbuilder.IRFunction], int]] = {
+    "deduplicate_constants": deduplicate_constants,
+    "fold_constants": fold_constants,
+    "forward_identities": forward_identities,
+    "eliminate_common_subexpressions": eliminate_common_subexpressions,
+    "eliminate_dead_nodes": eliminate_dead_nodes,
+}
+"""The available passes, by name, in the order they are run by default."""
+
+
+class PassManager:
+    """Runs a sequence of passes over IRFunctions."""
+
+    def __init__(
+        self, passes: Optional[Sequence[str]] = None, disable: Collection[str] = ()
+    ) -> None:
+        """Initializes a PassManager.
+
+        Args:
+            passes: The names of the passes to run, in order. Defaults to all the
+                passes in :data:`PASSES`.
+            disable: The names of passes not to run.
+        """
+        passes = list(PASSES) if passes is None else list(passes)
+        unknown = [name for name in (*passes, *disable) if name not in PASSES]
+        if unknown:
+            raise ValueError(f"Unknown passes {unknown}. Available passes: {list(PASSES)}")
+        self.passes = [name for name in passes if name not in disable]
+
+    def run(self, function: irbuilder.IRFunction) -> list[PassResult]:
+        """Optimizes the statements of a function in place.
+
+        Statements are replaced, never modified, so IRStmts shared with a copy of
+        the function are left unchanged.
+
+        Returns:
+            The results of the passes, in the order they were run.
+        """
+        if not _has_single_assignments(function):
+            logger.debug(
+                "Not optimizing function '%s' since it assigns a name more than once",
+                function.name,
+            )
+            return [PassResult(name, 0) for name in self.passes]
+        results = []
+        for name in self.passes:
+            result = PassResult(name, PASSES[name](function))
+            logger.debug(
+                "Pass '%s' removed %d nodes from function '%s'",
+                name,
+                result.nodes_removed,
+                function.name,
+            )
+            results.append(result)
+        return results
@@ -0,0 +1,157 @@
+import copy
+import unittest
+
+import numpy as np
+
+from onnxscript import FLOAT, evaluator, irbuilder, optimizer, script, values
+from onnxscript.onnx_opset import opset18 as op
+
+
+def _copy_ir(function: values.OnnxFunction) -> irbuilder.IRFunction:
+    function_ir = copy.copy(function.function_ir)
+    function_ir.stmts = list(function_ir.stmts)
+    return function_ir
+
+
+def _op_types(function_ir: irbuilder.IRFunction) -> list[str]:
+    return [stmt.callee.name for stmt in function_ir.stmts]
+
+
+@script()
+def _repeated_literals(x):
+    return op.Mul(op.Add(x, 1.0), 1.0)
+
+
+@script()
+def _repeated_calls(x):
+    noise = op.Add(op.RandomUniformLike(x), op.RandomUniformLike(x))
+    return op.Add(op.Relu(x), op.Relu(x)), noise
+
+
+@script()
+def _copies(x):
+    y = op.Identity(x)
+    z = op.Relu(y)
+    return op.Identity(z)
+
+
+@script()
+def _unused_values(x):
+    unused = op.Relu(x)  # pylint: disable=unused-variable
+    if op.ReduceSum(x) > 0.0:
+        result = op.Neg(x)
+    else:
+        result = op.Abs(x)
+    return result
+
+
+@script()
+def _shape_computation(x: FLOAT[2, 3], y):
+    shape = op.Concat(op.Constant(value_ints=[3]), op.Constant(value_ints=[2]), axis=0)
+    return op.Reshape(x, shape), op.Reshape(y, op.Shape(x))
+
+
+class PassesTest(unittest.TestCase):
+    def test_deduplicate_constants_replaces_constants_of_same_value(self):
+        function_ir = _copy_ir(_repeated_literals)
+        self.assertEqual(_op_types(function_ir).count("Constant"), 2)
+        self.assertEqual(optimizer.deduplicate_constants(function_ir), 1)
+        self.assertEqual(_op_types(function_ir).count("Constant"), 1)
+
+    def test_eliminate_common_subexpressions_keeps_random_ops(self):
+        function_ir = _copy_ir(_repeated_calls)
+        self.assertEqual(optimizer.eliminate_common_subexpressions(function_ir), 1)
+        self.assertEqual(_op_types(function_ir).count("Relu"), 1)
+        self.assertEqual(_op_types(function_ir).count("RandomUniformLike"), 2)
+        add = function_ir.stmts[-1]
+        self.assertEqual(add.args[0], add.args[1])
+
+    def test_forward_identities_keeps_function_outputs(self):
+        function_ir = _copy_ir(_copies)
+        self.assertEqual(optimizer.forward_identities(function_ir), 2)
+        self.assertEqual(_op_types(function_ir), ["Relu"])
+        relu = function_ir.stmts[0]
+        self.assertEqual(relu.args, ["x"])
+        self.assertEqual(relu.output_names, [function_ir.outputs[0].name])
+
+    def test_eliminate_dead_nodes_keeps_values_used_in_subgraphs(self):
+        function_ir = _copy_ir(_unused_values)
+        self.assertEqual(optimizer.eliminate_dead_nodes(function_ir), 1)
+        self.assertNotIn("Relu", _op_types(function_ir))
+        self.assertIn("If", _op_types(function_ir))
+
+    def test_fold_constants_evaluates_shape_computations(self):
+        function_ir = _copy_ir(_shape_computation)
+        # The two constants used by Concat are removed
+        self.assertEqual(optimizer.fold_constants(function_ir), 2)
+        # The annotated shape of x is not trusted by default
+        self.assertEqual(_op_types(function_ir), ["Constant", "Reshape", "Shape", "Reshape"])
+
+    def test_fold_constants_assumes_static_shapes_of_inputs_when_asked(self):
+        function_ir = _copy_ir(_shape_computation)
+        self.assertEqual(optimizer.fold_constants(function_ir, assume_static_shapes=True), 2)
+        self.assertEqual(
+            _op_types(function_ir), ["Constant", "Reshape", "Constant", "Reshape"]
+        )
+        shapes = [
+            optimizer._constant_value(stmt)  # pylint: disable=protected-access
+            for stmt in function_ir.stmts
+            if stmt.callee.name == "Constant"
+        ]
+        np.testing.assert_array_equal(shapes[0], [3, 2])
+        np.testing.assert_array_equal(shapes[1], [2, 3])
+
+
+class PassManagerTest(unittest.TestCase):
+    def test_run_reports_nodes_removed_by_each_pass(self):
+        function_ir = _copy_ir(_repeated_calls)
+        results = optimizer.PassManager(
+            ["eliminate_common_subexpressions", "eliminate_dead_nodes"]
+        ).run(function_ir)
+        self.assertEqual(
+            results,
+            [
+                optimizer.PassResult("eliminate_common_subexpressions", 1),
+                optimizer.PassResult("eliminate_dead_nodes", 0),
+            ],
+        )
+
+    def test_disabled_passes_are_not_run(self):
+        function_ir = _copy_ir(_repeated_literals)
+        disabled = ["deduplicate_constants", "eliminate_common_subexpressions"]
+        results = optimizer.PassManager(disable=disabled).run(function_ir)
+        self.assertEqual(
+            [result.name for result in results],
+            ["fold_constants", "forward_identities", "eliminate_dead_nodes"],
+        )
+        self.assertEqual(_op_types(function_ir).count("Constant"), 2)
+
+    def test_unknown_pass_raises(self):
+        with self.assertRaises(ValueError):
+            optimizer.PassManager(["inline_everything"])
+
+    def test_optimized_function_computes_the_same_outputs(self):
+        @script()
+        def redundant(x):
+            a = op.Identity(op.Add(x, 2.0))
+            b = op.Add(x, 2.0)
+            unused = op.Sub(a, 2.0)  # pylint: disable=unused-variable
+            return op.Mul(a, b)
+
+        x = np.random.rand(2, 3).astype(np.float32)
+        compiled_evaluator = evaluator.CompiledORTEvaluator()
+        expected = redundant[compiled_evaluator](x)
+        nodes_before = len(redundant.to_function_proto().node)
+
+        results = redundant.optimize()
+
+        self.assertEqual(
+            len(redundant.to_function_proto().node),
+            nodes_before - sum(result.nodes_removed for result in results),
+        )
+        compiled_evaluator.clear_session_cache()
+        np.testing.assert_allclose(redundant[compiled_evaluator](x), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
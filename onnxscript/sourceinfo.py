@@ -12,7 +12,14 @@ from typing import Callable, Optional
 
 
 class SourceInfo:
-    """Information about onnxscript source fragment, used for diagnostic messages."""
+    """Information about onnxscript source fragment, used for diagnostic messages.
+
+    Only the position of the AST node is kept, not the node itself, so that the IR
+    of converted functions does not keep their AST alive. The source code is shared
+    by all the SourceInfo of a function.
+    """
+
+    __slots__ = ("lineno", "col_offset", "code", "function_name")
 
     def __init__(
         self,
@@ -20,25 +27,22 @@ class SourceInfo:
         code: Optional[str] = None,
         function_name: Optional[str] = None,
     ):
-        self.ast_node = ast_node
+        self.lineno: int = ast_node.lineno  # type: ignore[attr-defined]
+        self.col_offset: int = ast_node.col_offset  # type: ignore[attr-defined]
         self.code = code
         self.function_name = function_name
 
-    @property
-    def lineno(self):
-        return self.ast_node.lineno
-
     def msg(self, error_message: str) -> str:
         lineno = self.lineno
         if self.function_name:
             source_loc = f"Function '{self.function_name}', line {lineno}"
         else:
-            source_loc = "Line {lineno}"
+            source_loc = f"Line {lineno}"
 
         if self.code:
             lines = self.code.split("\n")
             line = lines[lineno - 1]
-            marker_prefix = " " * (self.ast_node.col_offset)
+            marker_prefix = " " * (self.col_offset)
             source_line = f"{line}\n{marker_prefix}^\n"
         else:
             source_line = ""
@@ -0,0 +1,357 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# --------------------------------------------------------------------------
+"""Specialization of functions for the values of their attributes.
+
+A FunctionProto with attributes is generic: the nodes reading the attributes, and
+the If nodes branching on them, are only resolved by the runtime. When the values of
+the attributes are known when a call is created, :func:`specialize_function` creates
+a variant of the function without attributes in which
+
+- references to the attributes are replaced with their values,
+- ops computing shapes and conditions from constants are evaluated,
+- If nodes whose condition is constant are replaced with the taken branch,
+- Identity nodes and nodes whose outputs are not used are removed.
+
+:class:`FunctionSpecializer` caches the variants and bounds their number per function.
+"""
+from __future__ import annotations
+
+import collections
+import logging
+from typing import Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import onnx
+import onnx.helper
+import onnx.numpy_helper
+
+from onnxscript._internal import graph_utils
+from onnxscript.inliner import FunctionId
+
+logger = logging.getLogger("onnxscript")
+
+
+def _defined_names(
+    nodes: Iterable[onnx.NodeProto],
+    value_counts: collections.Counter,
+    node_counts: collections.Counter,
+) -> None:
+    """Counts the definitions of each value name and node name."""
+    for node in nodes:
+        value_counts.update(name for name in node.output if name)
+        if node.name:
+            node_counts[node.name] += 1
+        for subgraph in graph_utils.subgraphs(node):
+            value_counts.update(value_info.name for value_info in subgraph.input)
+            _defined_names(subgraph.node, value_counts, node_counts)
+
+
+def _unique_name(name: str, counts: collections.Counter) -> str:
+    """Returns a name not counted yet, and counts it."""
+    candidate = name
+    suffix = 0
+    while candidate in counts:
+        suffix += 1
+        candidate = f"{name}_{suffix}"
+    counts[candidate] += 1
+    return candidate
+
+
+class _Simplifier:
+    def __init__(self, function: onnx.FunctionProto) -> None:
+        self._opset_imports = list(function.opset_import)
+        self._value_counts: collections.Counter = collections.Counter(function.input)
+        # Node names must be unique in the function too. The converter numbers the
+        # nodes of each graph from zero.
+        self._node_counts: collections.Counter = collections.Counter()
+        _defined_names(function.node, self._value_counts, self._node_counts)
+
+    def _fold(
+        self, node: onnx.NodeProto, inputs: Sequence[np.ndarray]
+    ) -> Optional[list[np.ndarray]]:
+        try:
+            outputs = [
+                np.asarray(output)
+                for output in graph_utils.evaluate_node(node, self._opset_imports, inputs)
+            ]
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Unable to fold '%s': %s", node.op_type, e)
+            return None
+        if any(output.size > graph_utils.MAX_FOLDED_SIZE for output in outputs):
+            return None
+        return outputs
+
+    def _expand_branch(
+        self, node: onnx.NodeProto, branch: onnx.GraphProto
+    ) -> list[onnx.NodeProto]:
+        """Returns the nodes of the branch of an If node, computing its outputs."""
+        produced = {name for branch_node in branch.node for name in branch_node.output if name}
+        renames: Dict[str, str] = {}
+        identities = []
+        for output, if_output in zip(branch.output, node.output):
+            if not if_output:
+                continue
+            if output.name in produced and output.name not in renames:
+                renames[output.name] = if_output
+            else:
+                identities.append(
+                    onnx.helper.make_node(
+                        "Identity", [renames.get(output.name, output.name)], [if_output]
+                    )
+                )
+        for name in produced:
+            if name not in renames and self._value_counts[name] > 1:
+                # The name is also defined elsewhere, e.g. in the other branch
+                self._value_counts[name] -= 1
+                renames[name] = _unique_name(name, self._value_counts)
+
+        nodes = list(branch.node)
+        for branch_node in nodes:
+            graph_utils.rename_node(branch_node, lambda name: renames.get(name, name))
+            if branch_node.name and self._node_counts[branch_node.name] > 1:
+                self._node_counts[branch_node.name] -= 1
+                branch_node.name = _unique_name(branch_node.name, self._node_counts)
+        return [*nodes, *identities]
+
+    def simplify(
+        self, nodes: Iterable[onnx.NodeProto], constants: Dict[str, np.ndarray], fold: bool
+    ) -> list[onnx.NodeProto]:
+        """Prunes If nodes with constant conditions, and folds constants if ``fold``.
+
+        Values computed from constants are evaluated either way, to find the
+        conditions that are constant.
+        """
+        queue = collections.deque(nodes)
+        result = []
+        while queue:
+            node = queue.popleft()
+            if graph_utils.is_standard_domain(node.domain):
+                if node.op_type == "Constant" and len(node.attribute) == 1:
+                    value = graph_utils.constant_attribute_value(node.attribute[0])
+                    if value is not None:
+                        constants[node.output[0]] = value
+                elif node.op_type == "If" and node.input[0] in constants:
+                    attributes = {attr.name: attr.g for attr in node.attribute}
+                    branch = "then_branch" if constants[node.input[0]].all() else "else_branch"
+                    queue.extendleft(reversed(self._expand_branch(node, attributes[branch])))
+                    continue
+                elif (
+                    node.op_type in graph_utils.FOLDABLE_OPS
+                    and node.input
+                    and all(name in constants for name in node.input)
+                ):
+                    outputs = self._fold(node, [constants[name] for name in node.input])
+                    if outputs is not None:
+                        constants.update(zip(node.output, outputs))
+                    if outputs is not None and fold:
+                        for name, value in zip(node.output, outputs):
+                            result.append(
+                                onnx.helper.make_node(
+                                    "Constant",
+                                    [],
+                                    [name],
+                                    value=onnx.numpy_helper.from_array(value, name),
+                                )
+                            )
+                        continue
+            for subgraph in graph_utils.subgraphs(node):
+                # Values of the outer scope are visible in the subgraph, not the reverse.
+                # Values are not folded in branches that may not be taken: the shape
+                # inference of runtimes fails on the nodes of some of them, like a
+                # Squeeze of a dimension that is not 1, when their inputs are known.
+                subgraph_nodes = self.simplify(subgraph.node, dict(constants), fold=False)
+                del subgraph.node[:]
+                subgraph.node.extend(subgraph_nodes)
+            result.append(node)
+        return result
+
+
+def _forward_identities(
+    nodes: Iterable[onnx.NodeProto], pinned: set[str]
+) -> list[onnx.NodeProto]:
+    """Removes Identity nodes by using their input in place of their output."""
+    renames: Dict[str, str] = {}
+    result = []
+    for node in nodes:
+        if renames:
+            node.input[:] = [renames.get(name, name) for name in node.input]
+            for subgraph in graph_utils.subgraphs(node):
+                for subgraph_node in subgraph.node:
+                    graph_utils.rename_node(
+                        subgraph_node, lambda name: renames.get(name, name)
+                    )
+                for value_info in subgraph.output:
+                    value_info.name = renames.get(value_info.name, value_info.name)
+        if (
+            node.op_type == "Identity"
+            and graph_utils.is_standard_domain(node.domain)
+            and node.input[0]
+            and node.output[0] not in pinned
+        ):
+            renames[node.output[0]] = node.input[0]
+            continue
+        result.append(node)
+    return result
+
+
+def _eliminate_dead_nodes(
+    nodes: Sequence[onnx.NodeProto], live: set[str]
+) -> list[onnx.NodeProto]:
+    """Removes the nodes whose outputs are not used, in subgraphs too."""
+    result = []
+    for node in reversed(nodes):
+        if not live.intersection(node.output):
+            continue
+        live.update(node.input)
+        for subgraph in graph_utils.subgraphs(node):
+            subgraph_nodes = _eliminate_dead_nodes(
+                subgraph.node, {value_info.name for value_info in subgraph.output}
+            )
+            del subgraph.node[:]
+            subgraph.node.extend(subgraph_nodes)
+            live.update(graph_utils.graph_references(subgraph))
+        result.append(node)
+    result.reverse()
+    return result
+
+
+def specialize_function(
+    function: onnx.FunctionProto, attributes: Mapping[str, onnx.AttributeProto], name: str
+) -> onnx.FunctionProto:
+    """Returns a variant of a function without attributes, for the given values.
+
+    Args:
+        function: The function.
+        attributes: The values of the attributes, by name. Attributes that are not
+            set take their default value.
+        name: The name of the specialized function.
+
+    Raises:
+        ValueError: If an attribute without default value is not set.
+    """
+    bound = {attr.name: attr for attr in function.attribute_proto}
+    bound.update(attributes)
+    missing = [attr for attr in function.attribute if attr not in bound]
+    if missing:
+        raise ValueError(f"Attributes {missing} of function '{function.name}' are not set.")
+
+    specialized = onnx.FunctionProto()
+    specialized.CopyFrom(function)
+    specialized.name = name
+    del specialized.attribute[:]
+    del specialized.attribute_proto[:]
+    for node in specialized.node:
+        graph_utils.bind_attributes(node, bound)
+
+    nodes = _Simplifier(specialized).simplify(specialized.node, {}, fold=True)
+    outputs = set(specialized.output)
+    nodes = _forward_identities(nodes, outputs)
+    nodes = _eliminate_dead_nodes(nodes, set(outputs))
+    del specialized.node[:]
+    specialized.node.extend(nodes)
+    return specialized
+
+
+def _attributes_key(attributes: Mapping[str, onnx.AttributeProto]) -> Tuple[bytes, ...]:
+    return tuple(
+        attributes[name].SerializeToString(deterministic=True) for name in sorted(attributes)
+    )
+
+
+class FunctionSpecializer:
+    """Creates and caches the specialized variants of functions.
+
+    At most ``max_specializations`` variants are created for each function. Calls
+    with other attribute values use the generic function.
+
+    Attributes:
+        max_specializations: The maximum number of variants of a function.
+        specialization_counts: The number of variants created for each function.
+        fallback_counts: The number of calls to each function that use the generic
+            function because the maximum number of variants was reached.
+    """
+
+    def __init__(self, max_specializations: int = 8) -> None:
+        self.max_specializations = max_specializations
+        self.specialization_counts: Dict[FunctionId, int] = collections.defaultdict(int)
+        self.fallback_counts: Dict[FunctionId, int] = collections.defaultdict(int)
+        self._cache: Dict[Tuple[FunctionId, Tuple[bytes, ...]], onnx.FunctionProto] = {}
+        # The result of specialize_call for the attribute values of the calls, and
+        # whether it is a fallback to the generic function
+        self._calls: Dict[
+            Tuple[FunctionId, Tuple[bytes, ...]], Tuple[Optional[onnx.FunctionProto], bool]
+        ] = {}
+
+    def specialize(
+        self, function: onnx.FunctionProto, attributes: Mapping[str, onnx.AttributeProto]
+    ) -> Optional[onnx.FunctionProto]:
+        """Returns the variant of a function for the attribute values of a call.
+
+        Returns None if the function should be called as is: when it has no
+        attributes, when an attribute without default value is not set, or when
+        the maximum number of variants is reached.
+        """
+        if not function.attribute and not function.attribute_proto:
+            return None
+        bound = {attr.name: attr for attr in function.attribute_proto}
+        bound.update(attributes)
+        if any(attr not in bound for attr in function.attribute):
+            return None
+        function_id = (function.domain, function.name)
+        key = (function_id, _attributes_key(bound))
+        specialized = self._cache.get(key)
+        if specialized is not None:
+            return specialized
+
+        count = self.specialization_counts[function_id]
+        if count >= self.max_specializations:
+            if not self.fallback_counts[function_id]:
+                logger.debug(
+                    "Function '%s::%s' has %d specialized variants, "
+                    "using the generic function for other attribute values",
+                    function.domain,
+                    function.name,
+                    count,
+                )
+            self.fallback_counts[function_id] += 1
+            return None
+        specialized = specialize_function(
+            function, bound, f"{function.name}_specialized_{count}"
+        )
+        self.specialization_counts[function_id] += 1
+        self._cache[key] = specialized
+        logger.debug(
+            "Specialized function '%s::%s' into '%s' with %d nodes instead of %d",
+            function.domain,
+            function.name,
+            specialized.name,
+            len(specialized.node),
+            len(function.node),
+        )
+        return specialized
+
+    def specialize_call(
+        self,
+        function_id: FunctionId,
+        attributes: Mapping[str, onnx.AttributeProto],
+        function_proto: Callable[[], onnx.FunctionProto],
+    ) -> Optional[onnx.FunctionProto]:
+        """Returns the variant of a function for the attribute values of a call.
+
+        Like :meth:`specialize`, but the result is looked up by the domain and name
+        of the function and the attribute values of the call first. ``function_proto``
+        builds the function, and is only called for attribute values not seen before.
+        """
+        key = (function_id, _attributes_key(attributes))
+        result = self._calls.get(key)
+        if result is not None:
+            specialized, fallback = result
+            if fallback:
+                self.fallback_counts[function_id] += 1
+            return specialized
+        fallbacks = self.fallback_counts.get(function_id, 0)
+        specialized = self.specialize(function_proto(), attributes)
+        self._calls[key] = (specialized, self.fallback_counts.get(function_id, 0) > fallbacks)
+        return specialized
@@ -0,0 +1,193 @@
+import unittest
+
+import numpy as np
+import onnx
+import onnx.checker
+import onnx.helper
+import onnx.parser
+import onnxruntime as ort
+
+from onnxscript import specializer
+
+_FUNCTIONS = """
+<ir_version: 8, opset_import: ["" : 18, "local" : 1]>
+agraph (float[N] x) => (float[N] y) {
+    y = local.reduce <reduction: int = 1> (x)
+}
+<domain: "local", opset_import: ["" : 18]>
+reduce <reduction> (x) => (result) {
+    shape = Shape (x)
+    reduction_value = Constant <value_int: int = @reduction> ()
+    one = Constant <value_int: int = 1> ()
+    is_mean = Equal (reduction_value, one)
+    result = If (is_mean) <
+        then_branch = then_graph () => (mean) {
+            mean_value = ReduceMean <keepdims: int = 0> (x)
+            mean = Expand (mean_value, shape)
+        },
+        else_branch = else_graph () => (x_copy) {
+            x_copy = Identity (x)
+        }
+    >
+}
+<domain: "local", opset_import: ["" : 18]>
+reduce_vectors <reduction> (x) => (result) {
+    shape = Shape (x)
+    rank = Size (shape)
+    one = Constant <value_int: int = 1> ()
+    is_vector = Equal (rank, one)
+    result = If (is_vector) <
+        then_branch = then_graph () => (vector_result) {
+            reduction_value = Constant <value_int: int = @reduction> ()
+            is_mean = Equal (reduction_value, one)
+            vector_result = If (is_mean) <
+                then_branch = mean_graph () => (mean) {
+                    mean_value = ReduceMean <keepdims: int = 0> (x)
+                    mean = Expand (mean_value, shape)
+                },
+                else_branch = copy_graph () => (x_copy) {
+                    x_copy = Identity (x)
+                }
+            >
+        },
+        else_branch = else_graph () => (x_copy) {
+            x_copy = Identity (x)
+        }
+    >
+}
+"""
+
+
+def _function(index: int = 0) -> onnx.FunctionProto:
+    return onnx.parser.parse_model(_FUNCTIONS).functions[index]
+
+
+def _model(function: onnx.FunctionProto, attributes: dict) -> onnx.ModelProto:
+    node = onnx.helper.make_node(function.name, ["x"], ["y"], domain="local", **attributes)
+    graph = onnx.helper.make_graph(
+        [node],
+        "graph",
+        [onnx.helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, ["N"])],
+        [onnx.helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, ["N"])],
+    )
+    return onnx.helper.make_model(
+        graph,
+        opset_imports=[
+            onnx.helper.make_opsetid("", 18),
+            onnx.helper.make_opsetid("local", 1),
+        ],
+        functions=[function],
+    )
+
+
+def _run(model: onnx.ModelProto, x: np.ndarray) -> np.ndarray:
+    session = ort.InferenceSession(
+        model.SerializeToString(), providers=["CPUExecutionProvider"]
+    )
+    return session.run(None, {"x": x})[0]
+
+
+def _attribute(value: int) -> dict:
+    return {"reduction": onnx.helper.make_attribute("reduction", value)}
+
+
+class SpecializeFunctionTest(unittest.TestCase):
+    def test_if_on_attribute_is_replaced_with_taken_branch(self):
+        function = _function()
+        for reduction, expected_op_types in (
+            (1, ["Shape", "ReduceMean", "Expand"]),
+            (0, ["Identity"]),
+        ):
+            specialized = specializer.specialize_function(
+                function, _attribute(reduction), "reduce_specialized"
+            )
+            self.assertEqual([node.op_type for node in specialized.node], expected_op_types)
+            self.assertEqual(len(specialized.attribute), 0)
+
+            x = np.arange(4, dtype=np.float32)
+            model = _model(specialized, {})
+            onnx.checker.check_model(model, full_check=True)
+            np.testing.assert_allclose(
+                _run(model, x), _run(_model(function, {"reduction": reduction}), x)
+            )
+
+    def test_if_on_attribute_in_branch_is_replaced_with_taken_branch(self):
+        function = _function(1)
+        specialized = specializer.specialize_function(function, _attribute(1), "specialized")
+
+        # The rank of the input is unknown, so the outer If is kept
+        self.assertEqual(
+            [node.op_type for node in specialized.node],
+            ["Shape", "Size", "Constant", "Equal", "If"],
+        )
+        then_branch = specialized.node[-1].attribute[0].g
+        self.assertEqual([node.op_type for node in then_branch.node], ["ReduceMean", "Expand"])
+        self.assertEqual(list(then_branch.node[-1].output), [then_branch.output[0].name])
+        x = np.arange(4, dtype=np.float32)
+        np.testing.assert_allclose(
+            _run(_model(specialized, {}), x), _run(_model(function, {"reduction": 1}), x)
+        )
+
+    def test_unset_attribute_without_default_raises(self):
+        with self.assertRaises(ValueError):
+            specializer.specialize_function(_function(), {}, "specialized")
+
+
+class FunctionSpecializerTest(unittest.TestCase):
+    def test_specialized_functions_are_cached_by_attribute_values(self):
+        function_specializer = specializer.FunctionSpecializer()
+        function = _function()
+        first = function_specializer.specialize(function, _attribute(1))
+        second = function_specializer.specialize(function, _attribute(1))
+        other = function_specializer.specialize(function, _attribute(0))
+        assert first is not None and other is not None
+        self.assertIs(first, second)
+        self.assertNotEqual(first.name, other.name)
+        self.assertEqual(function_specializer.specialization_counts, {("local", "reduce"): 2})
+
+    def test_generic_function_is_used_once_max_specializations_is_reached(self):
+        function_specializer = specializer.FunctionSpecializer(max_specializations=1)
+        function = _function()
+        self.assertIsNotNone(function_specializer.specialize(function, _attribute(1)))
+        self.assertIsNone(function_specializer.specialize(function, _attribute(0)))
+        self.assertIsNone(function_specializer.specialize(function, _attribute(2)))
+        self.assertIsNotNone(function_specializer.specialize(function, _attribute(1)))
+        self.assertEqual(function_specializer.specialization_counts, {("local", "reduce"): 1})
+        self.assertEqual(function_specializer.fallback_counts, {("local", "reduce"): 2})
+
+    def test_function_is_only_built_for_new_attribute_values_of_calls(self):
+        function_specializer = specializer.FunctionSpecializer(max_specializations=1)
+        built = []
+
+        def function_proto():
+            built.append(True)
+            return _function()
+
+        first = function_specializer.specialize_call(
+            ("local", "reduce"), _attribute(1), function_proto
+        )
+        second = function_specializer.specialize_call(
+            ("local", "reduce"), _attribute(1), function_proto
+        )
+        for _ in range(2):
+            self.assertIsNone(
+                function_specializer.specialize_call(
+                    ("local", "reduce"), _attribute(0), function_proto
+                )
+            )
+        self.assertIsNotNone(first)
+        self.assertIs(first, second)
+        self.assertEqual(len(built), 2)
+        self.assertEqual(function_specializer.fallback_counts, {("local", "reduce"): 2})
+
+    def test_functions_without_attributes_or_values_are_not_specialized(self):
+        function_specializer = specializer.FunctionSpecializer()
+        function = _function()
+        self.assertIsNone(function_specializer.specialize(function, {}))
+        del function.attribute[:]
+        self.assertIsNone(function_specializer.specialize(function, {}))
+        self.assertEqual(function_specializer.specialization_counts, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,20 @@
 # --------------------------------------------------------------------------
 """Public utilities for testing onnxscript."""
 
+from typing import Union
+
 import onnx
 from onnx import parser
 
 import onnxscript
+from onnxscript._internal import structural_hashing
 
-__all__ = ["assert_isomorphic", "assert_isomorphic_graph", "assert_isomorphic_function"]
+__all__ = [
+    "assert_isomorphic",
+    "assert_isomorphic_graph",
+    "assert_isomorphic_function",
+    "structural_hash",
+]
 
 
 def assert_isomorphic(graph_or_function_1, graph_or_function_2):
@@ -214,6 +222,8 @@ class _Matcher:
             return False
         if node1.domain != node2.domain:
             return False
+        if [bool(x) for x in node1.output] != [bool(x) for x in node2.output]:
+            return False
         # check attrs
         if not _same_attrs(node1.attribute, node2.attribute, self.same_sub_graph):
             return False
@@ -294,6 +304,41 @@ class _Matcher:
         return True
 
 
+def structural_hash(
+    graph_or_function: Union[
+        onnx.FunctionProto, onnx.GraphProto, onnx.ModelProto, onnxscript.OnnxFunction
+    ]
+) -> str:
+    """Returns a hash of the computation of a graph or function.
+
+    The hash is computed bottom-up (as a Merkle tree) from the operators, the
+    attributes and the inputs of the nodes, with the sub-graphs of the attributes
+    hashed the same way, in time linear in the size of the graph or function and
+    without recursion. It does not depend on the order of the nodes, on the names
+    of the nodes and of the intermediate values, on the names of the initializers,
+    on the names and the types of the outputs, nor on the name, domain and input
+    names of a function. Isomorphic graphs or functions have the same hash. The
+    converse only holds when no two nodes have the same operator, attributes and
+    inputs: the values computed by such nodes cannot be told apart. Unlike
+    `assert_isomorphic`, graphs with initializers are supported, and the unused
+    nodes are part of the hash.
+
+    Args:
+        graph_or_function: The graph or function. The hash of a model is the hash
+            of its graph.
+
+    Returns:
+        The hexadecimal SHA-256 hash.
+    """
+    return structural_hashing.structural_hash(_to_function_or_graph(graph_or_function))
+
+
+def _same_unique_hash(fg1, fg2) -> bool:
+    """Fast path of _isomorphic: graphs or functions with the same unique hash are isomorphic."""
+    digest = structural_hashing.unique_structural_hash(fg1)
+    return digest is not None and digest == structural_hashing.unique_structural_hash(fg2)
+
+
 def _isomorphic(fg1, fg2):
     """Checks that two function/graph bodies are isomorphic.
     Assumes that the inputs are valid FunctionProto/GraphProto.
@@ -304,11 +349,11 @@ def _isomorphic(fg1, fg2):
     if isinstance(fg1, onnx.FunctionProto):
         if not isinstance(fg2, onnx.FunctionProto):
             raise TypeError("Both inputs must be same type (function or graph)")
-        return matcher.same_function()
+        return _same_unique_hash(fg1, fg2) or matcher.same_function()
     if isinstance(fg1, onnx.GraphProto):
         if not isinstance(fg2, onnx.GraphProto):
             raise TypeError("Both inputs must be same type (function or graph)")
-        return matcher.same_graph()
+        return _same_unique_hash(fg1, fg2) or matcher.same_graph()
     raise TypeError("Inputs must be either a FunctionProto or GraphProto")
 
 
@@ -0,0 +1,192 @@
+import unittest
+
+import numpy as np
+import onnx
+from onnx import helper, numpy_helper, parser
+
+from onnxscript import testing
+
+_FUNCTION = """
+    <domain: "test", opset_import: ["" : 18]>
+    scaled_sum (x, y) => (z)
+    {
+        sum = Add(x, y)
+        two = Constant<value_float = 2.0>()
+        z = Mul(sum, two)
+    }
+"""
+
+# The same computation, with other names and another order of the nodes
+_RENAMED_FUNCTION = """
+    <domain: "other", opset_import: ["" : 18]>
+    other_name (a, b) => (c)
+    {
+        factor = Constant<value_float = 2.0>()
+        s = Add(a, b)
+        c = Mul(s, factor)
+    }
+"""
+
+
+def _chain_graph(length: int) -> onnx.GraphProto:
+    nodes = [
+        helper.make_node("Relu", [f"x{i}"], [f"x{i + 1}"], name=f"node{i}")
+        for i in range(length)
+    ]
+    value_info = helper.make_tensor_value_info("x0", onnx.TensorProto.FLOAT, [2])
+    output = helper.make_tensor_value_info(f"x{length}", onnx.TensorProto.FLOAT, [2])
+    return helper.make_graph(nodes, "chain", [value_info], [output])
+
+
+def _graph_with_initializer(name: str, value: float) -> onnx.GraphProto:
+    return parser.parse_graph(
+        f"""
+        graph (float[2] x) => (float[2] y)
+        <float[2] {name} = {{{value}, {value}}}>
+        {{
+            y = Add(x, {name})
+        }}
+        """
+    )
+
+
+def _graph_with_if(outer_value: str) -> onnx.GraphProto:
+    return parser.parse_graph(
+        f"""
+        graph (bool cond, float[2] x, float[2] y) => (float[2] z)
+        {{
+            z = If(cond) <
+                then_branch = then_graph () => (float[2] then_z) {{
+                    then_z = Relu({outer_value})
+                }},
+                else_branch = else_graph () => (float[2] else_z) {{
+                    else_z = Neg({outer_value})
+                }}
+            >
+        }}
+        """
+    )
+
+
+class StructuralHashTest(unittest.TestCase):
+    def test_hash_does_not_depend_on_names_and_node_order(self):
+        self.assertEqual(
+            testing.structural_hash(parser.parse_function(_FUNCTION)),
+            testing.structural_hash(parser.parse_function(_RENAMED_FUNCTION)),
+        )
+
+    def test_hash_depends_on_the_computation(self):
+        expected = testing.structural_hash(parser.parse_function(_FUNCTION))
+        for old, new in (
+            ("Mul(sum, two)", "Mul(two, sum)"),
+            ("Add(x, y)", "Sub(x, y)"),
+            ("Add(x, y)", "Add(x, x)"),
+            ("value_float = 2.0", "value_float = 3.0"),
+            ('"" : 18', '"" : 17'),
+        ):
+            with self.subTest(old=old, new=new):
+                function = parser.parse_function(_FUNCTION.replace(old, new))
+                self.assertNotEqual(testing.structural_hash(function), expected)
+
+    def test_hash_of_a_model_is_the_hash_of_its_graph(self):
+        graph = _chain_graph(3)
+        model = helper.make_model(graph)
+        self.assertEqual(testing.structural_hash(model), testing.structural_hash(graph))
+
+    def test_hash_of_deep_graph_does_not_recurse(self):
+        graph = _chain_graph(10_000)
+        self.assertEqual(testing.structural_hash(graph), testing.structural_hash(graph))
+        self.assertNotEqual(
+            testing.structural_hash(graph), testing.structural_hash(_chain_graph(10_001))
+        )
+
+    def test_hash_depends_on_initializer_values_but_not_names(self):
+        expected = testing.structural_hash(_graph_with_initializer("w", 1.0))
+        self.assertEqual(
+            testing.structural_hash(_graph_with_initializer("weight", 1.0)), expected
+        )
+        self.assertNotEqual(
+            testing.structural_hash(_graph_with_initializer("w", 2.0)), expected
+        )
+
+    def test_hash_of_sub_graphs_depends_on_outer_scope_values(self):
+        self.assertNotEqual(
+            testing.structural_hash(_graph_with_if("x")),
+            testing.structural_hash(_graph_with_if("y")),
+        )
+
+    def test_hash_depends_on_unused_nodes(self):
+        graph = _chain_graph(2)
+        unused = onnx.GraphProto()
+        unused.CopyFrom(graph)
+        unused.node.append(helper.make_node("Neg", ["x0"], ["unused"]))
+        self.assertNotEqual(testing.structural_hash(graph), testing.structural_hash(unused))
+
+
+class AssertIsomorphicTest(unittest.TestCase):
+    def test_isomorphic_functions(self):
+        testing.assert_isomorphic_function(_FUNCTION, _RENAMED_FUNCTION)
+        with self.assertRaises(AssertionError):
+            testing.assert_isomorphic_function(
+                _FUNCTION, _FUNCTION.replace("Add(x, y)", "Sub(x, y)")
+            )
+
+    def test_functions_with_identical_nodes_are_compared_by_the_matcher(self):
+        function = """
+            <domain: "test", opset_import: ["" : 18]>
+            f (x) => (a, z)
+            {{
+                a = RandomUniformLike(x)
+                b = RandomUniformLike(x)
+                z = Identity({})
+            }}
+        """
+        # Both functions have the same hash, as a and b have the same key
+        self.assertEqual(
+            testing.structural_hash(parser.parse_function(function.format("a"))),
+            testing.structural_hash(parser.parse_function(function.format("b"))),
+        )
+        with self.assertRaises(AssertionError):
+            testing.assert_isomorphic_function(function.format("a"), function.format("b"))
+
+    def test_functions_with_different_numbers_of_outputs_are_not_isomorphic(self):
+        function = """
+            <domain: "test", opset_import: ["" : 18]>
+            f (x) => (b)
+            {{
+                {} = Split<axis = 0>(x)
+            }}
+        """
+        with self.assertRaises(AssertionError):
+            testing.assert_isomorphic_function(
+                function.format("a, b"), function.format("a, b, c")
+            )
+
+    def test_isomorphic_deep_graphs(self):
+        testing.assert_isomorphic_graph(_chain_graph(10_000), _chain_graph(10_000))
+
+    def test_isomorphic_graphs_with_initializers(self):
+        testing.assert_isomorphic_graph(
+            _graph_with_initializer("w", 1.0), _graph_with_initializer("weight", 1.0)
+        )
+        with self.assertRaises(AssertionError):
+            testing.assert_isomorphic_graph(
+                _graph_with_initializer("w", 1.0), _graph_with_initializer("w", 2.0)
+            )
+
+    def test_graph_and_function_are_not_comparable(self):
+        with self.assertRaises(TypeError):
+            testing.assert_isomorphic(
+                parser.parse_function(_FUNCTION),
+                helper.make_graph(
+                    [],
+                    "constant",
+                    [],
+                    [helper.make_tensor_value_info("c", onnx.TensorProto.FLOAT, [1])],
+                    [numpy_helper.from_array(np.array([1.0], dtype=np.float32), "c")],
+                ),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -212,19 +212,9 @@ def run_test_output_match(
                 if isinstance(torch_output, torch.Tensor) and torch.is_complex(torch_output):
                     torch_output = torch.view_as_real(torch_output.resolve_conj())
 
-                reference_torch_outputs, _ = pytree.tree_flatten(torch_output)
-                if (
-                    op.name.startswith("split")
-                    or op.name.startswith("chunk")
-                    or op.name.startswith("unbind")
-                    or op.name
-                    in {"atleast_1d_Sequence", "atleast_2d_Sequence", "atleast_3d_Sequence"}
-                ):
-                    # Hack for handling split, chunk and unbind which relies on SplitToSequence op.
-                    # Split returns a Sequence that should be treats as a single
-                    # value. So we wrap it into a tuple.
-                    # TODO(justinchuby): Find a more general solution
-                    reference_torch_outputs = [reference_torch_outputs]
+                reference_torch_outputs = ops_test_common.reference_outputs(
+                    op.name, torch_output
+                )
 
                 test_name = test_suite.id()
                 function_output = function_executor(test_name, reference_torch_outputs)(
@@ -28,10 +28,11 @@ import onnxruntime.capi.onnxruntime_pybind11_state
 import pytest
 import torch
 from torch.testing._internal.opinfo import core as opinfo_core
+from torch.utils import _pytree as pytree
 
 import onnxscript
 import onnxscript.evaluator
-from onnxscript.function_libs.torch_lib import graph_building
+from onnxscript.function_libs.torch_lib import graph_building, onnx_graph_building
 from onnxscript.tests.function_libs.torch_lib import error_reproduction
 
 T = TypeVar("T")
@@ -434,86 +435,140 @@ def dtype_op_schema_compatible(dtype: torch.dtype, schema: onnx.defs.OpSchema) -
     return any(TORCH_DTYPE_TO_ONNX_STRING[dtype] in type_str for type_str in allowed_type_strs)
 
 
+def reference_outputs(op_name: str, torch_output: Any) -> list[Any]:
+    """Returns the outputs of a torch op as the outputs of the torch_lib function.
+
+    Args:
+        op_name: The name of the OpInfo.
+        torch_output: The output of the torch op.
+    """
+    outputs, _ = pytree.tree_flatten(torch_output)
+    if (
+        op_name.startswith("split")
+        or op_name.startswith("chunk")
+        or op_name.startswith("unbind")
+        or op_name in {"atleast_1d_Sequence", "atleast_2d_Sequence", "atleast_3d_Sequence"}
+    ):
+        # Hack for handling split, chunk and unbind which relies on SplitToSequence op.
+        # Split returns a Sequence that should be treats as a single
+        # value. So we wrap it into a tuple.
+        # TODO(justinchuby): Find a more general solution
+        outputs = [outputs]
+    return outputs
+
+
+# The graph builders by name, with their tracing evaluator
+GRAPH_BACKENDS = {
+    "torchscript": (
+        graph_building.TorchScriptGraph,
+        graph_building.TorchScriptTracingEvaluator,
+    ),
+    "onnx": (onnx_graph_building.OnnxGraph, onnx_graph_building.OnnxGraphTracingEvaluator),
+}
+
+
+def capture_graph(
+    function: Callable, args, kwargs, outputs: Sequence[Any], backend: str = "torchscript"
+) -> tuple[Any, dict[str, Any]]:
+    """Captures the graph of a function called on the inputs of an OpInfo sample.
+
+    Args:
+        function: The torch_lib function.
+        args: The positional arguments, with tensors as numpy arrays.
+        kwargs: The keyword arguments, with tensors as numpy arrays.
+        outputs: The expected outputs, used to set the types of the graph outputs.
+        backend: The name of the graph builder in GRAPH_BACKENDS.
+
+    Returns:
+        The graph, and the ONNX Runtime inputs of the model by name.
+    """
+    # Initialize the ONNX graph
+    graph_class, tracer_class = GRAPH_BACKENDS[backend]
+    onnxscript_graph = graph_class()
+    tracer = tracer_class(onnxscript_graph)
+    ort_inputs = {}
+    onnxscript_args: list[Any] = []
+    onnxscript_kwargs = {}
+    for i, arg in enumerate(args):
+        if isinstance(arg, np.ndarray):
+            input_name = f"input_{i}"
+            input = onnxscript_graph.add_input(
+                input_name,
+                torch.tensor(arg).shape,
+                torch.tensor(arg).dtype,
+            )
+            input.value = arg
+            onnxscript_args.append(input)
+            ort_inputs[input_name] = arg
+        elif isinstance(arg, Sequence):
+            sequence_input = []
+            for j, subarg in enumerate(arg):
+                if isinstance(subarg, np.ndarray):
+                    input_name = f"input_{i}_{j}"
+                    input = onnxscript_graph.add_input(
+                        input_name,
+                        torch.tensor(subarg).shape,
+                        torch.tensor(subarg).dtype,
+                    )
+                    input.value = subarg
+                    sequence_input.append(input)
+                    ort_inputs[input_name] = subarg
+                else:
+                    # Include non-numpy inputs as-is
+                    # For example, it could be a None value that we want to keep
+                    sequence_input.append(subarg)
+            onnxscript_args.append(sequence_input)
+        else:
+            onnxscript_args.append(arg)
+    for key, value in kwargs.items():
+        if isinstance(value, np.ndarray):
+            input = onnxscript_graph.add_input(
+                key,
+                torch.tensor(value).shape,
+                torch.tensor(value).dtype,
+            )
+            input.value = value
+            ort_inputs[key] = value
+            onnxscript_kwargs[key] = input
+        else:
+            onnxscript_kwargs[key] = value
+
+    with onnxscript.evaluator.default_as(tracer):
+        symbolic_outputs = function(*onnxscript_args, **onnxscript_kwargs)
+    if not isinstance(symbolic_outputs, Sequence):
+        symbolic_outputs = (symbolic_outputs,)
+
+    # We need to set the size of the output tensors for the ONNX model to be valid
+    for output, symbolic_output in zip(outputs, symbolic_outputs):
+        if isinstance(output, Sequence):
+            # Output is a sequence, set the type correctly to ListType
+            symbolic_output.dtype = output[0].dtype
+            if isinstance(symbolic_output, onnx_graph_building.OnnxGraphTensor):
+                symbolic_output.is_sequence = True
+            else:
+                symbolic_output.symbolic_value().setType(torch.ListType.ofTensors())
+            continue
+        output = (
+            output if isinstance(output, torch.Tensor) else torch.tensor(output, device="cpu")
+        )
+        symbolic_output.shape = output.shape
+        symbolic_output.dtype = output.dtype
+
+    onnxscript_graph.register_outputs(symbolic_outputs)
+
+    return onnxscript_graph, ort_inputs
+
+
 def graph_executor(
     test_name: str,
     outputs: Sequence[Any],
+    backend: str = "torchscript",
 ) -> Callable[[Callable[..., Any], tuple[Any], dict[str, Any]], None]:
     """Eagerly executes a function."""
 
     def _capture_graph_and_evaluate_torch_script_evaluator(function: Callable, args, kwargs):
         """Captures the graph of a function and evaluates it using TorchScriptEvaluator."""
-
-        # Initialize the ONNX graph
-        onnxscript_graph = graph_building.TorchScriptGraph()
-        tracer = graph_building.TorchScriptTracingEvaluator(onnxscript_graph)
-        ort_inputs = {}
-        onnxscript_args: list[Any] = []
-        onnxscript_kwargs = {}
-        for i, arg in enumerate(args):
-            if isinstance(arg, np.ndarray):
-                input_name = f"input_{i}"
-                input = onnxscript_graph.add_input(
-                    input_name,
-                    torch.tensor(arg).shape,
-                    torch.tensor(arg).dtype,
-                )
-                input.value = arg
-                onnxscript_args.append(input)
-                ort_inputs[input_name] = arg
-            elif isinstance(arg, Sequence):
-                sequence_input = []
-                for j, subarg in enumerate(arg):
-                    if isinstance(subarg, np.ndarray):
-                        input_name = f"input_{i}_{j}"
-                        input = onnxscript_graph.add_input(
-                            input_name,
-                            torch.tensor(subarg).shape,
-                            torch.tensor(subarg).dtype,
-                        )
-                        input.value = subarg
-                        sequence_input.append(input)
-                        ort_inputs[input_name] = subarg
-                    else:
-                        # Include non-numpy inputs as-is
-                        # For example, it could be a None value that we want to keep
-                        sequence_input.append(subarg)
-                onnxscript_args.append(sequence_input)
-            else:
-                onnxscript_args.append(arg)
-        for key, value in kwargs.items():
-            if isinstance(value, np.ndarray):
-                input = onnxscript_graph.add_input(
-                    key,
-                    torch.tensor(value).shape,
-                    torch.tensor(value).dtype,
-                )
-                input.value = value
-                ort_inputs[key] = value
-                onnxscript_kwargs[key] = input
-            else:
-                onnxscript_kwargs[key] = value
-
-        with onnxscript.evaluator.default_as(tracer):
-            symbolic_outputs = function(*onnxscript_args, **onnxscript_kwargs)
-        if not isinstance(symbolic_outputs, Sequence):
-            symbolic_outputs = (symbolic_outputs,)
-
-        # We need to set the size of the output tensors for the ONNX model to be valid
-        for output, symbolic_output in zip(outputs, symbolic_outputs):
-            if isinstance(output, Sequence):
-                # Output is a sequence, set the type correctly to ListType
-                symbolic_output.dtype = output[0].dtype
-                symbolic_output.symbolic_value().setType(torch.ListType.ofTensors())
-                continue
-            output = (
-                output
-                if isinstance(output, torch.Tensor)
-                else torch.tensor(output, device="cpu")
-            )
-            symbolic_output.shape = output.shape
-            symbolic_output.dtype = output.dtype
-
-        onnxscript_graph.register_outputs(symbolic_outputs)
+        onnxscript_graph, ort_inputs = capture_graph(function, args, kwargs, outputs, backend)
 
         onnx_model = onnxscript_graph.to_model_proto(TEST_OPSET_VERSION)
         # Make sure the model is valid
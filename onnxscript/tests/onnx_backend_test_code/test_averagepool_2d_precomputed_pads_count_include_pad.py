@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset19
+
+
+
+@script()
+def bck_test_averagepool_2d_precomputed_pads_count_include_pad(x: FLOAT[1,1,5,5]) -> (FLOAT[1,1,5,5]):
+    
+    y = opset19.AveragePool(x, count_include_pad=1, kernel_shape=[5, 5], pads=[2, 2, 2, 2])
+    return y
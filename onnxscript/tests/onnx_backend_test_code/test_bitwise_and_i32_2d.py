@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import INT32
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_bitwise_and_i32_2d(x: INT32[3,4], y: INT32[3,4]) -> (INT32[3,4]):
+    
+    bitwiseand = opset18.BitwiseAnd(x, y)
+    return bitwiseand
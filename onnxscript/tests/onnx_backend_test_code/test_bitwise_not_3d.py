@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import UINT16
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_bitwise_not_3d(x: UINT16[3,4,5]) -> (UINT16[3,4,5]):
+    
+    bitwise_not = opset18.BitwiseNot(x)
+    return bitwise_not
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import INT8
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_bitwise_or_i16_4d(x: INT8[3,4,5,6], y: INT8[3,4,5,6]) -> (INT8[3,4,5,6]):
+    
+    bitwiseor = opset18.BitwiseOr(x, y)
+    return bitwiseor
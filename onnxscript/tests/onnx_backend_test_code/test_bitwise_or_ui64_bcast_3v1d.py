@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import UINT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_bitwise_or_ui64_bcast_3v1d(x: UINT64[3,4,5], y: UINT64[5]) -> (UINT64[3,4,5]):
+    
+    bitwiseor = opset18.BitwiseOr(x, y)
+    return bitwiseor
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import UINT8
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_bitwise_or_ui8_bcast_4v3d(x: UINT8[3,4,5,6], y: UINT8[4,5,6]) -> (UINT8[3,4,5,6]):
+    
+    bitwiseor = opset18.BitwiseOr(x, y)
+    return bitwiseor
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import INT16
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_bitwise_xor_i16_3d(x: INT16[3,4,5], y: INT16[3,4,5]) -> (INT16[3,4,5]):
+    
+    bitwisexor = opset18.BitwiseXor(x, y)
+    return bitwisexor
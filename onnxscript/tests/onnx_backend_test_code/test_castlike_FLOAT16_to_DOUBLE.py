@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import DOUBLE, FLOAT16
+from onnxscript.onnx_opset import opset19
+
+
+
+@script()
+def bck_test_castlike_FLOAT16_to_DOUBLE(input: FLOAT16[3,4], like: DOUBLE[1]) -> (DOUBLE[3,4]):
+    
+    output = opset19.CastLike(input, like)
+    return output
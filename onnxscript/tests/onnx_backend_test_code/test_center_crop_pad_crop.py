@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_center_crop_pad_crop(x: FLOAT[20,10,3], shape: INT64[3]) -> (FLOAT[10,7,3]):
+    
+    y = opset18.CenterCropPad(x, shape)
+    return y
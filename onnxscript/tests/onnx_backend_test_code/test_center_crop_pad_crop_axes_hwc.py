@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_center_crop_pad_crop_axes_hwc(x: FLOAT[20,8,3], shape: INT64[2]) -> (FLOAT[10,9,3]):
+    
+    y = opset18.CenterCropPad(x, shape, axes=[0, 1])
+    return y
@@ -0,0 +1,29 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_center_crop_pad_pad_expanded(x: FLOAT[10,7,3], shape: INT64[3]) -> (FLOAT[20,10,3]):
+    
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_k2 = opset18.Constant(value=make_tensor("value", 7, dims=[1], vals=[2]))
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_x_shape = opset18.Shape(x)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_padded_sh = opset18.Max(CenterCropPad_test_center_crop_pad_pad_expanded_function_x_shape, shape)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_pad_amount = opset18.Sub(CenterCropPad_test_center_crop_pad_pad_expanded_function_padded_sh, CenterCropPad_test_center_crop_pad_pad_expanded_function_x_shape)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_pad_amount_left = opset18.Div(CenterCropPad_test_center_crop_pad_pad_expanded_function_pad_amount, CenterCropPad_test_center_crop_pad_pad_expanded_function_k2)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_pad_amount_right = opset18.Sub(CenterCropPad_test_center_crop_pad_pad_expanded_function_pad_amount, CenterCropPad_test_center_crop_pad_pad_expanded_function_pad_amount_left)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_pads = opset18.Concat(CenterCropPad_test_center_crop_pad_pad_expanded_function_pad_amount_left, CenterCropPad_test_center_crop_pad_pad_expanded_function_pad_amount_right, axis=0)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_padded_input = opset18.Pad(x, CenterCropPad_test_center_crop_pad_pad_expanded_function_pads)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_x_shape2 = opset18.Shape(CenterCropPad_test_center_crop_pad_pad_expanded_function_padded_input)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_sh_diff = opset18.Sub(CenterCropPad_test_center_crop_pad_pad_expanded_function_x_shape2, shape)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_start_dims = opset18.Div(CenterCropPad_test_center_crop_pad_pad_expanded_function_sh_diff, CenterCropPad_test_center_crop_pad_pad_expanded_function_k2)
+    CenterCropPad_test_center_crop_pad_pad_expanded_function_end_dims = opset18.Add(CenterCropPad_test_center_crop_pad_pad_expanded_function_start_dims, shape)
+    y = opset18.Slice(CenterCropPad_test_center_crop_pad_pad_expanded_function_padded_input, CenterCropPad_test_center_crop_pad_pad_expanded_function_start_dims, CenterCropPad_test_center_crop_pad_pad_expanded_function_end_dims)
+    return y
@@ -0,0 +1,18 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset13
+
+
+
+@script()
+def bck_test_clip_default_max_expanded(x: FLOAT[3,4,5], max: FLOAT) -> (FLOAT[3,4,5]):
+    
+    Clip_test_clip_default_max_expanded_function_input_large_than_max = opset13.Less(max, x)
+    y = opset13.Where(Clip_test_clip_default_max_expanded_function_input_large_than_max, max, x)
+    return y
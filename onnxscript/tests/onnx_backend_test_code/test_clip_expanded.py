@@ -0,0 +1,20 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset13
+
+
+
+@script()
+def bck_test_clip_expanded(x: FLOAT[3,4,5], min: FLOAT, max: FLOAT) -> (FLOAT[3,4,5]):
+    
+    Clip_test_clip_expanded_function_input_less_than_min = opset13.Less(x, min)
+    Clip_test_clip_expanded_function_tmp = opset13.Where(Clip_test_clip_expanded_function_input_less_than_min, min, x)
+    Clip_test_clip_expanded_function_output_large_than_max = opset13.Less(max, Clip_test_clip_expanded_function_tmp)
+    y = opset13.Where(Clip_test_clip_expanded_function_output_large_than_max, max, Clip_test_clip_expanded_function_tmp)
+    return y
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_col2im_5d(input: FLOAT[1,10,12], image_shape: INT64[3], block_shape: INT64[3]) -> (FLOAT[1,2,3,4,5]):
+    
+    output = opset18.Col2Im(input, image_shape, block_shape)
+    return output
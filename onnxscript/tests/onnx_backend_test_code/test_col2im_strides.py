@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_col2im_strides(input: FLOAT[1,9,4], image_shape: INT64[2], block_shape: INT64[2]) -> (FLOAT[1,1,5,5]):
+    
+    output = opset18.Col2Im(input, image_shape, block_shape, strides=[2, 2])
+    return output
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset19
+
+
+
+@script()
+def bck_test_constant_pad_axes(x: FLOAT[1,3,4,5], pads: INT64[4], value: FLOAT, axes: INT64[2]) -> (FLOAT[1,3,4,12]):
+    
+    y = opset19.Pad(x, pads, value, axes, mode='constant')
+    return y
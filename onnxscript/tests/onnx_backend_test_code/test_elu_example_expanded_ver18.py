@@ -0,0 +1,27 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_elu_example_expanded_ver18(x: FLOAT[3]) -> (FLOAT[3]):
+    
+    Elu_test_elu_example_expanded_function_Alpha = opset18.Constant(value_float=2.0)
+    Elu_test_elu_example_expanded_function_AlphaCast = opset18.CastLike(Elu_test_elu_example_expanded_function_Alpha, x)
+    Elu_test_elu_example_expanded_function_Zero = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[0.0]))
+    Elu_test_elu_example_expanded_function_ZeroCast = opset18.CastLike(Elu_test_elu_example_expanded_function_Zero, x)
+    Elu_test_elu_example_expanded_function_One = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[1.0]))
+    Elu_test_elu_example_expanded_function_OneCast = opset18.CastLike(Elu_test_elu_example_expanded_function_One, x)
+    Elu_test_elu_example_expanded_function_XLessThanZero = opset18.Less(x, Elu_test_elu_example_expanded_function_ZeroCast)
+    Elu_test_elu_example_expanded_function_ExpX = opset18.Exp(x)
+    Elu_test_elu_example_expanded_function_ExpXSubOne = opset18.Sub(Elu_test_elu_example_expanded_function_ExpX, Elu_test_elu_example_expanded_function_OneCast)
+    Elu_test_elu_example_expanded_function_AlphaMulExpXSubOne = opset18.Mul(Elu_test_elu_example_expanded_function_AlphaCast, Elu_test_elu_example_expanded_function_ExpXSubOne)
+    y = opset18.Where(Elu_test_elu_example_expanded_function_XLessThanZero, Elu_test_elu_example_expanded_function_AlphaMulExpXSubOne, x)
+    return y
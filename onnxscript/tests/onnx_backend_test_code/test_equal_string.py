@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import BOOL, STRING
+from onnxscript.onnx_opset import opset19
+
+
+
+@script()
+def bck_test_equal_string(x: STRING[2], y: STRING[2]) -> (BOOL[2]):
+    
+    z = opset19.Equal(x, y)
+    return z
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_group_normalization_epsilon(x: FLOAT[3,4,2,2], scale: FLOAT[2], bias: FLOAT[2]) -> (FLOAT[3,4,2,2]):
+    
+    y = opset18.GroupNormalization(x, scale, bias, epsilon=0.009999999776482582, num_groups=2)
+    return y
@@ -0,0 +1,46 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_group_normalization_example_expanded(x: FLOAT[3,4,2,2], scale: FLOAT[2], bias: FLOAT[2]) -> (FLOAT[3,4,2,2]):
+    
+    GroupNormalization_test_group_normalization_example_expanded_function_FloatEpsilon = opset18.Constant(value=make_tensor("value", 1, dims=[1], vals=[9.999999747378752e-06]))
+    GroupNormalization_test_group_normalization_example_expanded_function_Epsilon = opset18.Cast(GroupNormalization_test_group_normalization_example_expanded_function_FloatEpsilon, to=1)
+    GroupNormalization_test_group_normalization_example_expanded_function_XShape = opset18.Shape(x)
+    GroupNormalization_test_group_normalization_example_expanded_function_C = opset18.Shape(x, start=1, end=2)
+    GroupNormalization_test_group_normalization_example_expanded_function_NumGroups = opset18.Constant(value=make_tensor("value", 7, dims=[1], vals=[2]))
+    GroupNormalization_test_group_normalization_example_expanded_function_GroupSize = opset18.Div(GroupNormalization_test_group_normalization_example_expanded_function_C, GroupNormalization_test_group_normalization_example_expanded_function_NumGroups)
+    GroupNormalization_test_group_normalization_example_expanded_function_N = opset18.Shape(x, start=0, end=1)
+    GroupNormalization_test_group_normalization_example_expanded_function_InstanceShape = opset18.Shape(x, start=2)
+    GroupNormalization_test_group_normalization_example_expanded_function_NewShape = opset18.Concat(GroupNormalization_test_group_normalization_example_expanded_function_N, GroupNormalization_test_group_normalization_example_expanded_function_NumGroups, GroupNormalization_test_group_normalization_example_expanded_function_GroupSize, GroupNormalization_test_group_normalization_example_expanded_function_InstanceShape, axis=0)
+    GroupNormalization_test_group_normalization_example_expanded_function_XReshaped = opset18.Reshape(x, GroupNormalization_test_group_normalization_example_expanded_function_NewShape)
+    GroupNormalization_test_group_normalization_example_expanded_function_Shape3D = opset18.Constant(value_ints=[0, 0, -1])
+    GroupNormalization_test_group_normalization_example_expanded_function_X3D = opset18.Reshape(GroupNormalization_test_group_normalization_example_expanded_function_XReshaped, GroupNormalization_test_group_normalization_example_expanded_function_Shape3D)
+    GroupNormalization_test_group_normalization_example_expanded_function_Axes2 = opset18.Constant(value=make_tensor("value", 7, dims=[1], vals=[2]))
+    GroupNormalization_test_group_normalization_example_expanded_function_Mean = opset18.ReduceMean(GroupNormalization_test_group_normalization_example_expanded_function_X3D, GroupNormalization_test_group_normalization_example_expanded_function_Axes2)
+    GroupNormalization_test_group_normalization_example_expanded_function_Square = opset18.Mul(GroupNormalization_test_group_normalization_example_expanded_function_X3D, GroupNormalization_test_group_normalization_example_expanded_function_X3D)
+    GroupNormalization_test_group_normalization_example_expanded_function_MeanOfSquare = opset18.ReduceMean(GroupNormalization_test_group_normalization_example_expanded_function_Square, GroupNormalization_test_group_normalization_example_expanded_function_Axes2)
+    GroupNormalization_test_group_normalization_example_expanded_function_SquareOfMean = opset18.Mul(GroupNormalization_test_group_normalization_example_expanded_function_Mean, GroupNormalization_test_group_normalization_example_expanded_function_Mean)
+    GroupNormalization_test_group_normalization_example_expanded_function_Var = opset18.Sub(GroupNormalization_test_group_normalization_example_expanded_function_MeanOfSquare, GroupNormalization_test_group_normalization_example_expanded_function_SquareOfMean)
+    GroupNormalization_test_group_normalization_example_expanded_function_VarPlusEpsilon = opset18.Add(GroupNormalization_test_group_normalization_example_expanded_function_Var, GroupNormalization_test_group_normalization_example_expanded_function_Epsilon)
+    GroupNormalization_test_group_normalization_example_expanded_function_StdDev = opset18.Sqrt(GroupNormalization_test_group_normalization_example_expanded_function_VarPlusEpsilon)
+    GroupNormalization_test_group_normalization_example_expanded_function_Deviation = opset18.Sub(GroupNormalization_test_group_normalization_example_expanded_function_X3D, GroupNormalization_test_group_normalization_example_expanded_function_Mean)
+    GroupNormalization_test_group_normalization_example_expanded_function_Normalized = opset18.Div(GroupNormalization_test_group_normalization_example_expanded_function_Deviation, GroupNormalization_test_group_normalization_example_expanded_function_StdDev)
+    GroupNormalization_test_group_normalization_example_expanded_function_ScaleShape = opset18.Constant(value_ints=[1, -1, 1])
+    GroupNormalization_test_group_normalization_example_expanded_function_ScaleT = opset18.Cast(scale, to=1)
+    GroupNormalization_test_group_normalization_example_expanded_function_BiasT = opset18.Cast(bias, to=1)
+    GroupNormalization_test_group_normalization_example_expanded_function_ScaleReshaped = opset18.Reshape(GroupNormalization_test_group_normalization_example_expanded_function_ScaleT, GroupNormalization_test_group_normalization_example_expanded_function_ScaleShape)
+    GroupNormalization_test_group_normalization_example_expanded_function_BiasReshaped = opset18.Reshape(GroupNormalization_test_group_normalization_example_expanded_function_BiasT, GroupNormalization_test_group_normalization_example_expanded_function_ScaleShape)
+    GroupNormalization_test_group_normalization_example_expanded_function_Scaled = opset18.Mul(GroupNormalization_test_group_normalization_example_expanded_function_ScaleReshaped, GroupNormalization_test_group_normalization_example_expanded_function_Normalized)
+    GroupNormalization_test_group_normalization_example_expanded_function_Biased = opset18.Add(GroupNormalization_test_group_normalization_example_expanded_function_Scaled, GroupNormalization_test_group_normalization_example_expanded_function_BiasReshaped)
+    y = opset18.Reshape(GroupNormalization_test_group_normalization_example_expanded_function_Biased, GroupNormalization_test_group_normalization_example_expanded_function_XShape)
+    return y
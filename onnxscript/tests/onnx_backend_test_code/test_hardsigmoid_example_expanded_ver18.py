@@ -0,0 +1,28 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_hardsigmoid_example_expanded_ver18(x: FLOAT[3]) -> (FLOAT[3]):
+    
+    HardSigmoid_test_hardsigmoid_example_expanded_function_Alpha = opset18.Constant(value_float=0.5)
+    HardSigmoid_test_hardsigmoid_example_expanded_function_AlphaCast = opset18.CastLike(HardSigmoid_test_hardsigmoid_example_expanded_function_Alpha, x)
+    HardSigmoid_test_hardsigmoid_example_expanded_function_Beta = opset18.Constant(value_float=0.6000000238418579)
+    HardSigmoid_test_hardsigmoid_example_expanded_function_BetaCast = opset18.CastLike(HardSigmoid_test_hardsigmoid_example_expanded_function_Beta, x)
+    HardSigmoid_test_hardsigmoid_example_expanded_function_Zero = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[0.0]))
+    HardSigmoid_test_hardsigmoid_example_expanded_function_ZeroCast = opset18.CastLike(HardSigmoid_test_hardsigmoid_example_expanded_function_Zero, x)
+    HardSigmoid_test_hardsigmoid_example_expanded_function_One = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[1.0]))
+    HardSigmoid_test_hardsigmoid_example_expanded_function_OneCast = opset18.CastLike(HardSigmoid_test_hardsigmoid_example_expanded_function_One, x)
+    HardSigmoid_test_hardsigmoid_example_expanded_function_AlphaMulX = opset18.Mul(x, HardSigmoid_test_hardsigmoid_example_expanded_function_AlphaCast)
+    HardSigmoid_test_hardsigmoid_example_expanded_function_AlphaMulXAddBeta = opset18.Add(HardSigmoid_test_hardsigmoid_example_expanded_function_AlphaMulX, HardSigmoid_test_hardsigmoid_example_expanded_function_BetaCast)
+    HardSigmoid_test_hardsigmoid_example_expanded_function_MinOneOrAlphaMulXAddBeta = opset18.Min(HardSigmoid_test_hardsigmoid_example_expanded_function_AlphaMulXAddBeta, HardSigmoid_test_hardsigmoid_example_expanded_function_OneCast)
+    y = opset18.Max(HardSigmoid_test_hardsigmoid_example_expanded_function_MinOneOrAlphaMulXAddBeta, HardSigmoid_test_hardsigmoid_example_expanded_function_ZeroCast)
+    return y
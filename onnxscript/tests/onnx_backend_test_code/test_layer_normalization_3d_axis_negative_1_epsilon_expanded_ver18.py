@@ -0,0 +1,47 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_ver18(X: FLOAT[2,3,5], W: FLOAT[5], B: FLOAT[5]) -> (FLOAT[2,3,5], FLOAT[2,3,1], FLOAT[2,3,1]):
+    
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_FloatEpsilon = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[0.10000000149011612]))
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Epsilon = opset18.Cast(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_FloatEpsilon, to=1)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_XShape = opset18.Shape(X)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Rank = opset18.Size(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_XShape)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Zero1D = opset18.Constant(value=make_tensor("value", 7, dims=[1], vals=[0]))
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Axis1D = opset18.Constant(value=make_tensor("value", 7, dims=[1], vals=[-1]))
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_PrefixShape = opset18.Slice(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_XShape, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Zero1D, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Axis1D)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_NumReducedAxes = opset18.Neg(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Axis1D)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_SuffixShape = opset18.ConstantOfShape(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_NumReducedAxes, value=make_tensor("value", 7, dims=[1], vals=[1]))
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_ReducedShape = opset18.Concat(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_PrefixShape, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_SuffixShape, axis=0)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_X2D = opset18.Flatten(X, axis=-1)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_XU = opset18.Cast(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_X2D, to=1)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Axes_1 = opset18.Constant(value=make_tensor("value", 7, dims=[1], vals=[1]))
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Mean2D = opset18.ReduceMean(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_XU, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Axes_1)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Square = opset18.Mul(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_XU, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_XU)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_MeanOfSquare = opset18.ReduceMean(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Square, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Axes_1)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_SquareOfMean = opset18.Mul(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Mean2D, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Mean2D)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Var = opset18.Sub(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_MeanOfSquare, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_SquareOfMean)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_VarPlusEpsilon = opset18.Add(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Var, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Epsilon)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_StdDev = opset18.Sqrt(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_VarPlusEpsilon)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Deviation = opset18.Sub(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_XU, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Mean2D)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Normalized = opset18.Div(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Deviation, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_StdDev)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_NormalizedT = opset18.Cast(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Normalized, to=1)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Scale2D = opset18.Flatten(W, axis=0)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Scaled = opset18.Mul(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_NormalizedT, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Scale2D)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_B2D = opset18.Flatten(B, axis=0)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Biased = opset18.Add(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Scaled, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_B2D)
+    Y = opset18.Reshape(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Biased, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_XShape)
+    LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_InvStdDev2D = opset18.Reciprocal(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_StdDev)
+    Mean = opset18.Reshape(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_Mean2D, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_ReducedShape)
+    InvStdDev = opset18.Reshape(LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_InvStdDev2D, LayerNormalization_test_layer_normalization_3d_axis_negative_1_epsilon_expanded_function_ReducedShape)
+    return Y, Mean, InvStdDev
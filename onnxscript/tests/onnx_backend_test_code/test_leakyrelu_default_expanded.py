@@ -0,0 +1,23 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset16
+
+
+
+@script()
+def bck_test_leakyrelu_default_expanded(x: FLOAT[3,4,5]) -> (FLOAT[3,4,5]):
+    
+    LeakyRelu_test_leakyrelu_default_expanded_function_Alpha = opset16.Constant(value_float=0.009999999776482582)
+    LeakyRelu_test_leakyrelu_default_expanded_function_AlphaCast = opset16.CastLike(LeakyRelu_test_leakyrelu_default_expanded_function_Alpha, x)
+    LeakyRelu_test_leakyrelu_default_expanded_function_Zero = opset16.Constant(value=make_tensor("value", 1, dims=[], vals=[0.0]))
+    LeakyRelu_test_leakyrelu_default_expanded_function_ZeroCast = opset16.CastLike(LeakyRelu_test_leakyrelu_default_expanded_function_Zero, x)
+    LeakyRelu_test_leakyrelu_default_expanded_function_XLessThanZero = opset16.Less(x, LeakyRelu_test_leakyrelu_default_expanded_function_ZeroCast)
+    LeakyRelu_test_leakyrelu_default_expanded_function_AlphaMulX = opset16.Mul(LeakyRelu_test_leakyrelu_default_expanded_function_AlphaCast, x)
+    y = opset16.Where(LeakyRelu_test_leakyrelu_default_expanded_function_XLessThanZero, LeakyRelu_test_leakyrelu_default_expanded_function_AlphaMulX, x)
+    return y
@@ -0,0 +1,23 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_logsoftmax_axis_1_expanded_ver18(x: FLOAT[3,4,5]) -> (FLOAT[3,4,5]):
+    
+    LogSoftmax_test_logsoftmax_axis_1_expanded_function_axes = opset18.Constant(value=make_tensor("value", 7, dims=[1], vals=[1]))
+    LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_ReduceMax = opset18.ReduceMax(x, LogSoftmax_test_logsoftmax_axis_1_expanded_function_axes, keepdims=1)
+    LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_Sub = opset18.Sub(x, LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_ReduceMax)
+    LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_Exp = opset18.Exp(LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_Sub)
+    LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_ReduceSum = opset18.ReduceSum(LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_Exp, LogSoftmax_test_logsoftmax_axis_1_expanded_function_axes, keepdims=1)
+    LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_Log = opset18.Log(LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_ReduceSum)
+    y = opset18.Sub(LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_Sub, LogSoftmax_test_logsoftmax_axis_1_expanded_function_X_Log)
+    return y
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_lppool_1d_default(x: FLOAT[1,3,32]) -> (FLOAT[1,3,31]):
+    
+    y = opset18.LpPool(x, kernel_shape=[2], p=3, strides=[1])
+    return y
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_lppool_2d_strides(x: FLOAT[1,3,32,32]) -> (FLOAT[1,3,10,10]):
+    
+    y = opset18.LpPool(x, kernel_shape=[5, 5], p=2, strides=[3, 3])
+    return y
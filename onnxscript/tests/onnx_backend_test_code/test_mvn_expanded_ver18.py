@@ -0,0 +1,28 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_mvn_expanded_ver18(X: FLOAT[3,3,3,1]) -> (FLOAT[3,3,3,1]):
+    
+    MeanVarianceNormalization_test_mvn_expanded_function_Exponent = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[2.0]))
+    MeanVarianceNormalization_test_mvn_expanded_function_Epsilon = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[9.999999717180685e-10]))
+    MeanVarianceNormalization_test_mvn_expanded_function_axes = opset18.Constant(value_ints=[0, 2, 3])
+    MeanVarianceNormalization_test_mvn_expanded_function_X_RM = opset18.ReduceMean(X, MeanVarianceNormalization_test_mvn_expanded_function_axes)
+    MeanVarianceNormalization_test_mvn_expanded_function_EX_squared = opset18.Pow(MeanVarianceNormalization_test_mvn_expanded_function_X_RM, MeanVarianceNormalization_test_mvn_expanded_function_Exponent)
+    MeanVarianceNormalization_test_mvn_expanded_function_X_squared = opset18.Pow(X, MeanVarianceNormalization_test_mvn_expanded_function_Exponent)
+    MeanVarianceNormalization_test_mvn_expanded_function_E_Xsquared = opset18.ReduceMean(MeanVarianceNormalization_test_mvn_expanded_function_X_squared, MeanVarianceNormalization_test_mvn_expanded_function_axes)
+    MeanVarianceNormalization_test_mvn_expanded_function_Variance = opset18.Sub(MeanVarianceNormalization_test_mvn_expanded_function_E_Xsquared, MeanVarianceNormalization_test_mvn_expanded_function_EX_squared)
+    MeanVarianceNormalization_test_mvn_expanded_function_STD = opset18.Sqrt(MeanVarianceNormalization_test_mvn_expanded_function_Variance)
+    MeanVarianceNormalization_test_mvn_expanded_function_X_variance = opset18.Sub(X, MeanVarianceNormalization_test_mvn_expanded_function_X_RM)
+    MeanVarianceNormalization_test_mvn_expanded_function_Processed_STD = opset18.Add(MeanVarianceNormalization_test_mvn_expanded_function_STD, MeanVarianceNormalization_test_mvn_expanded_function_Epsilon)
+    Y = opset18.Div(MeanVarianceNormalization_test_mvn_expanded_function_X_variance, MeanVarianceNormalization_test_mvn_expanded_function_Processed_STD)
+    return Y
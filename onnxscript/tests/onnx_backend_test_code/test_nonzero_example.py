@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import BOOL, INT64
+from onnxscript.onnx_opset import opset13
+
+
+
+@script()
+def bck_test_nonzero_example(condition: BOOL[2,2]) -> (INT64[2,3]):
+    
+    result = opset13.NonZero(condition)
+    return result
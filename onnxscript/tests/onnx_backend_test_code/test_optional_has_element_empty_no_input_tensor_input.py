@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import BOOL
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_optional_has_element_empty_no_input_tensor_input() -> (BOOL):
+    
+    output = opset18.OptionalHasElement()
+    return output
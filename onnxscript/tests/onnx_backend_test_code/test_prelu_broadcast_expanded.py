@@ -0,0 +1,21 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset16
+
+
+
+@script()
+def bck_test_prelu_broadcast_expanded(x: FLOAT[3,4,5], slope: FLOAT[5]) -> (FLOAT[3,4,5]):
+    
+    PRelu_test_prelu_broadcast_expanded_function_Zero = opset16.Constant(value=make_tensor("value", 1, dims=[], vals=[0.0]))
+    PRelu_test_prelu_broadcast_expanded_function_ZeroCast = opset16.CastLike(PRelu_test_prelu_broadcast_expanded_function_Zero, x)
+    PRelu_test_prelu_broadcast_expanded_function_XLessThanZero = opset16.Less(x, PRelu_test_prelu_broadcast_expanded_function_ZeroCast)
+    PRelu_test_prelu_broadcast_expanded_function_SlopeMulX = opset16.Mul(slope, x)
+    y = opset16.Where(PRelu_test_prelu_broadcast_expanded_function_XLessThanZero, PRelu_test_prelu_broadcast_expanded_function_SlopeMulX, x)
+    return y
@@ -0,0 +1,18 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_reduce_l1_keep_dims_example_expanded(data: FLOAT[3,2,2], axes: INT64[1]) -> (FLOAT[3,2,1]):
+    
+    ReduceL1_test_reduce_l1_keep_dims_example_expanded_function_data_abs = opset18.Abs(data)
+    reduced = opset18.ReduceSum(ReduceL1_test_reduce_l1_keep_dims_example_expanded_function_data_abs, axes, keepdims=1)
+    return reduced
@@ -0,0 +1,21 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_reduce_l2_negative_axes_keep_dims_example_expanded(data: FLOAT[3,2,2], axes: INT64[1]) -> (FLOAT[3,2,1]):
+    
+    ReduceL2_test_reduce_l2_negative_axes_keep_dims_example_expanded_function_data_square = opset18.Mul(data, data)
+    ReduceL2_test_reduce_l2_negative_axes_keep_dims_example_expanded_function_sum_square = opset18.ReduceSum(ReduceL2_test_reduce_l2_negative_axes_keep_dims_example_expanded_function_data_square, axes, keepdims=1)
+    ReduceL2_test_reduce_l2_negative_axes_keep_dims_example_expanded_function_sum_square_dbl = opset18.Cast(ReduceL2_test_reduce_l2_negative_axes_keep_dims_example_expanded_function_sum_square, to=1)
+    ReduceL2_test_reduce_l2_negative_axes_keep_dims_example_expanded_function_sqrt = opset18.Sqrt(ReduceL2_test_reduce_l2_negative_axes_keep_dims_example_expanded_function_sum_square_dbl)
+    reduced = opset18.CastLike(ReduceL2_test_reduce_l2_negative_axes_keep_dims_example_expanded_function_sqrt, data)
+    return reduced
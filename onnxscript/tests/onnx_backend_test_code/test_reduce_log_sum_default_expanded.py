@@ -0,0 +1,18 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_reduce_log_sum_default_expanded(data: FLOAT[3,4,5], axes: INT64[0]) -> (FLOAT[1,1,1]):
+    
+    ReduceLogSum_test_reduce_log_sum_default_expanded_function_reduced_sum = opset18.ReduceSum(data, axes, keepdims=1)
+    reduced = opset18.Log(ReduceLogSum_test_reduce_log_sum_default_expanded_function_reduced_sum)
+    return reduced
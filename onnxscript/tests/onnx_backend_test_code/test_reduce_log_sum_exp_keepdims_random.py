@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import DOUBLE, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_reduce_log_sum_exp_keepdims_random(data: DOUBLE[3,2,2], axes: INT64[1]) -> (DOUBLE[3,1,2]):
+    
+    reduced = opset18.ReduceLogSumExp(data, axes, keepdims=1)
+    return reduced
@@ -0,0 +1,21 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import DOUBLE, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_reduce_log_sum_exp_negative_axes_keepdims_example_expanded(data: DOUBLE[3,2,2], axes: INT64[1]) -> (DOUBLE[3,1,2]):
+    
+    ReduceLogSumExp_test_reduce_log_sum_exp_negative_axes_keepdims_example_expanded_function_data_double = opset18.Cast(data, to=11)
+    ReduceLogSumExp_test_reduce_log_sum_exp_negative_axes_keepdims_example_expanded_function_data_exp = opset18.Exp(ReduceLogSumExp_test_reduce_log_sum_exp_negative_axes_keepdims_example_expanded_function_data_double)
+    ReduceLogSumExp_test_reduce_log_sum_exp_negative_axes_keepdims_example_expanded_function_reduced_sum = opset18.ReduceSum(ReduceLogSumExp_test_reduce_log_sum_exp_negative_axes_keepdims_example_expanded_function_data_exp, axes, keepdims=1)
+    ReduceLogSumExp_test_reduce_log_sum_exp_negative_axes_keepdims_example_expanded_function_reduced_double = opset18.Log(ReduceLogSumExp_test_reduce_log_sum_exp_negative_axes_keepdims_example_expanded_function_reduced_sum)
+    reduced = opset18.CastLike(ReduceLogSumExp_test_reduce_log_sum_exp_negative_axes_keepdims_example_expanded_function_reduced_double, data)
+    return reduced
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_reduce_log_sum_negative_axes(data: FLOAT[3,4,5], axes: INT64[1]) -> (FLOAT[3,1,5]):
+    
+    reduced = opset18.ReduceLogSum(data, axes)
+    return reduced
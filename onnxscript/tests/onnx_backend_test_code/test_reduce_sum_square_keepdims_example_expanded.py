@@ -0,0 +1,18 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_reduce_sum_square_keepdims_example_expanded(data: FLOAT[3,2,2], axes: INT64[1]) -> (FLOAT[3,1,2]):
+    
+    ReduceSumSquare_test_reduce_sum_square_keepdims_example_expanded_function_data_square = opset18.Mul(data, data)
+    reduced = opset18.ReduceSum(ReduceSumSquare_test_reduce_sum_square_keepdims_example_expanded_function_data_square, axes, keepdims=1)
+    return reduced
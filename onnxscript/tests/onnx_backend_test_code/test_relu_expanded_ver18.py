@@ -0,0 +1,19 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_relu_expanded_ver18(x: FLOAT[3,4,5]) -> (FLOAT[3,4,5]):
+    
+    Relu_test_relu_expanded_function_Zero = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[0.0]))
+    Relu_test_relu_expanded_function_ZeroCast = opset18.CastLike(Relu_test_relu_expanded_function_Zero, x)
+    y = opset18.Max(x, Relu_test_relu_expanded_function_ZeroCast)
+    return y
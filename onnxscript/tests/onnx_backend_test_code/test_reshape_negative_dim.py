@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset19
+
+
+
+@script()
+def bck_test_reshape_negative_dim(data: FLOAT[2,3,4], shape: INT64[3]) -> (FLOAT[2,6,2]):
+    
+    reshaped = opset19.Reshape(data, shape)
+    return reshaped
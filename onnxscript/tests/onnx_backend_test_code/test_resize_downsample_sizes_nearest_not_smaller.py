@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset19
+
+
+
+@script()
+def bck_test_resize_downsample_sizes_nearest_not_smaller(X: FLOAT[1,1,2,4], sizes: INT64[2]) -> (FLOAT[1,1,2,3]):
+    
+    Y = opset19.Resize(X, None, None, sizes, axes=[2, 3], keep_aspect_ratio_policy='not_smaller', mode='nearest')
+    return Y
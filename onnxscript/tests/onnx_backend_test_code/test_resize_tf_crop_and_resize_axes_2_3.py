@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset19
+
+
+
+@script()
+def bck_test_resize_tf_crop_and_resize_axes_2_3(X: FLOAT[1,1,4,4], roi: FLOAT[4], sizes: INT64[2]) -> (FLOAT[1,1,3,3]):
+    
+    Y = opset19.Resize(X, roi, None, sizes, axes=[2, 3], coordinate_transformation_mode='tf_crop_and_resize', mode='linear')
+    return Y
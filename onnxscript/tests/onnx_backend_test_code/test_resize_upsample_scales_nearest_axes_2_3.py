@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset19
+
+
+
+@script()
+def bck_test_resize_upsample_scales_nearest_axes_2_3(X: FLOAT[1,1,2,2], scales: FLOAT[2]) -> (FLOAT[1,1,4,6]):
+    
+    Y = opset19.Resize(X, None, scales, axes=[2, 3], mode='nearest')
+    return Y
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset16
+
+
+
+@script()
+def bck_test_roialign_mode_max(X: FLOAT[1,1,10,10], rois: FLOAT[3,4], batch_indices: INT64[3]) -> (FLOAT[3,1,5,5]):
+    
+    Y = opset16.RoiAlign(X, rois, batch_indices, coordinate_transformation_mode='output_half_pixel', mode='max', output_height=5, output_width=5, sampling_ratio=2, spatial_scale=1.0)
+    return Y
@@ -0,0 +1,29 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_selu_expanded_ver18(x: FLOAT[3,4,5]) -> (FLOAT[3,4,5]):
+    
+    Selu_test_selu_expanded_function_Alpha = opset18.Constant(value_float=2.0)
+    Selu_test_selu_expanded_function_AlphaCast = opset18.CastLike(Selu_test_selu_expanded_function_Alpha, x)
+    Selu_test_selu_expanded_function_Gamma = opset18.Constant(value_float=3.0)
+    Selu_test_selu_expanded_function_GammaCast = opset18.CastLike(Selu_test_selu_expanded_function_Gamma, x)
+    Selu_test_selu_expanded_function_Zero = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[0.0]))
+    Selu_test_selu_expanded_function_ZeroCast = opset18.CastLike(Selu_test_selu_expanded_function_Zero, x)
+    Selu_test_selu_expanded_function_ExpX = opset18.Exp(x)
+    Selu_test_selu_expanded_function_AlphaMulExpX = opset18.Mul(Selu_test_selu_expanded_function_AlphaCast, Selu_test_selu_expanded_function_ExpX)
+    Selu_test_selu_expanded_function_AlphaMulExpXSubAlpha = opset18.Sub(Selu_test_selu_expanded_function_AlphaMulExpX, Selu_test_selu_expanded_function_AlphaCast)
+    Selu_test_selu_expanded_function_Neg = opset18.Mul(Selu_test_selu_expanded_function_GammaCast, Selu_test_selu_expanded_function_AlphaMulExpXSubAlpha)
+    Selu_test_selu_expanded_function_Pos = opset18.Mul(Selu_test_selu_expanded_function_GammaCast, x)
+    Selu_test_selu_expanded_function_XLessThanZero = opset18.Less(x, Selu_test_selu_expanded_function_ZeroCast)
+    y = opset18.Where(Selu_test_selu_expanded_function_XLessThanZero, Selu_test_selu_expanded_function_Neg, Selu_test_selu_expanded_function_Pos)
+    return y
@@ -0,0 +1,17 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT, INT64
+from onnxscript.onnx_opset import opset19
+
+
+
+@script()
+def bck_test_shape_end_negative_1(x: FLOAT[3,4,5]) -> (INT64[2]):
+    
+    y = opset19.Shape(x, end=-1)
+    return y
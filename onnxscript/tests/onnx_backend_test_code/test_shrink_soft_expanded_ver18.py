@@ -0,0 +1,29 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_shrink_soft_expanded_ver18(x: FLOAT[5]) -> (FLOAT[5]):
+    
+    Shrink_test_shrink_soft_expanded_function_Lambd = opset18.Constant(value_float=1.5)
+    Shrink_test_shrink_soft_expanded_function_LambdCast = opset18.CastLike(Shrink_test_shrink_soft_expanded_function_Lambd, x)
+    Shrink_test_shrink_soft_expanded_function_Bias = opset18.Constant(value_float=1.5)
+    Shrink_test_shrink_soft_expanded_function_BiasCast = opset18.CastLike(Shrink_test_shrink_soft_expanded_function_Bias, x)
+    Shrink_test_shrink_soft_expanded_function_Zero = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[0.0]))
+    Shrink_test_shrink_soft_expanded_function_ZeroCast = opset18.CastLike(Shrink_test_shrink_soft_expanded_function_Zero, x)
+    Shrink_test_shrink_soft_expanded_function_NegLmbda = opset18.Neg(Shrink_test_shrink_soft_expanded_function_LambdCast)
+    Shrink_test_shrink_soft_expanded_function_InputLessThanNegLambda = opset18.Less(x, Shrink_test_shrink_soft_expanded_function_NegLmbda)
+    Shrink_test_shrink_soft_expanded_function_InputAddBias = opset18.Add(x, Shrink_test_shrink_soft_expanded_function_BiasCast)
+    Shrink_test_shrink_soft_expanded_function_InputSubBias = opset18.Sub(x, Shrink_test_shrink_soft_expanded_function_BiasCast)
+    Shrink_test_shrink_soft_expanded_function_LambdaLessThanInput = opset18.Less(Shrink_test_shrink_soft_expanded_function_LambdCast, x)
+    Shrink_test_shrink_soft_expanded_function_InputSubBiasOrZero = opset18.Where(Shrink_test_shrink_soft_expanded_function_LambdaLessThanInput, Shrink_test_shrink_soft_expanded_function_InputSubBias, Shrink_test_shrink_soft_expanded_function_ZeroCast)
+    y = opset18.Where(Shrink_test_shrink_soft_expanded_function_InputLessThanNegLambda, Shrink_test_shrink_soft_expanded_function_InputAddBias, Shrink_test_shrink_soft_expanded_function_InputSubBiasOrZero)
+    return y
@@ -0,0 +1,22 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_softmax_axis_2_expanded_ver18(x: FLOAT[3,4,5]) -> (FLOAT[3,4,5]):
+    
+    Softmax_test_softmax_axis_2_expanded_function_axes = opset18.Constant(value=make_tensor("value", 7, dims=[1], vals=[2]))
+    Softmax_test_softmax_axis_2_expanded_function_X_ReduceMax = opset18.ReduceMax(x, Softmax_test_softmax_axis_2_expanded_function_axes, keepdims=1)
+    Softmax_test_softmax_axis_2_expanded_function_X_Sub = opset18.Sub(x, Softmax_test_softmax_axis_2_expanded_function_X_ReduceMax)
+    Softmax_test_softmax_axis_2_expanded_function_X_Exp = opset18.Exp(Softmax_test_softmax_axis_2_expanded_function_X_Sub)
+    Softmax_test_softmax_axis_2_expanded_function_X_ReduceSum = opset18.ReduceSum(Softmax_test_softmax_axis_2_expanded_function_X_Exp, Softmax_test_softmax_axis_2_expanded_function_axes, keepdims=1)
+    y = opset18.Div(Softmax_test_softmax_axis_2_expanded_function_X_Exp, Softmax_test_softmax_axis_2_expanded_function_X_ReduceSum)
+    return y
@@ -0,0 +1,21 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_softplus_expanded_ver18(x: FLOAT[3,4,5]) -> (FLOAT[3,4,5]):
+    
+    Softplus_test_softplus_expanded_function_exp_x = opset18.Exp(x)
+    Softplus_test_softplus_expanded_function_one = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[1.0]))
+    Softplus_test_softplus_expanded_function_one_cast = opset18.CastLike(Softplus_test_softplus_expanded_function_one, x)
+    Softplus_test_softplus_expanded_function_exp_x_add_one = opset18.Add(Softplus_test_softplus_expanded_function_exp_x, Softplus_test_softplus_expanded_function_one_cast)
+    y = opset18.Log(Softplus_test_softplus_expanded_function_exp_x_add_one)
+    return y
@@ -0,0 +1,21 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_softsign_example_expanded_ver18(x: FLOAT[3]) -> (FLOAT[3]):
+    
+    Softsign_test_softsign_example_expanded_function_One = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[1.0]))
+    Softsign_test_softsign_example_expanded_function_OneCast = opset18.CastLike(Softsign_test_softsign_example_expanded_function_One, x)
+    Softsign_test_softsign_example_expanded_function_AbsInput = opset18.Abs(x)
+    Softsign_test_softsign_example_expanded_function_OneAddAbsInput = opset18.Add(Softsign_test_softsign_example_expanded_function_OneCast, Softsign_test_softsign_example_expanded_function_AbsInput)
+    y = opset18.Div(x, Softsign_test_softsign_example_expanded_function_OneAddAbsInput)
+    return y
@@ -0,0 +1,22 @@
+
+import numpy
+from onnx import TensorProto
+from onnx.helper import make_tensor
+from onnxscript import script, external_tensor
+from onnxscript.values import Opset
+
+from onnxscript.onnx_types import FLOAT
+from onnxscript.onnx_opset import opset18
+
+
+
+@script()
+def bck_test_thresholdedrelu_example_expanded_ver18(x: FLOAT[5]) -> (FLOAT[5]):
+    
+    ThresholdedRelu_test_thresholdedrelu_example_expanded_function_Alpha = opset18.Constant(value_float=2.0)
+    ThresholdedRelu_test_thresholdedrelu_example_expanded_function_AlphaCast = opset18.CastLike(ThresholdedRelu_test_thresholdedrelu_example_expanded_function_Alpha, x)
+    ThresholdedRelu_test_thresholdedrelu_example_expanded_function_Zero = opset18.Constant(value=make_tensor("value", 1, dims=[], vals=[0.0]))
+    ThresholdedRelu_test_thresholdedrelu_example_expanded_function_ZeroCast = opset18.CastLike(ThresholdedRelu_test_thresholdedrelu_example_expanded_function_Zero, x)
+    ThresholdedRelu_test_thresholdedrelu_example_expanded_function_AlphaLessThanX = opset18.Less(ThresholdedRelu_test_thresholdedrelu_example_expanded_function_AlphaCast, x)
+    y = opset18.Where(ThresholdedRelu_test_thresholdedrelu_example_expanded_function_AlphaLessThanX, x, ThresholdedRelu_test_thresholdedrelu_example_expanded_function_ZeroCast)
+    return y
@@ -11,14 +11,18 @@ import types
 import typing
 from enum import IntFlag
 from typing import _GenericAlias  # type: ignore[attr-defined]
-from typing import Any, ClassVar, Optional, Protocol, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Optional, Protocol, Sequence
 
 import onnx
 import onnx.defs
 
 from onnxscript import converter as converter_module
 from onnxscript import irbuilder, sourceinfo, type_annotation
-from onnxscript._internal import ast_utils
+from onnxscript._internal import ast_utils, param_manipulation
+
+if TYPE_CHECKING:
+    # function_cache depends on this module
+    from onnxscript.function_cache import CacheEntry
 
 _ATTRIBUTE_TYPE_TO_PYTHON_TYPE = {
     onnx.defs.OpSchema.AttrType.FLOAT: float,
@@ -65,6 +69,11 @@ class Opset:
         instance.domain = domain  # type: ignore[attr-defined]
         instance.version = version  # type: ignore[attr-defined]
         instance.function_defs = {}  # type: ignore[attr-defined]
+        # Lazily populated caches of schema lookups and Op objects.
+        # key: op name; value: the OpSchema found in the ONNX schema registry
+        instance._schemas = {}  # type: ignore[attr-defined]
+        # key: (op name, since_version of the OpSchema)
+        instance._ops = {}  # type: ignore[attr-defined]
         cls.cache[key] = instance
         return instance
 
@@ -75,28 +84,54 @@ class Opset:
     def __repr__(self):
         return f"{self.__class__.__name__}({self.domain!r}, {self.version!r})"
 
-    def __getitem__(self, opname):
+    def _lookup_schema(self, opname: str) -> Optional[onnx.defs.OpSchema]:
+        """Returns the OpSchema of an op in this opset, or None if there is not one.
+
+        The schemas found in the ONNX schema registry are cached. Misses are not, as
+        the schema may be registered later.
+        """
+        schemas: dict[str, onnx.defs.OpSchema] = self._schemas  # type: ignore[attr-defined]
+        schema = schemas.get(opname)
+        if schema is not None:
+            return schema
         try:
-            return onnx.defs.get_schema(opname, self.version, self.domain)
+            schema = onnx.defs.get_schema(opname, self.version, self.domain)
         except Exception:  # pylint: disable=broad-except # TODO: more specific exception
             return None
+        schemas[opname] = schema
+        return schema
+
+    def _get_op(self, opname: str, version: int) -> Op:
+        """Returns the Op for the version of an op defined in a given opset version.
+
+        Used by the static opset code generator. Op objects are created once and cached.
+        """
+        ops: dict[tuple[str, int], Op] = self._ops  # type: ignore[attr-defined]
+        key = (opname, version)
+        op = ops.get(key)
+        if op is None:
+            op = Op(self, opname, onnx.defs.get_schema(opname, version, self.domain))
+            ops[key] = op
+        return op
+
+    def __getitem__(self, opname):
+        return self._lookup_schema(opname)
 
     def __contains__(self, opname):
-        try:
-            onnx.defs.get_schema(opname, self.version, self.domain)
-            return True
-        except Exception:  # pylint: disable=broad-except # TODO: more specific exception
-            return False
+        return self._lookup_schema(opname) is not None
 
     def __str__(self) -> str:
         return self.domain
 
     def __getattr__(self, attr: str):
-        try:
-            schema = onnx.defs.get_schema(attr, self.version, self.domain)
-            return Op(self, attr, schema)
-        except Exception as exc:
-            raise AttributeError(f"Attribute {attr} not found.") from exc
+        if attr.startswith("__") or attr in {"_schemas", "_ops"}:
+            # Avoid looking up schemas for special attributes (e.g. when copying or
+            # pickling) and for the caches themselves
+            raise AttributeError(f"Attribute {attr} not found.")
+        schema = self._lookup_schema(attr)
+        if schema is None:
+            raise AttributeError(f"Attribute {attr} not found.")
+        return self._get_op(attr, schema.since_version)
 
     def add_function_def(self, fun):
         if fun.name in self.function_defs:
@@ -276,6 +311,7 @@ class Op(OpLike):
         self._name = opname
         self._op_schema = op_schema or opset[opname]
         self._param_schemas: Optional[tuple[ParamSchema, ...]] = None
+        self._param_binder: Optional[param_manipulation.ParamBinder] = None
 
         if self._op_schema is None:
             logging.debug(
@@ -324,6 +360,21 @@ class Op(OpLike):
         self._param_schemas = param_schemas_from_op_schema(op_schema)
         return self._param_schemas
 
+    def param_binder(self) -> Optional[param_manipulation.ParamBinder]:
+        """Returns the binder of the arguments of calls to this op, if it has parameter schemas.
+
+        The binder is compiled from :meth:`param_schemas` on the first call.
+        """
+        if self._param_binder is not None:
+            return self._param_binder
+
+        param_schemas = self.param_schemas()
+        if param_schemas is None:
+            return None
+
+        self._param_binder = param_manipulation.ParamBinder(param_schemas)
+        return self._param_binder
+
 
 @dataclasses.dataclass(repr=False, eq=False)
 class OnnxClosure:
@@ -472,6 +523,7 @@ class OnnxFunction(Op):
         self.kwargs = kwargs
         self._param_schemas: Optional[tuple[ParamSchema, ...]] = None
         self._op_schema: Optional[onnx.defs.OpSchema] = None
+        self._function_proto: Optional[onnx.FunctionProto] = None
 
     @property
     def op_schema(self) -> Optional[onnx.defs.OpSchema]:
@@ -507,6 +559,29 @@ class OnnxFunction(Op):
 
         return evaluator.default().eval_function(self, args, kwargs)
 
+    def map_batch(
+        self, inputs: Iterable[Any], batch_size: int = 64, **kwargs: Any
+    ) -> list[Any]:
+        """Evaluates the function on many samples with ONNX Runtime.
+
+        Samples with inputs of the same types and shapes are stacked and evaluated
+        together when the function only computes elementwise ops, and one by one
+        otherwise. See :func:`onnxscript.evaluator.map_batch`.
+
+        Args:
+            inputs: The samples. Each sample is a tuple of positional arguments to the
+                function, or a single argument.
+            batch_size: The maximum number of samples evaluated together.
+            kwargs: Keyword arguments passed to the function for every sample.
+
+        Returns:
+            The outputs of the function for each sample, in the order of the samples.
+        """
+        # FIXME(after #225): Move import to the top of the file.
+        from onnxscript import evaluator  # pylint: disable=import-outside-toplevel
+
+        return evaluator.map_batch(self, inputs, batch_size, **kwargs)
+
     def param_schemas(self) -> tuple[ParamSchema, ...]:
         """Returns the parameter schemas of this function."""
         if self._param_schemas is not None:
@@ -518,10 +593,40 @@ class OnnxFunction(Op):
         self._param_schemas = param_schemas_from_function_ir(self.function_ir)
         return self._param_schemas
 
-    def to_function_proto(self):
-        """Converts the function into :class:`onnx.FunctionProto`."""
+    def _build_function_proto(self) -> onnx.FunctionProto:
         return self.function_ir.to_function_proto()
 
+    def to_function_proto(self) -> onnx.FunctionProto:
+        """Converts the function into :class:`onnx.FunctionProto`.
+
+        The FunctionProto is built on the first call. Each call returns a copy of it,
+        which the caller is free to modify.
+        """
+        if self._function_proto is None:
+            self._function_proto = self._build_function_proto()
+        function_proto = onnx.FunctionProto()
+        function_proto.CopyFrom(self._function_proto)
+        return function_proto
+
+    def optimize(
+        self, passes: Optional[Sequence[str]] = None, disable: Sequence[str] = ()
+    ) -> list[Any]:
+        """Optimizes the IR of the function before it is converted to a FunctionProto.
+
+        Args:
+            passes: The names of the passes to run, in order. Defaults to all the
+                passes in :data:`onnxscript.optimizer.PASSES`.
+            disable: The names of passes not to run.
+
+        Returns:
+            The :class:`onnxscript.optimizer.PassResult` of each pass.
+        """
+        from onnxscript import optimizer  # pylint: disable=import-outside-toplevel
+
+        results = optimizer.PassManager(passes, disable).run(self.function_ir)
+        self._function_proto = None
+        return results
+
     def to_model_proto(self, **kwargs):
         """Converts the function into :class:`onnx.ModelProto`."""
         if self.function_ir.attrs and any(
@@ -540,6 +645,163 @@ class OnnxFunction(Op):
         return self.function_ir.to_model_proto(**merged_kw_args)
 
 
+class LazyOnnxFunction(OnnxFunction):
+    """An OnnxFunction that is converted from its Python source on first use.
+
+    Parsing the source and converting it into an :class:`irbuilder.IRFunction` is
+    deferred until :attr:`function_ir` or :attr:`source` is first accessed, which
+    happens when the function is called, when its schemas or protos are requested,
+    or when it is called from another function being converted. Conversion errors
+    are therefore reported at first use instead of at definition time.
+
+    The globals of the defining module are captured when the conversion happens,
+    so names defined later in the module are visible to the function.
+
+    When the on-disk function cache is enabled (see :mod:`onnxscript.function_cache`),
+    the FunctionProto and the schemas are loaded from it when available, and the
+    Python function is converted only if :attr:`function_ir` is needed.
+
+    Attributes:
+        opset: Opset the function belongs to.
+        name: Name of the function.
+        function: Python function.
+        function_ir: Python code parsed as an :class:`irbuilder.IRFunction`.
+        source: Source code used to generate the function.
+        kwargs: Additional properties used to construct a ModelProto.
+        op_schema: Generated ONNX OpSchema for this op.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        opset: Opset,
+        pyfun: types.FunctionType,
+        kwargs: Optional[dict[str, Any]] = None,
+        default_opset: Optional[Opset] = None,
+    ):
+        """Constructs a LazyOnnxFunction.
+
+        Args:
+            opset: opset the function belongs to
+            pyfun: python function
+            kwargs: additional properties used to construct a ModelProto
+            default_opset: opset to use for operators not in the function's opset
+        """
+        # OnnxFunction.__init__ requires the function IR, which is what we defer
+        Op.__init__(self, opset, pyfun.__name__)  # pylint: disable=non-parent-init-called
+        self.function = pyfun
+        self.kwargs = kwargs or {}
+        self._default_opset = default_opset
+        self._function_ir: Optional[irbuilder.IRFunction] = None
+        self._source: Optional[str] = None
+        self._param_schemas = None
+        self._op_schema = None
+        self._function_proto = None
+        self._cache_checked = False
+        self._cached_function_proto: Optional[bytes] = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.function!r})"
+
+    @property
+    def is_compiled(self) -> bool:
+        """Whether the Python function has been converted."""
+        return self._function_ir is not None
+
+    def compile(self) -> None:
+        """Converts the Python function if it has not been converted yet.
+
+        The result is stored in the function cache if it is enabled and the
+        function was not found in it.
+        """
+        if self._function_ir is not None:
+            return
+        cached = self.load_cached()
+        src, func_ast = ast_utils.get_src_and_ast(self.function)
+        module = inspect.getmodule(self.function)
+        closure = inspect.getclosurevars(self.function)
+        global_names = module.__dict__.copy()
+        global_names.update(closure.nonlocals)
+        converter = converter_module.Converter(
+            opset=self._opset,
+            global_names=global_names,
+            source=src,
+            default_opset=self._default_opset,
+        )
+        function_ir = converter.translate_function_def(func_ast)
+        # Set the source first so that a concurrent reader that observes the
+        # function IR also observes the source
+        self._source = src
+        self._function_ir = function_ir
+        if not cached:
+            # function_cache depends on this module
+            # pylint: disable-next=import-outside-toplevel
+            from onnxscript import function_cache
+
+            cache = function_cache.default_cache()
+            if cache is not None:
+                cache.store(self, self._default_opset)
+
+    def load_cached(self) -> bool:
+        """Loads the FunctionProto and schemas from the function cache, if enabled.
+
+        Returns:
+            True if the function was found in the cache.
+        """
+        if not self._cache_checked and self._function_ir is None:
+            self._cache_checked = True
+            # function_cache depends on this module
+            # pylint: disable-next=import-outside-toplevel
+            from onnxscript import function_cache
+
+            cache = function_cache.default_cache()
+            entry = None
+            if cache is not None:
+                entry = cache.load(self.function, self._opset, self._default_opset)
+            if entry is not None:
+                self.load_conversion(entry)
+        return self._cached_function_proto is not None
+
+    def load_conversion(self, entry: CacheEntry) -> None:
+        """Uses the FunctionProto and schemas of a conversion done elsewhere.
+
+        The conversion is loaded from the function cache, or done by another process
+        (see :func:`onnxscript.compile_module`). It is ignored if the function has
+        already been converted.
+        """
+        if self._function_ir is None:
+            self._cache_checked = True
+            self._param_schemas = entry.param_schemas
+            self._op_schema = entry.op_schema
+            self._cached_function_proto = entry.function_proto
+
+    @property
+    def op_schema(self) -> Optional[onnx.defs.OpSchema]:
+        self.load_cached()
+        return super().op_schema
+
+    def param_schemas(self) -> tuple[ParamSchema, ...]:
+        self.load_cached()
+        return super().param_schemas()
+
+    def _build_function_proto(self) -> onnx.FunctionProto:
+        if self._function_ir is None and self.load_cached():
+            assert self._cached_function_proto is not None
+            return onnx.FunctionProto.FromString(self._cached_function_proto)
+        return super()._build_function_proto()
+
+    @property
+    def function_ir(self) -> irbuilder.IRFunction:  # type: ignore[override]
+        self.compile()
+        assert self._function_ir is not None
+        return self._function_ir
+
+    @property
+    def source(self) -> str:  # type: ignore[override]
+        self.compile()
+        assert self._source is not None
+        return self._source
+
+
 class TracedOnnxFunction(Op):
     """TracedOnnxFunction.
 
@@ -551,6 +813,7 @@ class TracedOnnxFunction(Op):
     def __init__(self, opset: Opset, func: types.FunctionType):
         super().__init__(opset, func.__name__)
         self.func = func
+        self._function_ir: Optional[irbuilder.IRFunction] = None
 
     def __call__(self, *args, **kwargs):
         return self.func(*args, **kwargs)
@@ -562,8 +825,12 @@ class TracedOnnxFunction(Op):
     def function_ir(self) -> irbuilder.IRFunction:
         """Return the function_ir.
 
-        This function IR contains only the signature of the function.
+        This function IR contains only the signature of the function. It is
+        computed on first access.
         """
+        if self._function_ir is not None:
+            return self._function_ir
+
         src, func_ast = ast_utils.get_src_and_ast(self.func)
         module = inspect.getmodule(self.func)
         closure = inspect.getclosurevars(self.func)
@@ -575,7 +842,8 @@ class TracedOnnxFunction(Op):
             source=src,
         )
 
-        return converter.translate_function_signature(func_ast)
+        self._function_ir = converter.translate_function_signature(func_ast)
+        return self._function_ir
 
     @property
     def op_schema(self) -> Optional[onnx.defs.OpSchema]:
@@ -1,7 +1,100 @@
 import unittest
+from unittest import mock
+
+import numpy as np
+import onnx.defs
 
 import onnxscript
 from onnxscript import values
+from onnxscript.onnx_opset import opset17, opset18
+
+
+class OpsetTest(unittest.TestCase):
+    def test_generated_op_method_reuses_op_object(self):
+        op = opset18._get_op("Add", 14)  # pylint: disable=protected-access
+        self.assertIs(opset18._get_op("Add", 14), op)  # pylint: disable=protected-access
+        self.assertIs(op.opset, opset18)
+        self.assertEqual(op.op_schema.since_version, 14)
+
+    def test_get_op_is_per_opset_instance(self):
+        op17 = opset17._get_op("Add", 14)  # pylint: disable=protected-access
+        op18 = opset18._get_op("Add", 14)  # pylint: disable=protected-access
+        self.assertIsNot(op17, op18)
+        self.assertIs(op17.opset, opset17)
+
+    def test_getattr_returns_cached_op(self):
+        opset = values.Opset("", 18)
+        self.assertIs(opset.Relu, opset.Relu)
+        self.assertEqual(opset.ReduceMax.op_schema.since_version, 18)
+
+    def test_param_binder_is_compiled_once_per_op(self):
+        op = values.Op(values.Opset("", 18), "Add")
+        binder = op.param_binder()
+        self.assertIs(op.param_binder(), binder)
+        self.assertEqual([param.name for param in binder.param_schemas], ["A", "B"])
+
+    def test_schema_lookup_for_unknown_op(self):
+        self.assertIsNone(opset18["NotAnOp"])
+        self.assertNotIn("NotAnOp", opset18)
+        self.assertIn("Add", opset18)
+        with self.assertRaises(AttributeError):
+            _ = opset18.NotAnOp
+
+    def test_schema_registered_after_a_failed_lookup_is_found(self):
+        opset = values.Opset("test.registered_later", 1)
+        schema = onnx.defs.get_schema("Relu", 14)
+        self.assertIsNone(opset["Relu"])
+        with mock.patch.object(onnx.defs, "get_schema", return_value=schema):
+            self.assertIs(opset["Relu"], schema)
+
+
+def _double(x):
+    return opset18.Add(x, x)
+
+
+def _double_relu(x):
+    return opset18.Relu(_lazy_double(x))
+
+
+_LAZY_OPSET = values.Opset("test.lazy", 1)
+_lazy_double = values.LazyOnnxFunction(_LAZY_OPSET, _double)
+
+
+class LazyOnnxFunctionTest(unittest.TestCase):
+    def test_conversion_is_deferred_until_function_ir_is_used(self):
+        function = values.LazyOnnxFunction(_LAZY_OPSET, _double)
+        self.assertFalse(function.is_compiled)
+        self.assertEqual(function.name, "_double")
+        self.assertIs(function.opset, _LAZY_OPSET)
+        self.assertFalse(function.is_compiled)
+
+        self.assertEqual([param.name for param in function.param_schemas()], ["x"])
+        self.assertTrue(function.is_compiled)
+
+    def test_function_proto_is_same_as_script(self):
+        lazy = values.LazyOnnxFunction(_LAZY_OPSET, _double)
+        scripted = onnxscript.script(_LAZY_OPSET)(_double)
+        self.assertEqual(lazy.to_function_proto(), scripted.to_function_proto())
+        self.assertEqual(lazy.source, scripted.source)
+
+    def test_call_converts_and_evaluates(self):
+        function = values.LazyOnnxFunction(_LAZY_OPSET, _double)
+        x = np.array([1.0, -2.0], dtype=np.float32)
+        np.testing.assert_allclose(function(x), x + x)
+        self.assertTrue(function.is_compiled)
+
+    def test_to_function_proto_returns_copies_of_the_same_proto(self):
+        function = values.LazyOnnxFunction(_LAZY_OPSET, _double)
+        function_proto = function.to_function_proto()
+        function_proto.name = "modified"
+        self.assertEqual(function.to_function_proto().name, "_double")
+        self.assertIsNot(function.to_function_proto(), function.to_function_proto())
+
+    def test_it_can_be_called_from_a_function_being_converted(self):
+        function = values.LazyOnnxFunction(_LAZY_OPSET, _double_relu)
+        called_functions = function.function_ir.called_functions
+        self.assertIn("_double", called_functions)
+        self.assertTrue(_lazy_double.is_compiled)
 
 
 class TracedOnnxFunctionTest(unittest.TestCase):
@@ -15,6 +108,16 @@ class TracedOnnxFunctionTest(unittest.TestCase):
         self.assertEqual(traced_function.name, function.__name__)
         self.assertEqual(traced_function.func, function)
 
+    def test_function_ir_is_computed_once(self):
+        def function(input1, attr1: int = 1):
+            return opset18.Add(input1, attr1)
+
+        traced_function = values.TracedOnnxFunction(values.Opset("test", 1), function)
+        self.assertIs(traced_function.function_ir, traced_function.function_ir)
+        self.assertEqual(
+            [param.name for param in traced_function.param_schemas()], ["input1", "attr1"]
+        )
+
     def test_param_schemas_in_correct_order_with_mixed_inputs_and_attrs(self):
         opset = values.Opset("test", 1)
 
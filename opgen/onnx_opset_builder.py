@@ -321,11 +321,7 @@ class OpsetsBuilder:
         for module in self._result.all_modules:
             if isinstance(module, OpsetModule):
                 module.prepend_child(
-                    cg.ImportFrom(MODULE_ONNX_DEFS, cg.Alias("get_schema")),
-                    cg.Module.Roles.Body,
-                )
-                module.prepend_child(
-                    cg.ImportFrom(MODULE_ONNX_SCRIPT_VALUES, cg.Alias("Op, Opset")),
+                    cg.ImportFrom(MODULE_ONNX_SCRIPT_VALUES, cg.Alias("Opset")),
                     cg.Module.Roles.Body,
                 )
             module.accept(cg.ImportAdjuster())
@@ -443,7 +439,9 @@ class OpsetsBuilder:
             op_call = cg.Call(
                 cg.Name("op"),
                 cg.Starred(
-                    cg.Call(cg.Name("self._prepare_inputs"), cg.Name("schema"), *op_inputs)
+                    cg.Call(
+                        cg.Name("self._prepare_inputs"), cg.Name("op.op_schema"), *op_inputs
+                    )
                 ),
                 *op_attrs,
             )
@@ -461,22 +459,12 @@ class OpsetsBuilder:
             ),
             doc=_process_documentation(doc),
             body=[
-                cg.Assign(
-                    cg.Name("schema"),
-                    cg.Call(
-                        cg.Name("get_schema"),
-                        cg.Constant(qualname.name),
-                        cg.Constant(qualname.version),
-                        cg.Constant(qualname.domain),
-                    ),
-                ),
                 cg.Assign(
                     cg.Name("op"),
                     cg.Call(
-                        cg.Name("Op"),
-                        cg.Name("self"),
+                        cg.Name("self._get_op"),
                         cg.Constant(qualname.name),
-                        cg.Name("schema"),
+                        cg.Constant(qualname.version),
                     ),
                 ),
                 cg.Return(op_call),
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Microbenchmark of the per-call overhead of functions decorated with diagnose_call.
+
+The benchmark calls a function decorated with
+``onnxscript.diagnostics.infra.decorator.diagnose_call`` that succeeds, and reports
+the time per call without the decorator, with the default diagnostic options, and
+with a ``verbosity_level`` above the level of the diagnostics, so that the calls do
+not record their signature and return values. The time to serialize the
+diagnostics to SARIF is reported separately, as the messages are formatted then.
+
+Usage:
+
+python tools/benchmark/diagnose_call_benchmark.py --num-calls 10000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable
+
+from onnxscript.diagnostics import infra
+from onnxscript.diagnostics.infra import decorator
+
+_RULE = infra.Rule(id="BENCH0001", name="benchmark", message_default_template="benchmark")
+
+
+def _add(diagnostic_context: infra.DiagnosticContext, x: int, y: int = 1) -> int:
+    del diagnostic_context  # Unused
+    return x + y
+
+
+def _time(
+    function: Callable[..., Any],
+    options: infra.DiagnosticOptions,
+    num_calls: int,
+    repeat: int,
+) -> tuple[float, float]:
+    """Returns the best times of the calls and of the serialization to SARIF."""
+    best_calls = best_sarif = float("inf")
+    for _ in range(repeat):
+        context = infra.DiagnosticContext("benchmark", "1.0", options=options)
+        start = time.perf_counter()
+        for i in range(num_calls):
+            function(context, i)
+        end = time.perf_counter()
+        context.to_json()
+        best_calls = min(best_calls, end - start)
+        best_sarif = min(best_sarif, time.perf_counter() - end)
+    return best_calls, best_sarif
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-calls", type=int, default=10_000, help="calls per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs; the best is reported")
+    args = parser.parse_args()
+
+    diagnosed = decorator.diagnose_call(_RULE)(_add)
+    for name, function, options in (
+        ("undecorated", _add, infra.DiagnosticOptions()),
+        ("default options", diagnosed, infra.DiagnosticOptions()),
+        (
+            "verbosity_level=NOTE",
+            diagnosed,
+            infra.DiagnosticOptions(verbosity_level=infra.Level.NOTE),
+        ),
+    ):
+        calls, sarif = _time(function, options, args.num_calls, args.repeat)
+        print(
+            f"{name:22} calls: {calls * 1e6 / args.num_calls:8.2f} us/call, "
+            f"SARIF: {sarif * 1e6 / args.num_calls:8.2f} us/call"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark of the memory retained by the IR of the compiled torch_lib functions.
+
+The torch_lib functions are compiled eagerly at import (as with
+ONNXSCRIPT_TORCH_LIB_EAGER_COMPILATION=1) in a new process, and the benchmark reports
+
+- the memory allocated by the import and still in use once it is done, as traced by
+  tracemalloc, and the increase of the RSS,
+- the number and the size of the retained IR objects, SourceInfo objects and AST
+  nodes. The size of an object includes the size of its ``__dict__``, if any, but
+  not of the objects it refers to.
+
+Run it on two versions of the tree to measure the memory saved by a change.
+
+Usage:
+
+python tools/benchmark/function_ir_memory_benchmark.py
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import collections
+import gc
+import os
+import subprocess
+import sys
+import tracemalloc
+
+_EAGER_COMPILATION_VARIABLE = "ONNXSCRIPT_TORCH_LIB_EAGER_COMPILATION"
+_CLASSES = (
+    "IRFunction",
+    "IRStmt",
+    "IRVar",
+    "IRAttributeValue",
+    "IRAttributeParameter",
+    "SourceInfo",
+)
+
+
+def _rss_bytes() -> int:
+    with open("/proc/self/statm", encoding="utf-8") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _shallow_size(obj: object) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def _run() -> None:
+    # Import the dependencies first so that only the compilation is measured
+    # pylint: disable-next=import-outside-toplevel,unused-import
+    import onnxscript.function_libs.torch_lib.registration  # noqa: F401
+
+    gc.collect()
+    rss_before = _rss_bytes()
+    tracemalloc.start()
+    # pylint: disable-next=import-outside-toplevel,unused-import
+    import onnxscript.function_libs.torch_lib.ops  # noqa: F401
+
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_increase = _rss_bytes() - rss_before
+
+    counts: collections.Counter = collections.Counter()
+    sizes: collections.Counter = collections.Counter()
+    for obj in gc.get_objects():
+        name = "AST nodes" if isinstance(obj, ast.AST) else type(obj).__name__
+        if name in _CLASSES or name == "AST nodes":
+            counts[name] += 1
+            sizes[name] += _shallow_size(obj)
+
+    functions = sum(isinstance(obj, onnxscript.OnnxFunction) for obj in gc.get_objects())
+    print(f"Compiled functions: {functions}")
+    print(f"Retained by the import: {retained / 1024**2:10.2f} MB")
+    print(f"RSS increase:           {rss_increase / 1024**2:10.2f} MB")
+    print(f"{'objects':24}{'count':>10}{'size (KB)':>12}")
+    for name in (*_CLASSES, "AST nodes"):
+        print(f"{name:24}{counts[name]:10}{sizes[name] / 1024:12.1f}")
+    print(f"{'total':24}{sum(counts.values()):10}{sum(sizes.values()) / 1024:12.1f}")
+
+
+def main() -> None:
+    """Runs the benchmark in a new process."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--run", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        _run()
+        return
+    # A new process, so that the torch_lib is not imported yet and is compiled eagerly
+    env = dict(os.environ, **{_EAGER_COMPILATION_VARIABLE: "1"})
+    subprocess.run([sys.executable, __file__, "--run"], env=env, check=True)
+
+
+if __name__ == "__main__":
+    main()
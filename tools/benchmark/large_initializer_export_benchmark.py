@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark of saving a TorchScriptGraph with large initializers.
+
+Two ways of saving a synthetic model whose initializers total ``--size-gb`` are
+compared:
+
+- model_proto: ``to_model_proto`` followed by ``onnx.save_model`` with external data.
+  The initializers are copied into the ModelProto (through a temporary file for
+  models larger than 2GB) before being written.
+- external_data: ``to_model_proto_with_external_data``, which streams the
+  initializers from the tensor storage into the external data file.
+
+Each mode runs in its own process so that the peak RSS can be measured. The reported
+memory is the peak RSS of the export minus the RSS after the weights are allocated.
+
+Usage:
+
+python tools/benchmark/large_initializer_export_benchmark.py --size-gb 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import onnx
+import torch
+
+from onnxscript import evaluator
+from onnxscript import opset18 as op
+from onnxscript.function_libs.torch_lib import graph_building
+
+_MODES = ("model_proto", "external_data")
+
+
+def _rss_bytes() -> int:
+    with open("/proc/self/statm", encoding="utf-8") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _peak_rss_bytes() -> int:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _synthetic_graph(size_gb: float, layers: int) -> graph_building.TorchScriptGraph:
+    """Builds a chain of Add nodes with one initializer each."""
+    elements = int(size_gb * 1024**3 / 4 / layers)
+    graph = graph_building.TorchScriptGraph()
+    output = graph.add_input("x", (elements,), torch.float32)
+    with evaluator.default_as(graph_building.TorchScriptTracingEvaluator(graph)):
+        for i in range(layers):
+            # torch.ones touches every page, unlike torch.empty
+            weight = graph.add_initializer(f"weight_{i}", torch.ones(elements))
+            output = op.Add(output, weight)  # type: ignore[type-var]
+    graph.register_outputs(output)
+    return graph
+
+
+def _run(mode: str, size_gb: float, layers: int, output_dir: str) -> None:
+    graph = _synthetic_graph(size_gb, layers)
+    rss_before = _rss_bytes()
+    model_path = os.path.join(output_dir, f"{mode}.onnx")
+    start = time.perf_counter()
+    if mode == "model_proto":
+        model = graph.to_model_proto(18, validation="none")
+        onnx.save_model(model, model_path, save_as_external_data=True, location=f"{mode}.data")
+    else:
+        model = graph.to_model_proto_with_external_data(
+            18, os.path.join(output_dir, f"{mode}.data"), validation="none"
+        )
+        onnx.save_model(model, model_path)
+    elapsed = time.perf_counter() - start
+    extra_gb = (_peak_rss_bytes() - rss_before) / 1024**3
+    print(f"{mode:16}{elapsed:10.2f} s{max(extra_gb, 0.0):12.2f} GB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-gb", type=float, default=2.5, help="size of the initializers")
+    parser.add_argument("--layers", type=int, default=16, help="number of initializers")
+    parser.add_argument("--mode", choices=_MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--output-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        _run(args.mode, args.size_gb, args.layers, args.output_dir)
+        return
+
+    print(f"Initializers: {args.size_gb} GB in {args.layers} tensors")
+    print(f"{'mode':16}{'time':>12}{'extra peak RSS':>15}")
+    for mode in _MODES:
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    f"--mode={mode}",
+                    f"--size-gb={args.size_gb}",
+                    f"--layers={args.layers}",
+                    f"--output-dir={output_dir}",
+                ],
+                check=False,
+            )
+            if result.returncode != 0:
+                # E.g. killed by the OOM killer
+                print(f"{mode:16}failed with exit code {result.returncode}")
+
+
+if __name__ == "__main__":
+    main()
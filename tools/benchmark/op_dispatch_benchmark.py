@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Microbenchmark of the per-call overhead of the generated opset methods.
+
+The benchmark traces a loop of op calls (``op.Add``, ``op.Mul``, ``op.Relu``, ...)
+through an opset, once through the generated methods, which reuse the Op objects
+cached on the Opset, and once emulating the previously generated code, which looked
+up the OpSchema in the ONNX schema registry and created a new Op on every call.
+
+By default the op calls are dispatched to an evaluator that does no work, so that
+only the dispatch overhead is measured. Use ``--evaluator torchscript`` to trace
+into a TorchScriptGraph instead.
+
+Usage:
+
+python tools/benchmark/op_dispatch_benchmark.py --num-ops 100000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable, Mapping, Sequence
+
+import onnx.defs
+
+from onnxscript import evaluator, values
+from onnxscript.onnx_opset import opset18
+
+_OPS = ("Add", "Mul", "Sub", "Relu", "Neg")
+
+
+class _NullEvaluator(evaluator.Evaluator):
+    """An evaluator that returns its first input without doing any work."""
+
+    def eval(
+        self,
+        schema: onnx.defs.OpSchema,
+        inputs: Sequence[Any],
+        attributes: Mapping[str, Any],
+    ) -> Any:
+        return inputs[0]
+
+    def eval_function(
+        self,
+        function: values.OnnxFunction,
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any],
+    ) -> Any:
+        raise NotImplementedError
+
+
+def _trace_cached(x: Any, num_ops: int) -> Any:
+    for i in range(num_ops):
+        opname = _OPS[i % len(_OPS)]
+        if opname in {"Relu", "Neg"}:
+            x = getattr(opset18, opname)(x)
+        else:
+            x = getattr(opset18, opname)(x, x)
+    return x
+
+
+def _trace_uncached(x: Any, num_ops: int) -> Any:
+    """Emulates the previously generated code for the opset methods."""
+    for i in range(num_ops):
+        opname = _OPS[i % len(_OPS)]
+        schema = onnx.defs.get_schema(opname, opset18.version, opset18.domain)
+        op = values.Op(opset18, opname, schema)
+        if opname in {"Relu", "Neg"}:
+            x = op(*opset18._prepare_inputs(schema, x))  # pylint: disable=protected-access
+        else:
+            x = op(*opset18._prepare_inputs(schema, x, x))  # pylint: disable=protected-access
+    return x
+
+
+def _make_evaluator_and_input(kind: str) -> tuple[evaluator.Evaluator, Any]:
+    if kind == "null":
+        return _NullEvaluator(), object()
+    if kind == "torchscript":
+        # pylint: disable=import-outside-toplevel
+        import torch
+
+        from onnxscript.function_libs.torch_lib import graph_building
+
+        # pylint: enable=import-outside-toplevel
+        graph = graph_building.TorchScriptGraph()
+        tracer = graph_building.TorchScriptTracingEvaluator(graph)
+        return tracer, graph.add_input("x", (2, 3), torch.float32)
+    raise ValueError(f"Unknown evaluator '{kind}'")
+
+
+def _time(trace: Callable[[Any, int], Any], kind: str, num_ops: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        tracer, x = _make_evaluator_and_input(kind)
+        with evaluator.default_as(tracer):
+            start = time.perf_counter()
+            trace(x, num_ops)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-ops", type=int, default=100_000, help="op calls per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs; the best is reported")
+    parser.add_argument(
+        "--evaluator",
+        choices=("null", "torchscript"),
+        default="null",
+        help="evaluator the op calls are dispatched to",
+    )
+    args = parser.parse_args()
+
+    before = _time(_trace_uncached, args.evaluator, args.num_ops, args.repeat)
+    after = _time(_trace_cached, args.evaluator, args.num_ops, args.repeat)
+    print(f"Op calls: {args.num_ops}, evaluator: {args.evaluator}")
+    print(f"  schema lookup per call: {before * 1e6 / args.num_ops:8.2f} us/op")
+    print(f"  cached Op per opset:    {after * 1e6 / args.num_ops:8.2f} us/op")
+    print(f"  speedup:                {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
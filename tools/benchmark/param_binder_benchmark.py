@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Microbenchmark of the binding of call arguments to the parameters of torch_lib functions.
+
+For every registered torch_lib function, the benchmark binds the positional
+arguments of a call (up to the last required parameter) to the parameters of the
+function, once with the module functions of ``param_manipulation``, which compile
+a ``ParamBinder`` for every call, and once with the ``ParamBinder`` compiled once per
+function and cached by ``Op.param_binder()``. The tracing evaluator binds the
+arguments of every torch_lib call it traces with ``separate_input_attributes``, and
+the eager evaluators with ``tag_arguments``. Run it on two versions of the tree to
+compare with a previous implementation of the module functions.
+
+Usage:
+
+python tools/benchmark/param_binder_benchmark.py --num-calls 100000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable, Sequence
+
+from onnxscript import values
+from onnxscript._internal import param_manipulation
+from onnxscript.function_libs.torch_lib import registration
+
+# pylint: disable-next=unused-import
+from onnxscript.function_libs.torch_lib.ops import core, nn, special  # noqa: F401
+
+
+def _functions() -> list[values.OnnxFunction]:
+    functions = []
+    for overloads in registration.default_registry.values():
+        for function in overloads.overloads:
+            if isinstance(function, values.OnnxFunction):
+                functions.append(function)
+    return functions
+
+
+def _calls(
+    functions: Sequence[values.OnnxFunction],
+) -> list[tuple[values.OnnxFunction, tuple[Any, ...]]]:
+    calls = []
+    for function in functions:
+        param_schemas = function.param_schemas()
+        # Pass the parameters up to the last required one positionally
+        num_args = max(
+            (i + 1 for i, param in enumerate(param_schemas) if param.required), default=0
+        )
+        calls.append((function, tuple(object() for _ in range(num_args))))
+    return calls
+
+
+def _time(
+    bind: Callable[[values.OnnxFunction, tuple[Any, ...]], Any],
+    calls: Sequence[tuple[values.OnnxFunction, tuple[Any, ...]]],
+    num_calls: int,
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(num_calls):
+            function, args = calls[i % len(calls)]
+            bind(function, args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _separate_with_function(function, args):
+    return param_manipulation.separate_input_attributes_from_arguments(
+        function.param_schemas(), args, {}, fill_defaults=True, allow_extra_kwargs=True
+    )
+
+
+def _separate_with_binder(function, args):
+    return function.param_binder().separate_input_attributes(
+        args, {}, fill_defaults=True, allow_extra_kwargs=True
+    )
+
+
+def _tag_with_function(function, args):
+    return param_manipulation.tag_arguments_with_param_schemas(
+        function.param_schemas(), args, {}
+    )
+
+
+def _tag_with_binder(function, args):
+    return function.param_binder().tag_arguments(args, {})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-calls", type=int, default=100_000, help="bindings per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs; the best is reported")
+    args = parser.parse_args()
+
+    functions = _functions()
+    calls = _calls(functions)
+    # Compile the binders outside of the timed runs, as they are compiled once per function
+    for function in functions:
+        function.param_binder()
+
+    print(f"Functions: {len(functions)}, bindings per run: {args.num_calls}")
+    for name, with_function, with_binder in (
+        ("separate_input_attributes", _separate_with_function, _separate_with_binder),
+        ("tag_arguments", _tag_with_function, _tag_with_binder),
+    ):
+        before = _time(with_function, calls, args.num_calls, args.repeat)
+        after = _time(with_binder, calls, args.num_calls, args.repeat)
+        print(f"{name}:")
+        print(f"  param_manipulation function: {before * 1e6 / args.num_calls:8.2f} us/call")
+        print(f"  cached ParamBinder:          {after * 1e6 / args.num_calls:8.2f} us/call")
+        print(f"  speedup:                     {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark of the time and the peak memory of writing diagnostics to a SARIF file.
+
+Each mode runs in a new process that logs ``--num-diagnostics`` diagnostics, each
+with a Python call stack and an additional message, in a DiagnosticContext, and
+writes them to a SARIF file:
+
+- ``to_json``: logs the diagnostics, then writes the JSON string of the whole SARIF
+  log returned by ``DiagnosticContext.to_json()``,
+- ``dump``: logs the diagnostics, then writes them with ``DiagnosticContext.dump()``,
+- ``stream``: streams the diagnostics to the file as they are logged, with
+  ``DiagnosticContext.stream_sarif()``.
+
+The benchmark reports the time spent logging the diagnostics, the time spent
+writing the file after the last diagnostic is logged, and the peak RSS of the
+process.
+
+Usage:
+
+python tools/benchmark/sarif_dump_benchmark.py --num-diagnostics 20000
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+_MODES = ("to_json", "dump", "stream")
+
+
+def _run(mode: str, num_diagnostics: int, path: str) -> None:
+    # pylint: disable-next=import-outside-toplevel
+    from onnxscript.diagnostics import infra
+
+    rule = infra.Rule(id="BENCH0001", name="benchmark", message_default_template="benchmark")
+    context = infra.DiagnosticContext("benchmark", "1.0")
+    stream = context.stream_sarif(path) if mode == "stream" else contextlib.nullcontext()
+    start = time.perf_counter()
+    with stream:
+        for i in range(num_diagnostics):
+            diagnostic = infra.Diagnostic(rule, infra.Level.NONE, f"Diagnostic #{i}")
+            diagnostic.record_python_call_stack(frames_to_skip=0)
+            diagnostic.with_additional_message(f"### Details\n- index: {i}\n" * 4)
+            context.log(diagnostic)
+        logged = time.perf_counter()
+    if mode == "to_json":
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(context.to_json())
+    elif mode == "dump":
+        context.dump(path)
+    written = time.perf_counter()
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    print(
+        f"{mode:8} log: {logged - start:7.2f} s, write: {written - logged:7.2f} s, "
+        f"peak RSS: {peak_rss / 1024**2:8.1f} MB, file: {os.path.getsize(path) / 1024**2:7.1f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--num-diagnostics", type=int, default=20_000, help="diagnostics to log"
+    )
+    parser.add_argument("--modes", nargs="+", choices=_MODES, default=list(_MODES))
+    parser.add_argument("--run", choices=_MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        _run(args.run, args.num_diagnostics, args.path)
+        return
+    print(f"Diagnostics: {args.num_diagnostics}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for mode in args.modes:
+            # A new process for each mode, so that the peak RSS is its own
+            subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--run",
+                    mode,
+                    "--num-diagnostics",
+                    str(args.num_diagnostics),
+                    "--path",
+                    os.path.join(temp_dir, f"{mode}.sarif"),
+                ],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Microbenchmark of the recording of Python call stacks in diagnostics.
+
+The benchmark records the Python call stack of diagnostics with
+``Diagnostic.record_python_call_stack`` and thread flow steps with
+``Diagnostic.record_python_call``, at a given depth of the call stack, and reports
+the time per recorded stack. The time to serialize the diagnostics to SARIF is
+reported separately, as the stack frames are created then.
+
+Usage:
+
+python tools/benchmark/stack_capture_benchmark.py --num-records 2000 --depth 50
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+from onnxscript.diagnostics import infra
+
+_RULE = infra.Rule(id="BENCH0001", name="benchmark", message_default_template="benchmark")
+
+
+def _record_python_call_stack(diagnostic: infra.Diagnostic) -> None:
+    diagnostic.record_python_call_stack(frames_to_skip=0)
+
+
+def _record_python_call(diagnostic: infra.Diagnostic) -> None:
+    diagnostic.record_python_call(_record_python_call, {}, frames_to_skip=0)
+
+
+def _time(
+    record: Callable[[infra.Diagnostic], None], num_records: int, repeat: int
+) -> tuple[float, float]:
+    """Returns the best times of the records and of the serialization to SARIF."""
+    best_records = best_sarif = float("inf")
+    for _ in range(repeat):
+        context = infra.DiagnosticContext("benchmark", "1.0")
+        start = time.perf_counter()
+        for _ in range(num_records):
+            diagnostic = infra.Diagnostic(_RULE, infra.Level.NONE)
+            record(diagnostic)
+            context.log(diagnostic)
+        end = time.perf_counter()
+        context.to_json()
+        best_records = min(best_records, end - start)
+        best_sarif = min(best_sarif, time.perf_counter() - end)
+    return best_records, best_sarif
+
+
+def _time_at_depth(
+    depth: int, record: Callable[[infra.Diagnostic], None], num_records: int, repeat: int
+) -> tuple[float, float]:
+    """Returns the times of `_time` with `depth` more frames in the call stack."""
+    if depth <= 0:
+        return _time(record, num_records, repeat)
+    return _time_at_depth(depth - 1, record, num_records, repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-records", type=int, default=2_000, help="records per run")
+    parser.add_argument("--depth", type=int, default=50, help="depth of the call stack")
+    parser.add_argument("--repeat", type=int, default=3, help="runs; the best is reported")
+    args = parser.parse_args()
+
+    for record in (_record_python_call_stack, _record_python_call):
+        records, sarif = _time_at_depth(args.depth, record, args.num_records, args.repeat)
+        print(
+            f"{record.__name__[1:]:26} record: {records * 1e6 / args.num_records:8.2f} us, "
+            f"SARIF: {sarif * 1e6 / args.num_records:8.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
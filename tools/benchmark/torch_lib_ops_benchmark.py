@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""Benchmark of the torch_lib ops in eager and graph modes.
+
+The ops and their inputs are the ones of the op tests: for each op in
+``ops_test_data.TESTED_TORCHLIB_OPS``, the function is called on the first
+``--samples`` OpInfo samples with the executors of ``ops_test_common``. For each
+sample, the benchmark measures
+
+- trace_s: capturing the graph of the function into a TorchScriptGraph
+- to_model_proto_s: converting the graph into a ModelProto
+- node_count: the number of nodes of the model, including the nodes of its functions
+- session_creation_s: creating the ONNX Runtime InferenceSession of the model
+- run_s: running the session, once warmed up
+- eager_s: calling the function in eager mode
+
+Times are the best of ``--repeat`` measurements, except for run_s and eager_s which
+are the median of ``--runs`` calls. The metrics of an op are the median over its
+samples. The first sample of each op is run once before measuring, so that one-time
+costs like building the FunctionProto of the function are not counted.
+
+The results are written as JSON. With ``--baseline``, they are compared with the
+results of a previous run, and the command fails if an op became slower by more than
+``--tolerance`` or its model has more nodes. Sub-millisecond timings vary a lot with
+the load of the machine: compare results measured on the same, otherwise idle machine.
+
+``--backend`` selects the graph builder, one of ``ops_test_common.GRAPH_BACKENDS``.
+Comparing the results of two backends compares their trace and to_model_proto times.
+
+Usage:
+
+python tools/benchmark/torch_lib_ops_benchmark.py --output baseline.json
+python tools/benchmark/torch_lib_ops_benchmark.py --baseline baseline.json --ops add gelu
+python tools/benchmark/torch_lib_ops_benchmark.py --backend onnx --baseline baseline.json
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import warnings
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import onnx
+import onnxruntime as ort
+import torch
+
+from onnxscript.tests.function_libs.torch_lib import ops_test_common, ops_test_data
+
+_TIME_METRICS = ("trace_s", "to_model_proto_s", "session_creation_s", "run_s", "eager_s")
+_METRICS = (*_TIME_METRICS, "node_count")
+_COLUMNS = ("trace", "to_proto", "session", "run", "eager")
+
+# The inputs of the function, and the outputs of the torch op, for an OpInfo sample
+_Sample = Tuple[List[Any], Dict[str, Any], List[Any]]
+
+
+@contextlib.contextmanager
+def _gc_disabled():
+    # Like timeit, so that collections do not add noise to sub-millisecond timings
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _best_time(call: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """Returns the best time of calling a function, and its last result."""
+    best = float("inf")
+    result = None
+    with _gc_disabled():
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = call()
+            best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _median_time(call: Callable[[], Any], runs: int, warmup: int = 2) -> float:
+    for _ in range(warmup):
+        call()
+    times = []
+    with _gc_disabled():
+        for _ in range(runs):
+            start = time.perf_counter()
+            call()
+            times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _node_count(model: onnx.ModelProto) -> int:
+    return len(model.graph.node) + sum(len(function.node) for function in model.functions)
+
+
+def _first_line(error: Exception) -> str:
+    message = str(error).strip().splitlines()
+    return f"{type(error).__name__}: {message[0] if message else ''}"
+
+
+def _measure_graph(
+    function: Callable, sample: _Sample, repeat: int, runs: int, backend: str
+) -> Dict[str, float]:
+    metrics: Dict[str, float] = {}
+    metrics["trace_s"], (graph, ort_inputs) = _best_time(
+        lambda: ops_test_common.capture_graph(function, *sample, backend), repeat
+    )
+    metrics["to_model_proto_s"], model = _best_time(
+        lambda: graph.to_model_proto(ops_test_common.TEST_OPSET_VERSION), repeat
+    )
+    metrics["node_count"] = _node_count(model)
+    serialized_model = model.SerializeToString()
+    metrics["session_creation_s"], session = _best_time(
+        lambda: ort.InferenceSession(serialized_model, providers=["CPUExecutionProvider"]),
+        repeat,
+    )
+    metrics["run_s"] = _median_time(lambda: session.run(None, ort_inputs), runs)
+    return metrics
+
+
+def _measure_eager(
+    function: Callable, sample: _Sample, repeat: int, runs: int, backend: str
+) -> Dict[str, float]:
+    del repeat, backend  # Unused
+    args, kwargs, _ = sample
+    executor = ops_test_common.eager_executor("benchmark", None)
+    return {"eager_s": _median_time(lambda: executor(function, tuple(args), kwargs), runs)}
+
+
+_MODES = {"graph": _measure_graph, "eager": _measure_eager}
+
+
+def _samples(
+    op: Any, torchlib_op_info: ops_test_data.TorchLibOpInfo, dtype: torch.dtype, count: int
+) -> List[_Sample]:
+    """Returns the inputs of the function and the torch outputs of the first samples."""
+    samples: List[_Sample] = []
+    for sample in op.sample_inputs("cpu", dtype, requires_grad=False):
+        if len(samples) == count:
+            break
+        inputs = (sample.input, *sample.args)
+        input_onnx = [ops_test_common.convert_tensor_to_numpy(x) for x in inputs]
+        kwargs_onnx = ops_test_common.convert_kwargs_for_onnx(sample.kwargs)
+        if torchlib_op_info.input_wrangler:
+            input_onnx, kwargs_onnx = torchlib_op_info.input_wrangler(input_onnx, kwargs_onnx)
+        outputs = ops_test_common.reference_outputs(op.name, op(*inputs, **sample.kwargs))
+        samples.append((input_onnx, kwargs_onnx, outputs))
+    return samples
+
+
+def _benchmark_op(
+    op: Any,
+    torchlib_op_info: ops_test_data.TorchLibOpInfo,
+    dtype: torch.dtype,
+    args: argparse.Namespace,
+) -> Dict[str, Any]:
+    function: Any = torchlib_op_info.op
+    result: Dict[str, Any] = {"function": function.name, "samples": 0}
+    if not ops_test_common.dtype_op_schema_compatible(dtype, function.op_schema):
+        result["skipped"] = f"dtype '{dtype}' is not supported by the function"
+        return result
+
+    samples = _samples(op, torchlib_op_info, dtype, args.samples)
+    measurements: Dict[str, List[float]] = {metric: [] for metric in _METRICS}
+    for mode, measure in _MODES.items():
+        try:
+            if samples:
+                # Warm up
+                measure(function, samples[0], 1, 1, args.backend)
+            for sample in samples:
+                metrics = measure(function, sample, args.repeat, args.runs, args.backend)
+                for metric, value in metrics.items():
+                    measurements[metric].append(value)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            result[f"{mode}_error"] = _first_line(e)
+
+    result["samples"] = len(samples)
+    for metric, values in measurements.items():
+        if values and len(values) == len(samples):
+            result[metric] = (
+                statistics.median_low(values)
+                if metric == "node_count"
+                else statistics.median(values)
+            )
+    return result
+
+
+def _selected_ops(names: Sequence[str]) -> Iterable[tuple[str, Any, Any]]:
+    """Yields the name of the benchmark, the OpInfo and the TorchLibOpInfo of the ops."""
+    for op in ops_test_data.OPS_DB:
+        torchlib_op_info = ops_test_data.TORCHLIB_OPINFO_MAPPING.get(op.name)
+        if torchlib_op_info is None or (names and op.name not in names):
+            continue
+        name = f"{op.name}.{op.variant_test_name}" if op.variant_test_name else op.name
+        yield name, op, torchlib_op_info
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Measures the selected ops and returns the results, printing them as they come."""
+    dtype = getattr(torch, args.dtype)
+    results: Dict[str, Any] = {
+        "metadata": {
+            "backend": args.backend,
+            "dtype": args.dtype,
+            "samples": args.samples,
+            "repeat": args.repeat,
+            "runs": args.runs,
+            "platform": platform.platform(),
+            "versions": {
+                "onnx": onnx.__version__,
+                "onnxruntime": ort.__version__,
+                "torch": torch.__version__,
+            },
+        },
+        "ops": {},
+    }
+    for name, op, torchlib_op_info in _selected_ops(args.ops):
+        torch.manual_seed(42)
+        result = _benchmark_op(op, torchlib_op_info, dtype, args)
+        results["ops"][name] = result
+        if "skipped" in result:
+            continue
+        print(
+            f"{name:48}"
+            + "".join(
+                f"{result[metric] * 1e3:14.3f}" if metric in result else f"{'-':>14}"
+                for metric in _TIME_METRICS
+            )
+            + f"{result.get('node_count', '-'):>8}",
+            flush=True,
+        )
+    return results
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, min_diff_s: float
+) -> List[str]:
+    """Returns the regressions of the results from the baseline."""
+    regressions = []
+    for name, baseline_result in baseline["ops"].items():
+        result = results["ops"].get(name)
+        if result is None:
+            continue
+        for mode in ("graph", "eager"):
+            error = result.get(f"{mode}_error")
+            if error and not baseline_result.get(f"{mode}_error"):
+                regressions.append(f"{name}: {mode} mode now fails with {error}")
+        for metric in _TIME_METRICS:
+            if metric not in result or metric not in baseline_result:
+                continue
+            before, after = baseline_result[metric], result[metric]
+            if after > before * (1 + tolerance) and after - before > min_diff_s:
+                regressions.append(
+                    f"{name}: {metric} {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms "
+                    f"({after / before:.2f}x)"
+                )
+        if result.get("node_count", 0) > baseline_result.get("node_count", float("inf")):
+            regressions.append(
+                f"{name}: node_count {baseline_result['node_count']} -> {result['node_count']}"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the benchmark and returns 1 if there are regressions from the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", nargs="*", default=[], help="OpInfo names; all ops if empty")
+    parser.add_argument(
+        "--backend",
+        choices=list(ops_test_common.GRAPH_BACKENDS),
+        default="torchscript",
+        help="graph builder",
+    )
+    parser.add_argument("--dtype", default="float32", help="dtype of the sample inputs")
+    parser.add_argument("--samples", type=int, default=3, help="samples measured per op")
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="measurements; the best is used"
+    )
+    parser.add_argument("--runs", type=int, default=20, help="calls to time the run latency")
+    parser.add_argument("--output", help="path of the JSON file to write the results to")
+    parser.add_argument("--baseline", help="path of the JSON results to compare with")
+    parser.add_argument(
+        "--load",
+        help="path of JSON results to compare with the baseline instead of running",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.5, help="relative slowdown reported"
+    )
+    parser.add_argument(
+        "--min-diff-ms", type=float, default=0.1, help="smallest slowdown reported"
+    )
+    args = parser.parse_args(argv)
+
+    # Only show errors, not the warnings of the samples with empty outputs
+    ort.set_default_logger_severity(3)
+    if args.load:
+        with open(args.load, encoding="utf-8") as f:
+            results = json.load(f)
+    else:
+        print(
+            f"{'op':48}"
+            + "".join(f"{column + ' (ms)':>14}" for column in _COLUMNS)
+            + f"{'nodes':>8}"
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = run_benchmark(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance, args.min_diff_ms / 1e3)
+    compared = len(results["ops"].keys() & baseline["ops"].keys())
+    print(f"\nCompared {compared} ops with {args.baseline}: {len(regressions)} regressions")
+    for regression in regressions:
+        print(f"  {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark of the signature queries made on trace-only torch_lib functions.
+
+On every dispatch, the exporter matches the inputs against the signature of the
+candidate functions, which reads ``function_ir``, ``param_schemas()`` and
+``op_schema`` of each TracedOnnxFunction. ``function_ir`` is now computed once per
+function. The benchmark compares it with the previous behavior, which re-read the
+source, re-parsed it, copied the module globals and translated the signature on
+every access.
+
+Two costs are reported per function, averaged over the selected trace-only ops:
+
+- first dispatch: the schemas are computed on a new TracedOnnxFunction
+- later dispatches: the schemas are already computed
+
+Usage:
+
+python tools/benchmark/traced_function_benchmark.py --ops aten_index aten_native_layer_norm
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import time
+from typing import Callable, Sequence
+
+# Imported to populate the registry
+import onnxscript.function_libs.torch_lib.ops  # pylint: disable=unused-import  # noqa: F401
+from onnxscript import converter as converter_module
+from onnxscript import irbuilder, values
+from onnxscript._internal import ast_utils
+from onnxscript.function_libs.torch_lib import registration
+
+
+class _UncachedTracedOnnxFunction(values.TracedOnnxFunction):
+    """A TracedOnnxFunction that translates its signature on every access."""
+
+    @property
+    def function_ir(self) -> irbuilder.IRFunction:
+        src, func_ast = ast_utils.get_src_and_ast(self.func)
+        module = inspect.getmodule(self.func)
+        closure = inspect.getclosurevars(self.func)
+        global_names = module.__dict__.copy()
+        global_names.update(closure.nonlocals)
+        converter = converter_module.Converter(
+            opset=self._opset,
+            global_names=global_names,
+            source=src,
+        )
+        return converter.translate_function_signature(func_ast)
+
+
+def _traced_functions(names: Sequence[str]) -> list[values.TracedOnnxFunction]:
+    functions: list[values.TracedOnnxFunction] = []
+    for overloads in registration.default_registry.values():
+        for function in (*overloads.overloads, *overloads.privates, *overloads.complex):
+            if isinstance(function, values.TracedOnnxFunction) and (
+                not names or function.name in names
+            ):
+                functions.append(function)
+    return functions
+
+
+def _dispatch(function: values.TracedOnnxFunction) -> None:
+    """Makes the signature queries of one dispatch."""
+    _ = function.function_ir
+    function.param_schemas()
+    _ = function.op_schema
+
+
+def _time_per_function(
+    functions: Sequence[values.TracedOnnxFunction],
+    make: Callable[[values.TracedOnnxFunction], values.TracedOnnxFunction],
+    dispatches: int,
+    repeat: int,
+) -> tuple[float, float]:
+    """Returns the best average time of the first and of later dispatches."""
+    best_first = best_later = float("inf")
+    for _ in range(repeat):
+        instances = [make(function) for function in functions]
+        start = time.perf_counter()
+        for instance in instances:
+            _dispatch(instance)
+        best_first = min(best_first, (time.perf_counter() - start) / len(instances))
+        start = time.perf_counter()
+        for _ in range(dispatches):
+            for instance in instances:
+                _dispatch(instance)
+        best_later = min(
+            best_later, (time.perf_counter() - start) / (dispatches * len(instances))
+        )
+    return best_first, best_later
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--ops", nargs="*", default=[], help="names of trace-only functions (default: all)"
+    )
+    parser.add_argument("--dispatches", type=int, default=20, help="dispatches per function")
+    parser.add_argument("--repeat", type=int, default=3, help="runs; the best is reported")
+    args = parser.parse_args()
+
+    functions = _traced_functions(args.ops)
+    if not functions:
+        parser.error(f"No trace-only functions named {args.ops}")
+
+    before = _time_per_function(
+        functions,
+        lambda f: _UncachedTracedOnnxFunction(f.opset, f.func),
+        args.dispatches,
+        args.repeat,
+    )
+    after = _time_per_function(
+        functions,
+        lambda f: values.TracedOnnxFunction(f.opset, f.func),
+        args.dispatches,
+        args.repeat,
+    )
+    print(f"Trace-only functions: {len(functions)}")
+    print(f"{'':24}{'first dispatch':>16}{'later dispatches':>18}")
+    print(f"{'function_ir per access':24}{before[0] * 1e6:13.1f} us{before[1] * 1e6:15.1f} us")
+    print(f"{'memoized function_ir':24}{after[0] * 1e6:13.1f} us{after[1] * 1e6:15.1f} us")
+    print(f"{'speedup':24}{before[0] / after[0]:14.1f}x{before[1] / after[1]:16.1f}x")
+
+
+if __name__ == "__main__":
+    main()